@@ -18,6 +18,7 @@ belangeo - 2014
 """
 from pyo import *
 import sys, random
+from radio_pyo_wavetables import shared_table
 
 ################### USER-DEFINED VARIABLES ###################
 ### READY is used to manage the server behaviour depending ###
@@ -48,12 +49,12 @@ masterfade = Fader(fadein=0.0001, fadeout=10, dur=DURATION, mul=1.4).play()
 
 
 ### Waveform tables ###
-tCustom = HarmTable([0,0,0,0,.2,0,0,0,.3,0,0,.1,0,0,0,.4,0,0,0,.2,0,0,0,0,.1])
-tPulse = HarmTable([1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1])
-tSaw4d = HarmTable([1,.35,.2,.1])
-tSaw6d = HarmTable([1,.35,.2,.1,.07,.04])
-tSaw8d = HarmTable([1,.35,.2,.1,.07,.04,.015,.008])
-tSquare3 = SquareTable(3)
+tCustom = shared_table(HarmTable, [0,0,0,0,.2,0,0,0,.3,0,0,.1,0,0,0,.4,0,0,0,.2,0,0,0,0,.1])
+tPulse = shared_table(HarmTable, [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1])
+tSaw4d = shared_table(HarmTable, [1,.35,.2,.1])
+tSaw6d = shared_table(HarmTable, [1,.35,.2,.1,.07,.04])
+tSaw8d = shared_table(HarmTable, [1,.35,.2,.1,.07,.04,.015,.008])
+tSquare3 = shared_table(SquareTable, 3)
 pad1 = PadSynthTable(basefreq=midiToHz(84), spread=0.85, bw=30, bwscl=1.4, nharms=48, damp=0.7)
 pad2 = PadSynthTable(basefreq=midiToHz(84), spread=1.10, bw=10, bwscl=1.2, nharms=48, damp=0.4)
 pad3 = PadSynthTable(basefreq=midiToHz(84), spread=0.99, bw=50, bwscl=1.7, nharms=48, damp=0.5)
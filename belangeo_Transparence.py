@@ -3,6 +3,7 @@
 
 from pyo import *
 import random, sys
+from radio_pyo_transforms import read_table, overlap_stretch, write_table
 
 ARTIST = 'Olivier Bélanger'
 TITLE = 'Transparence'
@@ -18,25 +19,7 @@ accents = [[1,0,.5,.3,.8,0,.5,0,1,0,.5,.3,.8,0,.9,.9],
            [1,.5,.5,.3,.8,.3,0,0,1,0,.5,.3,.8,0,.9,0]]
 
 snd = SndTable(SNDS_PATH+'/transparent.aif')
-sndlen = snd.getSize()
-
-samps = []
-for i in range(sndlen):
-    samps.append(snd.get(i))
-for j in range(10):
-    sampslen = len(samps)
-    hsampslen = sampslen/2
-    tmp = []
-    for i in range(sampslen+hsampslen):
-        if i < hsampslen:
-            tmp.append(samps[i])
-        elif i < sampslen:
-            tmp.append((samps[i] + samps[i-hsampslen])*0.5)
-        else:
-            tmp.append(samps[i-hsampslen])
-    samps = [x for x in tmp]
-
-snd2 = DataTable(size=len(samps), init=samps)
+snd2 = write_table(overlap_stretch(read_table(snd), 10), DataTable)
 
 ###############################################################
 ### BEAT ###
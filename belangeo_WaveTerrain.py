@@ -5,6 +5,7 @@ Created by belangeo on 2010-10-06.
 """
 from pyo import *
 import random, math, sys
+from radio_pyo_matrices import terrain_matrix
 
 TITLE = 'Wave Terrain'
 ARTIST = 'Olivier Bélanger'
@@ -20,14 +21,10 @@ NUM = len(FREQS)
 
 def getNumRand(mini, maxi, num=NUM):
     return [random.uniform(mini,maxi) for i in range(num)]
-    
-def terrain(size=256, freq=3, phase=16):
-    xfreq = 2 * math.pi * freq
-    return [[math.sin(xfreq * (j/float(size)) + math.sin(i/float(phase))) for j in range(size)] for i in range(size)]
 
-m1 = NewMatrix(SIZE, SIZE, terrain(SIZE, 1, 4)).normalize()
-m2 = NewMatrix(SIZE, SIZE, terrain(SIZE, 2, 8)).normalize()
-m3 = NewMatrix(SIZE, SIZE, terrain(SIZE, 3, 12)).normalize()
+m1 = terrain_matrix(SIZE, 1, 4, NewMatrix)
+m2 = terrain_matrix(SIZE, 2, 8, NewMatrix)
+m3 = terrain_matrix(SIZE, 3, 12, NewMatrix)
 
 mm = NewMatrix(SIZE, SIZE)
 inter = Sine(.00278, 0, .5, .5)
@@ -14,1030 +14,17 @@ else:
     from pyo import *
 
 import random, sys
+from radio_pyo_tables import load_table
+from radio_pyo_wavetables import shared_table
 
 duration = 420
 
-WAV_PAS = [
-0.0, -3.0517578125e-05, 0.0, 3.0517578125e-05, 9.1552734375e-05, 0.000152587890625, 0.000274658203125, 0.000335693359375, 
-0.00030517578125, 0.000274658203125, 0.000335693359375, 0.000274658203125, 0.0003662109375, 0.00048828125, 0.000579833984375, 0.000396728515625, 
--0.000274658203125, -0.00100708007812, -0.00048828125, 0.00180053710938, 0.00299072265625, 0.000885009765625, -9.1552734375e-05, 0.00048828125, 
--0.00112915039062, -0.000732421875, 0.00164794921875, 0.00079345703125, -0.0003662109375, 0.00018310546875, -0.0001220703125, -0.00152587890625, 
--0.00201416015625, -0.002197265625, -0.00332641601562, -0.00433349609375, -0.00469970703125, -0.00442504882812, -0.003173828125, -0.00262451171875, 
--0.00250244140625, -0.0001220703125, 0.00198364257812, 0.000518798828125, -0.000762939453125, -0.000732421875, -0.00164794921875, -0.001220703125, 
-0.001220703125, 0.00149536132812, 0.00155639648438, 0.00216674804688, 0.00131225585938, -0.000396728515625, 0.000885009765625, 0.00335693359375, 
-0.00299072265625, 0.0006103515625, 0.00106811523438, 0.0030517578125, 0.001953125, 0.00119018554688, 0.00265502929688, 0.00308227539062, 
-0.00299072265625, 0.00466918945312, 0.00491333007812, 0.0035400390625, 0.00253295898438, 0.00079345703125, -0.00018310546875, -0.000946044921875, 
--0.00274658203125, -0.00299072265625, -0.000762939453125, 0.000823974609375, -0.000335693359375, -0.00234985351562, -0.00204467773438, -0.00067138671875, 
-0.00018310546875, 0.000885009765625, 0.00149536132812, 0.00152587890625, -0.000244140625, -0.00262451171875, -0.00421142578125, -0.00436401367188, 
--0.00469970703125, -0.00482177734375, -0.00360107421875, -0.00534057617188, -0.00924682617188, -0.0113220214844, -0.0133666992188, -0.0162963867188, 
--0.0170593261719, -0.0156555175781, -0.01611328125, -0.017578125, -0.0161437988281, -0.0123901367188, -0.00906372070312, -0.00796508789062, 
--0.00323486328125, 0.00238037109375, 0.00531005859375, 0.00863647460938, 0.010498046875, 0.0112915039062, 0.0120849609375, 0.0133972167969, 
-0.0135498046875, 0.012451171875, 0.0121154785156, 0.0116882324219, 0.0100402832031, 0.0108642578125, 0.0120544433594, 0.0113830566406, 
-0.0121459960938, 0.0115356445312, 0.0105895996094, 0.0089111328125, 0.00869750976562, 0.00833129882812, 0.00692749023438, 0.00537109375, 
-0.00332641601562, 0.00173950195312, 0.00091552734375, 0.000762939453125, -0.00119018554688, -0.00619506835938, -0.00897216796875, -0.00909423828125, 
--0.00811767578125, -0.0067138671875, -0.00894165039062, -0.00949096679688, -0.004638671875, -0.00314331054688, -0.00439453125, -0.00299072265625, 
--0.00115966796875, -0.00277709960938, -0.00375366210938, -0.00384521484375, -0.00595092773438, -0.00808715820312, -0.00814819335938, -0.00552368164062, 
--0.00164794921875, -0.000518798828125, -0.000885009765625, -0.00103759765625, -0.00146484375, -0.00054931640625, 0.0023193359375, 0.00360107421875, 
-0.00411987304688, 0.0023193359375, 0.00332641601562, 0.00619506835938, 0.00714111328125, 0.00799560546875, 0.0064697265625, 0.00616455078125, 
-0.00839233398438, 0.00985717773438, 0.00982666015625, 0.0074462890625, 0.00506591796875, 0.00360107421875, 0.0023193359375, -0.000640869140625, 
--0.00344848632812, -0.00674438476562, -0.009033203125, -0.00924682617188, -0.00823974609375, -0.00637817382812, -0.00466918945312, -0.00189208984375, 
-0.000946044921875, 0.00311279296875, 0.00503540039062, 0.00552368164062, 0.00723266601562, 0.00961303710938, 0.009033203125, 0.0081787109375, 
-0.0059814453125, -9.1552734375e-05, -0.00177001953125, -0.00152587890625, -0.0037841796875, -0.00653076171875, -0.00933837890625, -0.0098876953125, 
--0.0089111328125, -0.0110473632812, -0.0145568847656, -0.0148315429688, -0.0121459960938, -0.00796508789062, -0.00030517578125, 0.00448608398438, 
-0.00234985351562, 0.00018310546875, 0.000396728515625, 0.001708984375, 0.00570678710938, 0.00750732421875, 0.005126953125, 0.00680541992188, 
-0.0106506347656, 0.0134887695312, 0.0154724121094, 0.0158081054688, 0.0127868652344, 0.009521484375, 0.00558471679688, -0.00210571289062, 
--0.01171875, -0.0159606933594, -0.0144958496094, -0.0149536132812, -0.0159912109375, -0.013916015625, -0.0114135742188, -0.00912475585938, 
--0.00439453125, -0.00381469726562, -0.00970458984375, -0.0121459960938, -0.0117797851562, -0.00973510742188, -0.00335693359375, 0.00338745117188, 
-0.0057373046875, 0.00796508789062, 0.0111389160156, 0.00726318359375, -0.00289916992188, -0.00765991210938, -0.0084228515625, -0.0112915039062, 
--0.0112609863281, -0.0108032226562, -0.00885009765625, -0.00372314453125, -0.00155639648438, -0.000701904296875, -0.00131225585938, -0.00631713867188, 
--0.00741577148438, 0.000732421875, 0.0078125, 0.0144653320312, 0.0263366699219, 0.0383911132812, 0.0479736328125, 0.0447692871094, 
-0.0372009277344, 0.0387878417969, 0.0306091308594, 0.0215454101562, 0.0223999023438, 0.005859375, -0.00146484375, 0.00418090820312, 
--0.0123291015625, -0.0203552246094, -0.0169372558594, -0.03271484375, -0.0355834960938, -0.0348205566406, -0.0434875488281, -0.0338745117188, 
--0.0262145996094, -0.0279541015625, -0.0127563476562, -0.00457763671875, -0.00839233398438, 0.001708984375, 0.00820922851562, 0.00558471679688, 
-0.0108642578125, 0.0150451660156, 0.0174865722656, 0.0217895507812, 0.014892578125, 0.00665283203125, 0.00946044921875, 0.0101013183594, 
-0.00503540039062, 0.0037841796875, 0.00985717773438, 0.00296020507812, -0.0102844238281, 0.00119018554688, 0.0076904296875, -0.00527954101562, 
--0.00308227539062, -0.00375366210938, -0.00689697265625, 0.005615234375, 0.00363159179688, -0.00335693359375, 0.0006103515625, 0.000457763671875, 
-0.0003662109375, 0.00497436523438, 0.00576782226562, -0.00131225585938, -0.009033203125, -0.00338745117188, -0.000701904296875, -0.00909423828125, 
--0.0089111328125, -0.00881958007812, -0.0103454589844, -0.00830078125, -0.0101013183594, -0.00958251953125, -0.0054931640625, -0.00717163085938, 
--0.00689697265625, -0.00372314453125, -0.00393676757812, -0.00344848632812, -0.0015869140625, -0.00436401367188, -0.00216674804688, -0.0006103515625, 
--0.00473022460938, 0.00149536132812, 0.00765991210938, 0.000579833984375, -0.00177001953125, 0.00704956054688, 0.0115966796875, 0.00949096679688, 
-0.00869750976562, 0.0062255859375, -0.00363159179688, -0.00863647460938, -0.00384521484375, -0.0072021484375, -0.0138244628906, -0.0107727050781, 
--0.0184936523438, -0.0159912109375, 0.0074462890625, 0.0211791992188, 0.0175476074219, 0.00204467773438, 0.00161743164062, 0.0226440429688, 
-0.0195922851562, 0.000823974609375, -0.0108642578125, -0.0185241699219, -0.0121459960938, -0.00277709960938, 0.0104064941406, 0.0213317871094, 
--0.005126953125, -0.0223693847656, 0.00906372070312, 0.0317993164062, 0.0260620117188, 0.00286865234375, -0.02197265625, -0.0270080566406, 
--0.004638671875, 0.0250854492188, 0.0300598144531, 0.0149841308594, 0.00714111328125, 0.00555419921875, 0.0130004882812, 0.0196838378906, 
-0.011474609375, 0.00460815429688, -0.000732421875, -0.00411987304688, -0.00439453125, -0.00604248046875, 0.003662109375, 0.00759887695312, 
--0.00643920898438, -0.010009765625, 0.004638671875, 0.0159301757812, 0.0171203613281, 0.0177307128906, 0.0119934082031, 0.00042724609375, 
--0.00387573242188, -0.00411987304688, 0.0020751953125, 0.00448608398438, -0.0018310546875, 0.0246887207031, 0.0549621582031, 0.0261535644531, 
--0.0210571289062, -0.0272827148438, -0.00479125976562, 0.0121459960938, 0.000213623046875, -0.0210266113281, -0.0303039550781, -0.0356750488281, 
--0.031005859375, -0.0123901367188, 0.00277709960938, 0.0148315429688, 0.0263671875, -0.000396728515625, -0.034912109375, -0.0150146484375, 
-0.0155029296875, 0.00494384765625, -0.00979614257812, -0.0147705078125, -0.0202941894531, -0.00830078125, 0.0141296386719, 0.0239562988281, 
-0.0283203125, 0.0115356445312, -0.00997924804688, -0.003662109375, 0.00497436523438, 0.00567626953125, 0.0052490234375, 0.00701904296875, 
-0.0105895996094, -0.00173950195312, -0.0010986328125, 0.037109375, 0.0341796875, -0.00299072265625, 0.0120849609375, 0.0307922363281, 
-0.00189208984375, -0.0003662109375, 0.0172424316406, 0.00634765625, 0.00448608398438, 0.0114135742188, 0.00469970703125, -0.001708984375, 
--0.00582885742188, 0.006591796875, 0.0144348144531, -0.00106811523438, -0.0181274414062, -0.0245361328125, -0.0182800292969, -0.0142211914062, 
--0.0134887695312, -0.0197143554688, -0.0398254394531, -0.0351867675781, -0.0196228027344, -0.0215148925781, -0.0208129882812, -0.01953125, 
--0.0187072753906, -0.0086669921875, -0.00347900390625, -0.0081787109375, -0.0115051269531, -0.0101928710938, -0.0134887695312, -0.0243530273438, 
--0.0501098632812, -0.0673828125, -0.0255737304688, 0.0221862792969, 0.00885009765625, -0.0003662109375, 0.004638671875, -0.0177307128906, 
--0.002685546875, 0.0243225097656, 0.00881958007812, 0.0126647949219, 0.0281677246094, 0.0048828125, -0.017333984375, -0.00857543945312, 
-0.00814819335938, -0.000274658203125, -0.0105590820312, 0.0206298828125, 0.0345458984375, -0.00250244140625, -0.021728515625, -0.00863647460938, 
-0.0130004882812, 0.0314331054688, 0.0314331054688, 0.00637817382812, -0.0167846679688, 0.00155639648438, 0.0281982421875, 0.0219421386719, 
-0.00161743164062, -0.00665283203125, 0.00515747070312, 0.0113220214844, -0.00701904296875, -0.00772094726562, 0.0089111328125, 0.00274658203125, 
--0.00537109375, -0.0137634277344, -0.0336303710938, -0.0244445800781, 0.00393676757812, 0.0037841796875, -0.012939453125, -0.0218200683594, 
--0.0275268554688, -0.0225219726562, -0.0108947753906, -0.0148315429688, -0.0213012695312, -0.0171813964844, -0.00857543945312, -0.00042724609375, 
--0.00363159179688, -0.00711059570312, -0.0003662109375, -0.00442504882812, -0.008056640625, -0.000640869140625, 0.00289916992188, 0.00308227539062, 
--0.00527954101562, -0.0221252441406, -0.0215454101562, -0.0130004882812, -0.0146179199219, -0.0193786621094, -0.02294921875, -0.018798828125, 
--0.004150390625, 0.00247192382812, 0.00048828125, -0.00692749023438, -0.0149230957031, -0.0157775878906, -0.00439453125, 0.00927734375, 
-0.00790405273438, -0.00668334960938, -0.0101928710938, -0.00350952148438, 0.00576782226562, 0.0101928710938, 0.00454711914062, -0.000335693359375, 
-0.001953125, 0.0133972167969, 0.0297546386719, 0.0262451171875, 0.0110778808594, 0.0104370117188, 0.0105285644531, 0.0107421875, 
-0.0154418945312, 0.0169067382812, 0.0171508789062, 0.0147705078125, 0.0107421875, 0.0163269042969, 0.015625, 0.00677490234375, 
-0.0154113769531, 0.0303039550781, 0.0209350585938, 0.00775146484375, 0.0156860351562, 0.0301208496094, 0.0297241210938, 0.0159912109375, 
-0.0062255859375, 0.00473022460938, 0.00637817382812, 0.0171203613281, 0.0170288085938, -0.00054931640625, 0.00436401367188, 0.0150146484375, 
-0.0109558105469, 0.0146484375, 0.0142822265625, 0.00869750976562, 0.00997924804688, 0.0109558105469, 0.0126037597656, 0.0189208984375, 
-0.0206909179688, 0.0120239257812, 0.0125122070312, 0.0266418457031, 0.0211486816406, 0.0186157226562, 0.0260925292969, 0.0191040039062, 
-0.0179443359375, 0.0243225097656, 0.0239562988281, 0.0216064453125, 0.0154113769531, 0.00933837890625, 0.00918579101562, 0.00711059570312, 
-0.00735473632812, 0.005859375, 0.000579833984375, -0.00241088867188, -0.00677490234375, 0.00546264648438, 0.0164489746094, -0.000823974609375, 
--0.0105590820312, 0.00375366210938, 0.0098876953125, 0.00814819335938, 0.0182495117188, 0.0306701660156, 0.0182495117188, 0.00888061523438, 
-0.0117797851562, -0.00433349609375, -0.0186767578125, -0.0119018554688, -0.0035400390625, -0.0069580078125, -0.0181579589844, -0.01123046875, 
-0.00363159179688, 0.00079345703125, -0.006591796875, -0.00241088867188, -0.0157165527344, -0.0326843261719, -0.0177001953125, 0.00387573242188, 
-0.00457763671875, 0.00332641601562, 0.0121154785156, 0.0101013183594, -0.0145263671875, -0.0205993652344, -0.00799560546875, -0.0167541503906, 
--0.0289916992188, -0.0278015136719, -0.0226745605469, -0.023681640625, -0.0297546386719, -0.0262145996094, -0.00418090820312, 0.0103149414062, 
--0.00653076171875, -0.0326538085938, -0.0361022949219, -0.0166931152344, -0.0162353515625, -0.0417785644531, -0.0180358886719, 0.00897216796875, 
--0.0175476074219, -0.00326538085938, -0.0122375488281, -0.0525207519531, -0.0111694335938, -0.0143127441406, -0.0673522949219, -0.03271484375, 
--0.01025390625, -0.0164184570312, -0.012451171875, -0.0468139648438, -0.0490112304688, -0.0150146484375, -0.0198059082031, -0.0316772460938, 
--0.0175476074219, 0.0068359375, 0.0029296875, -0.0155334472656, -0.00283813476562, -0.0205993652344, -0.0407409667969, -0.0147399902344, 
--0.00466918945312, 0.00042724609375, 0.0023193359375, 0.0074462890625, 0.0341186523438, 0.0240783691406, -0.0015869140625, 0.0107421875, 
-0.01953125, 0.0313720703125, 0.0439453125, 0.0259704589844, 0.00732421875, -0.0006103515625, 0.0096435546875, 0.0376892089844, 
-0.0380859375, 0.0464477539062, 0.0476379394531, 0.00704956054688, 0.00650024414062, 0.0267639160156, 0.000579833984375, 0.0171508789062, 
-0.0564880371094, 0.0378723144531, -0.0047607421875, -0.0238342285156, -0.0165710449219, -0.00820922851562, 0.000213623046875, 0.0201110839844, 
-0.014404296875, -0.0068359375, 0.00857543945312, 0.0272216796875, 0.0294189453125, 0.0340881347656, 0.0279541015625, 0.00689697265625, 
--0.00698852539062, -0.0117492675781, 0.0145874023438, 0.0407104492188, 0.0362548828125, 0.0260925292969, 0.0254821777344, 0.0183715820312, 
-0.0081787109375, 0.0202941894531, 0.0263061523438, 0.008056640625, -0.0008544921875, -0.016845703125, -0.0472717285156, -0.0722961425781, 
--0.100402832031, -0.117919921875, -0.0914306640625, -0.0397338867188, -0.012451171875, -0.0035400390625, 0.0308532714844, 0.0592956542969, 
-0.0701904296875, 0.0749816894531, 0.0511779785156, 0.0298156738281, 0.0189208984375, 0.00653076171875, 0.0181274414062, 0.0081787109375, 
--0.024169921875, -0.0372009277344, -0.0369262695312, -0.00546264648438, 0.0204162597656, 0.00851440429688, -0.0115661621094, -0.0314636230469, 
--0.0428161621094, -0.0447387695312, -0.054931640625, -0.0180053710938, 0.0136108398438, -0.00692749023438, 0.00564575195312, 0.0255737304688, 
-0.0270080566406, 0.0550842285156, 0.0499572753906, -0.001220703125, -0.0526123046875, -0.0725402832031, -0.0443115234375, -0.0122985839844, 
--0.00973510742188, -0.0174255371094, -0.0470886230469, -0.0653686523438, -0.035888671875, -0.0154724121094, -0.0160522460938, -0.00390625, 
--0.0290222167969, -0.0609436035156, -0.0269165039062, 0.00820922851562, -0.0118713378906, -0.0280151367188, -0.0263671875, -0.02734375, 
-0.00714111328125, 0.0482482910156, 0.0289916992188, -0.00296020507812, 0.0205078125, 0.0255432128906, -0.0137023925781, -0.030029296875, 
--0.0305480957031, -0.0557250976562, -0.0711364746094, -0.0262756347656, 0.0285339355469, 0.0126953125, -0.022705078125, -0.0148620605469, 
--0.0087890625, -0.0360107421875, -0.0520324707031, -0.0257568359375, -0.00302124023438, -0.0102844238281, -0.00048828125, 0.0397644042969, 
-0.0640869140625, 0.0621032714844, 0.0543212890625, 0.0339050292969, 0.00357055664062, -0.00677490234375, 0.00796508789062, 0.0124206542969, 
--0.0153198242188, -0.0267028808594, 0.00265502929688, 0.0203857421875, 0.0271301269531, 0.0285339355469, 0.00897216796875, 0.0035400390625, 
-0.0196838378906, 0.0299987792969, 0.0395202636719, 0.0436401367188, 0.0316772460938, -0.00457763671875, -0.0302734375, -0.0188598632812, 
--0.00732421875, 0.000457763671875, 0.0257263183594, 0.0483703613281, 0.0595092773438, 0.0709533691406, 0.0355834960938, -0.0363464355469, 
--0.051025390625, -0.00689697265625, 0.0125732421875, 0.00265502929688, -0.0193481445312, -0.0159606933594, 0.0265808105469, 0.0465393066406, 
-0.0126953125, -0.00030517578125, 0.0343017578125, 0.0299072265625, 0.0003662109375, 0.0259704589844, 0.0536804199219, 0.0362548828125, 
-0.0128479003906, 0.00442504882812, 0.0042724609375, 0.0302429199219, 0.0677795410156, 0.0733337402344, 0.0425415039062, -0.0169372558594, 
--0.0616455078125, -0.038330078125, -0.00637817382812, -0.0156555175781, -0.0238647460938, -0.0126342773438, -0.0123596191406, -0.00741577148438, 
-0.0315551757812, 0.06982421875, 0.0487976074219, 0.0100402832031, 0.0015869140625, -9.1552734375e-05, 0.0078125, 0.0233459472656, 
-0.0211791992188, 0.00149536132812, -0.0126037597656, -0.0003662109375, 0.00079345703125, -0.0115966796875, 0.00262451171875, -0.00314331054688, 
--0.0311584472656, -0.0176696777344, -0.00753784179688, -0.0324096679688, -0.0294494628906, -0.0093994140625, -0.007568359375, -0.0040283203125, 
--0.0267028808594, -0.0309143066406, 0.0140380859375, 0.037109375, 0.0287475585938, 0.0220031738281, 0.0299682617188, 0.0392761230469, 
-0.0110473632812, -0.01171875, -0.012451171875, -0.0272521972656, -0.0228576660156, -0.00839233398438, 0.00228881835938, 0.0276794433594, 
-0.0333862304688, 0.0152282714844, 0.00863647460938, -0.001953125, -0.0281982421875, -0.0588684082031, -0.0438232421875, -0.00350952148438, 
--0.0161743164062, -0.0349426269531, -0.00115966796875, 0.0380249023438, 0.0386047363281, 0.0152893066406, 0.0025634765625, 0.00662231445312, 
--0.00674438476562, -0.00424194335938, 0.0178833007812, -0.00741577148438, -0.0653381347656, -0.123413085938, -0.161834716797, -0.154846191406, 
--0.153045654297, -0.155792236328, -0.112884521484, -0.099853515625, -0.118103027344, -0.0490112304688, 0.0640869140625, 0.106781005859, 
-0.113891601562, 0.124176025391, 0.1123046875, 0.113433837891, 0.135986328125, 0.143585205078, 0.123931884766, 0.0689697265625, 
-0.0284118652344, 0.0179748535156, -0.0255737304688, -0.0684814453125, -0.0690612792969, -0.0650024414062, -0.0545349121094, -0.0213928222656, 
-0.00531005859375, 0.0244140625, 0.056884765625, 0.0615539550781, 0.0592346191406, 0.0576477050781, 0.0337219238281, 0.0201416015625, 
-0.0193481445312, 0.0142211914062, 0.0203247070312, 0.0269165039062, 0.0241394042969, -0.00201416015625, -0.0365600585938, -0.0255737304688, 
--0.013427734375, -0.0315551757812, -0.0221252441406, -0.0337219238281, -0.0692749023438, -0.06787109375, -0.0372924804688, 0.00421142578125, 
-0.0413818359375, 0.045166015625, 0.0495300292969, 0.0460815429688, 0.038330078125, 0.057861328125, 0.0616149902344, 0.0392456054688, 
-0.033447265625, 0.0398254394531, 0.0432739257812, 0.0125732421875, -0.0309753417969, -0.0425109863281, -0.0363159179688, -0.0347290039062, 
--0.0505981445312, -0.0634155273438, -0.0883483886719, -0.106719970703, -0.0508728027344, 0.00509643554688, -0.0299682617188, -0.104156494141, 
--0.125549316406, -0.0657043457031, -0.0157775878906, 0.0148315429688, 0.0401000976562, 0.0244140625, 0.00314331054688, 0.000701904296875, 
-0.0106811523438, 0.0536804199219, 0.0765075683594, 0.0483093261719, 0.0203552246094, 0.0235290527344, 0.0145568847656, 0.0015869140625, 
-0.0339660644531, 0.044677734375, -0.0142822265625, -0.0659790039062, -0.0642700195312, -0.0174560546875, 0.0179748535156, 0.013671875, 
-0.018798828125, 0.0286560058594, 0.0258178710938, 0.0243225097656, 0.00271606445312, -0.0318298339844, -0.0647583007812, -0.0734252929688, 
--0.0177001953125, 0.0132141113281, -0.00601196289062, -0.0086669921875, 0.013671875, 0.0249633789062, 0.0314636230469, -0.00497436523438, 
--0.0655517578125, -0.0448913574219, 0.0424194335938, 0.0526123046875, 0.0154418945312, 0.0354309082031, 0.0359191894531, 0.00552368164062, 
--0.0279846191406, -0.0722045898438, -0.0419311523438, 0.052978515625, 0.0475463867188, 0.00686645507812, 0.0208435058594, -0.00408935546875, 
--0.04931640625, -0.0339050292969, -0.0272827148438, -0.057861328125, -0.104614257812, -0.100067138672, -0.0273132324219, -0.0320739746094, 
--0.088134765625, -0.0598754882812, -0.0180053710938, -0.0110168457031, -0.00177001953125, -0.021240234375, -0.0472106933594, -0.0196838378906, 
-0.0296936035156, 0.0242004394531, 0.0214233398438, 0.0496215820312, 0.0314331054688, -0.0324096679688, -0.0293884277344, -0.00457763671875, 
--0.0505981445312, -0.0869750976562, -0.0325927734375, -0.0337219238281, -0.0696411132812, -0.0313720703125, 0.00131225585938, 0.00857543945312, 
-0.0398559570312, 0.0469970703125, 0.0447082519531, 0.0657043457031, 0.0571899414062, 0.0264892578125, 0.0272827148438, 0.0525512695312, 
-0.056396484375, 0.0343017578125, 0.0405883789062, 0.0601196289062, 0.0123596191406, -0.0391845703125, -0.0201110839844, 0.0155334472656, 
-0.0354614257812, 0.0689697265625, 0.0928039550781, 0.0925598144531, 0.101135253906, 0.0786743164062, 0.0163879394531, 0.024169921875, 
-0.0544738769531, 0.00543212890625, -0.0366821289062, -0.0204467773438, 0.006591796875, 0.003662109375, -0.0128784179688, -0.0140991210938, 
--0.00778198242188, -0.00430297851562, 0.00238037109375, -0.00289916992188, -0.0147094726562, -0.0106811523438, -0.0301513671875, -0.049072265625, 
--0.0182800292969, -0.00802612304688, -0.0359802246094, -0.0324096679688, -0.0086669921875, -0.00534057617188, -0.00509643554688, 0.0176086425781, 
-0.0357360839844, 0.023681640625, 0.000244140625, -0.0162963867188, -0.0326843261719, -0.0257568359375, 0.0148010253906, 0.0505065917969, 
-0.054443359375, 0.0270385742188, 0.0029296875, 0.0006103515625, 0.0148620605469, 0.0430297851562, 0.0697937011719, 0.0682983398438, 
-0.0331726074219, 0.0103454589844, 0.0265502929688, 0.05224609375, 0.0796508789062, 0.0736389160156, 0.0249328613281, 0.0047607421875, 
-0.0133056640625, 0.0112915039062, 0.0179748535156, 0.0309753417969, 0.0239562988281, -0.001708984375, 0.00778198242188, 0.0378723144531, 
-0.0479736328125, 0.0484924316406, 0.0399780273438, 0.0390014648438, 0.0434265136719, 0.04150390625, 0.0596008300781, 0.0638427734375, 
-0.0404663085938, 0.03955078125, 0.0372619628906, 0.0269470214844, 0.00531005859375, -0.0235290527344, 0.00271606445312, 0.037841796875, 
-0.0429382324219, 0.0461120605469, 0.0257263183594, 0.00289916992188, 0.00247192382812, -0.00762939453125, -0.00732421875, -0.0050048828125, 
--0.0128479003906, -0.0140075683594, -0.0289611816406, -0.052490234375, -0.03955078125, -0.0106201171875, -0.0223999023438, -0.0644836425781, 
--0.0736999511719, -0.0494995117188, -0.0406494140625, -0.0505065917969, -0.0569152832031, -0.0634765625, -0.0828552246094, -0.0944213867188, 
--0.0858764648438, -0.069091796875, -0.0487365722656, -0.0447387695312, -0.0536499023438, -0.0601806640625, -0.0567321777344, -0.0325317382812, 
--0.019775390625, -0.0382995605469, -0.0411071777344, -0.0348510742188, -0.0641784667969, -0.0887756347656, -0.0724182128906, -0.0483703613281, 
--0.0357360839844, -0.0375366210938, -0.0509643554688, -0.065673828125, -0.0731201171875, -0.0557861328125, -0.02734375, -0.0243225097656, 
--0.03515625, -0.0395812988281, -0.0476684570312, -0.0416259765625, -0.0157775878906, 0.00308227539062, 0.000885009765625, -0.0202026367188, 
--0.0418395996094, -0.0430603027344, -0.025146484375, -0.00650024414062, -0.0032958984375, -0.00372314453125, 0.000335693359375, -0.0130920410156, 
--0.0293579101562, -0.0166931152344, 0.00137329101562, -0.00299072265625, -0.0068359375, 0.00820922851562, 0.0163879394531, 0.00863647460938, 
-0.0115356445312, 0.0189514160156, 0.0366516113281, 0.0578918457031, 0.0352783203125, 0.00067138671875, 0.00042724609375, 0.0171508789062, 
-0.0366516113281, 0.036376953125, 0.0213623046875, 0.01904296875, 0.0320434570312, 0.0371704101562, 0.0312805175781, 0.0278015136719, 
-0.0101623535156, 0.0113830566406, 0.0349731445312, 0.0237731933594, -0.00167846679688, -0.00445556640625, 0.00973510742188, 0.0416870117188, 
-0.0402221679688, 0.00213623046875, -0.0181579589844, 0.00680541992188, 0.0385437011719, 0.0234680175781, 0.0020751953125, 0.0205078125, 
-0.0202331542969, 0.0133056640625, 0.0416259765625, 0.0383605957031, -0.005126953125, -0.0314636230469, -0.03564453125, -0.0238952636719, 
--0.00619506835938, 0.0285339355469, 0.0416564941406, 0.00668334960938, -0.000640869140625, 0.0155029296875, 0.0162963867188, 0.0308532714844, 
-0.0263671875, 0.0128479003906, 0.0259704589844, 0.0384216308594, 0.0395202636719, 0.0227966308594, 0.00466918945312, 0.0074462890625, 
-0.0244445800781, 0.0271301269531, 0.0155029296875, 0.00775146484375, 0.0201721191406, 0.0333251953125, 0.0346374511719, 0.0158996582031, 
--0.010986328125, -0.0184936523438, -0.0170288085938, -0.0076904296875, 0.0147705078125, 0.0120239257812, -0.00131225585938, 0.00711059570312, 
--0.00399780273438, -0.0203247070312, -0.0253601074219, -0.0386352539062, -0.0244445800781, -0.000244140625, -0.00286865234375, 0.0102233886719, 
-0.0278930664062, 0.0169372558594, 0.0280456542969, 0.0321655273438, 0.000823974609375, -0.00796508789062, -0.0076904296875, -0.0189208984375, 
--0.0110473632812, 0.01123046875, 0.018798828125, 0.017822265625, -0.00787353515625, -0.0317077636719, -0.01220703125, 0.0144348144531, 
--0.00143432617188, -0.0128784179688, -0.018310546875, -0.0623474121094, -0.0675659179688, -0.0045166015625, 0.0158081054688, -0.021484375, 
--0.0443420410156, -0.0282897949219, 0.0159606933594, 0.0523376464844, 0.0646057128906, 0.0527954101562, 0.0108337402344, -0.0247192382812, 
--0.0211486816406, -0.00250244140625, -0.0084228515625, -0.0142822265625, 0.0135803222656, 0.0298156738281, 0.00216674804688, -0.0187072753906, 
--0.00347900390625, 0.00830078125, 0.0187377929688, 0.0407104492188, 0.0484313964844, 0.0278625488281, -0.00469970703125, -0.0057373046875, 
-0.0155334472656, 0.0152587890625, 0.00692749023438, -0.00808715820312, -0.029052734375, -0.0311279296875, -0.0226745605469, -0.0245361328125, 
--0.0118103027344, 0.00155639648438, -0.0171508789062, -0.0455017089844, -0.0498046875, -0.0149841308594, 0.0304260253906, 0.0274658203125, 
--6.103515625e-05, -0.0235290527344, -0.0384521484375, -0.0452270507812, -0.0423278808594, -0.0283203125, -0.0254516601562, -0.0482177734375, 
--0.0466918945312, -0.0172424316406, 0.0227661132812, 0.0594482421875, 0.0570678710938, 0.0161437988281, -0.0143127441406, -0.0156860351562, 
--0.0104064941406, 0.000732421875, 0.0271606445312, 0.0272827148438, -0.00509643554688, -0.00909423828125, 0.0154418945312, 0.0364685058594, 
-0.0505676269531, 0.040283203125, 0.0272827148438, 0.0289916992188, 0.0113830566406, -0.007080078125, -0.00228881835938, 0.0235900878906, 
-0.0505065917969, 0.044189453125, 0.0212097167969, 0.0191040039062, 0.0351257324219, 0.0569763183594, 0.0673217773438, 0.0451049804688, 
-0.0179443359375, 0.0296630859375, 0.0503845214844, 0.0498046875, 0.0318603515625, 0.01513671875, 0.00933837890625, 0.0315551757812, 
-0.0373840332031, -0.00234985351562, 0.0215759277344, 0.0668029785156, 0.0331726074219, 0.00222778320312, -0.00155639648438, -0.0091552734375, 
-0.00601196289062, 0.0385437011719, 0.0447387695312, 0.00030517578125, -0.0245361328125, 0.0190734863281, 0.0594177246094, 0.043701171875, 
-0.0200805664062, 0.0166625976562, -0.0076904296875, -0.0306701660156, -0.0162963867188, 0.0120239257812, 0.008544921875, 0.0155639648438, 
-0.0311279296875, -0.0087890625, -0.0440673828125, -0.0185546875, 0.0189208984375, 0.0465087890625, 0.0751953125, 0.0330810546875, 
--0.082275390625, -0.111267089844, -0.05908203125, -0.0423278808594, -0.0382385253906, -0.0467224121094, -0.0755615234375, -0.0799560546875, 
--0.06298828125, -0.0227355957031, 0.0303344726562, 0.030517578125, -0.0329895019531, -0.0965576171875, -0.0996704101562, -0.0559387207031, 
--0.01953125, -0.0175476074219, -0.0414428710938, -0.082275390625, -0.117401123047, -0.0866088867188, -0.03271484375, 0.003173828125, 
-0.0456848144531, 0.0298156738281, -0.0493774414062, -0.101806640625, -0.0975036621094, -0.0511779785156, -0.011474609375, 0.0315856933594, 
-0.0355224609375, -0.0279846191406, -0.0501098632812, -0.0326232910156, -0.016845703125, 0.0216369628906, 0.0252380371094, -0.0166015625, 
--0.046875, -0.0676574707031, -0.0871276855469, -0.0677185058594, -0.0378112792969, -0.0573120117188, -0.0317077636719, 0.0499267578125, 
-0.0554504394531, 0.0130310058594, -0.001220703125, -0.0167846679688, -0.0284118652344, 0.00372314453125, 0.0810546875, 0.0662231445312, 
--0.0342407226562, -0.0261535644531, -0.00299072265625, -0.0378723144531, -0.0076904296875, -0.0072021484375, -0.0285949707031, -0.008056640625, 
--0.0209655761719, -0.00222778320312, 0.00418090820312, -0.0450744628906, -0.0331115722656, 0.00970458984375, 0.013916015625, -0.0235900878906, 
--0.0482482910156, -0.00531005859375, 0.00457763671875, -0.0282592773438, -0.052490234375, -0.0657348632812, 0.0169982910156, 0.104461669922, 
-0.0390014648438, -0.0492858886719, -0.00457763671875, 0.0457153320312, 0.0126342773438, 0.0154724121094, 0.0741577148438, 0.0692443847656, 
-0.0209045410156, -0.00750732421875, -0.00650024414062, 0.00775146484375, 0.00164794921875, -0.0232543945312, -0.0452575683594, -0.0406799316406, 
--0.0531311035156, -0.115600585938, -0.0767822265625, 0.00820922851562, -0.0676879882812, -0.08837890625, 0.0173645019531, 0.0120849609375, 
-0.00381469726562, 0.0607604980469, 0.0420532226562, 0.0450744628906, 0.0654602050781, 0.0291137695312, 0.0912475585938, 0.110076904297, 
--0.00311279296875, 0.00994873046875, 0.05224609375, 0.0255432128906, 0.0763854980469, 0.08837890625, 0.0343933105469, 0.0665588378906, 
-0.0898742675781, 0.0341796875, -0.0084228515625, -0.0341186523438, -0.0069580078125, 0.0941467285156, 0.113464355469, 0.0482177734375, 
-0.0204162597656, 0.0250244140625, 0.0431518554688, 0.0513000488281, 0.0199279785156, -0.0186767578125, -0.030029296875, -0.0236511230469, 
-0.00457763671875, 0.0531005859375, 0.0728149414062, 0.0364685058594, 0.0072021484375, 0.0129699707031, 0.0309753417969, 0.0553894042969, 
-0.06005859375, 0.0591430664062, 0.05859375, 0.0508117675781, 0.0604553222656, 0.0597534179688, 0.0461120605469, 0.0442810058594, 
-0.0177917480469, 0.00466918945312, 0.0423889160156, 0.060546875, 0.0452880859375, 0.0393371582031, 0.0315246582031, 0.0201416015625, 
-0.0233764648438, 0.0303039550781, 0.0286254882812, 0.0224609375, 0.0239562988281, 0.0270690917969, 0.0280151367188, 0.00201416015625, 
--0.0253295898438, -0.0179443359375, -0.0208129882812, -0.00424194335938, 0.015869140625, 0.000518798828125, 0.0048828125, 0.000579833984375, 
--0.0128479003906, 0.0179138183594, 0.00787353515625, -0.0202331542969, -0.00839233398438, -0.0309753417969, -0.023681640625, 0.0326538085938, 
-0.0072021484375, -0.0109252929688, 0.0032958984375, -0.0521850585938, -0.0516662597656, -0.0164489746094, -0.0332946777344, -0.0218200683594, 
--0.0205078125, -0.0728454589844, -0.0706481933594, -0.0380859375, -0.0465087890625, -0.0564270019531, -0.0577087402344, -0.0699462890625, 
--0.0617980957031, -0.0473022460938, -0.0601806640625, -0.0504150390625, -0.0340270996094, -0.0436401367188, -0.0215759277344, -0.00119018554688, 
--0.0387268066406, -0.0187072753906, 0.0294189453125, 0.0054931640625, -0.0188903808594, -0.0406799316406, -0.0846252441406, -0.0574035644531, 
--0.00234985351562, 0.0191955566406, 0.0400390625, 0.0154418945312, -0.0155334472656, 0.0182800292969, 0.020751953125, -0.00344848632812, 
-0.0125122070312, -0.00448608398438, -0.0386047363281, -0.0447387695312, -0.0709838867188, -0.0743408203125, -0.0232543945312, -0.0100402832031, 
--0.0363464355469, -0.0448608398438, -0.0525817871094, -0.0769653320312, -0.0713195800781, -0.0317077636719, -0.0302124023438, -0.0426940917969, 
--0.0410766601562, -0.0388793945312, -0.00750732421875, 0.0123596191406, 0.00283813476562, 0.0215759277344, 0.0548095703125, 0.0394287109375, 
--0.0098876953125, -0.0321960449219, -0.0350341796875, -0.0661315917969, -0.0788269042969, -0.0605163574219, -0.0466003417969, -0.00161743164062, 
-0.0265808105469, -0.0162353515625, -0.0252380371094, 0.0171508789062, -0.00924682617188, -0.0393981933594, -0.0174255371094, -0.0284118652344, 
--0.0379028320312, -0.000732421875, -0.0074462890625, -0.00381469726562, 0.0354614257812, 0.0143432617188, -0.02587890625, -0.0410766601562, 
--0.0643005371094, -0.0375061035156, 0.0298156738281, 0.0345458984375, -0.01025390625, -0.0146179199219, 0.0296020507812, 0.0376586914062, 
-0.0183410644531, 0.037841796875, 0.0488891601562, 0.0260009765625, 0.0165100097656, 0.0295104980469, 0.0274047851562, 0.000640869140625, 
--0.0173645019531, -0.00857543945312, 0.0296325683594, 0.0905151367188, 0.110382080078, 0.0657348632812, 0.011962890625, -0.0009765625, 
-0.0029296875, 0.00491333007812, 0.0177307128906, 0.00299072265625, -0.0337829589844, -0.0260925292969, 0.00314331054688, 0.020751953125, 
-0.0375061035156, 0.0671691894531, 0.0921630859375, 0.0829467773438, 0.0507202148438, 0.0184631347656, 0.0187683105469, 0.0169372558594, 
-0.0062255859375, 0.0379943847656, 0.0504760742188, 0.0547485351562, 0.0936279296875, 0.0662841796875, 0.0482482910156, 0.093505859375, 
-0.0577392578125, 0.00607299804688, 0.037353515625, 0.0333251953125, -0.0135803222656, -0.0191345214844, -0.0444946289062, -0.0982666015625, 
--0.0870666503906, -0.0377502441406, -0.0448913574219, -0.0687255859375, -0.0299682617188, 0.0268859863281, 0.0684814453125, 0.110107421875, 
-0.0963439941406, -0.012939453125, -0.0617980957031, 0.0202331542969, 0.106811523438, 0.114959716797, 0.0431823730469, -0.0630493164062, 
--0.0841369628906, -0.00396728515625, 0.0597839355469, 0.110443115234, 0.127716064453, 0.0350646972656, -0.0589904785156, -0.0769348144531, 
--0.0702819824219, 0.00332641601562, 0.08056640625, 0.0466613769531, -0.0319213867188, -0.0511169433594, -0.0490417480469, -0.06005859375, 
--0.0487976074219, -0.0451049804688, -0.0569458007812, -0.031982421875, -0.0120849609375, -0.0336303710938, -0.0497436523438, -0.0372314453125, 
-0.00747680664062, 0.0609130859375, 0.0947570800781, 0.0954895019531, 0.0522155761719, -0.0181274414062, -0.0877685546875, -0.113891601562, 
--0.105377197266, -0.104888916016, -0.0921020507812, -0.09033203125, -0.136505126953, -0.134948730469, -0.0888977050781, -0.0658874511719, 
--0.0369262695312, -0.0220336914062, -0.0357360839844, -0.0458374023438, -0.0436096191406, -0.0310974121094, -0.0216369628906, 0.0001220703125, 
-0.0195617675781, 0.0068359375, -0.00689697265625, 0.0158386230469, 0.064453125, 0.0877380371094, 0.0333251953125, -0.0289611816406, 
--0.0333557128906, 0.00381469726562, 0.0584716796875, 0.0995788574219, 0.0890502929688, 0.0630493164062, 0.0776672363281, 0.106109619141, 
-0.118072509766, 0.123657226562, 0.103149414062, 0.0629577636719, 0.0359497070312, 0.0289001464844, 0.0371704101562, 0.0429077148438, 
-0.0340881347656, 0.0380249023438, 0.0530395507812, 0.0484008789062, 0.0284118652344, 0.0121459960938, 0.00640869140625, 0.0213012695312, 
-0.0461120605469, 0.062255859375, 0.0643005371094, 0.0526428222656, 0.0427551269531, 0.0484008789062, 0.067138671875, 0.0796508789062, 
-0.0652465820312, 0.0409240722656, 0.0319213867188, 0.0335693359375, 0.0372924804688, 0.0512390136719, 0.057861328125, 0.0406799316406, 
-0.0172424316406, 0.00387573242188, 0.0028076171875, 0.0122375488281, 0.017333984375, 0.0146179199219, 0.0006103515625, -0.0136413574219, 
--0.00439453125, 0.0182189941406, 0.0372619628906, 0.0462036132812, 0.0324096679688, 0.0181884765625, 0.0275573730469, 0.0242309570312, 
--0.00125122070312, -0.0339965820312, -0.0441589355469, -0.0100708007812, -0.00338745117188, -0.0263977050781, -0.0394287109375, -0.0541076660156, 
--0.0682373046875, -0.0819396972656, -0.0946655273438, -0.0951232910156, -0.0980834960938, -0.0968627929688, -0.090576171875, -0.0928649902344, 
--0.0859680175781, -0.0592346191406, -0.0503540039062, -0.0592346191406, -0.0621032714844, -0.0693969726562, -0.0785217285156, -0.0774536132812, 
--0.0701293945312, -0.0618591308594, -0.0580139160156, -0.0572814941406, -0.0452575683594, -0.0352783203125, -0.0448913574219, -0.0466918945312, 
--0.0379638671875, -0.0373840332031, -0.0407104492188, -0.0403137207031, -0.0402221679688, -0.0333557128906, -0.0288391113281, -0.0503540039062, 
--0.0734252929688, -0.0592651367188, -0.0437316894531, -0.044677734375, -0.0340881347656, -0.0212707519531, -0.0292358398438, -0.0427551269531, 
--0.0366516113281, -0.0302124023438, -0.0348510742188, -0.0286254882812, -0.0271606445312, -0.0392456054688, -0.0365295410156, -0.0226135253906, 
--0.0172424316406, -0.0119018554688, -0.0108947753906, -0.0244750976562, -0.0235900878906, -0.015380859375, -0.0231018066406, -0.0188598632812, 
--0.00628662109375, -0.0137329101562, -0.010498046875, 0.00381469726562, -0.00509643554688, -0.0275268554688, -0.0235595703125, -0.00320434570312, 
-6.103515625e-05, -0.00469970703125, 0.00509643554688, 0.00344848632812, -0.0131530761719, -0.0211791992188, -0.0261840820312, -0.0283813476562, 
--0.0230407714844, -0.0145874023438, -0.00604248046875, -0.00485229492188, -0.0108032226562, -0.00582885742188, 0.0123291015625, 0.0308227539062, 
-0.0299377441406, 0.0120849609375, -0.0115356445312, -0.0096435546875, 0.0192565917969, 0.0280456542969, 0.0129699707031, 0.0192260742188, 
-0.0356750488281, 0.0286560058594, 0.0216064453125, 0.0264282226562, 0.0206909179688, 0.0225219726562, 0.0460815429688, 0.0567321777344, 
-0.0454406738281, 0.0342407226562, 0.0308532714844, 0.0326843261719, 0.044921875, 0.0450744628906, 0.0300903320312, 0.0240478515625, 
-0.024658203125, 0.0313720703125, 0.0434265136719, 0.03955078125, 0.0389099121094, 0.0489501953125, 0.047607421875, 0.0520324707031, 
-0.0718994140625, 0.0747375488281, 0.0585021972656, 0.0462036132812, 0.0384216308594, 0.0344848632812, 0.0369567871094, 0.0375366210938, 
-0.0321655273438, 0.0234375, 0.0198669433594, 0.0206909179688, 0.027099609375, 0.0448913574219, 0.0488891601562, 0.0409545898438, 
-0.0464782714844, 0.053955078125, 0.0520629882812, 0.0538330078125, 0.0505981445312, 0.0488891601562, 0.0596313476562, 0.06005859375, 
-0.0570678710938, 0.056396484375, 0.0369873046875, 0.0219421386719, 0.0300598144531, 0.0353698730469, 0.0307312011719, 0.01318359375, 
--0.00357055664062, -0.00173950195312, 0.015869140625, 0.0285949707031, 0.0341186523438, 0.0355834960938, 0.0261840820312, 0.0182495117188, 
-0.0228576660156, 0.029541015625, 0.0347900390625, 0.03125, 0.0224609375, 0.0217590332031, 0.0241088867188, 0.0205688476562, 
-0.0091552734375, -0.0045166015625, -0.0157470703125, -0.0196838378906, -0.0155029296875, -0.0216674804688, -0.0426025390625, -0.0676574707031, 
--0.0866088867188, -0.0869750976562, -0.0668640136719, -0.0567016601562, -0.0732116699219, -0.0962829589844, -0.0964050292969, -0.0749206542969, 
--0.0614929199219, -0.0527038574219, -0.0330810546875, -0.0135803222656, -0.0078125, -0.000213623046875, 0.013427734375, 0.0257568359375, 
-0.0382690429688, 0.0392150878906, 0.0299072265625, 0.0140075683594, 0.002197265625, 0.01953125, 0.0329895019531, 0.0194091796875, 
--0.00390625, -0.0400695800781, -0.0670776367188, -0.0613403320312, -0.0462036132812, -0.0347290039062, -0.0177307128906, -0.00607299804688, 
--0.0130004882812, -0.0252990722656, -0.0242614746094, -0.01708984375, -0.0130310058594, -0.00491333007812, -0.00433349609375, -0.0224609375, 
--0.0274353027344, -0.0213012695312, -0.0238647460938, -0.0151977539062, -0.00894165039062, -0.0186462402344, -0.00637817382812, 0.00601196289062, 
--0.00604248046875, 0.00296020507812, 0.0303039550781, 0.0322265625, 0.0292358398438, 0.0410461425781, 0.0474853515625, 0.0418090820312, 
-0.0260314941406, 0.00958251953125, 0.005615234375, 0.00469970703125, -0.00650024414062, -0.01904296875, -0.0173034667969, -0.00717163085938, 
--0.00335693359375, -0.0115966796875, -0.0271911621094, -0.0305480957031, -0.017822265625, 0.008544921875, 0.0199890136719, 0.010986328125, 
-0.00445556640625, -0.006103515625, -0.0162353515625, -0.00473022460938, 0.00262451171875, -0.0159606933594, -0.0252685546875, -0.0191040039062, 
--0.0136413574219, -0.00714111328125, -0.00894165039062, -0.0130615234375, -0.00497436523438, -0.00030517578125, -0.0030517578125, -0.00311279296875, 
-0.00228881835938, 0.0035400390625, 0.003662109375, 0.00970458984375, 0.00912475585938, 0.0143127441406, 0.0226135253906, 0.00872802734375, 
--0.0123596191406, -0.0208435058594, -0.0308227539062, -0.0272521972656, -0.00436401367188, 0.0035400390625, -0.00750732421875, -0.0155639648438, 
--0.0186767578125, -0.0165710449219, -0.00469970703125, 0.000762939453125, -0.00341796875, -0.0076904296875, -0.0111999511719, -0.00942993164062, 
-0.003662109375, 0.00650024414062, -0.0064697265625, -0.0269165039062, -0.0433044433594, -0.0406188964844, -0.0273742675781, -0.0200805664062, 
--0.0171813964844, -0.0282592773438, -0.0411987304688, -0.0281982421875, -0.00177001953125, 0.0137939453125, 0.0035400390625, -0.019775390625, 
--0.0245666503906, -0.00994873046875, 0.00106811523438, 0.00482177734375, -0.0018310546875, -0.0197143554688, -0.0273132324219, -0.00808715820312, 
-0.0132751464844, 0.00650024414062, -0.010986328125, -0.0181274414062, -0.0164184570312, -0.00686645507812, -0.00381469726562, -0.00888061523438, 
--0.00637817382812, 0.000335693359375, 0.0114135742188, 0.0303649902344, 0.0357666015625, 0.0177917480469, -0.00228881835938, -0.0151977539062, 
--0.00588989257812, 0.01416015625, 0.00531005859375, -0.0184020996094, -0.0184936523438, -0.0025634765625, 0.00570678710938, 0.0086669921875, 
-0.00961303710938, 0.00198364257812, -0.00338745117188, 0.0109558105469, 0.0296630859375, 0.0322265625, 0.0190124511719, 0.0115661621094, 
-0.0214538574219, 0.029052734375, 0.0198364257812, 0.00689697265625, -0.00225830078125, -0.0107421875, -0.0105590820312, -0.006103515625, 
--0.00344848632812, -0.00079345703125, -0.00381469726562, -0.00701904296875, 0.00250244140625, 0.0134582519531, 0.00888061523438, -0.00112915039062, 
--0.0015869140625, 0.00234985351562, 0.00253295898438, -0.00131225585938, -0.0074462890625, -0.00881958007812, -0.00372314453125, -0.00042724609375, 
-0.000213623046875, 0.00244140625, 0.00665283203125, 0.0153198242188, 0.0185241699219, 0.0113830566406, 0.00149536132812, -6.103515625e-05, 
-0.0093994140625, 0.0237426757812, 0.0299377441406, 0.02294921875, 0.0163269042969, 0.0177307128906, 0.0151672363281, 0.0116271972656, 
-0.0152587890625, 0.015869140625, 0.00857543945312, 0.00823974609375, 0.0143737792969, 0.0150451660156, 0.02197265625, 0.0321044921875, 
-0.0338745117188, 0.0393371582031, 0.0402526855469, 0.0205993652344, 0.0030517578125, 0.00570678710938, 0.00787353515625, 0.00921630859375, 
-0.0126342773438, 0.0003662109375, -0.0081787109375, 0.00173950195312, 0.00833129882812, 0.0261840820312, 0.03173828125, 0.0113830566406, 
-0.00930786132812, 0.00497436523438, -0.00808715820312, 0.008056640625, 0.024169921875, 0.0153198242188, 0.00283813476562, -0.00216674804688, 
--0.000213623046875, 0.0110778808594, 0.0124206542969, 0.00277709960938, -0.00546264648438, -0.00860595703125, 0.00369262695312, 0.0166931152344, 
-0.0100708007812, -0.0064697265625, -0.00732421875, -0.0030517578125, -0.00228881835938, 0.00830078125, 0.0201416015625, 0.0108947753906, 
-0.0025634765625, 0.0125732421875, 0.0134582519531, -0.0023193359375, 0.0111694335938, 0.0199279785156, -0.00607299804688, -0.0257263183594, 
--0.0296936035156, -0.0158081054688, -0.00762939453125, -0.0210266113281, -0.01953125, -0.0181579589844, -0.0302734375, -0.0230712890625, 
--0.0132141113281, -0.0287475585938, -0.061279296875, -0.087890625, -0.0793151855469, -0.0348815917969, -0.0157775878906, -0.0306396484375, 
--0.0213928222656, 0.00970458984375, 0.0252685546875, 0.0335693359375, 0.043212890625, 0.0328674316406, 0.0170593261719, 0.00918579101562, 
-0.00921630859375, 0.0238647460938, 0.0289916992188, 0.0113220214844, -0.0098876953125, -0.0335083007812, -0.0341186523438, -0.00955200195312, 
-0.00177001953125, -0.00433349609375, -0.0149536132812, -0.0209350585938, -0.0265502929688, -0.0221862792969, 0.00588989257812, 0.0357055664062, 
-0.0274353027344, -0.0149841308594, -0.0491943359375, -0.0370788574219, 0.0042724609375, 0.0345458984375, 0.0396118164062, 0.00579833984375, 
--0.0473327636719, -0.0625915527344, -0.0354614257812, -0.0192260742188, -0.0140380859375, 0.00167846679688, 0.0182495117188, 0.0207214355469, 
-0.0112609863281, 0.00341796875, 0.0206909179688, 0.0477905273438, 0.0606994628906, 0.034912109375, -0.014892578125, -0.0406494140625, 
--0.0346374511719, -0.0278625488281, -0.0234375, -0.0219421386719, -0.0270690917969, -0.0262756347656, -0.00692749023438, 0.00662231445312, 
--0.00347900390625, -0.0111999511719, -0.00949096679688, -0.00277709960938, 0.0245056152344, 0.0311584472656, -0.00653076171875, -0.0227661132812, 
--0.00732421875, -0.00820922851562, -0.0158386230469, -0.0271301269531, -0.0350036621094, -0.0223083496094, -0.00534057617188, -0.00732421875, 
--0.00350952148438, 0.006103515625, 0.00485229492188, -0.00888061523438, -0.0213928222656, -0.0149841308594, 0.0106811523438, 0.0160522460938, 
--0.00271606445312, 0.00335693359375, 0.0201110839844, 0.0138854980469, 0.0185852050781, 0.038330078125, 0.0416259765625, 0.0301513671875, 
-0.0255126953125, 0.0184631347656, 0.00677490234375, 0.021240234375, 0.0369567871094, 0.0215454101562, 0.00552368164062, 0.0110778808594, 
-0.0278015136719, 0.0396728515625, 0.0302734375, 0.0185241699219, 0.0286560058594, 0.0332641601562, 0.0259704589844, 0.0459594726562, 
-0.0495910644531, 0.028564453125, 0.0395202636719, 0.0505676269531, 0.0542602539062, 0.0851440429688, 0.107971191406, 0.0802612304688, 
-0.0269775390625, 0.0126647949219, 0.0552673339844, 0.0760498046875, 0.0313415527344, -0.0172729492188, -0.0232849121094, -0.0177001953125, 
--0.00543212890625, -0.0140380859375, -0.0165710449219, -0.00534057617188, -0.0172424316406, -0.0754699707031, -0.142028808594, -0.184295654297, 
--0.133361816406, 0.0744018554688, 0.204650878906, 0.0907592773438, 0.00347900390625, 0.0579223632812, 0.0733337402344, 0.0888061523438, 
-0.0870971679688, 0.0368957519531, 0.0334167480469, 0.0552062988281, 0.003173828125, -0.0530700683594, -0.0256042480469, -0.00674438476562, 
--0.0242614746094, 0.0570678710938, 0.100677490234, -0.0364990234375, -0.110015869141, -0.100280761719, -0.107269287109, -0.0677185058594, 
--0.0240478515625, -0.0625915527344, -0.113647460938, -0.146636962891, -0.08984375, -0.0133972167969, -0.0934143066406, -0.211944580078, 
--0.225769042969, -0.221954345703, -0.257934570312, -0.308959960938, -0.317230224609, -0.246429443359, -0.235992431641, -0.271331787109, 
--0.2412109375, -0.293029785156, -0.298553466797, -0.109313964844, -0.0504150390625, -0.162170410156, -0.229034423828, -0.255523681641, 
--0.234130859375, -0.151458740234, -0.099853515625, -0.0448913574219, -0.0457763671875, -0.146179199219, -0.178100585938, -0.12255859375, 
--0.0282287597656, 0.0782165527344, 0.0734252929688, 0.0273742675781, 0.0556640625, 0.143402099609, 0.240783691406, 0.217681884766, 
-0.122802734375, 0.0872192382812, 0.07373046875, 0.107116699219, 0.158111572266, 0.124206542969, 0.133605957031, 0.176635742188, 
-0.160064697266, 0.171844482422, 0.145263671875, 0.0929870605469, 0.123382568359, 0.157623291016, 0.180999755859, 0.151000976562, 
-0.047119140625, 0.0636901855469, 0.203826904297, 0.286895751953, 0.331237792969, 0.345031738281, 0.285675048828, 0.227844238281, 
-0.249938964844, 0.271179199219, 0.25830078125, 0.271697998047, 0.331970214844, 0.334442138672, 0.189514160156, 0.067626953125, 
-0.165283203125, 0.348937988281, 0.418304443359, 0.353118896484, 0.194641113281, 0.120269775391, 0.134948730469, 0.142730712891, 
-0.214080810547, 0.201416015625, 0.109008789062, 0.119995117188, 0.0418395996094, -0.0715637207031, 0.0251159667969, 0.0908508300781, 
-0.0426025390625, 0.0573120117188, 0.05078125, -0.0324096679688, -0.0643005371094, 0.0137939453125, 0.0657653808594, -0.0101623535156, 
--0.107696533203, -0.175018310547, -0.196838378906, -0.149047851562, -0.109069824219, -0.106781005859, -0.148559570312, -0.215942382812, 
--0.226318359375, -0.196166992188, -0.146636962891, -0.114379882812, -0.123474121094, -0.110198974609, -0.078369140625, -0.0869445800781, 
--0.130798339844, -0.158843994141, -0.146728515625, -0.130737304688, -0.148986816406, -0.179656982422, -0.202392578125, -0.171539306641, 
--0.117340087891, -0.134002685547, -0.119323730469, -0.109191894531, -0.165802001953, -0.128784179688, -0.032958984375, -0.009521484375, 
-0.0076904296875, -0.0015869140625, -0.0129699707031, -0.00302124023438, -0.0208435058594, -0.0310668945312, -0.00997924804688, 0.0140380859375, 
-0.0411376953125, 0.0335083007812, -0.0234680175781, -0.0607604980469, -0.038818359375, 0.0040283203125, 0.0296630859375, 0.00894165039062, 
--0.0455017089844, -0.0692138671875, -0.074462890625, -0.0812377929688, -0.0565490722656, -0.0264282226562, -0.0459899902344, -0.0849914550781, 
--0.0804748535156, -0.100006103516, -0.114166259766, -0.0320434570312, 0.022705078125, -0.0215454101562, -0.0682983398438, -0.102203369141, 
--0.0999755859375, -0.0481872558594, 0.00167846679688, 0.0510559082031, 0.0898132324219, 0.0398559570312, -0.06103515625, -0.100921630859, 
--0.05810546875, -0.00100708007812, -0.006103515625, -0.0148315429688, -0.0296936035156, -0.0993957519531, -0.118774414062, -0.0357666015625, 
-0.0329895019531, 0.0313110351562, -0.0104675292969, -0.01220703125, -0.00405883789062, -0.05126953125, -0.0781555175781, -0.0610961914062, 
--0.0485534667969, -0.0359802246094, -0.00994873046875, -0.00741577148438, -0.0548706054688, -0.0494689941406, 0.0154113769531, 0.00433349609375, 
--0.0285339355469, -0.032470703125, -0.0749816894531, -0.140228271484, -0.138122558594, -0.073974609375, -0.0467529296875, -0.0696411132812, 
--0.0921630859375, -0.101379394531, -0.0720825195312, -0.0220336914062, -0.0248718261719, -0.0521545410156, -0.0606689453125, -0.0484313964844, 
--0.00411987304688, 0.0459899902344, 0.0752868652344, 0.0985412597656, 0.113555908203, 0.112823486328, 0.0951538085938, 0.0669250488281, 
-0.0718078613281, 0.0915832519531, 0.0738220214844, 0.067138671875, 0.0913696289062, 0.0868225097656, 0.0442810058594, 0.0269470214844, 
-0.0587768554688, 0.074462890625, 0.0621948242188, 0.0594177246094, 0.0474548339844, 0.022216796875, 0.0231628417969, 0.0528869628906, 
-0.0824890136719, 0.0984191894531, 0.0828247070312, 0.0765991210938, 0.0828857421875, 0.0592041015625, 0.0480041503906, 0.0579528808594, 
-0.0789489746094, 0.12890625, 0.133270263672, 0.06982421875, 0.0318298339844, 0.0263061523438, 0.0340576171875, 0.0823059082031, 
-0.106018066406, 0.0709533691406, 0.029296875, -0.0140380859375, -0.035400390625, 0.0198669433594, 0.0770263671875, 0.060302734375, 
-0.0382995605469, 0.0810852050781, 0.14306640625, 0.165313720703, 0.135986328125, 0.0914306640625, 0.0979309082031, 0.102081298828, 
-0.0490112304688, 0.0220336914062, 0.0204772949219, -0.0323486328125, -0.0476379394531, -0.00820922851562, 0.00485229492188, -0.00274658203125, 
--0.00668334960938, 0.0197143554688, 0.044677734375, -0.0154418945312, -0.0974731445312, -0.0840454101562, -0.0096435546875, 0.0190124511719, 
--0.0204162597656, -0.0416870117188, -0.0394287109375, -0.0601501464844, -0.0657348632812, -0.0284118652344, -0.025634765625, -0.0675048828125, 
--0.0758666992188, -0.0202941894531, 0.0282592773438, 0.0169677734375, -0.0204772949219, -0.0212707519531, 0.0230712890625, 0.0521850585938, 
-0.0438232421875, 0.052978515625, 0.100036621094, 0.127563476562, 0.102813720703, 0.0579833984375, 0.044189453125, 0.0552673339844, 
-0.0699768066406, 0.0668640136719, 0.0401611328125, -0.0152282714844, -0.0614929199219, -0.0321044921875, 0.0313110351562, 0.0454406738281, 
-0.0342712402344, -0.00186157226562, -0.037841796875, -0.0443115234375, -0.0537109375, -0.106567382812, -0.166351318359, -0.188537597656, 
--0.155609130859, -0.0990905761719, -0.0691833496094, -0.117309570312, -0.203186035156, -0.235504150391, -0.208465576172, -0.144653320312, 
--0.100555419922, -0.106597900391, -0.139343261719, -0.143371582031, -0.118377685547, -0.0988464355469, -0.0648803710938, -0.0297241210938, 
--0.0381164550781, -0.0629272460938, -0.101470947266, -0.102325439453, -0.0223693847656, 0.0398254394531, 0.0441284179688, 0.0093994140625, 
--0.0253295898438, 0.0144653320312, 0.0993957519531, 0.124176025391, 0.121704101562, 0.138366699219, 0.136322021484, 0.0948181152344, 
-0.0486450195312, 0.0305480957031, 0.0401000976562, 0.049560546875, 0.053466796875, 0.0844116210938, 0.107147216797, 0.0586547851562, 
-0.0054931640625, 0.00164794921875, 0.0170593261719, 0.0201416015625, 0.0140380859375, 0.004150390625, -0.00704956054688, 0.0118408203125, 
-0.0537414550781, 0.0831298828125, 0.0914611816406, 0.0475463867188, -0.0157470703125, -0.0168151855469, 0.0154418945312, 0.0380249023438, 
-0.0369262695312, -0.000640869140625, -0.0139770507812, 0.0369262695312, 0.0790100097656, 0.0640869140625, 0.0718994140625, 0.170440673828, 
-0.263458251953, 0.22607421875, 0.112396240234, 0.0331115722656, 0.0574340820312, 0.151794433594, 0.147216796875, 0.0086669921875, 
--0.0750427246094, -0.0395812988281, 0.01708984375, 0.0617370605469, -0.00506591796875, -0.123565673828, -0.0966796875, 0.00787353515625, 
-0.0482177734375, 0.0116882324219, -0.0980224609375, -0.145080566406, -0.0790100097656, -0.00607299804688, 0.0322875976562, 0.0339965820312, 
--0.0122985839844, -0.0723876953125, -0.0884094238281, -0.0440979003906, 0.001220703125, -0.00335693359375, -0.0340576171875, -0.08935546875, 
--0.10986328125, -0.0825500488281, -0.0849609375, -0.103118896484, -0.0600891113281, -0.0232543945312, -0.0380859375, -0.0523376464844, 
--0.0517578125, -0.0445251464844, 0.0104370117188, 0.0443725585938, 0.0257263183594, 0.0281066894531, 0.00833129882812, -0.0915222167969, 
--0.15869140625, -0.117126464844, 0.0128479003906, 0.109527587891, 0.0814819335938, -0.0128479003906, -0.107971191406, -0.114379882812, 
--0.0307312011719, 0.01416015625, -0.0137329101562, -0.0596923828125, -0.120208740234, -0.12060546875, -0.0560302734375, -0.0265197753906, 
--0.0360412597656, 0.00564575195312, 0.107818603516, 0.156036376953, 0.0855712890625, -0.0487976074219, -0.107696533203, -0.0267639160156, 
-0.0532836914062, 0.0138549804688, -0.0958557128906, -0.183166503906, -0.134185791016, 0.00515747070312, 0.102386474609, 0.0946960449219, 
--0.0340881347656, -0.148651123047, -0.133148193359, -0.0393676757812, 0.0680847167969, 0.0908813476562, 0.0259094238281, -0.0202331542969, 
--0.0242309570312, -0.00955200195312, 0.0205688476562, 0.0462036132812, 0.0467834472656, 0.00909423828125, -0.0285949707031, -0.0535583496094, 
--0.0597839355469, -0.0154418945312, 0.0445556640625, 0.0412292480469, 0.00637817382812, -0.0215148925781, -0.0387268066406, -0.0106506347656, 
-0.0116577148438, -0.0181579589844, -0.0323181152344, -0.00665283203125, 0.0242004394531, 0.0423889160156, 0.00241088867188, -0.0635986328125, 
--0.053466796875, 0.00747680664062, 0.0247192382812, -0.00704956054688, -0.0276489257812, -0.0231628417969, -0.00732421875, 0.0104064941406, 
-0.00982666015625, 0.0042724609375, -0.0020751953125, -0.0375061035156, -0.0513916015625, -0.021240234375, 0.00698852539062, 0.04443359375, 
-0.0640869140625, 0.0459289550781, 0.0248413085938, 0.00900268554688, 0.0218811035156, 0.0504760742188, 0.0485534667969, 0.0416259765625, 
-0.0516967773438, 0.0682373046875, 0.0926208496094, 0.0966796875, 0.0771484375, 0.0595703125, 0.0360107421875, 0.0326843261719, 
-0.0659790039062, 0.0696105957031, 0.0304870605469, -0.0081787109375, -0.0210571289062, -0.00146484375, 0.0171508789062, 0.00497436523438, 
--0.00143432617188, 0.0074462890625, 0.0231628417969, 0.0175170898438, -0.0188598632812, -0.0250854492188, 0.0166625976562, 0.038330078125, 
-0.0245666503906, 0.00921630859375, 0.0100708007812, 0.0259704589844, 0.0531921386719, 0.0672302246094, 0.0611572265625, 0.0514221191406, 
-0.0315551757812, 0.0233764648438, 0.0315551757812, 0.0227355957031, 0.00518798828125, -0.013916015625, -0.0186157226562, -0.0106201171875, 
--0.0255126953125, -0.0487365722656, -0.0436096191406, -0.0266723632812, -0.0136108398438, 0.00680541992188, 0.0115051269531, -0.0108947753906, 
--0.00973510742188, 0.00054931640625, -0.00369262695312, -0.018310546875, -0.0594482421875, -0.0662841796875, -0.02392578125, -0.00680541992188, 
-0.00592041015625, 0.0296630859375, 0.0261535644531, 0.017578125, 0.01025390625, -0.0177001953125, -0.0423583984375, -0.0226745605469, 
-0.03173828125, 0.0693054199219, 0.072265625, 0.0667419433594, 0.052490234375, 0.0328369140625, 0.0238647460938, -0.00442504882812, 
--0.0420532226562, -0.0402526855469, -0.027587890625, -0.00909423828125, 0.0279235839844, 0.0421447753906, 0.0124816894531, -0.00881958007812, 
-0.000518798828125, 0.00091552734375, -0.0125732421875, 0.001220703125, 0.0263977050781, 0.0246276855469, 0.00527954101562, -0.00802612304688, 
--0.0130310058594, -0.0125732421875, -0.00247192382812, 0.00851440429688, -0.00384521484375, -0.0252685546875, -0.0147399902344, -0.00030517578125, 
-0.00344848632812, 0.0173950195312, 0.0238342285156, 0.0151977539062, 0.00799560546875, -0.00588989257812, -0.00540161132812, 0.00262451171875, 
--0.01708984375, -0.0160217285156, 0.0183715820312, 0.0129089355469, -0.0202941894531, -0.0388488769531, -0.0408325195312, -0.0185852050781, 
--0.0015869140625, -0.0110473632812, -0.0185546875, -0.0172424316406, -0.0359802246094, -0.0384826660156, -0.00265502929688, 0.0216979980469, 
-0.0134582519531, -0.0161437988281, -0.0338134765625, -0.02490234375, -0.0191650390625, -0.00833129882812, 0.00567626953125, 0.00286865234375, 
-0.006103515625, -6.103515625e-05, -0.000518798828125, 0.0223693847656, 0.0282592773438, 0.017822265625, 0.0177612304688, 0.0064697265625, 
--0.0234375, -0.0369262695312, -0.0292663574219, -0.0211181640625, 0.00567626953125, 0.0248718261719, -0.0114440917969, -0.064697265625, 
--0.0801696777344, -0.0698547363281, -0.0508422851562, -0.0279235839844, -0.0140991210938, -0.0195617675781, -0.0280151367188, -0.0256652832031, 
--0.0128479003906, -0.0105285644531, -0.0154724121094, -0.027587890625, -0.028564453125, 0.002685546875, 0.02392578125, -0.00149536132812, 
--0.0460510253906, -0.068603515625, -0.0558471679688, -0.0126953125, 0.0346374511719, 0.0506286621094, 0.0240478515625, 0.00347900390625, 
-0.0197448730469, 0.0357360839844, 0.050537109375, 0.0274963378906, -0.015625, -0.0069580078125, -0.0260925292969, -0.111053466797, 
--0.0830383300781, 0.211608886719, 0.247406005859, -0.138427734375, -0.202209472656, 0.0347900390625, 0.062255859375, 0.0963745117188, 
-0.126403808594, -0.01123046875, -0.106262207031, 6.103515625e-05, 0.0668334960938, 0.0162353515625, 0.0706787109375, 0.119689941406, 
-0.00180053710938, -0.0623474121094, -0.0447998046875, -0.144470214844, -0.195465087891, 0.00704956054688, 0.107971191406, -0.07763671875, 
--0.126647949219, 0.0132751464844, 0.0198669433594, -0.0281372070312, 0.0161437988281, 0.0172424316406, -0.0222473144531, 0.0059814453125, 
-0.0328979492188, 0.0146484375, 0.00790405273438, 0.0323181152344, 0.0141296386719, -0.0766906738281, -0.0433654785156, 0.0641174316406, 
-0.00613403320312, -0.0957946777344, -0.0910034179688, -0.119964599609, -0.106323242188, 0.027587890625, 0.0157165527344, -0.0963134765625, 
--0.0612487792969, 0.0174255371094, -0.00238037109375, -0.0303344726562, 0.0207214355469, 0.0934143066406, 0.0650329589844, -0.0010986328125, 
--0.00308227539062, 0.00881958007812, 0.0445556640625, 0.103576660156, 0.08740234375, 0.0436096191406, 0.0330200195312, 0.0195617675781, 
-0.0199584960938, 0.0350036621094, 0.0362854003906, 0.0616149902344, 0.0585632324219, 0.0127563476562, -0.0105285644531, -0.0098876953125, 
--0.00283813476562, 0.0148620605469, -0.0182800292969, -0.0597229003906, -0.0276794433594, 0.0174560546875, 0.0230712890625, 0.0236206054688, 
-0.00128173828125, -0.0142517089844, 0.0297241210938, 0.0541687011719, 0.0157775878906, -0.00289916992188, 0.0194702148438, 0.0346069335938, 
-0.0220031738281, -0.00332641601562, -0.00323486328125, 0.017333984375, 0.0399475097656, 0.037841796875, -0.00189208984375, -0.0135803222656, 
-0.0236511230469, 0.0299682617188, 0.0376586914062, 0.0670776367188, 0.0429077148438, 0.0201416015625, 0.052490234375, 0.0657043457031, 
-0.0614929199219, 0.0596618652344, 0.0305480957031, -0.00018310546875, -0.0101623535156, 0.000396728515625, 0.018310546875, 0.0165100097656, 
-0.0137023925781, 0.0348205566406, 0.0240173339844, -0.0233764648438, 0.0256958007812, 0.113891601562, 0.0933532714844, 0.057373046875, 
-0.0698852539062, 0.06201171875, 0.0485229492188, 0.0480346679688, 0.0409545898438, 0.038818359375, 0.0374755859375, 0.0377807617188, 
-0.0326538085938, -0.00531005859375, -0.0459594726562, -0.0464782714844, -0.0113525390625, 0.020751953125, -0.0023193359375, -0.0438232421875, 
--0.0515747070312, -0.0465698242188, -0.03759765625, -0.0312805175781, -0.03271484375, -0.0296936035156, -0.0357360839844, -0.0267944335938, 
--0.00152587890625, 0.0141906738281, 0.0231018066406, 0.006103515625, -0.0222473144531, -0.0245971679688, -0.0227355957031, -0.0355529785156, 
--0.0493469238281, -0.0583190917969, -0.0756530761719, -0.0718688964844, -0.0393676757812, -0.0242309570312, -0.0519714355469, -0.0614318847656, 
--0.0458374023438, -0.0462951660156, -0.0609130859375, -0.049072265625, -0.0193176269531, -0.0310668945312, -0.0446472167969, -0.0230407714844, 
--0.04248046875, -0.06689453125, -0.0498657226562, -0.0424499511719, -0.0512084960938, -0.0581665039062, -0.061279296875, -0.0535278320312, 
--0.0707702636719, -0.095947265625, -0.0695495605469, -0.0134887695312, -0.0213012695312, -0.0960388183594, -0.10205078125, -0.0361328125, 
--0.0114440917969, -0.00860595703125, -0.0238647460938, -0.0602111816406, -0.0691833496094, -0.0498046875, 0.0107421875, 0.0491333007812, 
-0.0130310058594, 0.00048828125, 0.0254211425781, 0.0136108398438, 0.00537109375, 0.0422058105469, 0.0675964355469, 0.0520324707031, 
-0.0378723144531, 0.0374450683594, 0.0286560058594, 0.0340881347656, 0.0633544921875, 0.0736389160156, 0.0426025390625, 0.02294921875, 
-0.0203552246094, 0.00250244140625, -0.005615234375, -0.00506591796875, -0.00445556640625, 0.000762939453125, -0.0161743164062, -0.017578125, 
-0.0163269042969, 0.00888061523438, -0.0167541503906, 0.00448608398438, 0.0258483886719, 0.0216674804688, 0.0206909179688, 0.0289306640625, 
-0.0140380859375, -0.0135803222656, -0.00930786132812, 0.009765625, 0.00762939453125, -0.0102233886719, -0.008056640625, -3.0517578125e-05, 
--0.00631713867188, 0.00369262695312, 0.0303955078125, 0.00778198242188, -0.0221557617188, -0.00933837890625, -0.0154724121094, -0.0147094726562, 
-0.0125427246094, -0.001220703125, -0.0171203613281, 0.0100708007812, 0.0253295898438, 0.0222473144531, 0.031982421875, 0.0445251464844, 
-0.0584106445312, 0.0748901367188, 0.0906677246094, 0.0889892578125, 0.0692138671875, 0.051025390625, 0.0347290039062, 0.04248046875, 
-0.0707702636719, 0.0642700195312, 0.0208435058594, -0.023193359375, -0.0320434570312, -0.00430297851562, 0.0186462402344, 0.0191345214844, 
-0.00576782226562, -0.01708984375, -0.0155944824219, 0.00985717773438, 0.01123046875, 0.00790405273438, 0.0133972167969, 0.0171203613281, 
-0.027587890625, 0.0256042480469, -0.004150390625, -0.0379028320312, -0.0368041992188, -0.0263671875, -0.0198364257812, 0.0165100097656, 
-0.0359802246094, -0.00265502929688, -0.0296020507812, -0.0439453125, -0.0792541503906, -0.0575256347656, 0.0142822265625, 0.017822265625, 
--0.0260009765625, -0.00152587890625, 0.0442199707031, 0.0258483886719, 0.0245666503906, 0.04833984375, 0.0124816894531, -0.0148010253906, 
--0.012451171875, -0.0239868164062, -0.0157470703125, 0.00900268554688, 0.0209045410156, 0.0381164550781, 0.0172729492188, -0.0286865234375, 
--0.0233154296875, -0.0170288085938, -0.0548095703125, -0.0475463867188, -0.025146484375, -0.0397338867188, -0.0138549804688, 0.04296875, 
-0.0536193847656, 0.0390014648438, 0.0143432617188, -0.03125, -0.0556335449219, -0.0435485839844, -0.043701171875, -0.0692138671875, 
--0.105133056641, -0.124114990234, -0.0773620605469, -0.00314331054688, 0.028076171875, 0.0335083007812, 0.0185546875, -0.0226745605469, 
--0.0616455078125, -0.0623168945312, -0.00466918945312, 0.0519104003906, 0.0456237792969, 0.0168151855469, -0.00503540039062, -0.0352478027344, 
--0.053955078125, -0.0420837402344, -0.0199584960938, -0.0188598632812, -0.0391235351562, -0.0786437988281, -0.0963439941406, -0.0711975097656, 
--0.0332946777344, 0.0270690917969, 0.0569152832031, 0.0122375488281, -0.0108337402344, 0.00881958007812, -0.00189208984375, -0.00775146484375, 
--0.005859375, -0.0355224609375, -0.0339050292969, -0.00668334960938, -0.0201110839844, -0.0109252929688, 0.0438842773438, 0.0656127929688, 
-0.0545349121094, 0.0471801757812, 0.0289916992188, 0.003173828125, 0.00686645507812, 0.0514831542969, 0.0862731933594, 0.0715637207031, 
-0.0460510253906, 0.0494689941406, 0.0611572265625, 0.0574035644531, 0.0419921875, 0.008056640625, -0.019775390625, 0.0114135742188, 
-0.0687255859375, 0.0881652832031, 0.0798950195312, 0.0751647949219, 0.0714111328125, 0.0553894042969, 0.0382995605469, 0.0245361328125, 
-0.00149536132812, -0.0127258300781, -0.00411987304688, -0.00650024414062, -0.00772094726562, 0.00985717773438, 0.0288391113281, 0.0224609375, 
--0.0161437988281, -0.0386657714844, -0.0210571289062, 0.0148010253906, 0.0387573242188, 0.0226135253906, -0.0018310546875, -0.00576782226562, 
--0.00869750976562, 0.00222778320312, 0.0209655761719, 0.0218505859375, -0.00320434570312, -0.0271606445312, -0.0168762207031, 0.00634765625, 
-0.0232543945312, 0.0281982421875, 0.00634765625, -0.00848388671875, 0.00570678710938, 0.0247192382812, 0.0250549316406, 0.0133056640625, 
-0.0129089355469, 0.0145874023438, 0.00387573242188, 0.00115966796875, 0.00537109375, 0.0078125, 0.0166625976562, 0.0192565917969, 
-0.00198364257812, -0.0125122070312, -0.0126647949219, -0.00869750976562, -0.0128784179688, -0.0201721191406, -0.0212707519531, -0.0105285644531, 
--0.00311279296875, -0.0130615234375, -0.0232238769531, -0.0379638671875, -0.043212890625, -0.0201416015625, -0.0492553710938, -0.105316162109, 
--0.100555419922, -0.0840759277344, -0.0766296386719, -0.0558166503906, -0.0574645996094, -0.0653991699219, -0.0580139160156, -0.0420837402344, 
--0.0289001464844, -0.0325317382812, -0.0452270507812, -0.0424499511719, -0.0307312011719, -0.0187683105469, -0.00802612304688, -0.00030517578125, 
-0.001953125, 0.000946044921875, -0.00634765625, -0.0103759765625, 0.008056640625, 0.029541015625, 0.0398559570312, 0.0456237792969, 
-0.0346069335938, 0.0263671875, 0.052001953125, 0.0537109375, 0.0351257324219, 0.0457763671875, 0.0413208007812, 0.0119934082031, 
--0.0103454589844, -0.0296630859375, -0.0162048339844, 0.0176086425781, 0.025146484375, 0.0264587402344, 0.00582885742188, -0.0308532714844, 
--0.0333251953125, -0.0150451660156, 0.00827026367188, 0.0368957519531, 0.0248718261719, -0.0164184570312, -0.021484375, 0.00717163085938, 
-0.0340576171875, 0.0409545898438, 0.0253601074219, 0.00823974609375, 0.00067138671875, -0.0047607421875, 0.0047607421875, 0.0191650390625, 
-0.0180358886719, 0.000213623046875, -0.0288696289062, -0.0307312011719, -0.0115356445312, -0.00247192382812, -0.0035400390625, -0.0196533203125, 
--0.0374755859375, -0.0351867675781, -0.0253295898438, -0.0110168457031, -0.00457763671875, -0.00506591796875, 0.00234985351562, 0.011474609375, 
-0.0118713378906, 0.00961303710938, 0.0136108398438, 0.0216369628906, 0.0305480957031, 0.0511474609375, 0.0794067382812, 0.07568359375, 
-0.0436096191406, 0.0216979980469, 0.0252075195312, 0.0269470214844, 0.00946044921875, -0.0144653320312, -0.0126647949219, 0.00875854492188, 
-0.00949096679688, -0.0208435058594, -0.0462951660156, -0.0503845214844, -0.0426940917969, -0.0317687988281, -0.0360107421875, -0.0491333007812, 
--0.0460510253906, -0.049560546875, -0.0671081542969, -0.0608215332031, -0.0315551757812, -0.00796508789062, -0.00741577148438, -0.0109252929688, 
--0.0130004882812, -0.0159912109375, -0.00860595703125, 6.103515625e-05, 0.00320434570312, 0.00845336914062, 0.006103515625, -0.00125122070312, 
--0.0032958984375, 0.000457763671875, -0.00299072265625, -0.00930786132812, 9.1552734375e-05, 0.0181579589844, 0.0302124023438, 0.0360412597656, 
-0.0380554199219, 0.0357666015625, 0.0346374511719, 0.0348815917969, 0.0348510742188, 0.0248107910156, 0.00906372070312, 0.00518798828125, 
-0.0107116699219, 0.00595092773438, -0.00469970703125, -0.0221862792969, -0.0341186523438, -0.0237731933594, -0.00347900390625, 0.0133972167969, 
-0.0150451660156, 0.00204467773438, -0.00906372070312, -0.0102233886719, -0.000762939453125, 0.00225830078125, -0.00119018554688, 0.0150756835938, 
-0.03076171875, 0.0297241210938, 0.0232849121094, 0.0091552734375, -0.0045166015625, 0.011962890625, 0.0448303222656, 0.0691223144531, 
-0.072509765625, 0.0697326660156, 0.0640563964844, 0.0601501464844, 0.0620727539062, 0.0794677734375, 0.0841674804688, 0.0481262207031, 
-0.0008544921875, 0.00845336914062, 0.0317687988281, 0.0267944335938, 0.0394592285156, 0.0270690917969, -0.0343322753906, -0.0609436035156, 
--0.0340881347656, -0.0328979492188, -0.0325622558594, 0.0029296875, 0.00408935546875, -0.0604553222656, -0.103546142578, -0.100189208984, 
--0.0621032714844, -0.0132141113281, -0.00863647460938, -0.0301818847656, -0.0397033691406, -0.0758056640625, -0.121124267578, -0.109954833984, 
--0.0778503417969, -0.04736328125, -0.00570678710938, 0.00674438476562, -0.0875549316406, -0.150024414062, -0.0653381347656, -0.0108337402344, 
-0.00338745117188, 0.0627136230469, 0.0081787109375, -0.078125, -0.0753479003906, -0.072021484375, -0.0328063964844, 0.0155029296875, 
-0.0217590332031, 0.0294494628906, 0.0145568847656, -0.0339050292969, -0.0552978515625, 0.0186462402344, 0.0988464355469, 0.0411071777344, 
--0.0318298339844, -0.0354309082031, 0.00833129882812, 0.0787658691406, 0.0234680175781, -0.0960693359375, -0.0408630371094, -0.00173950195312, 
--0.0498962402344, 0.0456848144531, 0.0785522460938, -0.018798828125, -0.0230407714844, -0.00869750976562, 0.0410766601562, 0.0755310058594, 
-0.0010986328125, 0.00177001953125, 0.0430603027344, 0.0599975585938, 0.11865234375, 0.137298583984, 0.124664306641, 0.0949401855469, 
--0.004150390625, -0.0389709472656, 0.0232238769531, 0.0830383300781, 0.101257324219, 0.0772705078125, 0.0554504394531, 0.0397033691406, 
--0.0138854980469, -0.021728515625, -0.00564575195312, -0.0241088867188, -0.0151977539062, -0.01123046875, -0.0189514160156, 0.00701904296875, 
--0.00823974609375, -0.0252685546875, 0.0355224609375, 0.0587768554688, 0.0248413085938, 0.0248718261719, 0.0156555175781, 0.00180053710938, 
-0.0176696777344, 0.00927734375, -0.0396118164062, -0.0576171875, -0.00653076171875, 0.10009765625, 0.1806640625, 0.165588378906, 
-0.0752563476562, -0.00881958007812, -0.0591125488281, -0.0946044921875, -0.111206054688, -0.115051269531, -0.0695495605469, 0.0558776855469, 
-0.138885498047, 0.105529785156, 0.0391845703125, -0.00994873046875, -0.05126953125, -0.105133056641, -0.145935058594, -0.114013671875, 
--0.0362854003906, 0.06787109375, 0.129577636719, 0.090576171875, 0.0519714355469, 0.0255432128906, -0.0321655273438, -0.078857421875, 
--0.102294921875, -0.0710144042969, -0.0127563476562, 0.0271911621094, 0.0580444335938, 0.0433349609375, 0.0277709960938, 0.0230102539062, 
--0.0258483886719, -0.061279296875, -0.0507507324219, -0.0403747558594, -0.0215759277344, 0.0, 0.00457763671875, 0.00509643554688, 
--0.00204467773438, -0.0125732421875, -0.00717163085938, -0.0130920410156, -0.0488586425781, -0.0748291015625, -0.0767211914062, -0.0753479003906, 
--0.0596618652344, -0.0228576660156, 0.002197265625, 0.0242919921875, 0.0425720214844, 0.0352478027344, 0.0103454589844, -0.0125732421875, 
--0.0189514160156, -0.0072021484375, -0.0120849609375, -0.0175170898438, 0.0013427734375, 0.014404296875, 0.0165100097656, 0.0183410644531, 
--0.00265502929688, -0.0236206054688, -0.0310974121094, -0.0489501953125, -0.0369873046875, 0.00357055664062, 0.0158996582031, 0.00973510742188, 
-0.00466918945312, 0.0, -0.00799560546875, -0.0244750976562, -0.0299072265625, -0.0397644042969, -0.0697631835938, -0.0682373046875, 
--0.0582885742188, -0.0632934570312, -0.0492553710938, -0.0428771972656, -0.0459289550781, -0.0293273925781, -0.011962890625, 0.00311279296875, 
-0.00796508789062, -0.00274658203125, -0.0206909179688, -0.0271606445312, -0.01123046875, 0.00155639648438, 0.0129699707031, 0.0215759277344, 
-0.010498046875, 0.00445556640625, 0.00750732421875, 0.000579833984375, 0.00732421875, 0.019775390625, 0.021240234375, 0.0309143066406, 
-0.0300598144531, 0.0144958496094, 0.0117492675781, -0.0042724609375, -0.0249328613281, -0.0167541503906, -0.00604248046875, -0.000335693359375, 
-0.013671875, 0.0132751464844, 0.00100708007812, 0.000213623046875, -0.00234985351562, -0.0040283203125, 0.0106811523438, 0.0153198242188, 
-0.0153503417969, 0.0333251953125, 0.0348510742188, 0.0187377929688, 0.0208740234375, 0.0289001464844, 0.0327453613281, 0.0270690917969, 
-0.0152587890625, 0.0164184570312, 0.025146484375, 0.0201416015625, 0.012451171875, 0.0159912109375, 0.00146484375, -0.0229187011719, 
--0.0167541503906, 0.0116271972656, 0.0243835449219, 0.0246276855469, 0.0162048339844, 0.000732421875, -0.0150146484375, -0.00042724609375, 
-0.0335388183594, 0.0316162109375, 0.00787353515625, 0.0107727050781, 0.0118103027344, 0.00933837890625, 0.0244445800781, 0.0318298339844, 
-0.0211486816406, 0.0125427246094, 0.0185241699219, 0.0270080566406, 0.0246887207031, 0.0171813964844, 0.0126037597656, 0.0067138671875, 
-0.0048828125, 0.00723266601562, 0.0216064453125, 0.0393676757812, 0.0307312011719, 0.00787353515625, 0.00137329101562, 0.00900268554688, 
-0.00912475585938, 0.00344848632812, 0.00906372070312, 0.00820922851562, -0.00405883789062, -0.0009765625, 0.0089111328125, 0.00216674804688, 
--0.0132751464844, -0.0227966308594, -0.0274963378906, -0.02587890625, -0.0156555175781, -0.00552368164062, -0.0104370117188, -0.0271606445312, 
--0.0181884765625, 0.00341796875, -0.00146484375, -0.00030517578125, 0.0266723632812, 0.0286865234375, 0.01171875, 0.00775146484375, 
-0.0193786621094, 0.0336303710938, 0.0294494628906, 0.0127868652344, 0.0143127441406, 0.0226745605469, 0.00247192382812, -0.033935546875, 
--0.0546569824219, -0.0539245605469, -0.0420227050781, -0.0241088867188, -0.0272216796875, -0.0389709472656, -0.0298461914062, -0.0309448242188, 
--0.0582885742188, -0.0592956542969, -0.0393981933594, -0.022705078125, 0.0006103515625, 0.00668334960938, -0.0299682617188, -0.0677185058594, 
--0.0859375, -0.0871276855469, -0.0692749023438, -0.035400390625, -0.0030517578125, 0.0173950195312, 0.0162963867188, -0.00323486328125, 
-0.003662109375, 0.0423583984375, 0.058837890625, 0.0492248535156, 0.0475463867188, 0.0432434082031, 0.0437622070312, 0.05029296875, 
-0.0302734375, -0.008056640625, -0.013916015625, 0.0125427246094, 0.025146484375, 0.00753784179688, -0.014892578125, -0.0395202636719, 
--0.0530090332031, -0.0460205078125, -0.0386047363281, -0.0323791503906, -0.0308532714844, -0.0149841308594, -0.000946044921875, 0.00582885742188, 
-0.00396728515625, -0.0303955078125, -0.0278930664062, 0.0328063964844, 0.0465393066406, 0.0259704589844, 0.0288696289062, 0.00042724609375, 
--0.0467224121094, -0.041748046875, 0.00473022460938, 0.0265502929688, 0.001708984375, -0.0305480957031, -0.0284423828125, 0.0001220703125, 
-0.0316772460938, 0.0223083496094, -0.00222778320312, 0.0227966308594, 0.0536804199219, 0.057861328125, 0.0617065429688, 0.056640625, 
-0.0541381835938, 0.0401000976562, 0.0100708007812, -0.004150390625, -0.00466918945312, 0.0182189941406, 0.0488891601562, 0.0427856445312, 
-0.0171203613281, -0.00677490234375, -0.0232238769531, -0.02392578125, 0.00650024414062, 0.0308837890625, 0.0191345214844, 0.00497436523438, 
--0.0050048828125, -0.00259399414062, 0.0281982421875, 0.0543518066406, 0.0593872070312, 0.041259765625, 0.0134582519531, 0.0178527832031, 
-0.0239868164062, 0.0231628417969, 0.0310363769531, 0.0227966308594, 0.0318298339844, 0.0534973144531, 0.0459289550781, 0.04150390625, 
-0.019775390625, -0.0135192871094, 0.00918579101562, 0.0392150878906, 0.0300903320312, 0.0202026367188, 0.0226745605469, 0.00469970703125, 
--0.00860595703125, 0.00238037109375, -0.0193481445312, -0.0354919433594, -0.0207824707031, -0.00173950195312, 0.0252990722656, 0.0254516601562, 
-0.0101928710938, 0.0032958984375, -0.0181579589844, -0.0223388671875, 0.0122680664062, 0.0359497070312, 0.008056640625, -0.0194702148438, 
--0.0216369628906, -0.0172424316406, -0.00726318359375, -0.0131225585938, -0.0292663574219, -0.0372009277344, -0.0382385253906, -0.0309448242188, 
--0.0142517089844, -0.0182189941406, -0.0439758300781, -0.0562744140625, -0.0557250976562, -0.0407104492188, -0.0252685546875, -0.0347900390625, 
--0.046630859375, -0.0411682128906, -0.0347290039062, -0.0314025878906, -0.025390625, -0.0267333984375, -0.0269470214844, -0.020751953125, 
--0.0222778320312, -0.0246887207031, -0.0133361816406, -0.0131530761719, -0.0191345214844, -0.02099609375, -0.0293884277344, -0.0350036621094, 
--0.0390319824219, -0.0422058105469, -0.0281066894531, -0.00796508789062, 0.0193786621094, 0.0314025878906, 0.0149536132812, -0.00363159179688, 
--0.0155029296875, -0.0197143554688, 0.00289916992188, 0.0345153808594, 0.0244445800781, -0.0160217285156, -0.026611328125, 0.00796508789062, 
-0.0251770019531, -0.00079345703125, -0.0430603027344, -0.0687561035156, -0.0511474609375, -0.0227355957031, -0.0220336914062, -0.0214538574219, 
--0.0246276855469, -0.0283203125, 0.0135498046875, 0.0354919433594, 0.00942993164062, -0.00030517578125, -0.0121459960938, -0.0286865234375, 
--0.00350952148438, 0.0113220214844, -0.0102233886719, -0.0178527832031, 0.00079345703125, 0.0208129882812, 0.0384521484375, 0.0465087890625, 
-0.0344543457031, 0.00933837890625, 0.00537109375, 0.0105895996094, 3.0517578125e-05, 0.000823974609375, 0.00494384765625, -0.007080078125, 
--0.00997924804688, -0.0118103027344, -0.018310546875, -0.0121765136719, -0.0028076171875, 0.00503540039062, 0.007568359375, 0.0048828125, 
-0.00509643554688, 0.00155639648438, -0.0108947753906, -0.0103759765625, 0.00265502929688, 0.00042724609375, -0.0089111328125, 0.00393676757812, 
-0.0161437988281, 0.0138549804688, 0.0189819335938, 0.0209350585938, 0.0189208984375, 0.0254211425781, 0.0231323242188, 0.0140686035156, 
-0.0144348144531, 0.0103759765625, 0.0155944824219, 0.0390930175781, 0.0393371582031, 0.0124206542969, -9.1552734375e-05, -0.00067138671875, 
--0.00604248046875, -0.00247192382812, 0.00717163085938, 0.0146789550781, 0.00787353515625, -0.00653076171875, -0.00277709960938, 0.0127563476562, 
-0.0203247070312, 0.0258483886719, 0.0215759277344, 0.00241088867188, -0.00314331054688, 0.0210571289062, 0.0477905273438, 0.0589904785156, 
-0.0428466796875, 0.0187072753906, 0.0134887695312, 0.00933837890625, -0.0057373046875, -0.00320434570312, 0.0123901367188, 0.02734375, 
-0.0316772460938, 0.00946044921875, -0.0069580078125, -0.00509643554688, -0.00042724609375, 0.00299072265625, -0.0084228515625, -0.0143432617188, 
--0.0072021484375, -0.00601196289062, -0.0112915039062, -0.0166931152344, -0.00784301757812, -0.00149536132812, -0.0074462890625, 0.001220703125, 
-0.00897216796875, 0.0198669433594, 0.0342712402344, 0.0312194824219, 0.0346374511719, 0.0379943847656, 0.0340881347656, 0.0379638671875, 
-0.0288696289062, 0.0223083496094, 0.0531005859375, 0.077880859375, 0.0545654296875, 0.0131530761719, -0.0151977539062, -0.0112915039062, 
-0.0089111328125, 0.0106506347656, -0.00616455078125, -0.0300903320312, -0.0348205566406, -0.0258483886719, -0.0361633300781, -0.0411376953125, 
--0.0246276855469, -0.00970458984375, -0.0236206054688, -0.0473937988281, -0.0569152832031, -0.0672607421875, -0.0792541503906, -0.0695190429688, 
--0.04931640625, -0.0625305175781, -0.0958557128906, -0.0960388183594, -0.0662841796875, -0.0513305664062, -0.0578002929688, -0.0413818359375, 
--0.0198669433594, -0.0296936035156, -0.0326843261719, -0.0113830566406, -0.0042724609375, -0.00469970703125, 0.0045166015625, 0.00106811523438, 
-0.00357055664062, 0.0394287109375, 0.0711059570312, 0.0576782226562, 0.0263977050781, 0.024169921875, 0.0353698730469, 0.0310668945312, 
-0.0301513671875, 0.0232849121094, -0.00875854492188, -0.0194396972656, -0.0160522460938, -0.00296020507812, 0.00643920898438, -0.0208740234375, 
--0.0140075683594, -0.0079345703125, -0.067626953125, -0.0655212402344, -0.00234985351562, 0.0184020996094, 0.000152587890625, -0.02880859375, 
--0.0279846191406, 0.0210571289062, 0.0650939941406, 0.0344848632812, 0.00689697265625, 0.0278930664062, 0.0231628417969, 0.0154724121094, 
-0.0507507324219, 0.0684204101562, 0.0470581054688, 0.0110778808594, -0.0122985839844, 0.00091552734375, 0.0379333496094, 0.0382080078125, 
-0.0087890625, -0.0187377929688, -0.01513671875, 0.02197265625, 0.0496520996094, 0.0377807617188, 0.0236206054688, 0.0219421386719, 
-0.0191040039062, 0.00885009765625, 0.00711059570312, -0.00790405273438, -0.05615234375, -0.0567626953125, 0.0165100097656, 0.0555419921875, 
-0.0197448730469, -0.0228576660156, -0.00457763671875, 0.0372924804688, 0.0444641113281, 0.0329895019531, 0.0240478515625, 0.0228576660156, 
-0.0472717285156, 0.062744140625, 0.0811157226562, 0.0647888183594, 0.00067138671875, -0.0341186523438, -0.0394897460938, -0.0443115234375, 
--0.0048828125, 0.015869140625, -0.0547180175781, -0.139343261719, -0.143371582031, -0.0686950683594, -0.0208129882812, -0.0225219726562, 
--0.0471496582031, -0.0819396972656, -0.0775146484375, -0.0744323730469, -0.102203369141, -0.110717773438, -0.089599609375, -0.0613098144531, 
--0.0270080566406, -0.00042724609375, -0.01611328125, -0.0313415527344, 0.0163269042969, 0.0318603515625, 0.0284118652344, 0.0672302246094, 
-0.0835571289062, 0.0808410644531, 0.101776123047, 0.116363525391, 0.129241943359, 0.139953613281, 0.149139404297, 0.159301757812, 
-0.120269775391, 0.0489807128906, 0.0292053222656, 0.0367126464844, 0.0325317382812, 0.0198059082031, -0.0074462890625, -0.0432739257812, 
--0.0500793457031, -0.0487365722656, -0.0763244628906, -0.0929565429688, -0.0816040039062, -0.0985717773438, -0.117095947266, -0.111663818359, 
--0.109436035156, -0.0897521972656, -0.0819702148438, -0.0967712402344, -0.08642578125, -0.0760498046875, -0.06640625, -0.037109375, 
--0.0302429199219, -0.0333862304688, -0.00485229492188, 0.0293579101562, 0.0492248535156, 0.0624084472656, 0.0667419433594, 0.0666198730469, 
-0.0707092285156, 0.0898742675781, 0.123291015625, 0.127624511719, 0.117248535156, 0.113311767578, 0.104248046875, 0.101531982422, 
-0.108947753906, 0.102752685547, 0.08935546875, 0.0738830566406, 0.0470581054688, 0.0137023925781, -0.00634765625, -0.006103515625, 
--0.00888061523438, -0.0142822265625, -0.00970458984375, -0.0193481445312, -0.0529174804688, -0.0727233886719, -0.0725708007812, -0.0787048339844, 
--0.0785217285156, -0.0719604492188, -0.0791931152344, -0.0807495117188, -0.0726318359375, -0.0684509277344, -0.0692749023438, -0.0697021484375, 
--0.0578002929688, -0.0484313964844, -0.0382995605469, -0.0216979980469, -0.0279235839844, -0.0351867675781, -0.0149841308594, -0.00164794921875, 
--9.1552734375e-05, 0.0104370117188, 0.0213012695312, 0.0389099121094, 0.0593872070312, 0.0639953613281, 0.0594787597656, 0.0448913574219, 
-0.0379943847656, 0.0399780273438, 0.0407409667969, 0.0385131835938, 0.0243530273438, -0.00115966796875, -0.0152893066406, -0.0127563476562, 
--0.00497436523438, -0.00149536132812, 0.0091552734375, 0.0104675292969, -0.00390625, -0.0047607421875, -0.00091552734375, -0.00802612304688, 
--0.0146484375, -0.0245971679688, -0.0270385742188, -0.0274047851562, -0.0343627929688, -0.0137634277344, -0.00448608398438, -0.0259094238281, 
--0.0114440917969, 0.00430297851562, -0.00360107421875, 0.00347900390625, -0.00042724609375, -0.00042724609375, 0.0129699707031, 0.00238037109375, 
-0.00360107421875, 0.0236511230469, 0.0222778320312, 0.0205078125, 0.0152893066406, 0.0186462402344, 0.0276184082031, 0.01708984375, 
-0.0287170410156, 0.0445251464844, 0.04052734375, 0.0427856445312, 0.0228271484375, 0.0028076171875, -0.00079345703125, -0.013427734375, 
--0.00650024414062, 0.0064697265625, 0.00497436523438, 0.00772094726562, -0.00906372070312, -0.0272521972656, -0.0104064941406, -0.00509643554688, 
--0.0176696777344, -0.0145874023438, -0.0167541503906, -0.0328369140625, -0.0307006835938, -0.0282287597656, -0.02880859375, -0.0126342773438, 
--0.00418090820312, -0.0122375488281, -0.0108947753906, 0.00271606445312, 0.0371704101562, 0.0675964355469, 0.0538330078125, 0.0111999511719, 
--0.011474609375, -0.0306091308594, -0.0522155761719, 0.0113525390625, 0.0852661132812, 0.0281066894531, -0.0666198730469, -0.0755920410156, 
-0.0161743164062, 0.0989990234375, 0.0091552734375, -0.107269287109, -0.0902709960938, -0.0298461914062, 0.0264282226562, 0.0347290039062, 
--0.0214233398438, -0.0473022460938, -0.0421447753906, -0.010986328125, 0.0179443359375, 0.00137329101562, 0.00131225585938, 0.0138549804688, 
--0.00469970703125, -0.00833129882812, -0.00921630859375, -0.00973510742188, 0.00949096679688, 0.029052734375, 0.03955078125, 0.0348815917969, 
-0.0216369628906, 0.0181274414062, -0.00271606445312, -0.0150146484375, 0.0179748535156, 0.0405883789062, 0.00653076171875, -0.0377807617188, 
--0.0308837890625, 0.0107727050781, 0.0330505371094, 0.0168151855469, -0.0129699707031, -0.0267028808594, -0.0263061523438, -0.0132141113281, 
-0.00509643554688, 0.0207824707031, 0.0382385253906, 0.0350036621094, -0.00201416015625, -0.00607299804688, 0.0326538085938, 0.0401306152344, 
-0.0137939453125, -0.0291748046875, -0.0556335449219, -0.018798828125, 0.0203247070312, 0.02490234375, 0.0260925292969, -0.00552368164062, 
--0.0341796875, -0.015625, 0.0013427734375, 0.00762939453125, 0.000457763671875, -0.0580444335938, -0.0706481933594, -0.0462646484375, 
--0.0474243164062, -0.0345458984375, -0.0249328613281, 0.00424194335938, 0.040283203125, 0.0250244140625, 0.0191955566406, 0.046875, 
-0.0643920898438, 0.0614318847656, -0.00479125976562, -0.0772399902344, -0.0893859863281, -0.0369567871094, 0.0599975585938, 0.0744323730469, 
-0.0250854492188, 0.0278015136719, 0.0168762207031, -0.00970458984375, -0.0121459960938, -0.00225830078125, 0.0207214355469, 0.0258483886719, 
-0.00503540039062, -0.0062255859375, -0.0006103515625, 0.00897216796875, -0.00155639648438, -0.0160217285156, -0.031494140625, -0.0301513671875, 
-0.01416015625, 0.0293273925781, -0.0382995605469, -0.0545959472656, -0.0087890625, 0.0271606445312, 0.0420227050781, 0.0206298828125, 
-0.00546264648438, -0.0153503417969, -0.0471801757812, -0.0262756347656, 0.0134582519531, 0.00897216796875, -0.0154113769531, -0.0139465332031, 
-0.00540161132812, -0.00714111328125, 0.00924682617188, 0.0517578125, 0.0482177734375, 0.0564575195312, 0.0430908203125, -0.0330810546875, 
--0.0530700683594, -0.0193176269531, -0.0304565429688, -0.0188903808594, 0.0136108398438, -0.0397033691406, -0.0593566894531, 0.0493469238281, 
-0.095947265625, 0.0505676269531, 0.0570068359375, 0.0441284179688, -0.00762939453125, -0.024658203125, -0.0013427734375, 0.0245361328125, 
-0.0184936523438, -0.00149536132812, 0.0139770507812, -0.0101318359375, -0.056640625, -0.0492553710938, -0.0447387695312, -0.0309143066406, 
-0.0222778320312, -0.00149536132812, -0.0518188476562, -0.0035400390625, 0.0132751464844, -0.0486450195312, -0.0338134765625, 0.0239562988281, 
-0.0394897460938, 0.0234680175781, -0.0337219238281, -0.0856018066406, -0.037109375, 0.0560607910156, 0.0993957519531, 0.0714111328125, 
-0.0377197265625, 0.0192260742188, 0.000946044921875, 0.00787353515625, -0.00906372070312, -0.0320129394531, 0.00711059570312, -0.00872802734375, 
--0.0758056640625, -0.0504150390625, -0.00491333007812, -0.025146484375, -0.0480651855469, -0.0558471679688, -0.0516967773438, -0.0580139160156, 
--0.0798950195312, -0.0964965820312, -0.106384277344, -0.0827026367188, -0.03125, 0.0223388671875, 0.0630493164062, 0.0726928710938, 
-0.0648193359375, 0.0687866210938, 0.0744323730469, 0.0660400390625, 0.0632019042969, 0.0513610839844, 0.0283508300781, 0.0255432128906, 
-0.0416870117188, 0.0239562988281, 0.00820922851562, 0.0263671875, 0.0154418945312, -0.0218505859375, -0.0313110351562, -0.0247192382812, 
-0.0064697265625, 0.0418090820312, 0.0451965332031, 0.0324401855469, 0.0277709960938, 0.0249938964844, 0.0308837890625, 0.0272216796875, 
--0.0037841796875, -0.0346984863281, -0.0324096679688, -0.0284729003906, -0.00839233398438, 0.0422058105469, 0.0402526855469, 0.0155029296875, 
-0.000885009765625, -0.0532836914062, -0.0726013183594, -0.0527954101562, -0.0729675292969, -0.0804748535156, -0.0356140136719, 0.0125732421875, 
-0.0216064453125, 0.0260925292969, 0.03662109375, 0.0277709960938, 0.0176696777344, 0.0110473632812, 0.0125732421875, 0.0123901367188, 
-0.00936889648438, 0.0227355957031, 0.0175170898438, 0.00509643554688, -0.00210571289062, -0.0119323730469, 0.005126953125, 0.00482177734375, 
--0.0225524902344, 0.00112915039062, 0.0310668945312, 0.0270385742188, 0.0262756347656, 0.00494384765625, -0.00775146484375, 0.03759765625, 
-0.0625610351562, 0.0300903320312, -0.0106811523438, -0.0459899902344, -0.0708923339844, -0.0802612304688, -0.104095458984, -0.121765136719, 
--0.0705871582031, -0.0204162597656, -0.0131225585938, 0.0317077636719, 0.0510864257812, 0.0223388671875, 0.0420227050781, 0.0319213867188, 
--0.000732421875, 0.0297546386719, 0.0269165039062, -0.0191345214844, -0.0269165039062, -0.022216796875, 0.00018310546875, 0.0264892578125, 
-0.0148620605469, -0.00320434570312, 0.0310668945312, 0.0636901855469, 0.0590209960938, 0.0629272460938, 0.0884704589844, 0.0870361328125, 
-0.052734375, 0.0429077148438, 0.0471801757812, 0.0243530273438, 0.0293273925781, -0.00161743164062, -0.0514526367188, -0.0162658691406, 
--0.0180358886719, -0.0439453125, 0.00225830078125, 0.00759887695312, 0.005615234375, 0.0149536132812, -0.0242919921875, -0.0317993164062, 
--0.00845336914062, -0.0174560546875, -0.0256042480469, 0.0104675292969, 0.050048828125, -0.00201416015625, -0.0851745605469, -0.113403320312, 
--0.0925903320312, -0.0104064941406, 0.0155334472656, -0.0457153320312, -0.070556640625, -0.0760803222656, -0.063720703125, -0.00509643554688, 
-0.0133666992188, 0.000335693359375, 0.0230102539062, 0.0521850585938, 0.0395202636719, 0.00869750976562, 0.0180053710938, 0.0142822265625, 
--0.0133666992188, -0.0126342773438, -0.02197265625, -0.04443359375, -0.0298461914062, -0.0121459960938, 0.00643920898438, 0.0512084960938, 
-0.0875244140625, 0.064697265625, 0.0225219726562, -0.00595092773438, -0.00930786132812, -0.006103515625, -0.00750732421875, -0.029052734375, 
--0.0664978027344, -0.0714111328125, -0.0372009277344, -0.0169677734375, -0.020751953125, -0.0177307128906, 0.00582885742188, 0.0155944824219, 
-0.00930786132812, 0.000579833984375, -0.0169067382812, -0.0208740234375, -0.0194091796875, -0.0350341796875, -0.0242614746094, -0.00680541992188, 
-0.0313110351562, 0.0928039550781, 0.0570678710938, -0.0182800292969, -0.0239562988281, 0.00106811523438, 0.0199279785156, -0.0278930664062, 
--0.0578918457031, -0.0160522460938, 0.0221862792969, 0.05810546875, 0.0530395507812, 0.0128479003906, 0.0353698730469, 0.049560546875, 
-0.0184631347656, 0.0250244140625, 0.0437927246094, 0.0732727050781, 0.100860595703, 0.0380554199219, -0.0618591308594, -0.0896301269531, 
--0.0343627929688, 0.0052490234375, -0.0343322753906, -0.0523071289062, -0.0693054199219, -0.0885314941406, -0.0296936035156, -0.0155334472656, 
--0.040771484375, 0.0057373046875, -0.00885009765625, -0.0455627441406, -0.05419921875, -0.0845947265625, -0.0454711914062, 0.0147094726562, 
-0.0247802734375, 0.0307006835938, -0.03271484375, -0.0556945800781, 0.0253295898438, 0.0379943847656, 0.0295715332031, 0.0374145507812, 
--0.0134582519531, 0.0117492675781, 0.0797424316406, 0.073486328125, 0.104156494141, 0.126251220703, 0.0566101074219, 0.0200805664062, 
-0.0403137207031, 0.0625610351562, 0.0723876953125, 0.00918579101562, -0.0667724609375, -0.0518493652344, -0.0257568359375, -0.0207214355469, 
--0.00723266601562, -0.02490234375, -0.0614624023438, -0.0804443359375, -0.0624694824219, -0.0223999023438, -0.006103515625, -0.0091552734375, 
--0.0209350585938, -0.0394897460938, -0.0296936035156, 0.0188903808594, 0.0447998046875, 0.0256652832031, 0.0081787109375, 0.00433349609375, 
--0.00228881835938, -0.0008544921875, 0.00601196289062, 0.0132141113281, 0.0318603515625, 0.0307922363281, 0.0217895507812, 0.0382385253906, 
-0.0421752929688, 0.0272521972656, 0.0149841308594, -0.0006103515625, 0.0023193359375, 0.0139465332031, 0.0243835449219, 0.0594787597656, 
-0.0753784179688, 0.0487670898438, 0.0260620117188, 0.0207824707031, 0.027587890625, 0.02734375, 0.0105895996094, -0.00253295898438, 
--0.0179443359375, -0.0339965820312, -0.033935546875, -0.0143737792969, 0.00930786132812, 0.0180358886719, 0.00567626953125, -0.0294494628906, 
--0.0508728027344, -0.0346374511719, -0.00485229492188, 0.0103454589844, 0.000152587890625, -0.0245056152344, -0.0470886230469, -0.03466796875, 
-0.0104675292969, 0.0397644042969, 0.0365600585938, 0.0301513671875, 0.0155334472656, 0.00802612304688, 0.0273132324219, 0.0111389160156, 
--0.0263977050781, -0.0293579101562, -0.0259399414062, -0.0364379882812, -0.0416870117188, -0.0298461914062, -0.0142211914062, 0.00140380859375, 
-0.0163879394531, 0.0187683105469, 0.0112609863281, 0.00625610351562, -0.0128479003906, -0.0118713378906, -0.00167846679688, -0.0289611816406, 
--0.0257873535156, 0.00234985351562, -0.0162658691406, -0.0241088867188, -0.0108947753906, -0.00949096679688, -0.00885009765625, -0.01953125, 
--0.0274963378906, -0.0188293457031, -0.01318359375, -0.007080078125, -0.0020751953125, 0.0112915039062, 0.0042724609375, -0.0361633300781, 
--0.0412902832031, -0.0209350585938, -0.00750732421875, -0.0006103515625, -0.00457763671875, 0.00320434570312, 0.00048828125, 0.0209350585938, 
-0.0637817382812, 0.0292663574219, -0.0279541015625, -0.0260009765625, -0.0108642578125, -0.00204467773438, -0.0078125, -0.0441284179688, 
--0.0679931640625, -0.0390930175781, 0.00140380859375, -0.00067138671875, -0.046630859375, -0.0550231933594, -0.0230407714844, 0.00067138671875, 
-0.00558471679688, -0.00579833984375, 0.0086669921875, 0.0266723632812, 0.0150756835938, 0.0194396972656, 0.02880859375, 0.0255737304688, 
-0.00775146484375, 0.00393676757812, 0.0213317871094, -0.00274658203125, -0.00579833984375, 0.0309448242188, 0.0076904296875, -0.0102844238281, 
-0.0198059082031, 0.0553588867188, 0.0688171386719, 0.033447265625, 0.0254211425781, 0.0733337402344, 0.0477905273438, 0.0111999511719, 
-0.0390014648438, 0.00521850585938, -0.0272521972656, 0.00933837890625, 0.0243835449219, 0.0250549316406, 0.0062255859375, -0.0177917480469, 
--0.0020751953125, 0.0084228515625, 0.0202941894531, 0.0614013671875, 0.0882873535156, 0.0558471679688, -0.0216064453125, -0.0551452636719, 
--0.0404052734375, -0.0467529296875, -0.0443420410156, -0.0318603515625, -0.0474243164062, -0.0714416503906, -0.0384826660156, 0.0121765136719, 
-0.0140075683594, 0.00921630859375, -0.019775390625, -0.0538330078125, -0.00296020507812, 0.0286560058594, -0.0079345703125, -0.0465087890625, 
--0.0625305175781, -0.0523986816406, -0.0259704589844, 0.0093994140625, 0.0281066894531, -0.003662109375, -0.0358581542969, -0.0278625488281, 
-0.006103515625, 0.0154724121094, -0.020263671875, -0.060302734375, -0.076171875, -0.062744140625, -0.056396484375, -0.0936279296875, 
--0.0746765136719, -0.0101928710938, 0.0173950195312, 0.0455627441406, 0.025634765625, -0.0314636230469, 0.000579833984375, 0.0658569335938, 
-0.0892944335938, 0.053466796875, -0.0151672363281, -0.0207214355469, 0.0339050292969, 0.0698547363281, 0.0467224121094, -0.00152587890625, 
--0.0298461914062, -0.0411682128906, -0.016357421875, 0.0201416015625, 0.0309448242188, 0.0282897949219, 0.0115966796875, 0.00299072265625, 
-0.0256652832031, 0.0411682128906, 0.0447692871094, 0.0278625488281, 0.0183410644531, 0.0211181640625, -0.00653076171875, 0.00347900390625, 
-0.0572814941406, 0.0461120605469, 0.0303955078125, 0.0455627441406, 0.0444641113281, 0.0599975585938, 0.065673828125, 0.0440979003906, 
-0.0220642089844, -0.0158081054688, -0.01904296875, 0.0133972167969, 0.0168151855469, 0.041259765625, 0.0639343261719, 0.01806640625, 
--0.0409545898438, -0.0550842285156, 0.00967407226562, 0.0660400390625, 0.0394897460938, -0.0050048828125, -0.0479736328125, -0.0843811035156, 
--0.0395812988281, 0.0112915039062, 0.00119018554688, 0.00042724609375, 0.00466918945312, -0.00155639648438, 0.0211181640625, 0.0211181640625, 
-0.00155639648438, 0.0045166015625, -0.00894165039062, -0.0166625976562, 0.00125122070312, 0.00665283203125, 0.0276184082031, 0.0410461425781, 
-0.00686645507812, -0.0307312011719, -0.0330200195312, -0.00399780273438, 0.0240478515625, 0.0159912109375, -0.0158996582031, -0.046630859375, 
--0.0305480957031, 0.02978515625, 0.0493469238281, 0.0152587890625, -0.0112915039062, -0.0113220214844, -0.00030517578125, -0.00396728515625, 
--0.0108947753906, -0.0147705078125, -0.0125427246094, 0.00418090820312, 0.0089111328125, -0.0146484375, -0.0348205566406, -0.0309143066406, 
--0.0367431640625, -0.0522766113281, -0.0588073730469, -0.0621032714844, -0.0469970703125, -0.0161437988281, -0.00631713867188, -0.0173034667969, 
--0.04150390625, -0.0425720214844, -0.0050048828125, 0.005859375, -0.0161437988281, 0.00112915039062, 0.0292358398438, 0.0360107421875, 
-0.0415649414062, 0.0391540527344, 0.0245056152344, 0.0206604003906, 0.0304565429688, 0.0231628417969, 0.00521850585938, -0.00289916992188, 
--0.0149230957031, -0.00909423828125, 0.00564575195312, -0.00665283203125, -0.0068359375, 0.00717163085938, -0.00308227539062, -0.0223999023438, 
--0.0219116210938, -0.00778198242188, -0.01220703125, -0.0425109863281, -0.0598754882812, -0.0582885742188, -0.0169067382812, 0.0425415039062, 
-0.0140991210938, -0.0425415039062, -0.0350646972656, -0.0234375, -0.0209655761719, -0.00958251953125, -0.0152282714844, -0.0372619628906, 
--0.0428466796875, -0.0263671875, -0.0160217285156, -0.00286865234375, 0.0124206542969, 0.00704956054688, 0.0219421386719, 0.04345703125, 
-0.0234680175781, 0.0228576660156, 0.0624084472656, 0.0628051757812, 0.0388793945312, 0.0486450195312, 0.0608215332031, 0.0464477539062, 
-0.0341186523438, 0.0140380859375, -0.02685546875, -0.0276794433594, 0.0221557617188, 0.0367126464844, 0.0252380371094, 0.0372009277344, 
-0.00863647460938, -0.0585327148438, -0.0623779296875, -0.0494384765625, -0.0408630371094, -0.00149536132812, -0.0143737792969, -0.0823059082031, 
--0.102203369141, -0.0674743652344, -0.0353698730469, -0.0568237304688, -0.0863342285156, -0.0785217285156, -0.065673828125, -0.0407104492188, 
--0.010009765625, -0.0444946289062, -0.0877075195312, -0.0581359863281, -0.0062255859375, 0.0224914550781, 0.0191955566406, -0.021728515625, 
--0.0486145019531, -0.0476684570312, -0.0180358886719, 0.0484619140625, 0.0691833496094, 0.0494995117188, 0.0440368652344, 0.0337524414062, 
-0.0508728027344, 0.0675048828125, 0.021728515625, 0.0162963867188, 0.0614929199219, 0.0758666992188, 0.0869140625, 0.0979309082031, 
-0.0982360839844, 0.0534057617188, -0.0212707519531, -0.00906372070312, 0.0253295898438, -0.0189208984375, -0.0276489257812, 0.017578125, 
-0.0331420898438, 0.0511779785156, 0.0682373046875, 0.0299987792969, 0.00192260742188, 0.0172424316406, 0.0181274414062, 0.0284729003906, 
-0.0649108886719, 0.0796203613281, 0.0522155761719, 0.0162048339844, 0.0340576171875, 0.0793762207031, 0.0531005859375, 0.0282897949219, 
-0.056396484375, 0.0378112792969, 0.0025634765625, 0.0263366699219, 0.0310668945312, 0.0419921875, 0.0694580078125, 0.0374145507812, 
-0.0102844238281, -0.0107727050781, -0.084228515625, -0.0731506347656, -0.0162048339844, -0.0445251464844, -0.0581665039062, -0.0668029785156, 
--0.0705261230469, 0.004638671875, 0.0437622070312, 0.029296875, 0.0127258300781, -0.0260009765625, -0.00079345703125, 0.0405578613281, 
-0.00457763671875, -0.0198669433594, -0.0338745117188, -0.05859375, -0.0441589355469, -0.0252990722656, -0.0447387695312, -0.0817565917969, 
--0.0743713378906, -0.05224609375, -0.0599975585938, -0.04833984375, -0.0210266113281, -0.00384521484375, 0.007568359375, -0.00726318359375, 
--0.0194091796875, 0.004150390625, 0.0361022949219, 0.0494995117188, 0.0281066894531, 0.00100708007812, 0.00582885742188, -0.0008544921875, 
--0.00936889648438, 0.0325927734375, 0.0373229980469, -0.0136413574219, -0.0479431152344, -0.0531616210938, -0.0284118652344, -0.01171875, 
--0.0319519042969, -0.0374755859375, -0.0271301269531, -0.0318908691406, -0.0347290039062, -0.0322570800781, -0.0159912109375, 0.0229797363281, 
-0.0251159667969, -0.00274658203125, 0.00146484375, -0.00457763671875, -0.0486755371094, -0.0608215332031, -0.0286865234375, -0.00128173828125, 
-0.0517578125, 0.112823486328, 0.0760192871094, 0.0108032226562, 0.00604248046875, -0.0113830566406, -0.0426940917969, -0.0599670410156, 
--0.0597229003906, -0.041015625, 0.00152587890625, 0.0463256835938, 0.0458679199219, 0.0318603515625, 0.006591796875, -0.0364990234375, 
--0.0191650390625, 0.0301208496094, 0.0521240234375, 0.0273132324219, 0.006591796875, 0.0513305664062, 0.0380859375, -0.0346984863281, 
--0.0472412109375, -0.0419006347656, 0.0670776367188, 0.219390869141, 0.177276611328, -0.0247192382812, -0.165161132812, -0.180145263672, 
--0.0962829589844, 0.0515747070312, 0.141235351562, 0.0626831054688, -0.0625, -0.113464355469, -0.143463134766, -0.139953613281, 
--0.0956115722656, -0.0927429199219, -0.0478820800781, 0.0838012695312, 0.110321044922, 0.0257873535156, -0.0173950195312, -0.040771484375, 
--0.0661010742188, -0.0212707519531, 0.051025390625, 0.103576660156, 0.116607666016, 0.07080078125, 0.0208740234375, -0.0298156738281, 
--0.0733947753906, -0.0445556640625, -0.00253295898438, -0.0114440917969, 0.00827026367188, 0.0259399414062, 0.034912109375, 0.0375671386719, 
-0.0295104980469, 0.0812683105469, 0.110198974609, 0.0212097167969, -0.0355529785156, -0.0227355957031, -0.0437622070312, -0.0409545898438, 
-0.0160827636719, 0.0187072753906, -0.010009765625, 0.0113525390625, 0.033935546875, 0.00421142578125, -0.0391235351562, -0.0556335449219, 
--0.0639038085938, -0.0618286132812, -0.015869140625, 0.0118103027344, 0.00946044921875, 0.0428466796875, 0.0719604492188, 0.0668640136719, 
-0.0638122558594, 0.0261840820312, -0.00979614257812, 0.0509643554688, 0.127899169922, 0.106781005859, 0.0249633789062, -0.0225524902344, 
--0.0440063476562, -0.0299682617188, 0.0526733398438, 0.0679931640625, -0.0182189941406, -0.0279541015625, -0.000518798828125, -0.0418701171875, 
--0.0663146972656, -0.0453186035156, -0.0484924316406, -0.0243225097656, 0.0452880859375, 0.0655212402344, 0.0247192382812, -0.0110473632812, 
--0.0159912109375, -0.0084228515625, 0.00155639648438, -3.0517578125e-05, -0.0728759765625, -0.12353515625, -0.0103759765625, 0.103729248047, 
-0.0563354492188, -0.026123046875, -0.0755615234375, -0.0815734863281, -0.0361633300781, 0.00872802734375, 0.0165710449219, 0.00430297851562, 
--0.00091552734375, 0.0216064453125, 0.036865234375, 0.0162658691406, -0.000640869140625, -0.00173950195312, 0.000274658203125, 0.0334167480469, 
-0.0355529785156, 0.0137023925781, 0.0374755859375, 0.050048828125, 0.0165405273438, -0.0128173828125, -0.0113830566406, 0.00445556640625, 
-0.0141906738281, 0.0180358886719, 0.0105895996094, -0.0126953125, -0.0228271484375, -0.0107116699219, -0.00253295898438, 0.00106811523438, 
-0.0255126953125, 0.0509643554688, 0.057373046875, 0.0337829589844, -0.000885009765625, -0.000152587890625, 0.025634765625, 0.0390319824219, 
-0.05126953125, 0.055419921875, 0.021484375, -0.021240234375, -0.00204467773438, 0.048828125, 0.0367736816406, -0.0231323242188, 
--0.0370483398438, -0.00653076171875, -0.00616455078125, -0.0418395996094, -0.0604248046875, -0.056396484375, -0.0504455566406, -0.0428771972656, 
--0.0472106933594, -0.0833435058594, -0.1103515625, -0.0807495117188, -0.0364990234375, -0.041015625, -0.0372619628906, -0.00128173828125, 
--0.00698852539062, -0.0485229492188, -0.053955078125, -0.0450744628906, -0.0729064941406, -0.102661132812, -0.0881958007812, -0.0721130371094, 
--0.0730285644531, -0.0510559082031, -0.0223083496094, 0.000335693359375, 0.0201721191406, 0.0327453613281, 0.0270385742188, 0.0235595703125, 
-0.03662109375, 0.0439147949219, 0.0469055175781, 0.0646362304688, 0.036865234375, 0.0108947753906, 0.0584411621094, 0.0639953613281, 
-0.015869140625, 0.0126342773438, -0.0180358886719, -0.0525817871094, -0.0013427734375, 0.0260925292969, -0.0315551757812, -0.0583190917969, 
--0.0173645019531, 0.014892578125, 0.0154113769531, 0.0084228515625, 0.00970458984375, 0.0101013183594, 0.0149536132812, 0.0386352539062, 
-0.0414123535156, 0.00436401367188, -0.008544921875, -0.00289916992188, -0.0350341796875, -0.0618286132812, -0.0530090332031, -0.0541076660156, 
--0.037841796875, -0.0139770507812, -0.03125, -0.0282592773438, 0.01708984375, 0.0511779785156, 0.075439453125, 0.0733032226562, 
-0.0675048828125, 0.0830993652344, 0.0963439941406, 0.109252929688, 0.105438232422, 0.089111328125, 0.0965576171875, 0.107666015625, 
-0.0902099609375, 0.0723876953125, 0.0997924804688, 0.0657348632812, 0.002197265625, 0.0308837890625, 0.0379333496094, -0.0227661132812, 
--0.025634765625, -0.0008544921875, -0.0161743164062, -0.031005859375, -0.029052734375, -0.0289611816406, -0.0392150878906, -0.0416259765625, 
--0.0220642089844, -0.00424194335938, -0.0191345214844, -0.0489501953125, -0.0574645996094, -0.0396728515625, -0.0316162109375, -0.05419921875, 
--0.056640625, -0.0464172363281, -0.0581970214844, -0.06201171875, -0.0667724609375, -0.067138671875, -0.047119140625, -0.0330200195312, 
--0.0234375, -0.00595092773438, -0.010498046875, -0.01416015625, 0.000762939453125, 0.00588989257812, 0.0139465332031, 0.0398254394531, 
-0.0491943359375, 0.0400390625, 0.0466918945312, 0.0751037597656, 0.0878601074219, 0.0729675292969, 0.0770263671875, 0.0868835449219, 
-0.0777587890625, 0.0957641601562, 0.0910949707031, 0.0081787109375, -0.000732421875, 0.08349609375, 0.0983581542969, 0.0424194335938, 
-0.0286254882812, -0.0972595214844, -0.190643310547, -0.0690612792969, -0.0361328125, -0.0527038574219, 0.065185546875, -0.0616455078125, 
--0.146331787109, -0.0339660644531, -0.115783691406, -0.154998779297, -0.0921630859375, -0.179107666016, -0.177917480469, -0.0875244140625, 
--0.0147399902344, 0.0852661132812, 0.0597534179688, -0.062255859375, -0.0894165039062, -0.0388488769531, 0.0096435546875, 0.0519714355469, 
-0.0815734863281, 0.0894165039062, 0.127990722656, 0.128784179688, 0.0562438964844, 0.0129699707031, -0.00881958007812, -0.0154418945312, 
--0.00225830078125, -0.0234069824219, -0.0101318359375, 0.0704650878906, 0.0611877441406, -0.0251159667969, -0.0519104003906, -0.0307922363281, 
--0.03076171875, -0.0299072265625, -0.044189453125, -0.0782775878906, -0.0574340820312, -0.0374450683594, -0.0361328125, 0.000762939453125, 
--0.0093994140625, -0.0571899414062, -0.0776062011719, -0.0974426269531, -0.0890808105469, -0.0411682128906, -0.00439453125, -0.0035400390625, 
--0.0105590820312, 0.0134887695312, 0.02880859375, 0.0359802246094, 0.057861328125, 0.0360107421875, -0.00204467773438, 0.0181274414062, 
-0.0584716796875, 0.074462890625, 0.0575256347656, 0.0614318847656, 0.0931091308594, 0.104125976562, 0.112182617188, 0.0959167480469, 
-0.0895080566406, 0.114105224609, 0.0733337402344, 0.0423583984375, 0.0694580078125, 0.0280151367188, -0.0057373046875, -0.00421142578125, 
--0.0304565429688, 0.000244140625, 0.0505065917969, 0.019287109375, -0.0147094726562, -0.0463256835938, -0.0769348144531, -0.0419616699219, 
--0.0158386230469, -0.00234985351562, 0.0240173339844, 0.017822265625, 0.0442199707031, 0.0918273925781, 0.0689392089844, 0.0427551269531, 
-0.0321044921875, 0.0365295410156, 0.0736694335938, 0.060302734375, 0.0343627929688, 0.0396728515625, 0.0260009765625, 0.0379638671875, 
-0.048583984375, 0.0260925292969, 0.020263671875, -0.0138549804688, -0.0492248535156, -0.02587890625, -0.0118408203125, -0.0341796875, 
--0.0706176757812, -0.07666015625, -0.035888671875, -0.0234069824219, -0.0762023925781, -0.132263183594, -0.140075683594, -0.100524902344, 
--0.0640869140625, -0.0556030273438, -0.0696716308594, -0.0783386230469, -0.0715942382812, -0.056396484375, -0.0175170898438, -0.0145568847656, 
--0.0727844238281, -0.116943359375, -0.118896484375, -0.082275390625, -0.0513000488281, -0.0548400878906, -0.0169982910156, 0.0155639648438, 
--0.0181884765625, -0.0249938964844, -0.0078125, 0.000244140625, 0.02490234375, 0.00485229492188, -0.0380554199219, -0.00900268554688, 
-0.023681640625, 0.0281066894531, 0.0379333496094, 0.03125, 0.0157470703125, 0.0205993652344, 0.0452880859375, 0.0684814453125, 
-0.0416870117188, 0.00631713867188, 0.0189819335938, 0.0153503417969, -0.0116271972656, -0.0130004882812, -0.0252685546875, -0.0350341796875, 
--0.0103454589844, -0.00845336914062, -0.0131225585938, 0.0124206542969, 0.0225219726562, 0.0048828125, -0.0101928710938, -0.014892578125, 
--0.00540161132812, 0.0111999511719, -0.00677490234375, -0.0330810546875, -0.0155639648438, 0.00222778320312, -0.00753784179688, -0.000335693359375, 
-0.0062255859375, -0.00958251953125, -0.00958251953125, 0.00405883789062, -0.0216369628906, -0.05908203125, -0.0648193359375, -0.0511169433594, 
--0.0377502441406, -0.0305786132812, -0.0206909179688, 0.00906372070312, 0.0394287109375, 0.0573425292969, 0.0601806640625, 0.0500793457031, 
-0.0447082519531, 0.0316162109375, 0.0186767578125, 0.0355834960938, 0.0469055175781, 0.0350646972656, 0.0374145507812, 0.0400390625, 
-0.0245056152344, 0.0307312011719, 0.0768737792969, 0.0983276367188, 0.0646362304688, 0.0362243652344, 0.0292053222656, 0.0369262695312, 
-0.0505676269531, 0.0348510742188, 0.013916015625, 0.01513671875, 0.0205383300781, 0.0303955078125, 0.0413208007812, 0.0350036621094, 
-0.0286865234375, 0.0228881835938, 0.0103149414062, 0.0224609375, 0.0458068847656, 0.0381774902344, 0.034912109375, 0.04052734375, 
-0.0241394042969, 0.0283508300781, 0.0776062011719, 0.101348876953, 0.0552062988281, 0.0102844238281, 0.0206604003906, 0.0448913574219, 
-0.0495300292969, 0.0536499023438, 0.0503845214844, 0.0377502441406, 0.058837890625, 0.0984497070312, 0.0686340332031, 0.0158386230469, 
-0.0111083984375, 0.00958251953125, 0.00784301757812, 0.0176086425781, 0.00433349609375, -0.0482482910156, -0.103271484375, -0.0969848632812, 
--0.0771789550781, -0.0829467773438, -0.0643920898438, -0.0538940429688, -0.0721740722656, -0.098388671875, -0.133666992188, -0.125305175781, 
--0.0715942382812, -0.0502319335938, -0.0558166503906, -0.0538635253906, -0.0328979492188, -0.0104370117188, 0.0148620605469, 0.0407409667969, 
-0.0374145507812, 0.0214233398438, 0.0201721191406, 0.0401306152344, 0.0549621582031, 0.0429382324219, 0.0397338867188, 0.0330810546875, 
-0.00900268554688, -0.000762939453125, 0.00100708007812, 0.00396728515625, -0.00762939453125, -0.0352783203125, -0.0435180664062, -0.0455322265625, 
--0.0504760742188, -0.0687255859375, -0.106262207031, -0.126861572266, -0.105895996094, -0.0666809082031, -0.0473327636719, -0.0593566894531, 
--0.0782775878906, -0.0729064941406, -0.0470581054688, -0.0268249511719, -0.0130004882812, 0.00149536132812, 0.0130310058594, 0.024169921875, 
-0.0247802734375, 0.0344543457031, 0.04296875, 0.0280456542969, 0.0399475097656, 0.054931640625, 0.0362548828125, 0.0460510253906, 
-0.0519104003906, 0.0321655273438, 0.0480346679688, 0.0523681640625, 0.0437622070312, 0.0411682128906, 0.0215148925781, 0.0132141113281, 
-0.00527954101562, -0.0208435058594, -0.042236328125, -0.0400085449219, -0.0355224609375, -0.0531616210938, -0.0704650878906, -0.0754089355469, 
--0.0864562988281, -0.0994567871094, -0.117095947266, -0.125335693359, -0.0983581542969, -0.0686950683594, -0.039306640625, -0.03466796875, 
--0.0860595703125, -0.0779418945312, -0.012451171875, -0.0165100097656, -0.0179443359375, 0.0238647460938, 0.0277099609375, 0.0452270507812, 
-0.065673828125, 0.0543823242188, 0.0548706054688, 0.0439758300781, 0.04345703125, 0.0846252441406, 0.093994140625, 0.0730590820312, 
-0.0709228515625, 0.0788269042969, 0.057861328125, 0.0249938964844, 0.0195922851562, 0.0173645019531, 0.010498046875, -0.00582885742188, 
--0.0386047363281, -0.0519104003906, -0.0462951660156, -0.0570373535156, -0.0679931640625, -0.0557556152344, -0.0529174804688, -0.0645141601562, 
--0.0657348632812, -0.085693359375, -0.106628417969, -0.0732421875, -0.0621337890625, -0.0936584472656, -0.09228515625, -0.0517578125, 
-0.0113830566406, 0.044921875, 0.0378112792969, 0.0374755859375, 0.0491333007812, 0.0718688964844, 0.109008789062, 0.113861083984, 
-0.0981750488281, 0.104156494141, 0.129150390625, 0.127563476562, 0.116180419922, 0.116912841797, 0.0906982421875, 0.0494079589844, 
-0.08935546875, 0.126953125, 0.0902099609375, 0.0622253417969, 0.017333984375, -0.0282287597656, 0.0201416015625, 0.0684204101562, 
-0.0391845703125, -0.0166625976562, -0.060302734375, -0.0622863769531, -0.0362243652344, -0.01904296875, -0.0191040039062, -0.0184936523438, 
--0.00860595703125, -0.0164794921875, -0.0256042480469, 0.00457763671875, 0.0235900878906, 0.0135803222656, 0.00933837890625, 0.00396728515625, 
-0.0224304199219, 0.0357360839844, 0.0128173828125, 0.0404663085938, 0.0845947265625, 0.0741577148438, 0.0570068359375, 0.0362854003906, 
-0.00607299804688, -0.00164794921875, 0.00787353515625, 0.0227661132812, 0.0132446289062, -0.0274658203125, -0.0650329589844, -0.0863952636719, 
--0.0709838867188, -0.0205993652344, 0.0164184570312, 0.0115356445312, -0.0243835449219, -0.0515747070312, -0.0433654785156, -0.0296020507812, 
--0.0257263183594, -0.0229187011719, -0.0285949707031, -0.0205688476562, 0.0169982910156, 0.0535583496094, 0.064453125, 0.053466796875, 
-0.063232421875, 0.0776977539062, 0.0546569824219, 0.0494995117188, 0.0621643066406, 0.0291748046875, -0.00802612304688, -0.0119934082031, 
--0.00836181640625, 0.00048828125, -0.01611328125, -0.0686645507812, -0.0902709960938, -0.0460510253906, -0.0255126953125, -0.0617065429688, 
--0.092041015625, -0.104248046875, -0.10546875, -0.0830078125, -0.111755371094, -0.136047363281, -0.0726623535156, -0.0564575195312, 
--0.107330322266, -0.107116699219, -0.08056640625, -0.0496826171875, 0.0023193359375, 0.0221557617188, -0.0006103515625, -0.0116271972656, 
-0.00515747070312, 0.0179748535156, 0.0513000488281, 0.107055664062, 0.122039794922, 0.126586914062, 0.151153564453, 0.153839111328, 
-0.171051025391, 0.200775146484, 0.167144775391, 0.130859375, 0.152130126953, 0.146667480469, 0.108489990234, 0.0665588378906, 
-0.0338745117188, 0.0210876464844, -0.0105590820312, -0.0592346191406, -0.0746765136719, -0.0723571777344, -0.0477905273438, -0.0417785644531, 
--0.122131347656, -0.184722900391, -0.169677734375, -0.100738525391, -0.0180969238281, -0.0313415527344, -0.105377197266, -0.174896240234, 
--0.192626953125, -0.104461669922, -0.0398254394531, -0.0330810546875, 0.0084228515625, 0.00704956054688, -0.0262756347656, -0.0361938476562, 
--0.100769042969, -0.0922546386719, 0.00436401367188, 0.0308837890625, 0.0573120117188, 0.0608825683594, -0.0184631347656, -0.010498046875, 
-0.0367126464844, 0.00314331054688, -0.0235290527344, -0.0199584960938, -0.0350646972656, -0.021240234375, 0.00949096679688, 3.0517578125e-05, 
--0.0582885742188, -0.0949401855469, -0.0517883300781, -0.0101318359375, -0.0320434570312, -0.0514831542969, -0.0598449707031, -0.0583801269531, 
--0.0162048339844, 0.026123046875, -0.00357055664062, -0.0463562011719, -0.04150390625, -0.0358276367188, -0.006103515625, 0.0692749023438, 
-0.0668029785156, -0.0291442871094, -0.0728454589844, -0.025390625, -0.00308227539062, -0.0130920410156, -0.00518798828125, -0.004150390625, 
--0.00250244140625, 0.0328674316406, 0.0678405761719, 0.0718383789062, 0.0650634765625, 0.076171875, 0.0912170410156, 0.0926818847656, 
-0.0646667480469, 0.0161437988281, 0.0246887207031, 0.0650024414062, 0.0471801757812, 0.0214233398438, 0.0144653320312, 0.00274658203125, 
-0.0488891601562, 0.0610656738281, -0.0379333496094, -0.0614013671875, 0.0150146484375, 0.0330810546875, 0.0443725585938, 0.0312805175781, 
--0.04150390625, -0.0464477539062, -0.0130920410156, -0.00729370117188, 0.0183410644531, 0.0722045898438, 0.076171875, 0.0257263183594, 
-0.00482177734375, 0.0356750488281, 0.05126953125, 0.05078125, 0.0564880371094, 0.0457153320312, 0.0300598144531, 0.0494384765625, 
-0.100372314453, 0.099853515625, 0.0140991210938, -0.0385131835938, -0.00607299804688, 0.0392456054688, 0.0436401367188, -0.00332641601562, 
--0.0297241210938, -0.0195007324219, -0.0125732421875, 0.00735473632812, 0.0105895996094, -0.0314331054688, -0.0582885742188, -0.0403442382812, 
-0.00277709960938, 0.03125, 0.0174560546875, -0.0299682617188, -0.0595397949219, -0.0201416015625, 0.0178833007812, 0.00924682617188, 
--0.00149536132812, -0.00970458984375, 0.0109252929688, 0.0514526367188, 0.0286254882812, 0.0030517578125, 0.0174560546875, 0.0338439941406, 
-0.0963134765625, 0.0924377441406, -0.00918579101562, -0.0150756835938, 0.0400695800781, 0.0488891601562, 0.0794677734375, 0.102203369141, 
-0.0440368652344, -0.0435180664062, -0.0548706054688, 0.0127258300781, 0.00912475585938, -0.0290222167969, 0.00906372070312, 0.0498352050781, 
--0.00149536132812, -0.0368041992188, 0.0193481445312, -0.00579833984375, -0.0563049316406, 0.0228271484375, 0.0282287597656, -0.0360717773438, 
-0.0164184570312, 0.0392150878906, -0.00204467773438, -0.00344848632812, -0.0281066894531, -0.0425415039062, -0.020751953125, -0.0485229492188, 
--0.0885009765625, -0.109924316406, -0.0732727050781, -0.00918579101562, 0.0174255371094, -0.0407104492188, -0.116668701172, -0.103088378906, 
--0.0685424804688, -0.0817565917969, -0.0748596191406, -0.0807189941406, -0.0989990234375, -0.0695495605469, -0.0583801269531, -0.0849914550781, 
--0.100860595703, -0.0926208496094, -0.0470581054688, -0.00729370117188, -0.00332641601562, -0.006591796875, -0.0298156738281, -0.0438842773438, 
--0.0204162597656, -0.0128173828125, -0.0381164550781, -0.0487976074219, -0.0263671875, -0.009521484375, -0.0188293457031, -0.0537109375, 
--0.0761108398438, -0.0455627441406, 0.00408935546875, 0.000946044921875, -0.00198364257812, 0.0217895507812, 0.0249938964844, 0.0365295410156, 
-0.0525512695312, 0.0689392089844, 0.100250244141, 0.0962829589844, 0.0757141113281, 0.0855407714844, 0.0917053222656, 0.0901489257812, 
-0.103118896484, 0.0912780761719, 0.0582885742188, 0.0379638671875, 0.0476989746094, 0.0524597167969, 0.0398559570312, 0.0322875976562, 
-0.0220642089844, 0.0139465332031, 0.0154113769531, 0.00946044921875, 0.00216674804688, 0.00704956054688, -0.00537109375, -0.0296325683594, 
--0.0333557128906, -0.0220336914062, -0.023681640625, -0.0259094238281, -0.0122985839844, -0.00381469726562, -0.00234985351562, -0.00711059570312, 
--0.00830078125, -0.00494384765625, -0.0062255859375, 0.00619506835938, 0.0305786132812, 0.0221557617188, -0.0013427734375, 0.0047607421875, 
-0.0155334472656, 0.0116882324219, 0.00875854492188, 0.00634765625, -0.00146484375, -0.00146484375, 0.00262451171875, 0.00167846679688, 
--0.0069580078125, -0.0280151367188, -0.0382080078125, -0.0425109863281, -0.048583984375, -0.0431823730469, -0.0391540527344, -0.04443359375, 
--0.047607421875, -0.0514221191406, -0.0547790527344, -0.0453186035156, -0.036865234375, -0.038818359375, -0.0441284179688, -0.0375366210938, 
--0.022216796875, -0.016845703125, -0.0135803222656, -0.007080078125, -0.00164794921875, 0.000274658203125, -0.00173950195312, 0.0010986328125, 
-0.0047607421875, 0.00457763671875, 0.0116882324219, 0.0180358886719, 0.0193481445312, 0.0200805664062, 0.0211791992188, 0.0315856933594, 
-0.0390625, 0.0357360839844, 0.0345458984375, 0.0275573730469, 0.0169372558594, 0.0233154296875, 0.034912109375, 0.0403137207031, 
-0.0411376953125, 0.0272827148438, 0.0127868652344, 0.0137329101562, 0.018310546875, 0.0255432128906, 0.02783203125, 0.0163879394531, 
-0.00265502929688, -0.000274658203125, 0.00735473632812, 0.0121154785156, 0.0074462890625, 0.0101318359375, 0.0203247070312, 0.01953125, 
-0.017822265625, 0.0269775390625, 0.0290222167969, 0.0231018066406, 0.0198059082031, 0.025390625, 0.0282592773438, 0.0196838378906, 
-0.0127563476562, 0.0111389160156, 0.00790405273438, 0.0180969238281, 0.0321350097656, 0.0335388183594, 0.0291442871094, 0.0254516601562, 
-0.024169921875, 0.0274353027344, 0.0255432128906, 0.0201110839844, 0.0218200683594, 0.029296875, 0.0252990722656, 0.0101013183594, 
-0.00735473632812, -0.00164794921875, -0.0175170898438, -0.0108642578125, -0.0138244628906, -0.0396118164062, -0.0341796875, 0.0129089355469, 
-0.0411682128906, 0.0201110839844, -0.0216369628906, -0.0436401367188, -0.012451171875, 0.047119140625, 0.0480346679688, -0.0133361816406, 
--0.0380249023438, 0.00778198242188, 0.0313415527344, 0.00814819335938, 0.017333984375, 0.0550842285156, 0.0517272949219, 0.0018310546875, 
--0.0552978515625, -0.0567321777344, 0.00607299804688, 0.0435791015625, 0.0140380859375, -0.0207214355469, -0.0167846679688, 0.00314331054688, 
-0.00848388671875, 0.014404296875, 0.0213928222656, 0.0114135742188, -0.0209045410156, -0.0648498535156, -0.0969848632812, -0.0967102050781, 
--0.0774536132812, -0.061279296875, -0.0708923339844, -0.0802612304688, -0.0905456542969, -0.0997314453125, -0.0791015625, -0.0781860351562, 
--0.121459960938, -0.109710693359, -0.0342712402344, 0.0209655761719, 0.00851440429688, -0.0390319824219, -0.0484924316406, -0.0398559570312, 
--0.0333862304688, -0.00827026367188, 0.0118103027344, 0.0259704589844, 0.0303955078125, 0.00732421875, -0.0156555175781, -0.00833129882812, 
-0.0259704589844, 0.0348205566406, 0.0218200683594, 0.0314636230469, 0.0299682617188, 0.00601196289062, -0.0220642089844, -0.0164489746094, 
-0.01220703125, -9.1552734375e-05, -0.00631713867188, 0.0238342285156, 0.0172729492188, 0.0112915039062, 0.0309753417969, 0.00936889648438, 
--0.00918579101562, 0.0231018066406, 0.0247802734375, -0.00323486328125, -0.00296020507812, 0.00119018554688, 3.0517578125e-05, 0.0125427246094, 
-0.0184631347656, 0.00192260742188, -0.0270385742188, -0.0271911621094, -0.0137939453125, 0.011962890625, 0.0469665527344, 0.0298156738281, 
-0.0240783691406, 0.057373046875, 0.00576782226562, -0.0453491210938, -0.0023193359375, -3.0517578125e-05, -0.0220336914062, 0.0437927246094, 
-0.104125976562, 0.0662841796875, 0.0138549804688, 0.0133361816406, 0.0436706542969, 0.0819396972656, 0.0859375, 0.0558166503906, 
-0.00613403320312, -0.0319519042969, -0.0370483398438, -0.0161437988281, 0.0278930664062, 0.0443115234375, 0.0198059082031, 0.0155029296875, 
-0.0133666992188, -0.00335693359375, 0.00241088867188, 0.0023193359375, -0.0153503417969, -0.0270385742188, -0.000213623046875, 0.0411376953125, 
-0.046875, -0.00265502929688, -0.0697021484375, -0.0772399902344, -0.00592041015625, 0.0752868652344, 0.0822448730469, -0.0069580078125, 
--0.0734558105469, -0.0391235351562, 0.0187072753906, 0.0404968261719, 0.0243225097656, -0.0303955078125, -0.0565490722656, -0.0020751953125, 
-0.0714416503906, 0.0906982421875, 0.0578918457031, -0.00814819335938, -0.0344848632812, 0.0029296875, 0.0456237792969, 0.0422058105469, 
-0.00668334960938, -0.0417175292969, -0.08984375, -0.0864562988281, -0.0368041992188, -0.0289001464844, -0.0397338867188, -0.0379333496094, 
--0.0628051757812, -0.0815734863281, -0.0495300292969, -0.0144653320312, -0.033935546875, -0.0495910644531, -0.0332946777344, -0.0250244140625, 
--0.001220703125, 0.00997924804688, -0.0135803222656, -0.0328979492188, -0.0388793945312, 0.0137329101562, 0.0537719726562, 0.0323791503906, 
-0.0240173339844, -0.00534057617188, -0.0272827148438, 0.00552368164062, 0.0331420898438, 0.0773010253906, 0.12744140625, 0.109527587891, 
-0.0667114257812, 0.0417785644531, 0.0437622070312, 0.054931640625, 0.0446472167969, 0.0263061523438, -0.0171508789062, -0.0595703125, 
--0.0395812988281, -0.0350646972656, -0.0631103515625, -0.0670471191406, -0.0877990722656, -0.123626708984, -0.110992431641, -0.0805358886719, 
--0.0658569335938, -0.0578918457031, -0.0772094726562, -0.0900268554688, -0.0604553222656, -0.0172424316406, 0.0244140625, 0.0294799804688, 
--0.02392578125, -0.0507507324219, 0.00186157226562, 0.0895080566406, 0.12158203125, 0.0935363769531, 0.0539245605469, 0.0392150878906, 
-0.0478820800781, 0.0602722167969, 0.0884094238281, 0.121154785156, 0.0888366699219, 0.0419921875, 0.0443420410156, 0.0489196777344, 
-0.06103515625, 0.0755920410156, 0.0586547851562, 0.0374450683594, 0.0205383300781, 0.00653076171875, -0.0302734375, -0.0901489257812, 
--0.0899353027344, -0.0736083984375, -0.0709533691406, -0.0652160644531, -0.0830688476562, -0.105743408203, -0.11083984375, -0.0718078613281, 
-0.0108642578125, 0.0333251953125, -0.00579833984375, -0.0157470703125, 0.0101928710938, 0.029052734375, 0.0466918945312, 0.0598754882812, 
-0.0484313964844, 0.0224609375, 0.0202331542969, 0.048828125, 0.083740234375, 0.0980224609375, 0.0776977539062, 0.03564453125, 
-0.020751953125, 0.040771484375, 0.0624084472656, 0.0669555664062, 0.0435791015625, 0.00845336914062, -0.00125122070312, 0.00613403320312, 
--0.0003662109375, -0.0201721191406, -0.0455017089844, -0.0523986816406, -0.0184936523438, 0.00338745117188, -0.0076904296875, -0.0293273925781, 
--0.0438232421875, -0.0176086425781, 0.0106811523438, -0.00570678710938, -0.000640869140625, 0.00384521484375, -0.0301513671875, -0.0318603515625, 
--0.0111999511719, -0.0029296875, 0.00521850585938, -0.0159301757812, -0.0189819335938, 0.0115356445312, 0.0132446289062, 0.0114440917969, 
-0.00314331054688, -0.0364685058594, -0.0358581542969, -0.00637817382812, 0.0072021484375, 0.0101318359375, -0.0181884765625, -0.0449829101562, 
--0.0328063964844, -0.0147705078125, 0.00738525390625, -0.001953125, -0.0293579101562, -0.0164184570312, -0.0304565429688, -0.0697021484375, 
--0.0587158203125, -0.0517883300781, -0.0541381835938, -0.0271606445312, -0.0136108398438, -0.0201416015625, -0.0153503417969, -0.0134582519531, 
--0.0325927734375, -0.0547485351562, -0.0521240234375, -0.0358276367188, -0.0166015625, 0.00686645507812, 0.0165100097656, 0.0057373046875, 
--0.0147399902344, -0.0264892578125, -0.0126037597656, 0.019287109375, 0.0408935546875, 0.0348510742188, 0.0231323242188, 0.0148315429688, 
--0.00701904296875, -0.0160827636719, -0.0087890625, -0.00848388671875, -0.00262451171875, -0.00537109375, -0.00448608398438, 0.0201110839844, 
-0.0093994140625, -0.00848388671875, 0.0180053710938, 0.0321960449219, 0.0290222167969, 0.0441589355469, 0.0484924316406, 0.0141296386719, 
--0.00198364257812, 0.0198669433594, -0.0020751953125, -0.00357055664062, 0.0875244140625, 0.0792236328125, 0.00238037109375, 0.0197448730469, 
-0.0344848632812, 0.0617980957031, 0.119110107422, 0.0484008789062, -0.103179931641, -0.0817565917969, 0.056640625, 0.0590209960938, 
--0.0221557617188, -0.0633239746094, -0.0213317871094, 0.0387573242188, 0.0, -0.0734252929688, -0.0823364257812, -0.07373046875, 
--0.0339965820312, 0.0103149414062, -0.0213623046875, -0.0759582519531, -0.0672912597656, -0.0167236328125, -0.00527954101562, -0.0417175292969, 
--0.0500793457031, -0.0650024414062, -0.0755004882812, -0.0331726074219, 0.00714111328125, 0.00225830078125, -0.0389709472656, -0.0615844726562, 
-0.00448608398438, 0.0316467285156, -0.0108947753906, -0.0040283203125, -0.00186157226562, -0.0285949707031, -0.000946044921875, 0.0298461914062, 
-0.0589599609375, 0.0543212890625, -0.0112915039062, -0.0382995605469, -0.0165100097656, 0.0197143554688, 0.0457763671875, 0.0416259765625, 
-0.0431213378906, 0.0404052734375, 0.0264892578125, 0.0327758789062, 0.0159301757812, 0.00787353515625, 0.0370178222656, 0.0398864746094, 
-0.0391235351562, 0.05322265625, 0.0361022949219, 0.0224304199219, 0.0408325195312, 0.0465698242188, 0.0419006347656, 0.0483093261719, 
-0.0391235351562, 0.0279541015625, 0.0252075195312, 0.00363159179688, -0.0120239257812, -0.00582885742188, -0.00140380859375, 0.000457763671875, 
--0.0118408203125, -0.0230407714844, -0.0357055664062, -0.0552062988281, -0.015869140625, -0.0057373046875, -0.0560913085938, -0.00802612304688, 
-0.0303649902344, -0.0148010253906, 0.00906372070312, 0.0420837402344, 0.0322265625, 0.0532531738281, 0.0505981445312, 0.0265502929688, 
-0.0378112792969, 0.0338745117188, 0.0153198242188, 0.0127258300781, 0.0102844238281, 0.0287475585938, 0.0470886230469, 0.0171508789062, 
--0.0118408203125, -0.00546264648438, -0.00244140625, -0.0245666503906, -0.0332641601562, -0.00103759765625, 0.00119018554688, -0.0318908691406, 
--0.0301208496094, -0.0284729003906, -0.0489501953125, -0.0436706542969, -0.036865234375, -0.0383911132812, -0.0437316894531, -0.057373046875, 
--0.048828125, -0.0255737304688, -0.0227966308594, -0.02978515625, -0.0213317871094, -0.005615234375, 0.0028076171875, 0.00949096679688, 
-0.008544921875, -0.0009765625, -0.0009765625, 0.0124816894531, 0.0289916992188, 0.0302734375, 0.0155029296875, 0.0180053710938, 
-0.0328979492188, 0.0328674316406, 0.0232238769531, 0.0183715820312, 0.0220642089844, 0.0388793945312, 0.0398559570312, 0.0195922851562, 
-0.00640869140625, 0.00762939453125, 0.0138244628906, 0.0227661132812, 0.0238647460938, 0.0159301757812, 0.0292358398438, 0.0341491699219, 
-0.0191345214844, 0.0248718261719, 0.0222473144531, 0.0193481445312, 0.0458068847656, 0.044921875, 0.0170593261719, 0.0107727050781, 
-0.00479125976562, -0.0081787109375, -0.0030517578125, 0.006591796875, -0.00460815429688, -0.0078125, 0.0176086425781, 0.0227355957031, 
--0.000518798828125, 0.00811767578125, 0.0134887695312, 0.00186157226562, 0.0218811035156, 0.0220031738281, -0.0115356445312, -0.00637817382812, 
-0.0105895996094, 0.00540161132812, 0.00079345703125, 0.00543212890625, 0.01025390625, 0.0135498046875, 0.00711059570312, -0.00241088867188, 
-0.004638671875, 0.0186767578125, 0.00888061523438, 0.00018310546875, 0.00332641601562, -0.000823974609375, 0.00143432617188, -0.00396728515625, 
--0.032958984375, -0.0365905761719, -0.0224609375, -0.0320739746094, -0.0356140136719, -0.0303039550781, -0.0299072265625, -0.0252380371094, 
--0.0246276855469, -0.0318603515625, -0.0416564941406, -0.0428466796875, -0.0297546386719, -0.0172424316406, -0.01513671875, -0.0221252441406, 
--0.0294494628906, -0.0339965820312, -0.0347290039062, -0.0256652832031, -0.0184631347656, -0.0174865722656, -0.0130310058594, -0.0145263671875, 
--0.0124816894531, -0.008056640625, -0.0171203613281, -0.021484375, -0.0250549316406, -0.0328369140625, -0.01708984375, -0.002197265625, 
--0.0191345214844, -0.0282592773438, -0.0242309570312, -0.0274658203125, -0.0201416015625, -0.0050048828125, 0.00216674804688, -0.00149536132812, 
--0.00775146484375, -0.0059814453125, -0.00436401367188, -0.00604248046875, 0.0010986328125, 0.00369262695312, -0.00860595703125, -0.00350952148438, 
-0.013427734375, 0.00833129882812, -0.00106811523438, -0.00213623046875, -0.0100402832031, -0.0111389160156, -0.00192260742188, -0.00259399414062, 
--0.00927734375, -0.0169982910156, -0.0211791992188, -0.0155639648438, -0.0129089355469, -0.0194702148438, -0.0216369628906, -0.0203247070312, 
--0.0194702148438, -0.0149230957031, -0.0125427246094, -0.0138244628906, -0.0162963867188, -0.0142822265625, -0.00155639648438, 0.00497436523438, 
--0.00152587890625, -0.00244140625, 0.00271606445312, 0.0072021484375, 0.0181579589844, 0.0265502929688, 0.02490234375, 0.02978515625, 
-0.0370483398438, 0.0335693359375, 0.0313415527344, 0.0341796875, 0.0339660644531, 0.02783203125, 0.0269470214844, 0.0319213867188, 
-0.0325317382812, 0.0286254882812, 0.0245361328125, 0.0230712890625, 0.0250854492188, 0.0216064453125, 0.00762939453125, -0.006103515625, 
--0.011474609375, -0.0162353515625, -0.0221252441406, -0.0266418457031, -0.0246887207031, -0.0204467773438, -0.0271301269531, -0.0235595703125, 
--0.0150451660156, -0.0282592773438, -0.0265502929688, -0.0115966796875, -0.0136108398438, 0.00759887695312, 0.0201416015625, 0.00225830078125, 
-0.00863647460938, 0.0087890625, 0.00588989257812, 0.0311279296875, 0.0335998535156, 0.0231628417969, 0.019775390625, 0.0117492675781, 
-0.0244140625, 0.0299682617188, 0.0132751464844, 0.0114440917969, 0.0106811523438, 0.0169067382812, 0.0313720703125, 0.021728515625, 
-0.0103759765625, 0.0100402832031, 0.0025634765625, -0.00448608398438, -0.00601196289062, -0.0020751953125, -0.00543212890625, -0.0105590820312, 
--0.0187377929688, -0.0383911132812, -0.0361328125, -0.0328979492188, -0.0511169433594, -0.0470275878906, -0.0469970703125, -0.0602416992188, 
--0.0440368652344, -0.0318603515625, -0.0376892089844, -0.026123046875, -0.0180358886719, -0.0169982910156, -0.00332641601562, 0.00997924804688, 
-0.0249633789062, 0.0377502441406, 0.0337219238281, 0.0346069335938, 0.0484313964844, 0.0547180175781, 0.0514526367188, 0.0460815429688, 
-0.0463256835938, 0.0477294921875, 0.0391540527344, 0.0292358398438, 0.0263977050781, 0.0241394042969, 0.0213317871094, 0.0140075683594, 
-0.00296020507812, 0.00552368164062, 0.00888061523438, 0.00155639648438, -0.0048828125, -0.00732421875, 0.00247192382812, 0.00912475585938, 
-0.0023193359375, 0.00164794921875, -0.00665283203125, -0.0165710449219, -0.0048828125, 0.00137329101562, 0.0008544921875, 0.00634765625, 
-0.00210571289062, -0.00274658203125, 0.00830078125, 0.013916015625, 0.0118103027344, 0.0150451660156, 0.018798828125, 0.0198059082031, 
-0.0198364257812, 0.0250854492188, 0.0243530273438, 0.0171508789062, 0.0255432128906, 0.0346984863281, 0.0313720703125, 0.0274963378906, 
-0.0174255371094, 0.00485229492188, 0.00546264648438, 0.01220703125, 0.0086669921875, -0.0054931640625, -0.0155029296875, -0.0183715820312, 
--0.0148620605469, -0.0123291015625, -0.0283203125, -0.0411682128906, -0.0357360839844, -0.0343017578125, -0.0243530273438, -0.0147094726562, 
--0.0393981933594, -0.0599670410156, -0.0435180664062, -0.0152893066406, 0.00607299804688, 0.0054931640625, -0.0133666992188, -0.0216369628906, 
--0.0194091796875, -0.009521484375, 0.0121765136719, 0.0263671875, 0.0287475585938, 0.0295104980469, 0.001708984375, -0.0153503417969, 
-0.00949096679688, 0.0203552246094, 0.0140991210938, 0.0122680664062, -0.0040283203125, -0.0119934082031, 0.0115051269531, 0.0185241699219, 
--0.00595092773438, -0.0224609375, -0.0164184570312, -0.00607299804688, 0.0008544921875, -0.00570678710938, -0.0237731933594, -0.0294189453125, 
--0.0206604003906, -0.0135498046875, -0.00534057617188, -0.001708984375, -0.0234680175781, -0.0351867675781, -0.0131225585938, -0.000518798828125, 
--0.0159606933594, -0.0206909179688, -0.01123046875, -0.0133361816406, -0.0146484375, -0.00656127929688, -0.00210571289062, -0.00765991210938, 
--0.0123901367188, -0.00411987304688, 0.00802612304688, 0.00543212890625, 3.0517578125e-05, 0.00936889648438, 0.00479125976562, -0.00811767578125, 
-0.00222778320312, 0.013427734375, 0.009033203125, 0.00714111328125, 0.005615234375, 0.00155639648438, 0.00424194335938, 0.00833129882812, 
-0.00225830078125, -0.0096435546875, -0.0191345214844, -0.0186157226562, -0.00650024414062, 0.00311279296875, 0.00186157226562, -0.0115661621094, 
--0.0232543945312, -0.0242309570312, -0.0102844238281, 0.0113220214844, 0.0155944824219, -0.0013427734375, -0.0135498046875, -0.0125732421875, 
--0.00253295898438, 0.00973510742188, 0.00189208984375, -0.00906372070312, -0.0052490234375, -0.00302124023438, -0.00143432617188, 0.0057373046875, 
-0.00225830078125, 0.00128173828125, 0.0098876953125, 0.00830078125, 0.000457763671875, 0.00701904296875, 0.0106811523438, -0.00326538085938, 
--0.000457763671875, 0.0135192871094, 0.0111999511719, 0.00787353515625, 0.00360107421875, -0.0052490234375, -0.000518798828125, 0.00210571289062, 
--0.00222778320312, 0.0103454589844, 0.0217895507812, 0.0152893066406, 0.003662109375, -0.00042724609375, 0.0042724609375, 0.0074462890625, 
-0.00637817382812, 0.00863647460938, 0.01220703125, 0.0137329101562, 0.0162658691406, 0.0156860351562, 0.00369262695312, -0.00973510742188, 
--0.00375366210938, 0.0132141113281, 0.00253295898438, -0.005859375, -0.00418090820312, -0.0143432617188, -0.00848388671875, -0.00186157226562, 
--0.011474609375, -0.0030517578125, -0.00418090820312, -0.0100708007812, 0.007080078125, 0.01220703125, 0.0050048828125, 0.0069580078125, 
-0.0025634765625, -0.00238037109375, -0.00119018554688, 0.00347900390625, 0.01416015625, 0.0102233886719, -0.00408935546875, 0.00320434570312, 
-0.0109558105469, 0.0132751464844, 0.027099609375, 0.0170593261719, -0.00509643554688, 0.0018310546875, 0.00741577148438, 0.00454711914062, 
-0.0086669921875, -0.00369262695312, -0.0167236328125, -0.0057373046875, -0.0115356445312, -0.0242919921875, -0.0219116210938, -0.0151977539062, 
--0.01806640625, -0.0184936523438, -0.00863647460938, -0.0151062011719, -0.0250244140625, -0.0111999511719, -0.010009765625, -0.0116577148438, 
--0.000152587890625, -0.00192260742188, -0.0078125, -0.00802612304688, -0.0119018554688, -0.0105285644531, 0.001708984375, 0.0120544433594, 
-0.00653076171875, -6.103515625e-05, 0.0074462890625, 0.0086669921875, 0.0037841796875, 0.0178527832031, 0.0245056152344, 0.00949096679688, 
-0.0118713378906, 0.0242309570312, 0.0143127441406, 0.0086669921875, 0.0149536132812, 0.012451171875, 0.0119323730469, 0.0133361816406, 
-0.00759887695312, -0.0001220703125, 0.00143432617188, 0.00796508789062, 0.0062255859375, 0.00912475585938, 0.0128784179688, -0.00439453125, 
--0.0152282714844, -0.00228881835938, 0.00274658203125, 0.00357055664062, 0.011474609375, 0.0122375488281, 0.00375366210938, 0.00067138671875, 
-0.00714111328125, 0.0101013183594, 0.0103759765625, 0.0153503417969, 0.0206604003906, 0.0146484375, 0.00640869140625, 0.00979614257812, 
-0.0174255371094, 0.0205383300781, 0.0169067382812, 0.00900268554688, 0.0059814453125, 0.01025390625, 0.0142517089844, 0.011474609375, 
-0.00473022460938, 0.00408935546875, 0.006103515625, 0.00704956054688, 0.00506591796875, -0.000518798828125, 0.00018310546875, 0.00341796875, 
--0.00277709960938, -0.0032958984375, 0.00128173828125, -0.003662109375, -0.00885009765625, -0.00619506835938, -0.00595092773438, -0.0120239257812, 
--0.014892578125, -0.0142822265625, -0.019775390625, -0.0216064453125, -0.0159606933594, -0.0140075683594, -0.0121765136719, -0.0125427246094, 
--0.01416015625, -0.01123046875, -0.0072021484375, -0.00833129882812, -0.00823974609375, -0.0098876953125, -0.0135192871094, -0.0115661621094, 
--0.00942993164062, -0.0100708007812, -0.0104370117188, -0.0116577148438, -0.00775146484375, -0.00527954101562, -0.00778198242188, -0.00778198242188, 
--0.00811767578125, -0.0121154785156, -0.0130920410156, -0.0115966796875, -0.0142211914062, -0.0172729492188, -0.0171203613281, -0.017578125, 
--0.0192260742188, -0.0189208984375, -0.0198974609375, -0.015869140625, -0.0128784179688, -0.0125427246094, -0.00790405273438, -0.0101623535156, 
--0.0109252929688, -0.00518798828125, -0.00662231445312, -0.00485229492188, 0.0001220703125, -0.00161743164062, 0.00137329101562, 0.00360107421875, 
-0.00149536132812, 0.003173828125, 0.00405883789062, 0.0040283203125, 0.0032958984375, 0.00247192382812, 0.00515747070312, 0.00521850585938, 
-0.00357055664062, 0.00738525390625, 0.00778198242188, 0.00323486328125, 0.00341796875, 0.006103515625, 0.00790405273438, 0.00979614257812, 
-0.00909423828125, 0.005126953125, 0.00289916992188, 0.00442504882812, 0.00634765625, 0.00714111328125, 0.0105590820312, 0.0108947753906, 
-0.00509643554688, 0.002197265625, 0.00424194335938, 0.00613403320312, 0.00689697265625, 0.0120239257812, 0.0122985839844, 0.00625610351562, 
-0.0102844238281, 0.0151977539062, 0.0126037597656, 0.0117797851562, 0.007080078125, 0.00680541992188, 0.0136413574219, 0.0181274414062, 
-0.0162353515625, 0.00503540039062, 0.000274658203125, 0.00424194335938, 0.00881958007812, 0.0182800292969, 0.01416015625, -9.1552734375e-05, 
-0.000213623046875, -0.00103759765625, -0.004638671875, -0.00106811523438, -0.00296020507812, -0.00567626953125, -0.00753784179688, -0.00827026367188, 
--0.00054931640625, -0.00143432617188, -0.00515747070312, -0.00433349609375, -0.00820922851562, -0.00881958007812, -0.00778198242188, -0.0079345703125, 
--0.004150390625, -0.00799560546875, -0.0118713378906, -0.00851440429688, -0.00982666015625, -0.00927734375, -0.0072021484375, -0.00619506835938, 
--0.00173950195312, 0.000946044921875, -0.00018310546875, -0.00192260742188, -0.0054931640625, -0.0030517578125, 0.000244140625, 0.00238037109375, 
-0.00604248046875, 0.00579833984375, 0.00018310546875, -0.000823974609375, 0.00018310546875, 0.00198364257812, 0.00637817382812, 0.00894165039062, 
-0.0067138671875, 0.00411987304688, 0.00244140625, 0.00241088867188, 0.00296020507812, 0.00265502929688, 0.001220703125, -6.103515625e-05, 
--9.1552734375e-05, 0.00115966796875, 0.000701904296875, 0.0025634765625, 0.00518798828125, 0.0042724609375, -0.000152587890625, -0.00265502929688, 
--0.002685546875, -0.00180053710938, 0.00125122070312, 0.00302124023438, -0.00100708007812, 0.0, 0.00155639648438, -0.00091552734375, 
--0.00167846679688, -0.00048828125, 6.103515625e-05, 0.00473022460938, 0.00930786132812, 0.0108337402344, 0.0130615234375, 0.01171875, 
-0.0042724609375, -0.00103759765625, -0.00555419921875, -0.0023193359375, 0.0074462890625, 0.0104064941406, 0.0155639648438, 0.0204467773438, 
-0.0081787109375, 0.000244140625, 0.0, -0.0008544921875, 0.00753784179688, 0.011962890625, 0.00546264648438, 0.00582885742188, 
-0.0072021484375, 0.00152587890625, -0.00375366210938, -0.0068359375, -0.0118713378906, -0.0167846679688, -0.0143737792969, -0.00973510742188, 
--0.0098876953125, -0.005615234375, -0.00146484375, -0.00497436523438, -0.009033203125, -0.0138244628906, -0.0175476074219, -0.012939453125, 
--0.00857543945312, -0.0052490234375, -0.000640869140625, 0.00143432617188, -0.00030517578125, -0.00152587890625, 0.00155639648438, 0.00616455078125, 
-0.00473022460938, 0.00112915039062, 0.00320434570312, 0.00592041015625, -0.0040283203125, -0.0107421875, -0.00399780273438, -0.00466918945312, 
--0.00759887695312, 0.00173950195312, 0.00079345703125, -0.0102844238281, -0.00799560546875, -0.00225830078125, -0.0029296875, -0.00244140625, 
--0.00238037109375, 0.00140380859375, 0.0116271972656, 0.00640869140625, -0.00738525390625, -0.00860595703125, -0.005859375, -0.00253295898438, 
-0.0125122070312, 0.0245971679688, 0.0189208984375, 0.0185241699219, 0.00225830078125, -0.0182189941406, 0.0140991210938, 0.0325927734375, 
-0.0078125, 0.0062255859375, 0.0009765625, -0.0035400390625, 0.014404296875, 0.0087890625, 0.00262451171875, 0.00442504882812, 
--0.0101928710938, -0.0116882324219, 0.00079345703125, -0.00149536132812, -0.00302124023438, -0.00323486328125, -0.00674438476562, -0.0052490234375, 
-0.00228881835938, 0.000335693359375, -0.006591796875, -0.00350952148438, 0.00357055664062, 0.00320434570312, -0.00103759765625, -0.00558471679688, 
--0.00753784179688, -0.00723266601562, -0.00729370117188, -0.00616455078125, -0.0029296875, -0.00048828125, -0.00238037109375, -0.00570678710938, 
--0.00546264648438, -0.00448608398438, -0.00421142578125, -0.0023193359375, -0.00131225585938, -0.00326538085938, -0.00396728515625, -0.00177001953125, 
--0.0018310546875, -0.00286865234375, -0.00515747070312, -0.00830078125, -0.00457763671875, 0.00112915039062, 0.00030517578125, -0.0025634765625, 
--0.00399780273438, -0.00491333007812, -0.00375366210938, -0.00216674804688, -0.00216674804688, -0.00180053710938, -0.00192260742188, -0.00360107421875, 
--0.00341796875, -0.00143432617188, -0.000152587890625, 0.0001220703125, 0.000152587890625, 0.0, -9.1552734375e-05, 0.000213623046875, 
-0.00054931640625, 0.000762939453125, 0.00079345703125, 0.00030517578125, -0.000244140625, 0.0, 0.000152587890625, 3.0517578125e-05 ]
-LEN_WAV_PAS = len(WAV_PAS)
+# 8120 samples, in tables/ (see utils/radio_pyo_tables.py)
+WAV_PAS = 'eb4f2e765b0426a4b856c711b298cc28726bff39'
 
 class Intro_crunch:
     def __init__(self, IpulseHz):
-        self.wavPas = DataTable(size=LEN_WAV_PAS, init=WAV_PAS)
+        self.wavPas = load_table(WAV_PAS, DataTable)
         self.envPulse = LinTable([(0,1), (8191,1)])
         self.pas = Pulsar(table=self.wavPas, env=self.envPulse, freq=IpulseHz, 
                           frac=[IpulseHz*0.5,IpulseHz*0.48], interp=4, mul=1.25).stop()
@@ -1067,7 +54,7 @@ class Intro_crunch:
 
 class Intro_buzz:
     def __init__(self):
-        self.wav = HarmTable([.1,0,.2,0,.1,0,0,0,.04,0,0,0,0.02])
+        self.wav = shared_table(HarmTable, [.1,0,.2,0,.1,0,0,0,.04,0,0,0,0.02])
         self.env = HannTable()
 
         fadetime = 60
@@ -1137,7 +124,7 @@ class Intro_buzz:
 
 class Intro_high_sines:
     def __init__(self):
-        self.wav = HarmTable([.1,0,.2,0,.1,0,0,0,.04,0,0,0,0.02])
+        self.wav = shared_table(HarmTable, [.1,0,.2,0,.1,0,0,0,.04,0,0,0,0.02])
         self.fade = Fader(3, 20, mul=.005)
         self.mod = Osc(self.wav, [.3,.5,.4]).stop()
         self.car = Sine([4010,4050,4000], mul=self.mod).stop()
@@ -1268,7 +255,7 @@ class Rhythm_pulses:
 class Rhythm_pulse:
     def __init__(self, table, freq=100, lfo_freq=.1, env_freq=2, amp=1):
         #self.wav = HarmTable([.4,0,.2,0,.1,0,0.1,0,.04,0,0,0,0.02,0,0,.018,0,0,0,.015])
-        self.wav = HarmTable([1,0,.1,0,.1,0,0,0,.04])
+        self.wav = shared_table(HarmTable, [1,0,.1,0,.1,0,0,0,.04])
         self.env = HannTable()
         self.osc = Osc(table=table, freq=env_freq, mul=.1)
 
@@ -20,6 +20,7 @@ Original work by __ground_state__ from 12-2013
 """
 from pyo import *
 import math, sys  # for `pow`
+from radio_pyo_wavetables import shared_table
 
 ################### USER-DEFINED VARIABLES ###################
 ### READY is used to manage the server behaviour depending ###
@@ -187,7 +188,8 @@ class Whale(PyoObject):
         # triEnvTable.graph()
         self._triEnv = TrigEnv(self._trig, triEnvTable, dur=self._dur)
         # TriTable Table oscillator from the pyo docs.
-        triTable = TriTable(order=50, size=24000).normalize()
+        triTable = shared_table(TriTable, order=50, size=24000,
+                                normalize=True)
         self._osc = Osc(triTable, self._freq, interp=4,
                         mul=((self._triEnv + self._lfo) * self._mul))
 
@@ -327,7 +329,8 @@ class Aqueous(PyoObject):
         # Begin processing.
 
         # 1st Saw oscillator.
-        saw1Table = SawTable(order=50, size=24000).normalize()
+        saw1Table = shared_table(SawTable, order=50, size=24000,
+                                 normalize=True)
         self._saw1 = Osc(saw1Table, self._freq, interp=4, mul=0.6839)
         # Dummy amplitude knobs to split Saw 1 into two paths with independent
         # amplitudes.
@@ -348,7 +351,8 @@ class Aqueous(PyoObject):
         reson1Dummy = reson1 * 1.0
 
         # 2nd Saw oscillator.
-        saw2Table = SawTable(order=50, size=24000).normalize()
+        saw2Table = shared_table(SawTable, order=50, size=24000,
+                                 normalize=True)
         self._saw2 = Osc(saw2Table, self._freq / 2, interp=4, mul=0.5433)
         # Dummy amplitude knob to allow mixing with Saw1, going into Reson2.
         saw2Dummy = self._saw2 * 1.0
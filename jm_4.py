@@ -10,6 +10,7 @@ from random import randrange
 from random import uniform
 from random import shuffle
 import sys
+from radio_pyo_score import Score
 
 TITLE = '4'
 ARTIST = 'jmdumas'
@@ -173,113 +174,153 @@ risingfader = Fader(20,0.1)
 rising = SineLoop([i*risingfreq for i in sortedfreqlist],feedback=0.2, mul=risingfader*0.07)
 
 #TIMELINE
-temps = -0.5
-def timecontrol():
-    global temps
-    temps += 0.5
-    if temps == 0:
-        voice.out()
-        startnoiserev.out()
-        noisetrigger.play()
-    elif temps == 3:
-        met3.play()
-        ppmet2.play()
-        ppmet.play()
-        pmet.play()
-        pmul.play()
-        pmull.play()
-        pfilter.out()
-        basss.out()
-    elif temps == 10:
-        chordtrigger.play()
-        chordverb.out()
-        chordfader.base.play()
-        chordfader2.base.play()
-        chorddel.out()
-    elif temps == 48:
-        noisetrig.list=[(0,0),(2,0.7),(3,0)]
-        voiceenv.list=[(0,0),(2,0.9),(60,0)]
-        noisetrigger.play()
-    elif temps == 50:
-        voice.stop()
-        startnoiserev.stop()
-        chordfader.base.stop()
-        pmul.stop()
-        met12.play()
-        meloseq.play()
-        revfafa.out()
-        pm.play()
-        melfade.base.play()
-        revdel.out()
-        soundgen2fader.play()
-        soundgen2delay.out()
-        met.play()
-        met2.play()
-        fader.play()
-        fad1[0].play()
-    elif temps == 52:
-        pfilter.stop()
-        chordverb.stop()
-    elif temps == 60:
-        fmpulse.out()
-        fmfade.play()
-    elif temps == 70:
-        fad1[0].play()
-    elif temps == 90:
-        fad1[1].play()
-    elif temps == 100:
-        fad1[2].play()
-    elif temps == 110:
-        fad1[3].play()
-        melfade.base.stop()
-        chordfader2.base.stop()
-    elif temps == 115:
-        fad1[4].play()
-    elif temps == 120:
-        fad1[5].play()
-    elif temps == 125:
-        fad1[6].play()
-    elif temps == 130:
-        fad1[7].play()
-    elif temps == 140:
-        fad1[8].play()
-    elif temps == 150:
-        fad1[9].play()
-        chordverb.out()
-        chordfader.base.play()
-    elif temps == 160:
-        soundgen2fader.stop()
-    elif temps == 210:
-        risingfreq.play()
-        risingfader.play()
-        rising.out()
-    elif temps == 219.5:
-        noisetrig.list=[(0,0),(0.5,0.9),(1,0)]
-        voiceenv.list=[(0,0),(.4,1),(90,0)]
-        voice.out()
-        startnoiserev.out()
-        noisetrigger.play()
-    elif temps == 220:
-        risingfader.stop()
-        risingfreq.stop()
-        pfilter.out()
-        pmul.play()
-        revdel.stop()
-        chordfader.base.stop()
-    elif temps == 250:
-        noisetrig.list=[(0,0),(2,0.7),(3,0)]
-        voiceenv.list=[(0,0),(2,0.9),(60,0)]
-        noisetrigger.play()
-    elif temps == 252:
-        pmull.stop()
-        pmul.stop()
-        fmfade.stop()
-        voice.stop()
-        startnoiserev.stop()
-    else:
-        pass
-        
-mainp = Pattern(timecontrol, 0.5)
+mainp = Score(server=s)
+
+@mainp.at(0)
+def at_0():
+    voice.out()
+    startnoiserev.out()
+    noisetrigger.play()
+
+@mainp.at(3)
+def at_3():
+    met3.play()
+    ppmet2.play()
+    ppmet.play()
+    pmet.play()
+    pmul.play()
+    pmull.play()
+    pfilter.out()
+    basss.out()
+
+@mainp.at(10)
+def at_10():
+    chordtrigger.play()
+    chordverb.out()
+    chordfader.base.play()
+    chordfader2.base.play()
+    chorddel.out()
+
+@mainp.at(48)
+def at_48():
+    noisetrig.list=[(0,0),(2,0.7),(3,0)]
+    voiceenv.list=[(0,0),(2,0.9),(60,0)]
+    noisetrigger.play()
+
+@mainp.at(50)
+def at_50():
+    voice.stop()
+    startnoiserev.stop()
+    chordfader.base.stop()
+    pmul.stop()
+    met12.play()
+    meloseq.play()
+    revfafa.out()
+    pm.play()
+    melfade.base.play()
+    revdel.out()
+    soundgen2fader.play()
+    soundgen2delay.out()
+    met.play()
+    met2.play()
+    fader.play()
+    fad1[0].play()
+
+@mainp.at(52)
+def at_52():
+    pfilter.stop()
+    chordverb.stop()
+
+@mainp.at(60)
+def at_60():
+    fmpulse.out()
+    fmfade.play()
+
+@mainp.at(70)
+def at_70():
+    fad1[0].play()
+
+@mainp.at(90)
+def at_90():
+    fad1[1].play()
+
+@mainp.at(100)
+def at_100():
+    fad1[2].play()
+
+@mainp.at(110)
+def at_110():
+    fad1[3].play()
+    melfade.base.stop()
+    chordfader2.base.stop()
+
+@mainp.at(115)
+def at_115():
+    fad1[4].play()
+
+@mainp.at(120)
+def at_120():
+    fad1[5].play()
+
+@mainp.at(125)
+def at_125():
+    fad1[6].play()
+
+@mainp.at(130)
+def at_130():
+    fad1[7].play()
+
+@mainp.at(140)
+def at_140():
+    fad1[8].play()
+
+@mainp.at(150)
+def at_150():
+    fad1[9].play()
+    chordverb.out()
+    chordfader.base.play()
+
+@mainp.at(160)
+def at_160():
+    soundgen2fader.stop()
+
+@mainp.at(210)
+def at_210():
+    risingfreq.play()
+    risingfader.play()
+    rising.out()
+
+@mainp.at(219.5)
+def at_219_5():
+    noisetrig.list=[(0,0),(0.5,0.9),(1,0)]
+    voiceenv.list=[(0,0),(.4,1),(90,0)]
+    voice.out()
+    startnoiserev.out()
+    noisetrigger.play()
+
+@mainp.at(220)
+def at_220():
+    risingfader.stop()
+    risingfreq.stop()
+    pfilter.out()
+    pmul.play()
+    revdel.stop()
+    chordfader.base.stop()
+
+@mainp.at(250)
+def at_250():
+    noisetrig.list=[(0,0),(2,0.7),(3,0)]
+    voiceenv.list=[(0,0),(2,0.9),(60,0)]
+    noisetrigger.play()
+
+@mainp.at(252)
+def at_252():
+    pmull.stop()
+    pmul.stop()
+    fmfade.stop()
+    voice.stop()
+    startnoiserev.stop()
+
 mainp.play()
 
 s.start()
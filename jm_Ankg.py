@@ -8,6 +8,7 @@ Created by jmdumas
 #IMPORTS-----------------------------------------------------------------------------------------------------------------------------
 from pyo import *
 import sys
+from radio_pyo_score import Score
 
 #CLASSES
 #303
@@ -192,177 +193,227 @@ def drop():
 trigtriggg = TrigFunc(deltriggg,drop)
 
 #SEQUENCE-----------------------------------------------------------------------------------------------------------------------
-temps = -1
-def timecontrol():
-    global temps
-    temps += 1
-    if temps == 0:
-        p.play()
-        met.play()
-        metmet.play()
-        met11.play()
-        met12.play()
-        abmul.play()
-    if temps == 1:
-        fmsfade.play()
-        fmhigh.out()
-    elif temps == 15:
-        table.play()
-    elif temps == 20:
-        verbfade.play()
-        verb.out()
-    elif temps == 30:
-        distofade.play()
-        disto.out()
-    elif temps == 40:
-        cut2.play()
-        pr.play()
-    elif temps == 57:
-        triggg.play()
-    elif temps == 58:
-        selkick.play()
-        selkick2.play()
-        selkick3.play()
-        selkick4.play()
-        selkick.fill()
-        selkick2.fill()
-        selkick3.fill()
-        selkick4.fill()
-        fmhigh.stop()
-        beat.out()
-        verb.stop()
-        distobeat.out()
-        bass.out()
-        disto.stop()
-        pr.stop()
-    elif temps == 78:
-        selkick.new()
-        selkick2.new()
-        selkick3.new()
-        selkick4.new()
-        selkick.fill()
-        selkick2.fill()
-        selkick3.fill()
-        selkick4.fill()
-        bitdistfilt.out()
-        bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
-        bass2.out()
-    elif temps == 94:
-        selkick.new()
-        selkick2.new()
-        selkick3.new()
-        selkick4.new()
-        selkick.fill()
-        selkick2.fill()
-        selkick3.fill()
-        selkick4.fill()
-        bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
-        trenv.input = selkick2
-    elif temps == 102:
-        selkick.new()
-        selkick2.new()
-        selkick3.new()
-        selkick4.new()
-        selkick.fill()
-        selkick2.fill()
-        selkick3.fill()
-        selkick4.fill()
-        bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
-        trenv.input = selkick4
-    elif temps == 114:
-        selkick.new()
-        selkick2.new()
-        selkick3.new()
-        selkick4.new()
-        selkick.fill()
-        selkick2.fill()
-        selkick3.fill()
-        selkick4.fill()
-        bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
-        trenv.input = selkick
-    elif temps == 130:
-        bassdist.out()
-        bass.freq = [bassscale[3],bassscale[3]*0.5+0.1,bassscale[3]*0.5+0.1,bassscale[3]]
-        bass.mul = 0.1
-        selkick.setPresets([[16, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0]])
-        selkick2.setPresets([[8, 1, 0, 0, 0, 1, 0, 1, 0]])
-        selkick3.setPresets([[16, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0]])
-        selkick4.setPresets([[4, 0, 0, 0, 0]])
-        selkick.recall(0)
-        selkick2.recall(0)
-        selkick3.recall(0)
-        selkick4.recall(0)
-        meloseq.play()
-        pm.play()
-    elif temps == 134:
-        selkick.fill()
-    elif temps == 140:
-        selkick.fill()
-    elif temps == 170:
-        bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
-        bass.mul = 0.2
-    elif temps == 172:
-        bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
-    elif temps == 174:
-        bass.freq = [bassscale[3],bassscale[3]*0.5+0.1,bassscale[3]*0.5+0.1,bassscale[3]]
-        bass.mul = 0.15
-    elif temps == 176:
-        selkick2.fill()
-        selkick3.fill()
-        selkick4.fill()
-    elif temps == 178:
-        bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
-        bass.mul = 0.2
-    elif temps == 180:
-        bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
-    elif temps == 182:
-        bass.freq = [bassscale[3],bassscale[3]*0.5+0.1,bassscale[3]*0.5+0.1,bassscale[3]]
-    elif temps == 184:
-        bass.freq = [bassscale[11],bassscale[11]*0.5+0.1,bassscale[11]*0.5+0.1,bassscale[11]]
-        bass.mul = 0.05
-        selkick3.stop()
-        selkick4.stop()
-        meloseq.stop()
-        met11.stop()
-        met12.stop()
-        distobeat.stop()
-        delaybeat.stop()
-        bitdist.stop()
-        bitdistfilt.stop()
-        bass2.stop()
-        pm.stop()
-        p.stop()
-    elif temps == 185:
-        melo.stop()
-        melo2.stop()
-        melo3.stop()
-        melo4.stop()
-    elif temps == 192:
-        verbfade.play()
-        verb.out()
-        bass.freq = [bassscale[0],bassscale[11]*0.5+0.1,bassscale[11]*0.5+0.1,bassscale[0]]
-        fg.play()
-        bass.mul = 0.05*fg
-        fd.play()
-        fmkick.mul = (kickmul*0.4)*fd
-        distobeat.play()
-        delaybeat.play()
-        bitdist.play()
-        bitdistfilt.out()
-        distofafa.stop()
-    elif temps == 196:
-        selkick2.fill()
-    elif temps == 201:
-        fj.play()
-        fmkick2.mul = (kick2mul*0.3)*fj
-        verbfade.stop()
-    elif temps == 221:
-        selkick.stop()
-        selkick2.stop()
-    else:
-        pass
-
-mainp = Pattern(timecontrol, 1)
+mainp = Score(server=s)
+
+@mainp.at(0)
+def at_0():
+    p.play()
+    met.play()
+    metmet.play()
+    met11.play()
+    met12.play()
+    abmul.play()
+
+@mainp.at(1)
+def at_1():
+    fmsfade.play()
+    fmhigh.out()
+
+@mainp.at(15)
+def at_15():
+    table.play()
+
+@mainp.at(20)
+def at_20():
+    verbfade.play()
+    verb.out()
+
+@mainp.at(30)
+def at_30():
+    distofade.play()
+    disto.out()
+
+@mainp.at(40)
+def at_40():
+    cut2.play()
+    pr.play()
+
+@mainp.at(57)
+def at_57():
+    triggg.play()
+
+@mainp.at(58)
+def at_58():
+    selkick.play()
+    selkick2.play()
+    selkick3.play()
+    selkick4.play()
+    selkick.fill()
+    selkick2.fill()
+    selkick3.fill()
+    selkick4.fill()
+    fmhigh.stop()
+    beat.out()
+    verb.stop()
+    distobeat.out()
+    bass.out()
+    disto.stop()
+    pr.stop()
+
+@mainp.at(78)
+def at_78():
+    selkick.new()
+    selkick2.new()
+    selkick3.new()
+    selkick4.new()
+    selkick.fill()
+    selkick2.fill()
+    selkick3.fill()
+    selkick4.fill()
+    bitdistfilt.out()
+    bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
+    bass2.out()
+
+@mainp.at(94)
+def at_94():
+    selkick.new()
+    selkick2.new()
+    selkick3.new()
+    selkick4.new()
+    selkick.fill()
+    selkick2.fill()
+    selkick3.fill()
+    selkick4.fill()
+    bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
+    trenv.input = selkick2
+
+@mainp.at(102)
+def at_102():
+    selkick.new()
+    selkick2.new()
+    selkick3.new()
+    selkick4.new()
+    selkick.fill()
+    selkick2.fill()
+    selkick3.fill()
+    selkick4.fill()
+    bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
+    trenv.input = selkick4
+
+@mainp.at(114)
+def at_114():
+    selkick.new()
+    selkick2.new()
+    selkick3.new()
+    selkick4.new()
+    selkick.fill()
+    selkick2.fill()
+    selkick3.fill()
+    selkick4.fill()
+    bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
+    trenv.input = selkick
+
+@mainp.at(130)
+def at_130():
+    bassdist.out()
+    bass.freq = [bassscale[3],bassscale[3]*0.5+0.1,bassscale[3]*0.5+0.1,bassscale[3]]
+    bass.mul = 0.1
+    selkick.setPresets([[16, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0]])
+    selkick2.setPresets([[8, 1, 0, 0, 0, 1, 0, 1, 0]])
+    selkick3.setPresets([[16, 0, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0]])
+    selkick4.setPresets([[4, 0, 0, 0, 0]])
+    selkick.recall(0)
+    selkick2.recall(0)
+    selkick3.recall(0)
+    selkick4.recall(0)
+    meloseq.play()
+    pm.play()
+
+@mainp.at(134)
+def at_134():
+    selkick.fill()
+
+@mainp.at(140)
+def at_140():
+    selkick.fill()
+
+@mainp.at(170)
+def at_170():
+    bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
+    bass.mul = 0.2
+
+@mainp.at(172)
+def at_172():
+    bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
+
+@mainp.at(174)
+def at_174():
+    bass.freq = [bassscale[3],bassscale[3]*0.5+0.1,bassscale[3]*0.5+0.1,bassscale[3]]
+    bass.mul = 0.15
+
+@mainp.at(176)
+def at_176():
+    selkick2.fill()
+    selkick3.fill()
+    selkick4.fill()
+
+@mainp.at(178)
+def at_178():
+    bass.freq = [bassscale[0],bassscale[0]*0.5+0.1,bassscale[0]*0.5+0.1,bassscale[0]]
+    bass.mul = 0.2
+
+@mainp.at(180)
+def at_180():
+    bass.freq = [bassscale[1],bassscale[1]*0.5+0.1,bassscale[1]*0.5+0.1,bassscale[1]]
+
+@mainp.at(182)
+def at_182():
+    bass.freq = [bassscale[3],bassscale[3]*0.5+0.1,bassscale[3]*0.5+0.1,bassscale[3]]
+
+@mainp.at(184)
+def at_184():
+    bass.freq = [bassscale[11],bassscale[11]*0.5+0.1,bassscale[11]*0.5+0.1,bassscale[11]]
+    bass.mul = 0.05
+    selkick3.stop()
+    selkick4.stop()
+    meloseq.stop()
+    met11.stop()
+    met12.stop()
+    distobeat.stop()
+    delaybeat.stop()
+    bitdist.stop()
+    bitdistfilt.stop()
+    bass2.stop()
+    pm.stop()
+    p.stop()
+
+@mainp.at(185)
+def at_185():
+    melo.stop()
+    melo2.stop()
+    melo3.stop()
+    melo4.stop()
+
+@mainp.at(192)
+def at_192():
+    verbfade.play()
+    verb.out()
+    bass.freq = [bassscale[0],bassscale[11]*0.5+0.1,bassscale[11]*0.5+0.1,bassscale[0]]
+    fg.play()
+    bass.mul = 0.05*fg
+    fd.play()
+    fmkick.mul = (kickmul*0.4)*fd
+    distobeat.play()
+    delaybeat.play()
+    bitdist.play()
+    bitdistfilt.out()
+    distofafa.stop()
+
+@mainp.at(196)
+def at_196():
+    selkick2.fill()
+
+@mainp.at(201)
+def at_201():
+    fj.play()
+    fmkick2.mul = (kick2mul*0.3)*fj
+    verbfade.stop()
+
+@mainp.at(221)
+def at_221():
+    selkick.stop()
+    selkick2.stop()
+
 mainp.play()
 
 s.start()
@@ -8,6 +8,8 @@ Created by jmdumas
 #IMPORTS-----------------------------------------------------------------------------------------------------------------------------
 from pyo import *
 import sys
+from radio_pyo_tables import load_table
+from radio_pyo_score import Score
 
 #CONSTANTS---------------------------------------------------------------------------------------------------------------------------
 TITLE = 'Drehm'
@@ -21,771 +23,12 @@ s.setStartOffset(0)
 s.amp = 1
 
 #BUFFER------------------------------------------------------------------------------------------------------------------------------
-buff = [
--0.0369262695312, -0.0375671386719, -0.0379028320312, -0.0381469726562, -0.0386962890625, -0.0394287109375, -0.0396728515625, -0.0399475097656, 
--0.0406494140625, -0.0408020019531, -0.0409240722656, -0.0411987304688, -0.0414428710938, -0.0418090820312, -0.0418395996094, -0.0421142578125, 
--0.0423889160156, -0.0423889160156, -0.0421142578125, -0.0417785644531, -0.0414428710938, -0.0412292480469, -0.0409545898438, -0.040771484375, 
--0.0406494140625, -0.0403137207031, -0.0396423339844, -0.0390625, -0.0381469726562, -0.0372619628906, -0.0366516113281, -0.0357055664062, 
--0.0351867675781, -0.0344848632812, -0.0335693359375, -0.0323791503906, -0.0314636230469, -0.030029296875, -0.0287780761719, -0.0274963378906, 
--0.0257873535156, -0.0238342285156, -0.0215148925781, -0.0193481445312, -0.0166320800781, -0.0136108398438, -0.010498046875, -0.0078125, 
--0.00634765625, -0.00656127929688, -0.00933837890625, -0.0151062011719, -0.0226440429688, -0.0309143066406, -0.0387573242188, -0.0454406738281, 
--0.0505981445312, -0.0533752441406, -0.05419921875, -0.0533447265625, -0.0517883300781, -0.0487670898438, -0.0448608398438, -0.0399475097656, 
--0.0351257324219, -0.0293579101562, -0.0245056152344, -0.0196533203125, -0.015380859375, -0.0120849609375, -0.00942993164062, -0.00808715820312, 
--0.00689697265625, -0.00567626953125, -0.004150390625, -0.00177001953125, 0.0009765625, 0.00430297851562, 0.00765991210938, 0.0103149414062, 
-0.0124816894531, 0.0140686035156, 0.0148620605469, 0.0140686035156, 0.0112915039062, 0.00665283203125, 0.000732421875, -0.00631713867188, 
--0.013916015625, -0.021484375, -0.0287475585938, -0.0360717773438, -0.0423583984375, -0.0478515625, -0.0520935058594, -0.0560913085938, 
--0.0596923828125, -0.0633239746094, -0.06640625, -0.0693664550781, -0.0709228515625, -0.0718383789062, -0.0724182128906, -0.072998046875, 
--0.0733032226562, -0.073974609375, -0.0748901367188, -0.0763244628906, -0.0779113769531, -0.0797119140625, -0.0806274414062, -0.0806274414062, 
--0.0799560546875, -0.07763671875, -0.0736083984375, -0.0682067871094, -0.0624084472656, -0.056396484375, -0.050537109375, -0.0451965332031, 
--0.0399169921875, -0.0351257324219, -0.0302734375, -0.0257263183594, -0.021484375, -0.0181274414062, -0.0157165527344, -0.0141906738281, 
--0.01416015625, -0.0154113769531, -0.0166625976562, -0.01806640625, -0.0194091796875, -0.0202941894531, -0.0198974609375, -0.0181884765625, 
--0.0157470703125, -0.0126647949219, -0.0102844238281, -0.00869750976562, -0.009033203125, -0.0105590820312, -0.0133361816406, -0.017822265625, 
--0.0238952636719, -0.0308532714844, -0.0381469726562, -0.0448608398438, -0.0506591796875, -0.055419921875, -0.0593872070312, -0.0624694824219, 
--0.0639038085938, -0.0636291503906, -0.0614929199219, -0.0575866699219, -0.0520935058594, -0.0451354980469, -0.0375671386719, -0.0308532714844, 
--0.0248413085938, -0.0202331542969, -0.0181579589844, -0.0171813964844, -0.0184631347656, -0.0202331542969, -0.02294921875, -0.0260314941406, 
--0.0287475585938, -0.0311584472656, -0.03271484375, -0.0342407226562, -0.0362854003906, -0.0387573242188, -0.0414733886719, -0.0445251464844, 
--0.0466613769531, -0.0481262207031, -0.0482177734375, -0.0472412109375, -0.0457153320312, -0.0439147949219, -0.0424499511719, -0.041748046875, 
--0.0418395996094, -0.0426940917969, -0.0436706542969, -0.0445251464844, -0.0448303222656, -0.0445251464844, -0.0424194335938, -0.0390625, 
--0.0344848632812, -0.0296630859375, -0.0245056152344, -0.0194091796875, -0.0145263671875, -0.0101928710938, -0.00689697265625, -0.00332641601562, 
-6.103515625e-05, 0.00314331054688, 0.00643920898438, 0.00979614257812, 0.0127563476562, 0.0152282714844, 0.0161743164062, 0.0160827636719, 
-0.0152587890625, 0.0122680664062, 0.00692749023438, -0.00079345703125, -0.0108337402344, -0.0221252441406, -0.0332946777344, -0.0438842773438, 
--0.0547790527344, -0.0655212402344, -0.0739135742188, -0.0809020996094, -0.0867004394531, -0.0906677246094, -0.0921325683594, -0.0921020507812, 
--0.0912475585938, -0.0906372070312, -0.0899963378906, -0.0897216796875, -0.0906066894531, -0.0915832519531, -0.0933227539062, -0.0948791503906, 
--0.0954284667969, -0.09521484375, -0.0936584472656, -0.0897216796875, -0.0842590332031, -0.0772705078125, -0.0691223144531, -0.0605773925781, 
--0.0511474609375, -0.0424499511719, -0.0339050292969, -0.0257568359375, -0.0180969238281, -0.011474609375, -0.00503540039062, 0.0018310546875, 
-0.00830078125, 0.0142517089844, 0.01953125, 0.0231323242188, 0.0260925292969, 0.0276794433594, 0.028564453125, 0.0279846191406, 
-0.0270385742188, 0.02587890625, 0.0243530273438, 0.022216796875, 0.0191955566406, 0.014892578125, 0.0104064941406, 0.0054931640625, 
-0.000396728515625, -0.005126953125, -0.0102233886719, -0.0151672363281, -0.0190124511719, -0.0230102539062, -0.026611328125, -0.0314331054688, 
--0.0369873046875, -0.0435485839844, -0.0509033203125, -0.0587768554688, -0.0663452148438, -0.0727844238281, -0.078125, -0.0824584960938, 
--0.0848693847656, -0.0857238769531, -0.0855102539062, -0.084228515625, -0.0818176269531, -0.0785217285156, -0.0733642578125, -0.0669555664062, 
--0.0593872070312, -0.0518188476562, -0.0441284179688, -0.0366821289062, -0.0293579101562, -0.0220947265625, -0.0151062011719, -0.0084228515625, 
--0.00234985351562, 0.00277709960938, 0.00701904296875, 0.0112915039062, 0.01611328125, 0.0213623046875, 0.0267028808594, 0.0328979492188, 
-0.0391845703125, 0.0449523925781, 0.0501098632812, 0.0540466308594, 0.0567626953125, 0.0586242675781, 0.059814453125, 0.0603637695312, 
-0.0601196289062, 0.0595092773438, 0.0580139160156, 0.05615234375, 0.0537109375, 0.0513916015625, 0.0491027832031, 0.0458679199219, 
-0.0422058105469, 0.038330078125, 0.0340270996094, 0.0292053222656, 0.0233459472656, 0.0161437988281, 0.00735473632812, -0.00262451171875, 
--0.0138549804688, -0.0257873535156, -0.0372314453125, -0.0478515625, -0.0563354492188, -0.0630187988281, -0.0679016113281, -0.0708923339844, 
--0.072509765625, -0.0727233886719, -0.0717468261719, -0.0694580078125, -0.06640625, -0.06298828125, -0.0593872070312, -0.0551452636719, 
--0.0502624511719, -0.0454711914062, -0.0405578613281, -0.0366516113281, -0.0335998535156, -0.0314331054688, -0.030029296875, -0.0296936035156, 
--0.0299377441406, -0.0302429199219, -0.0302734375, -0.0299987792969, -0.0291137695312, -0.0271606445312, -0.0248107910156, -0.0218200683594, 
--0.0193481445312, -0.0172424316406, -0.0150756835938, -0.0135803222656, -0.0120849609375, -0.0108642578125, -0.00961303710938, -0.00845336914062, 
--0.00726318359375, -0.00628662109375, -0.00570678710938, -0.00540161132812, -0.00448608398438, -0.0032958984375, -0.00054931640625, 0.00314331054688, 
-0.00704956054688, 0.0109252929688, 0.0146484375, 0.0176391601562, 0.0191955566406, 0.0191650390625, 0.0179748535156, 0.0158081054688, 
-0.0128479003906, 0.00946044921875, 0.00613403320312, 0.0028076171875, -0.000885009765625, -0.00387573242188, -0.00628662109375, -0.00814819335938, 
--0.0098876953125, -0.0121154785156, -0.013916015625, -0.0163269042969, -0.0198669433594, -0.0245666503906, -0.0308837890625, -0.0377807617188, 
--0.0461120605469, -0.0545349121094, -0.0624084472656, -0.0693969726562, -0.0748901367188, -0.0781860351562, -0.0793762207031, -0.0782470703125, 
--0.0739135742188, -0.0678405761719, -0.0609436035156, -0.053955078125, -0.046630859375, -0.0393676757812, -0.0330505371094, -0.0259704589844, 
--0.0198974609375, -0.013916015625, -0.00811767578125, -0.00262451171875, 0.003662109375, 0.0100402832031, 0.0164794921875, 0.0234069824219, 
-0.0295104980469, 0.0352478027344, 0.0392456054688, 0.0419311523438, 0.0430908203125, 0.043701171875, 0.0437927246094, 0.0430908203125, 
-0.0416564941406, 0.0392150878906, 0.037353515625, 0.0352172851562, 0.033447265625, 0.0316467285156, 0.0294799804688, 0.02734375, 
-0.0255737304688, 0.023681640625, 0.0219421386719, 0.0197448730469, 0.0171203613281, 0.013916015625, 0.0103759765625, 0.00555419921875, 
-0.0001220703125, -0.00540161132812, -0.0121154785156, -0.0187377929688, -0.0254211425781, -0.0318298339844, -0.0371704101562, -0.0411987304688, 
--0.0439758300781, -0.0462951660156, -0.0479431152344, -0.049072265625, -0.0490417480469, -0.049072265625, -0.0487365722656, -0.0479125976562, 
--0.0469360351562, -0.0453796386719, -0.0433349609375, -0.0408935546875, -0.0381469726562, -0.035400390625, -0.0324401855469, -0.0302734375, 
--0.0284118652344, -0.0269165039062, -0.025390625, -0.0236206054688, -0.0212097167969, -0.0177612304688, -0.0139465332031, -0.00967407226562, 
--0.00509643554688, -0.000213623046875, 0.00454711914062, 0.00888061523438, 0.0125427246094, 0.01611328125, 0.02001953125, 0.0241088867188, 
-0.0273742675781, 0.0306701660156, 0.03369140625, 0.0370483398438, 0.0404357910156, 0.0431518554688, 0.0452270507812, 0.0468139648438, 
-0.0470886230469, 0.0461730957031, 0.0449523925781, 0.0440368652344, 0.0428161621094, 0.0413208007812, 0.039794921875, 0.0379638671875, 
-0.0355224609375, 0.031982421875, 0.0285339355469, 0.0246276855469, 0.0209655761719, 0.0173950195312, 0.0127563476562, 0.00802612304688, 
-0.00186157226562, -0.00570678710938, -0.0138549804688, -0.0224609375, -0.0311279296875, -0.0393676757812, -0.0469970703125, -0.0527038574219, 
--0.0566711425781, -0.0584411621094, -0.0585021972656, -0.0569763183594, -0.0541687011719, -0.0506286621094, -0.0462951660156, -0.0415344238281, 
--0.03662109375, -0.0314331054688, -0.0257568359375, -0.0193786621094, -0.0123596191406, -0.00543212890625, 0.002197265625, 0.00949096679688, 
-0.0169982910156, 0.0239868164062, 0.0316467285156, 0.0386047363281, 0.0455932617188, 0.0519104003906, 0.0564270019531, 0.0577087402344, 
-0.0558776855469, 0.0549621582031, 0.0552368164062, 0.0543823242188, 0.0369873046875, 0.0282897949219, 0.0283203125, 0.0260620117188, 
-0.0282897949219, 0.0248718261719, 0.027099609375, 0.101104736328, 0.0874328613281, 0.0804138183594, 0.00344848632812, -0.0448608398438, 
-0.140472412109, 0.0944213867188, 0.06591796875, 0.0743103027344, 0.0577087402344, 0.0597839355469, -0.0263061523438, -0.00271606445312, 
--0.00839233398438, 0.0453186035156, 0.0352478027344, 0.0497741699219, 0.119567871094, 0.142913818359, 0.0380249023438, -0.144348144531, 
--0.172821044922, -0.0144958496094, 0.0895080566406, 0.0246276855469, -0.137939453125, -0.158905029297, 0.0161743164062, 0.0880737304688, 
--0.0217895507812, -0.038818359375, -0.0569763183594, 0.0316772460938, 0.05615234375, -0.0654296875, -0.0970458984375, -0.121246337891, 
--0.106414794922, -0.0660705566406, 0.00677490234375, 0.0676879882812, 0.0328674316406, 0.0737915039062, 0.0613098144531, 0.0121765136719, 
--0.0269165039062, -0.104614257812, -0.0499877929688, 0.0386047363281, 0.0509948730469, 0.0191650390625, 0.0164794921875, 0.0318908691406, 
-0.00131225585938, -0.0193786621094, 0.0534362792969, 0.0285034179688, -0.0037841796875, 0.0322265625, 0.0594787597656, 0.0561828613281, 
-0.017333984375, 0.038330078125, 0.0194396972656, -0.0514831542969, -0.0447998046875, 0.0394897460938, 0.0465087890625, -0.0254516601562, 
--0.0451354980469, -0.00750732421875, -0.0035400390625, 0.0100402832031, 0.017333984375, 0.0106811523438, 0.0270690917969, 0.0867919921875, 
-0.124694824219, 0.0489807128906, -0.0230407714844, -0.00814819335938, 0.0285949707031, 0.00732421875, -0.0321044921875, -0.0359497070312, 
--0.00845336914062, 0.00796508789062, -0.00848388671875, -0.0414428710938, -0.0884704589844, -0.0876159667969, -0.1064453125, -0.112426757812, 
--0.0881958007812, -0.0523986816406, -0.121612548828, -0.184326171875, -0.299621582031, -0.365783691406, -0.155517578125, 0.0116577148438, 
-0.0485229492188, -0.000244140625, -0.0693969726562, -0.127624511719, -0.20556640625, -0.191101074219, -0.0532836914062, 0.00222778320312, 
--0.0181579589844, 0.0507202148438, 0.211456298828, 0.204193115234, 0.0980224609375, 0.00396728515625, 0.0110168457031, 0.176879882812, 
-0.309722900391, 0.288513183594, 0.141998291016, 0.0486145019531, 0.186584472656, 0.318237304688, 0.164764404297, -0.0271911621094, 
--0.0469665527344, 0.136840820312, 0.250946044922, 0.106536865234, -0.116973876953, -0.149505615234, -0.00115966796875, 0.0392150878906, 
--0.0281372070312, -0.104309082031, -0.114898681641, -0.0375366210938, -0.0148010253906, -0.0924072265625, -0.190460205078, -0.208862304688, 
--0.0718688964844, 0.15234375, 0.166900634766, -0.0102233886719, -0.167999267578, -0.120056152344, 0.0291442871094, 0.0158081054688, 
--0.0484313964844, -0.0797119140625, -0.0296325683594, 0.0545959472656, 0.0979919433594, 0.138977050781, 0.109008789062, 0.0849914550781, 
-0.08349609375, 0.0206298828125, -0.0125732421875, 0.02490234375, 0.0632019042969, 0.0436706542969, 0.0313415527344, 0.0855712890625, 
-0.105560302734, 0.0301208496094, -0.0914916992188, -0.167358398438, -0.132507324219, -0.0584716796875, -0.0575866699219, -0.0963745117188, 
--0.108520507812, -0.0967102050781, -0.0123596191406, 0.0982971191406, 0.109924316406, 0.0625, 0.0765075683594, 0.0795288085938, 
-0.0743408203125, 0.0889282226562, 0.12353515625, 0.156616210938, 0.155944824219, 0.126190185547, 0.100524902344, 0.126220703125, 
-0.184448242188, 0.224548339844, 0.146209716797, 0.0413513183594, 0.0364685058594, 0.129913330078, 0.192047119141, 0.108673095703, 
--0.000244140625, 0.00970458984375, 0.0240478515625, -0.030517578125, -0.0797729492188, -0.101226806641, -0.07666015625, -0.0126953125, 
-0.0452270507812, 0.0798645019531, 0.0355529785156, -0.0693359375, -0.0694580078125, 0.0298461914062, 0.0713195800781, 0.00921630859375, 
--0.0121459960938, 0.0607299804688, 0.0892944335938, 0.0500793457031, 0.0331726074219, 0.0694274902344, 0.104431152344, 0.108337402344, 
-0.121978759766, 0.133483886719, 0.104431152344, 0.048583984375, 0.072265625, 0.138641357422, 0.108337402344, 0.0255126953125, 
-0.0343627929688, 0.154388427734, 0.211151123047, 0.0995178222656, -0.0169067382812, 0.0434265136719, 0.169342041016, 0.162658691406, 
-0.0464477539062, -0.0408630371094, -0.0145263671875, 0.0792541503906, 0.154144287109, 0.170227050781, 0.162017822266, 0.168365478516, 
-0.131072998047, 0.0789184570312, 0.0465393066406, 0.0258178710938, 0.0558776855469, 0.0916442871094, 0.0962524414062, 0.113220214844, 
-0.114349365234, 0.0801391601562, 0.0440979003906, 0.0470275878906, 0.121704101562, 0.196655273438, 0.192596435547, 0.116577148438, 
-0.0389099121094, 0.0270080566406, 0.0776977539062, 0.149291992188, 0.1611328125, 0.0871276855469, 0.03466796875, 0.0549621582031, 
-0.0640258789062, 0.0413208007812, 0.0149230957031, 0.00582885742188, 0.0218505859375, -0.00924682617188, -0.0509033203125, -0.0269775390625, 
-0.00497436523438, -0.0120544433594, -0.0557861328125, -0.0763854980469, -0.0223999023438, 0.0589294433594, 0.0492248535156, -0.0281677246094, 
--0.0636291503906, -0.0442810058594, 0.0107116699219, 0.0458679199219, 0.0258483886719, -0.033935546875, -0.0621643066406, 0.0207214355469, 
-0.106262207031, 0.109832763672, 0.0604248046875, 0.0185852050781, 0.0249328613281, 0.0564270019531, 0.0537719726562, 0.0209350585938, 
-0.01318359375, 0.0155334472656, 3.0517578125e-05, -0.0599975585938, -0.106414794922, -0.0379028320312, 0.0619812011719, 0.0558776855469, 
--0.0211486816406, -0.0830383300781, -0.069091796875, -0.0008544921875, 0.0240173339844, -0.0102233886719, -0.0970458984375, -0.123382568359, 
--0.032958984375, 0.0352172851562, 0.0107421875, -0.0333251953125, -0.0248107910156, 0.0188598632812, 0.0330810546875, 0.00704956054688, 
--0.00628662109375, 0.0215454101562, 0.0562133789062, 0.0506591796875, 0.0262145996094, 0.00918579101562, 0.00732421875, -0.0010986328125, 
--0.0196838378906, 0.00128173828125, 0.0596008300781, 0.0952453613281, 0.0791931152344, 0.0285949707031, -0.0047607421875, -0.00543212890625, 
-0.00189208984375, -0.000518798828125, 0.0109252929688, 0.0491638183594, 0.0850524902344, 0.0903930664062, 0.0782775878906, 0.0534973144531, 
-0.0227966308594, 0.0261840820312, 0.06982421875, 0.103790283203, 0.0925903320312, 0.06494140625, 0.0789489746094, 0.120147705078, 
-0.140197753906, 0.132263183594, 0.109893798828, 0.097412109375, 0.111419677734, 0.13134765625, 0.136871337891, 0.13720703125, 
-0.144439697266, 0.163238525391, 0.182647705078, 0.177795410156, 0.145965576172, 0.130218505859, 0.150177001953, 0.175933837891, 
-0.176635742188, 0.154754638672, 0.137725830078, 0.144805908203, 0.144348144531, 0.130523681641, 0.125640869141, 0.125274658203, 
-0.139007568359, 0.134460449219, 0.110168457031, 0.103820800781, 0.0934448242188, 0.0962524414062, 0.117095947266, 0.135314941406, 
-0.141418457031, 0.118347167969, 0.0734558105469, 0.0461730957031, 0.0470581054688, 0.0771484375, 0.115875244141, 0.132934570312, 
-0.131652832031, 0.100463867188, 0.0671691894531, 0.0643615722656, 0.0888671875, 0.114135742188, 0.109527587891, 0.0938110351562, 
-0.108947753906, 0.126861572266, 0.104064941406, 0.0762023925781, 0.0667724609375, 0.0694885253906, 0.0740356445312, 0.0759582519531, 
-0.0912780761719, 0.113220214844, 0.117767333984, 0.105316162109, 0.102844238281, 0.106231689453, 0.0950317382812, 0.0955505371094, 
-0.109313964844, 0.106201171875, 0.100433349609, 0.121704101562, 0.150817871094, 0.150238037109, 0.114349365234, 0.107452392578, 
-0.151672363281, 0.169982910156, 0.127777099609, 0.0755310058594, 0.0626220703125, 0.0810241699219, 0.102844238281, 0.105346679688, 
-0.0852966308594, 0.0707397460938, 0.0827941894531, 0.0989685058594, 0.0801696777344, 0.0364990234375, 0.0227661132812, 0.0649108886719, 
-0.114440917969, 0.130187988281, 0.124114990234, 0.111999511719, 0.104095458984, 0.0973815917969, 0.0798034667969, 0.078369140625, 
-0.0986328125, 0.119018554688, 0.134979248047, 0.133880615234, 0.115600585938, 0.103179931641, 0.0986938476562, 0.0897827148438, 
-0.0782775878906, 0.0758972167969, 0.0802307128906, 0.0858154296875, 0.0987243652344, 0.113159179688, 0.112854003906, 0.0995788574219, 
-0.0704040527344, 0.0464782714844, 0.0425109863281, 0.0467834472656, 0.0501098632812, 0.042236328125, 0.0376281738281, 0.0508117675781, 
-0.063720703125, 0.06494140625, 0.0507202148438, 0.0243530273438, 0.0116271972656, 0.021240234375, 0.0398254394531, 0.0568237304688, 
-0.0579528808594, 0.0382995605469, 0.0201110839844, 0.0191040039062, 0.0370788574219, 0.0570678710938, 0.0516357421875, 0.0407409667969, 
-0.0467224121094, 0.0431518554688, 0.0374145507812, 0.0582580566406, 0.0776977539062, 0.0823059082031, 0.0789184570312, 0.0716247558594, 
-0.0650329589844, 0.0725402832031, 0.0795593261719, 0.0785522460938, 0.0713195800781, 0.0628662109375, 0.0753173828125, 0.0970764160156, 
-0.0886535644531, 0.0670776367188, 0.054931640625, 0.0458984375, 0.0325012207031, 0.0231628417969, 0.0194396972656, 0.0325622558594, 
-0.0528259277344, 0.0694885253906, 0.0674133300781, 0.05615234375, 0.069580078125, 0.0761413574219, 0.0595397949219, 0.0276184082031, 
-0.0225830078125, 0.0491333007812, 0.0637817382812, 0.0592041015625, 0.0503845214844, 0.0509948730469, 0.0546569824219, 0.0674438476562, 
-0.0752868652344, 0.071044921875, 0.0637512207031, 0.0637817382812, 0.0770874023438, 0.0831604003906, 0.071044921875, 0.0637817382812, 
-0.0603942871094, 0.0522155761719, 0.0480041503906, 0.0462036132812, 0.0579528808594, 0.0895690917969, 0.104370117188, 0.0928955078125, 
-0.0622253417969, 0.0355224609375, 0.03857421875, 0.0643310546875, 0.0816650390625, 0.0719299316406, 0.0562438964844, 0.0479736328125, 
-0.0464782714844, 0.0488891601562, 0.0495300292969, 0.051025390625, 0.0494384765625, 0.0458679199219, 0.0407104492188, 0.0416259765625, 
-0.0507202148438, 0.0564270019531, 0.0686950683594, 0.080078125, 0.0704650878906, 0.0546264648438, 0.0495300292969, 0.054931640625, 
-0.0625610351562, 0.0491638183594, 0.0295104980469, 0.0328063964844, 0.0452880859375, 0.0582885742188, 0.0771179199219, 0.0804138183594, 
-0.0619506835938, 0.0337219238281, 0.0188903808594, 0.0316467285156, 0.0594482421875, 0.0750427246094, 0.0764770507812, 0.0740966796875, 
-0.0603332519531, 0.0628967285156, 0.0852966308594, 0.0919189453125, 0.0832214355469, 0.0704345703125, 0.0628967285156, 0.0725402832031, 
-0.0813293457031, 0.0731506347656, 0.0665283203125, 0.079833984375, 0.0910949707031, 0.0907287597656, 0.0788879394531, 0.0765686035156, 
-0.0895690917969, 0.0970153808594, 0.0764770507812, 0.0656433105469, 0.0674133300781, 0.0689392089844, 0.0715942382812, 0.071044921875, 
-0.066162109375, 0.0646667480469, 0.0671081542969, 0.0577087402344, 0.0492248535156, 0.0397644042969, 0.0343322753906, 0.037353515625, 
-0.0216064453125, -0.00808715820312, -0.013916015625, -0.00875854492188, -0.005126953125, -0.00869750976562, -0.0281066894531, -0.0406188964844, 
--0.0245056152344, -0.00238037109375, 0.00857543945312, -0.0059814453125, -0.0381164550781, -0.0354614257812, -0.0084228515625, 0.00466918945312, 
-0.00704956054688, 0.00674438476562, 0.0115966796875, 0.0373229980469, 0.0416259765625, 0.0185852050781, -0.000274658203125, 0.00186157226562, 
-0.0243530273438, 0.0431518554688, 0.0422058105469, 0.0231323242188, 0.0158386230469, 0.0279541015625, 0.0415344238281, 0.0419921875, 
-0.0285034179688, 0.0125732421875, 0.00668334960938, 0.00827026367188, 0.0131530761719, 0.00967407226562, 0.004638671875, 0.0185546875, 
-0.0413513183594, 0.0597839355469, 0.0758972167969, 0.077392578125, 0.0758972167969, 0.0844116210938, 0.0941162109375, 0.0989074707031, 
-0.0934448242188, 0.0856018066406, 0.07861328125, 0.0762329101562, 0.0780029296875, 0.0888671875, 0.102569580078, 0.105682373047, 
-0.0867614746094, 0.0631408691406, 0.0516357421875, 0.0567626953125, 0.098388671875, 0.159576416016, 0.192321777344, 0.182098388672, 
-0.168060302734, 0.186553955078, 0.223327636719, 0.241821289062, 0.246002197266, 0.242370605469, 0.229370117188, 0.208160400391, 
-0.199615478516, 0.230346679688, 0.284545898438, 0.316131591797, 0.325561523438, 0.322784423828, 0.304321289062, 0.283325195312, 
-0.268768310547, 0.241821289062, 0.196319580078, 0.154449462891, 0.145935058594, 0.162353515625, 0.161102294922, 0.104766845703, 
-0.00787353515625, -0.05810546875, -0.0518493652344, 0.00341796875, 0.0703735351562, 0.108978271484, 0.100494384766, 0.0746765136719, 
-0.0771179199219, 0.117462158203, 0.149322509766, 0.11376953125, 0.0391540527344, -0.0171813964844, -0.0327453613281, -0.00506591796875, 
-0.0452270507812, 0.109222412109, 0.184509277344, 0.219970703125, 0.186309814453, 0.115020751953, 0.0579833984375, 0.0431518554688, 
-0.0670776367188, 0.101623535156, 0.113800048828, 0.0986328125, 0.0607604980469, 0.0228271484375, 0.0052490234375, -0.0120849609375, 
--0.0433044433594, -0.0636596679688, -0.0201721191406, 0.0537414550781, 0.0889282226562, 0.0546569824219, -0.0187377929688, -0.0523986816406, 
--0.0275573730469, -0.00631713867188, -0.00262451171875, 0.0197448730469, 0.0607299804688, 0.09228515625, 0.0828247070312, 0.052490234375, 
-0.0534973144531, 0.0646667480469, 0.0258483886719, -0.0455017089844, -0.0790710449219, -0.0751342773438, -0.0830688476562, -0.0912170410156, 
--0.0724182128906, -0.0403137207031, -0.0447998046875, -0.120391845703, -0.212249755859, -0.268951416016, -0.325714111328, -0.402709960938, 
--0.435516357422, -0.345642089844, -0.176208496094, -0.04541015625, -0.0260009765625, -0.0791320800781, -0.0958251953125, -0.0129699707031, 
-0.137786865234, 0.269439697266, 0.338531494141, 0.38134765625, 0.440124511719, 0.502349853516, 0.526611328125, 0.513580322266, 
-0.512145996094, 0.550537109375, 0.618865966797, 0.691619873047, 0.707061767578, 0.624572753906, 0.489929199219, 0.353729248047, 
-0.251190185547, 0.217895507812, 0.23876953125, 0.256042480469, 0.229370117188, 0.159240722656, 0.104125976562, 0.0925903320312, 
-0.109832763672, 0.117736816406, 0.0870666503906, 0.0307312011719, -0.0323791503906, -0.0788269042969, -0.0697326660156, -0.0138854980469, 
-0.0564575195312, 0.111114501953, 0.126831054688, 0.121673583984, 0.120819091797, 0.129577636719, 0.135650634766, 0.131134033203, 
-0.113189697266, 0.0888977050781, 0.072265625, 0.0531921386719, 0.0276184082031, 0.0288391113281, 0.0673522949219, 0.107788085938, 
-0.127166748047, 0.150787353516, 0.202453613281, 0.243896484375, 0.218505859375, 0.145904541016, 0.106842041016, 0.128051757812, 
-0.166229248047, 0.157562255859, 0.0897521972656, 0.0131225585938, -0.0275573730469, -0.016845703125, 0.000335693359375, -0.0445251464844, 
--0.153747558594, -0.260162353516, -0.312957763672, -0.327545166016, -0.345977783203, -0.383636474609, -0.423645019531, -0.429382324219, 
--0.373687744141, -0.267761230469, -0.161590576172, -0.0927124023438, -0.0572204589844, -0.0299682617188, 0.00189208984375, 0.0358276367188, 
-0.0716247558594, 0.0889892578125, 0.0750122070312, 0.0613098144531, 0.0934753417969, 0.180847167969, 0.275146484375, 0.316131591797, 
-0.292419433594, 0.266723632812, 0.314025878906, 0.414672851562, 0.465393066406, 0.413391113281, 0.296417236328, 0.197845458984, 
-0.161773681641, 0.138092041016, 0.0630798339844, -0.0490417480469, -0.135833740234, -0.184387207031, -0.210418701172, -0.228637695312, 
--0.23681640625, -0.22412109375, -0.204071044922, -0.192504882812, -0.187377929688, -0.163787841797, -0.100921630859, -0.00936889648438, 
-0.0656127929688, 0.0974426269531, 0.0880432128906, 0.0527954101562, 0.0422058105469, 0.0725708007812, 0.123229980469, 0.162933349609, 
-0.189636230469, 0.22998046875, 0.277862548828, 0.295806884766, 0.256927490234, 0.193023681641, 0.154479980469, 0.154693603516, 
-0.180206298828, 0.209991455078, 0.227874755859, 0.217193603516, 0.187225341797, 0.172027587891, 0.190887451172, 0.219024658203, 
-0.213623046875, 0.184448242188, 0.162933349609, 0.168701171875, 0.1884765625, 0.184753417969, 0.157165527344, 0.128356933594, 
-0.117462158203, 0.118316650391, 0.106506347656, 0.0780944824219, 0.0591735839844, 0.054931640625, 0.0461730957031, 0.0215454101562, 
--0.0193481445312, -0.072021484375, -0.139862060547, -0.206176757812, -0.233154296875, -0.202819824219, -0.145233154297, -0.0821533203125, 
--0.0199279785156, 0.0288391113281, 0.0744323730469, 0.135650634766, 0.216918945312, 0.291290283203, 0.352508544922, 0.412536621094, 
-0.451110839844, 0.449859619141, 0.414123535156, 0.357391357422, 0.295166015625, 0.220245361328, 0.133819580078, 0.0622253417969, 
-0.0331115722656, 0.0328063964844, 0.0255737304688, 0.0109252929688, -0.000518798828125, -0.00753784179688, -0.00753784179688, 0.018310546875, 
-0.0767211914062, 0.132904052734, 0.152374267578, 0.129547119141, 0.0789489746094, 0.0352783203125, 0.0179138183594, 0.0101013183594, 
--0.0078125, -0.0269775390625, -0.037841796875, -0.0497131347656, -0.0763549804688, -0.099365234375, -0.0976257324219, -0.0806274414062, 
--0.054931640625, -0.0220642089844, -0.00262451171875, -0.00567626953125, -0.0130310058594, -0.0238952636719, -0.03662109375, -0.0439147949219, 
--0.0442199707031, -0.036376953125, -0.0268859863281, -0.0215148925781, -0.0193176269531, -0.0127258300781, 0.0155944824219, 0.0515747070312, 
-0.0723571777344, 0.0873718261719, 0.105010986328, 0.137420654297, 0.173889160156, 0.189025878906, 0.179016113281, 0.159851074219, 
-0.14892578125, 0.154846191406, 0.164367675781, 0.155395507812, 0.128356933594, 0.0962219238281, 0.0628356933594, 0.0322265625, 
--0.00173950195312, -0.0191345214844, 0.0149536132812, 0.0904541015625, 0.160552978516, 0.187561035156, 0.195617675781, 0.216094970703, 
-0.2451171875, 0.257904052734, 0.235076904297, 0.199035644531, 0.172027587891, 0.159576416016, 0.154815673828, 0.141693115234, 
-0.115966796875, 0.0916442871094, 0.0934753417969, 0.120208740234, 0.137756347656, 0.131072998047, 0.10498046875, 0.0780334472656, 
-0.0625610351562, 0.0401000976562, 0.0052490234375, -0.0366516113281, -0.0712280273438, -0.0755004882812, -0.0705871582031, -0.0672607421875, 
--0.0529479980469, -0.0348510742188, -0.002685546875, 0.0270690917969, 0.03857421875, 0.0412902832031, 0.0519714355469, 0.092529296875, 
-0.161773681641, 0.225708007812, 0.262451171875, 0.270629882812, 0.255737304688, 0.237609863281, 0.225982666016, 0.226654052734, 
-0.239410400391, 0.258178710938, 0.260009765625, 0.231201171875, 0.184173583984, 0.138671875, 0.118988037109, 0.127716064453, 
-0.14111328125, 0.137115478516, 0.111389160156, 0.0750122070312, 0.0480346679688, 0.0373229980469, 0.0361633300781, 0.0325012207031, 
-0.0258178710938, 0.00799560546875, -0.022705078125, -0.0585021972656, -0.0875854492188, -0.0957641601562, -0.0857849121094, -0.0693664550781, 
--0.0497436523438, -0.0286560058594, -0.00390625, 0.0315856933594, 0.0780029296875, 0.112609863281, 0.103790283203, 0.0700988769531, 
-0.0367736816406, 0.0134582519531, 0.0067138671875, 0.0100402832031, 0.0198059082031, 0.0331420898438, 0.041015625, 0.0361022949219, 
-0.0273742675781, 0.0130920410156, -0.0078125, -0.0144958496094, -0.00750732421875, 0.00460815429688, 0.0167236328125, 0.0200805664062, 
-0.0261840820312, 0.0394592285156, 0.0449829101562, 0.0404052734375, 0.03125, 0.0243835449219, 0.0121765136719, -0.00204467773438, 
--0.015380859375, -0.0309143066406, -0.0320739746094, -0.0251159667969, -0.0223999023438, -0.0220947265625, -0.0193176269531, -0.0105590820312, 
-0.00067138671875, -0.00201416015625, -0.00146484375, 0.0297241210938, 0.0847473144531, 0.136260986328, 0.164398193359, 0.167541503906, 
-0.163848876953, 0.172943115234, 0.187164306641, 0.197845458984, 0.199310302734, 0.193298339844, 0.201995849609, 0.233978271484, 
-0.274322509766, 0.296325683594, 0.297027587891, 0.296997070312, 0.291564941406, 0.269653320312, 0.232727050781, 0.179656982422, 
-0.124114990234, 0.0888671875, 0.0767517089844, 0.0746765136719, 0.0604248046875, 0.0267333984375, -0.015380859375, -0.0436096191406, 
--0.0430297851562, -0.0202941894531, 0.009765625, 0.0397644042969, 0.0622863769531, 0.0801391601562, 0.0895385742188, 0.0807800292969, 
-0.0639953613281, 0.0491943359375, 0.0465087890625, 0.0631713867188, 0.0934448242188, 0.122009277344, 0.138671875, 0.153839111328, 
-0.195129394531, 0.242065429688, 0.25, 0.230285644531, 0.220001220703, 0.221496582031, 0.207214355469, 0.165954589844, 
-0.117736816406, 0.09228515625, 0.0931396484375, 0.102569580078, 0.106567382812, 0.104095458984, 0.101684570312, 0.0976867675781, 
-0.0883483886719, 0.0588684082031, -0.00115966796875, -0.0599975585938, -0.0687561035156, -0.0363159179688, -0.0260925292969, -0.0487670898438, 
--0.0442504882812, 0.0054931640625, 0.0480346679688, 0.0364074707031, 0.00985717773438, 0.0121765136719, 0.0276489257812, 0.0316162109375, 
-0.00765991210938, -0.026611328125, -0.0575866699219, -0.105529785156, -0.163391113281, -0.201049804688, -0.219848632812, -0.208587646484, 
--0.146148681641, -0.0517883300781, 0.0376281738281, 0.0914001464844, 0.111053466797, 0.135650634766, 0.169952392578, 0.16748046875, 
-0.107177734375, 0.0449523925781, 0.0354919433594, 0.0453186035156, 0.03369140625, 0.0240478515625, 0.0412902832031, 0.0788879394531, 
-0.128448486328, 0.180572509766, 0.201171875, 0.172027587891, 0.130767822266, 0.0932006835938, 0.0393981933594, -0.0281066894531, 
--0.0700378417969, -0.07177734375, -0.0596618652344, -0.0570068359375, -0.0721130371094, -0.0876159667969, -0.0760803222656, -0.0375366210938, 
-0.0110168457031, 0.0455322265625, 0.0679931640625, 0.101684570312, 0.160186767578, 0.237854003906, 0.307403564453, 0.327911376953, 
-0.283294677734, 0.217254638672, 0.195129394531, 0.224517822266, 0.255706787109, 0.249084472656, 0.215148925781, 0.200866699219, 
-0.209930419922, 0.190521240234, 0.111419677734, 0.0224304199219, -0.0087890625, -0.00112915039062, -0.00863647460938, -0.0318603515625, 
--0.0296020507812, 0.00491333007812, 0.0367736816406, 0.037353515625, 0.0131225585938, -0.00265502929688, 0.0133666992188, 0.0516357421875, 
-0.0889587402344, 0.144073486328, 0.236328125, 0.329772949219, 0.366149902344, 0.337982177734, 0.298797607422, 0.275817871094, 
-0.261810302734, 0.250640869141, 0.225677490234, 0.165100097656, 0.0576782226562, -0.0454406738281, -0.0679321289062, -0.00534057617188, 
-0.0695190429688, 0.0865173339844, 0.0534362792969, 0.0325012207031, 0.0458068847656, 0.0641174316406, 0.0795288085938, 0.111114501953, 
-0.149230957031, 0.169281005859, 0.159637451172, 0.132904052734, 0.10986328125, 0.0922241210938, 0.101348876953, 0.143615722656, 
-0.194152832031, 0.246032714844, 0.300048828125, 0.342803955078, 0.346984863281, 0.295196533203, 0.213043212891, 0.119232177734, 
-0.0364685058594, -0.0105285644531, -0.0193786621094, -0.00628662109375, 0.00823974609375, 0.00430297851562, -0.0111083984375, -0.0184631347656, 
--0.0209045410156, -0.0156860351562, 0.0042724609375, 0.0392456054688, 0.06982421875, 0.0724792480469, 0.0377197265625, -0.0311584472656, 
--0.102783203125, -0.128540039062, -0.102447509766, -0.0563659667969, -0.0147705078125, 0.00521850585938, 0.0121154785156, 0.00283813476562, 
--0.0293884277344, -0.0563659667969, -0.0657348632812, -0.0706176757812, -0.08544921875, -0.0951538085938, -0.0791320800781, -0.057861328125, 
--0.0512084960938, -0.0426940917969, -0.0176086425781, 0.0228271484375, 0.064697265625, 0.0862426757812, 0.101348876953, 0.130523681641, 
-0.158416748047, 0.155944824219, 0.133850097656, 0.138061523438, 0.169036865234, 0.195373535156, 0.209625244141, 0.220886230469, 
-0.223236083984, 0.209991455078, 0.173278808594, 0.119262695312, 0.0877380371094, 0.0910949707031, 0.0988464355469, 0.0804138183594, 
-0.0565185546875, 0.0719604492188, 0.0943908691406, 0.0631408691406, -0.0156555175781, -0.0779113769531, -0.0827331542969, -0.0466613769531, 
--0.021484375, -0.0369262695312, -0.0660400390625, -0.0724487304688, -0.0536193847656, -0.0390319824219, -0.0493774414062, -0.0617980957031, 
--0.0491027832031, -0.0147705078125, 0.0337524414062, 0.0670166015625, 0.0601196289062, 0.0434875488281, 0.0592346191406, 0.104370117188, 
-0.133483886719, 0.138397216797, 0.142364501953, 0.151397705078, 0.152893066406, 0.137451171875, 0.113830566406, 0.115020751953, 
-0.15380859375, 0.208770751953, 0.250274658203, 0.256134033203, 0.23388671875, 0.205963134766, 0.187255859375, 0.169616699219, 
-0.141387939453, 0.109588623047, 0.0768127441406, 0.0491943359375, 0.03857421875, 0.0372924804688, 0.0252990722656, -0.00390625, 
--0.0299377441406, -0.0321044921875, -0.0181274414062, -0.0132751464844, -0.0184936523438, -0.0129089355469, 0.000274658203125, 0.0079345703125, 
-0.0158386230469, 0.0431518554688, 0.0786743164062, 0.0980224609375, 0.102600097656, 0.0928344726562, 0.0728759765625, 0.072265625, 
-0.0985717773438, 0.121704101562, 0.126831054688, 0.112640380859, 0.0788879394531, 0.0476989746094, 0.0462036132812, 0.0634155273438, 
-0.0695495605469, 0.0507202148438, 0.0213317871094, -0.00054931640625, -0.0111999511719, -0.0108032226562, -0.00262451171875, 0.0106506347656, 
-0.0279235839844, 0.0431213378906, 0.0567626953125, 0.0786437988281, 0.105621337891, 0.119903564453, 0.110748291016, 0.0959167480469, 
-0.101989746094, 0.130462646484, 0.158386230469, 0.162017822266, 0.137176513672, 0.0907592773438, 0.0433959960938, 0.0179443359375, 
-0.0155334472656, 0.0188903808594, 0.02001953125, 0.0195007324219, 0.0101013183594, -0.0101928710938, -0.0291137695312, -0.0348205566406, 
--0.0223693847656, -0.00140380859375, 0.0176086425781, 0.03857421875, 0.0501098632812, 0.0522155761719, 0.0638122558594, 0.08251953125, 
-0.0883178710938, 0.0755920410156, 0.0562133789062, 0.0440368652344, 0.0464477539062, 0.0598449707031, 0.0752868652344, 0.0755310058594, 
-0.0595703125, 0.0482482910156, 0.0516052246094, 0.0470886230469, 0.0203552246094, -0.0126647949219, -0.0260009765625, -0.0160522460938, 
--0.00595092773438, -0.000244140625, 0.00186157226562, 0.00521850585938, 0.00640869140625, 0.0143737792969, 0.0285034179688, 0.0413818359375, 
-0.0494995117188, 0.0458374023438, 0.0331726074219, 0.0301208496094, 0.0491638183594, 0.0810546875, 0.108032226562, 0.120422363281, 
-0.11962890625, 0.104370117188, 0.0710754394531, 0.0267639160156, 0.0030517578125, 0.0128479003906, 0.0288696289062, 0.0292358398438, 
-0.0197448730469, 0.0140075683594, 0.0184936523438, 0.0322875976562, 0.041259765625, 0.0368347167969, 0.0303344726562, 0.0340576171875, 
-0.0483093261719, 0.0718994140625, 0.098388671875, 0.118621826172, 0.132568359375, 0.139617919922, 0.139617919922, 0.135589599609, 
-0.128112792969, 0.120422363281, 0.115325927734, 0.106872558594, 0.09375, 0.0819702148438, 0.059814453125, 0.0312805175781, 
-0.00186157226562, -0.0278625488281, -0.0521545410156, -0.0636291503906, -0.0460205078125, -0.004150390625, 0.0361633300781, 0.0494995117188, 
-0.042236328125, 0.0382385253906, 0.0492553710938, 0.0712585449219, 0.087158203125, 0.0755920410156, 0.0455322265625, 0.0234375, 
-0.0310363769531, 0.0758972167969, 0.13134765625, 0.162384033203, 0.166900634766, 0.155059814453, 0.131958007812, 0.108367919922, 
-0.0916748046875, 0.0816650390625, 0.0746459960938, 0.0598449707031, 0.0376586914062, 0.0182189941406, 0.00399780273438, -0.00628662109375, 
--0.0105590820312, -0.00634765625, 0.00799560546875, 0.0315856933594, 0.0494995117188, 0.0504150390625, 0.0437316894531, 0.0464782714844, 
-0.0561828613281, 0.0597839355469, 0.0568542480469, 0.0630493164062, 0.0825805664062, 0.0989685058594, 0.100463867188, 0.0879211425781, 
-0.0847473144531, 0.10009765625, 0.113250732422, 0.108001708984, 0.0928649902344, 0.0771789550781, 0.05859375, 0.0328369140625, 
--0.00302124023438, -0.0347900390625, -0.0460510253906, -0.029296875, 0.00973510742188, 0.0458679199219, 0.0634765625, 0.0697631835938, 
-0.0653076171875, 0.0545654296875, 0.0440368652344, 0.0346984863281, 0.0270080566406, 0.0264892578125, 0.0292663574219, 0.0306091308594, 
-0.0264892578125, 0.0133972167969, -0.00149536132812, -0.0108032226562, -0.00994873046875, -0.00543212890625, -0.00778198242188, -0.0142211914062, 
--0.0159912109375, -0.013916015625, -0.0135498046875, -0.0093994140625, 0.0143432617188, 0.0586242675781, 0.112609863281, 0.154449462891, 
-0.168060302734, 0.153594970703, 0.126220703125, 0.105346679688, 0.088623046875, 0.0707397460938, 0.0464477539062, 0.0103759765625, 
--0.0326538085938, -0.0657653808594, -0.0782165527344, -0.0688171386719, -0.0408630371094, 0.0003662109375, 0.043701171875, 0.0744323730469, 
-0.0882873535156, 0.0983581542969, 0.108367919922, 0.113494873047, 0.114990234375, 0.115600585938, 0.112609863281, 0.107757568359, 
-0.104705810547, 0.104431152344, 0.112884521484, 0.128387451172, 0.138702392578, 0.135314941406, 0.115051269531, 0.0888977050781, 
-0.0716552734375, 0.0658569335938, 0.06591796875, 0.0622253417969, 0.0449829101562, 0.0203247070312, -0.00686645507812, -0.0356750488281, 
--0.0594177246094, -0.0778503417969, -0.0952453613281, -0.116088867188, -0.125518798828, -0.118591308594, -0.101226806641, -0.0778503417969, 
--0.0573120117188, -0.0372009277344, -0.0233459472656, -0.0223388671875, -0.024169921875, -0.0148620605469, 0.00497436523438, 0.0294799804688, 
-0.0516357421875, 0.0595397949219, 0.0603637695312, 0.0616760253906, 0.0670776367188, 0.0780334472656, 0.0859069824219, 0.0859069824219, 
-0.0765075683594, 0.0616455078125, 0.0555114746094, 0.0549621582031, 0.0486450195312, 0.0394897460938, 0.0279235839844, 0.0143127441406, 
-0.0003662109375, -0.0111389160156, -0.0130004882812, -0.00234985351562, 0.00979614257812, 0.0164184570312, 0.0100708007812, -0.00393676757812, 
--0.0132751464844, -0.0187072753906, -0.0190124511719, -0.0166320800781, -0.0175476074219, -0.0169372558594, -0.0078125, 0.0100708007812, 
-0.0270690917969, 0.0315551757812, 0.0252685546875, 0.0104064941406, -0.0057373046875, -0.0163269042969, -0.0172119140625, -0.01025390625, 
--0.00537109375, -0.00146484375, 0.00827026367188, 0.0212707519531, 0.0358276367188, 0.0516052246094, 0.0628967285156, 0.0755310058594, 
-0.0923156738281, 0.100158691406, 0.0974731445312, 0.0858764648438, 0.076171875, 0.0765075683594, 0.0735168457031, 0.0580139160156, 
-0.0376892089844, 0.0260925292969, 0.0310668945312, 0.0470886230469, 0.05859375, 0.0603332519531, 0.0534973144531, 0.041015625, 
-0.0273132324219, 0.00677490234375, -0.014892578125, -0.0247802734375, -0.0197143554688, -0.0029296875, 0.0263977050781, 0.0565490722656, 
-0.0731506347656, 0.0749816894531, 0.0728454589844, 0.0743408203125, 0.0768127441406, 0.077392578125, 0.0791625976562, 0.0823059082031, 
-0.0834045410156, 0.0862121582031, 0.0892639160156, 0.093505859375, 0.0956115722656, 0.0904235839844, 0.0722045898438, 0.0498046875, 
-0.0376892089844, 0.0350036621094, 0.0419311523438, 0.057373046875, 0.0774230957031, 0.0950012207031, 0.100402832031, 0.0938415527344, 
-0.088623046875, 0.0907287597656, 0.0935363769531, 0.0952453613281, 0.0914001464844, 0.0849914550781, 0.0868225097656, 0.08984375, 
-0.0874328613281, 0.0804138183594, 0.06982421875, 0.0541076660156, 0.0339965820312, 0.0133666992188, -0.00234985351562, -0.0126342773438, 
--0.0193481445312, -0.0187683105469, -0.0118103027344, 0.0001220703125, 0.00848388671875, 0.0162048339844, 0.0224609375, 0.0234069824219, 
-0.0228271484375, 0.0213317871094, 0.0186157226562, 0.0194091796875, 0.0279846191406, 0.0352783203125, 0.03125, 0.0179443359375, 
-0.0116271972656, 0.0188598632812, 0.0294799804688, 0.0337524414062, 0.031005859375, 0.0255737304688, 0.0176086425781, 0.00650024414062, 
--0.00479125976562, -0.0160217285156, -0.0275573730469, -0.0399780273438, -0.0505981445312, -0.0563354492188, -0.0591125488281, -0.0581359863281, 
--0.0538940429688, -0.0505981445312, -0.0500183105469, -0.0475158691406, -0.0408630371094, -0.0263671875, -0.0120544433594, -0.00991821289062, 
--0.01416015625, -0.0221557617188, -0.026611328125, -0.0169067382812, -0.0045166015625, -0.00326538085938, -0.00991821289062, -0.0157470703125, 
--0.0169067382812, -0.0138854980469, -0.0126953125, -0.0159301757812, -0.0151977539062, -0.0047607421875, 0.0127563476562, 0.0279846191406, 
-0.0380249023438, 0.04833984375, 0.0555114746094, 0.0610656738281, 0.0653076171875, 0.0692138671875, 0.0713500976562, 0.0664672851562, 
-0.0543518066406, 0.0364379882812, 0.0194396972656, 0.00985717773438, 0.007568359375, 0.0128479003906, 0.0237121582031, 0.0400390625, 
-0.055908203125, 0.0679931640625, 0.0650024414062, 0.0479125976562, 0.0295715332031, 0.0148620605469, 0.0100708007812, 0.013427734375, 
-0.0209655761719, 0.0261535644531, 0.0243530273438, 0.0194396972656, 0.0192260742188, 0.0258483886719, 0.0307006835938, 0.0333862304688, 
-0.0407104492188, 0.0531005859375, 0.0625915527344, 0.0655517578125, 0.0671081542969, 0.0698547363281, 0.0716247558594, 0.0713195800781, 
-0.0677185058594, 0.0582580566406, 0.0494995117188, 0.0477600097656, 0.0525207519531, 0.0628662109375, 0.0734252929688, 0.0802001953125, 
-0.0804138183594, 0.0725402832031, 0.0601501464844, 0.0431518554688, 0.0240173339844, 0.0100402832031, 0.00430297851562, 0.0104064941406, 
-0.024658203125, 0.0385437011719, 0.0458679199219, 0.0489196777344, 0.0491943359375, 0.0519409179688, 0.0537719726562, 0.04736328125, 
-0.03955078125, 0.0334167480469, 0.0297241210938, 0.0319519042969, 0.0385131835938, 0.0440368652344, 0.042236328125, 0.03466796875, 
-0.0273742675781, 0.023681640625, 0.0188293457031, 0.0118713378906, 0.00225830078125, -0.00845336914062, -0.0111694335938, -0.00537109375, 
-0.002197265625, 0.00485229492188, 0.00161743164062, -0.0045166015625, -0.00689697265625, -0.00448608398438, -0.000274658203125, 0.0003662109375, 
--0.000213623046875, 0.00216674804688, 0.00491333007812, 0.000396728515625, -0.0121154785156, -0.0250854492188, -0.0329895019531, -0.0357360839844, 
--0.0384826660156, -0.0429382324219, -0.0487976074219, -0.0546264648438, -0.0593566894531, -0.0608520507812, -0.0587768554688, -0.0619201660156, 
--0.0709228515625, -0.0811767578125, -0.0830383300781, -0.0718383789062, -0.0563049316406, -0.0420837402344, -0.02783203125, -0.0102844238281, 
-0.00582885742188, 0.017333984375, 0.0267944335938, 0.0354919433594, 0.041015625, 0.0358276367188, 0.0270690917969, 0.0249938964844, 
-0.0267028808594, 0.0289001464844, 0.028564453125, 0.0264587402344, 0.0219421386719, 0.0145874023438, 0.00613403320312, 0.0013427734375, 
-0.00091552734375, -0.00198364257812, -0.00726318359375, -0.0035400390625, 0.00698852539062, 0.0216064453125, 0.0343322753906, 0.0385437011719, 
-0.0376892089844, 0.0364685058594, 0.0364379882812, 0.0328063964844, 0.027099609375, 0.0206909179688, 0.0176696777344, 0.0179443359375, 
-0.0185546875, 0.015869140625, 0.0104064941406, 0.00332641601562, -0.00445556640625, -0.0096435546875, -0.00869750976562, -0.00326538085938, 
--0.00091552734375, 0.000396728515625, 0.00762939453125, 0.0192260742188, 0.0327453613281, 0.0455627441406, 0.0546875, 0.0595092773438, 
-0.0606994628906, 0.0622253417969, 0.0641174316406, 0.0621643066406, 0.0543518066406, 0.041015625, 0.0316162109375, 0.0303955078125, 
-0.0303649902344, 0.0310363769531, 0.0255737304688, 0.0146179199219, 0.00128173828125, -0.00628662109375, -0.00875854492188, -0.00875854492188, 
--0.00503540039062, 3.0517578125e-05, 0.00579833984375, 0.0122375488281, 0.0157775878906, 0.0155334472656, 0.01611328125, 0.0155334472656, 
-0.0158386230469, 0.0162048339844, 0.00912475585938, -0.000885009765625, -0.009033203125, -0.0174865722656, -0.0254516601562, -0.0254516601562, 
--0.0159606933594, -0.00299072265625, 0.00640869140625, 0.0106811523438, 0.00885009765625, 0.00067138671875, -0.00418090820312, -0.00723266601562, 
--0.00961303710938, -0.0132141113281, -0.0230407714844, -0.0305786132812, -0.0302429199219, -0.0242004394531, -0.013916015625, -0.0045166015625, 
-0.00674438476562, 0.0194396972656, 0.028564453125, 0.0282592773438, 0.0215759277344, 0.0146179199219, 0.0103149414062, 0.00494384765625, 
--0.00234985351562, -0.00418090820312, 0.0018310546875, 0.0125427246094, 0.0194702148438, 0.0203552246094, 0.0170288085938, 0.0124816894531, 
-0.0143432617188, 0.0195007324219, 0.0231628417969, 0.0239868164062, 0.0228271484375, 0.0240173339844, 0.0264587402344, 0.0292053222656, 
-0.0289001464844, 0.0285339355469, 0.0264892578125, 0.0203247070312, 0.0143432617188, 0.00759887695312, 0.00253295898438, -0.000274658203125, 
--0.00234985351562, -0.00265502929688, -0.00146484375, -0.00204467773438, -0.00048828125, -0.00054931640625, -0.00543212890625, -0.01171875, 
--0.01513671875, -0.0142211914062, -0.0102233886719, -0.00360107421875, 0.00555419921875, 0.0130615234375, 0.0167236328125, 0.0165100097656, 
-0.0109252929688, 0.00131225585938, -0.00814819335938, -0.0159912109375, -0.0199584960938, -0.0227355957031, -0.0268859863281, -0.0287780761719, 
--0.0250549316406, -0.0187683105469, -0.0120849609375, -0.00411987304688, 0.00515747070312, 0.0116577148438, 0.0154724121094, 0.0174255371094, 
-0.0170593261719, 0.0170288085938, 0.0164184570312, 0.0164184570312, 0.0186157226562, 0.0212707519531, 0.0243530273438, 0.0249328613281, 
-0.0188293457031, 0.0122375488281, 0.00860595703125, 0.0030517578125, -0.00570678710938, -0.0174865722656, -0.025390625, -0.0257568359375, 
--0.0230102539062, -0.0211486816406, -0.0235290527344, -0.02880859375, -0.0335693359375, -0.0338745117188, -0.0318298339844, -0.0285034179688, 
--0.0278015136719, -0.0342102050781, -0.0387573242188, -0.0414733886719, -0.0445556640625, -0.045654296875, -0.0424499511719, -0.0368957519531, 
--0.0285339355469, -0.0208129882812, -0.0120849609375, -0.00363159179688, 0.000701904296875, 0.00375366210938, 0.00552368164062, 0.00579833984375, 
-0.0079345703125, 0.0100708007812, 0.0133972167969, 0.0191955566406, 0.0234069824219, 0.0216369628906, 0.0146179199219, 0.00521850585938, 
--0.00604248046875, -0.0174560546875, -0.0290832519531, -0.0408935546875, -0.0500183105469, -0.0521240234375, -0.0493774414062, -0.0451049804688, 
--0.040283203125, -0.0350952148438, -0.0284423828125, -0.0245056152344, -0.0229797363281, -0.0208740234375, -0.0154113769531, -0.00991821289062, 
--0.0100708007812, -0.0135498046875, -0.01904296875, -0.0220947265625, -0.0244750976562, -0.02783203125, -0.0302429199219, -0.0306091308594, 
--0.0281677246094, -0.0248107910156, -0.0180969238281, -0.0124206542969, -0.00473022460938, 0.0081787109375, 0.0191650390625, 0.0264587402344, 
-0.0285949707031, 0.0289001464844, 0.0337219238281, 0.0401306152344, 0.0440368652344, 0.0437316894531, 0.0428161621094, 0.0440063476562, 
-0.0425109863281, 0.0377502441406, 0.0294189453125, 0.0200805664062, 0.0155944824219, 0.0142822265625, 0.0130615234375, 0.00979614257812, 
-0.00213623046875, -0.00225830078125, -0.00299072265625, -0.002685546875, 0.0003662109375, 0.00131225585938, -0.000579833984375, -0.00115966796875, 
--0.00119018554688, -0.00442504882812, -0.0105895996094, -0.0169067382812, -0.0226745605469, -0.0293884277344, -0.0353698730469, -0.0390319824219, 
--0.0399780273438, -0.036376953125, -0.02783203125, -0.017822265625, -0.010498046875, -0.00579833984375, -0.00384521484375, -0.00418090820312, 
--0.00628662109375, -0.00537109375, -0.002685546875, -0.0020751953125, -0.00387573242188, -0.00933837890625, -0.0115051269531, -0.00747680664062, 
--0.00210571289062, 0.00344848632812, 0.00369262695312, 0.00192260742188, -0.002685546875, -0.0096435546875, -0.0135803222656, -0.0138854980469, 
--0.0111999511719, -0.0101928710938, -0.0141296386719, -0.0203247070312, -0.0272521972656, -0.0371704101562, -0.047607421875, -0.0572814941406, 
--0.0617065429688, -0.0627136230469, -0.0618286132812, -0.0576171875, -0.0520629882812, -0.0481567382812, -0.0455017089844, -0.0432434082031, 
--0.0399475097656, -0.0375671386719, -0.03662109375, -0.0354614257812, -0.0304870605469, -0.0242614746094, -0.0205688476562, -0.0208435058594, 
--0.0229797363281, -0.0266418457031, -0.0284729003906, -0.0272216796875, -0.025390625, -0.0251159667969, -0.024169921875, -0.0169372558594, 
--0.00628662109375, -0.00143432617188, -0.00811767578125, -0.0181274414062, -0.0248413085938, -0.0272216796875, -0.0299987792969, -0.0354309082031, 
--0.0405883789062, -0.0420837402344, -0.0436401367188, -0.0432739257812, -0.0378723144531, -0.029296875, -0.0236511230469, -0.0226745605469, 
--0.0223999023438, -0.01904296875, -0.0108032226562, -0.00390625, -0.00177001953125, -0.0008544921875, -0.00323486328125, -0.00628662109375, 
--0.0084228515625, -0.00906372070312, -0.00778198242188, -0.00784301757812, -0.0126647949219, -0.0180969238281, -0.021240234375, -0.0263366699219, 
--0.0342102050781, -0.04150390625, -0.0433044433594, -0.0402526855469, -0.0372924804688, -0.0335693359375, -0.0278930664062, -0.0187377929688, 
--0.00747680664062, 0.0003662109375, 0.0028076171875, 0.0028076171875, 0.00338745117188, 0.0067138671875, 0.008544921875, 0.0040283203125, 
--0.00390625, -0.0108337402344, -0.0147705078125, -0.0193481445312, -0.0227355957031, -0.0214538574219, -0.0175170898438, -0.0138854980469, 
--0.00906372070312, 3.0517578125e-05, 0.0106811523438, 0.0155639648438, 0.0143432617188, 0.0103149414062, 0.00393676757812, -0.00018310546875, 
--0.00296020507812, -0.00454711914062, -0.00357055664062, -0.00296020507812, -0.00173950195312, 3.0517578125e-05, -0.000518798828125, -0.00146484375, 
--0.00390625, -0.00961303710938, -0.0159912109375, -0.0215454101562, -0.0278015136719, -0.0339050292969, -0.0393676757812, -0.0439147949219, 
--0.0466918945312, -0.0478820800781, -0.0490112304688, -0.0478820800781, -0.04296875, -0.0390319824219, -0.0373229980469, -0.0381164550781, 
--0.0399475097656, -0.0424499511719, -0.0408325195312, -0.0354309082031, -0.0284118652344, -0.0209045410156, -0.0127258300781, -0.00357055664062, 
-0.00308227539062, 0.00701904296875, 0.0110473632812, 0.0133666992188, 0.0110168457031, 0.00369262695312, -0.00759887695312, -0.0187072753906, 
--0.0269165039062, -0.0342102050781, -0.0412292480469, -0.0454406738281, -0.0481567382812, -0.0484924316406, -0.0460510253906, -0.0439147949219, 
--0.040771484375, -0.0378723144531, -0.0357666015625, -0.0317687988281, -0.0281372070312, -0.0284118652344, -0.029052734375, -0.0290222167969, 
--0.0276184082031, -0.026611328125, -0.0296936035156, -0.0347900390625, -0.0390319824219, -0.0393676757812, -0.0372619628906, -0.033935546875, 
--0.0293273925781, -0.025390625, -0.0245666503906, -0.0202941894531, -0.0141296386719, -0.0093994140625, -0.008056640625, -0.0081787109375, 
--0.009033203125, -0.0123596191406, -0.0150756835938, -0.0159912109375, -0.0142211914062, -0.0123901367188, -0.0105285644531, -0.00933837890625, 
--0.0120544433594, -0.0138854980469, -0.0136413574219, -0.0147399902344, -0.0184326171875, -0.0229797363281, -0.0248413085938, -0.0257263183594, 
--0.0263061523438, -0.0287780761719, -0.0308837890625, -0.0305786132812, -0.0306091308594, -0.030517578125, -0.0281372070312, -0.0232849121094, 
--0.0191040039062, -0.0175170898438, -0.0162963867188, -0.0136108398438, -0.0105590820312, -0.00927734375, -0.00787353515625, -0.00601196289062, 
--0.00262451171875, 0.000701904296875, 0.00247192382812, 0.0003662109375, -0.00210571289062, -0.0010986328125, -0.0008544921875, -0.00631713867188, 
--0.0156860351562, -0.0245361328125, -0.029296875, -0.0312194824219, -0.0314636230469, -0.0266418457031, -0.0205383300781, -0.0172119140625, 
--0.0172424316406, -0.0181579589844, -0.0172424316406, -0.0144653320312, -0.0126037597656, -0.0108947753906, -0.00814819335938, -0.00845336914062, 
--0.00869750976562, -0.00872802734375, -0.0106506347656, -0.0153503417969, -0.0218505859375, -0.0269165039062, -0.0335388183594, -0.0417785644531, 
--0.0479125976562, -0.0484313964844, -0.0457153320312, -0.045166015625, -0.0460510253906, -0.0442199707031, -0.0387573242188, -0.0308837890625, 
--0.0235595703125, -0.0166320800781, -0.0105895996094, -0.00714111328125, -0.00634765625, -0.00811767578125, -0.0117797851562, -0.0184326171875, 
--0.0266418457031, -0.0308532714844, -0.0323791503906, -0.0330200195312, -0.035400390625, -0.0387878417969, -0.0396728515625, -0.0378723144531, 
--0.0347595214844, -0.0324401855469, -0.0290222167969, -0.0233154296875, -0.0177917480469, -0.0121154785156, -0.00808715820312, -0.0072021484375, 
--0.00784301757812, -0.0078125, -0.00906372070312, -0.0129699707031, -0.0169372558594, -0.0217590332031, -0.0247497558594, -0.0245361328125, 
--0.0214233398438, -0.0181884765625, -0.0153503417969, -0.0102844238281, -0.00357055664062, 0.00433349609375, 0.0128173828125, 0.0194091796875, 
-0.0240783691406, 0.026123046875, 0.0273132324219, 0.0286254882812, 0.0255432128906, 0.018798828125, 0.0113220214844, 0.00338745117188, 
--0.00204467773438, -0.00784301757812, -0.0129699707031, -0.0205993652344, -0.0278625488281, -0.0308227539062, -0.0314636230469, -0.031494140625, 
--0.0317687988281, -0.0345458984375, -0.0360107421875, -0.033935546875, -0.0321350097656, -0.0308837890625, -0.0326843261719, -0.0357055664062, 
--0.0375671386719, -0.0402526855469, -0.0457458496094, -0.0508728027344, -0.0524291992188, -0.0533142089844, -0.0539245605469, -0.053955078125, 
--0.0526733398438, -0.0481872558594, -0.0438842773438, -0.0402221679688, -0.0385437011719, -0.0375366210938, -0.0360107421875, -0.03515625, 
--0.0354309082031, -0.0327453613281, -0.0281066894531, -0.0272521972656, -0.0287780761719, -0.0320434570312, -0.035400390625, -0.0362854003906, 
--0.0324401855469, -0.0275268554688, -0.0226745605469, -0.0169372558594, -0.0108337402344, -0.00482177734375, -0.00421142578125, -0.00808715820312, 
--0.0150756835938, -0.0242309570312, -0.0317993164062, -0.0365600585938, -0.0442199707031, -0.0548400878906, -0.0621643066406, -0.0639038085938, 
--0.0633239746094, -0.0630798339844, -0.0627136230469, -0.0603637695312, -0.0571899414062, -0.0554504394531, -0.0518188476562, -0.0466003417969, 
--0.0420532226562, -0.0379028320312, -0.0341796875, -0.030029296875, -0.0268859863281, -0.02490234375, -0.0226135253906, -0.0199584960938, 
--0.0178527832031, -0.0157470703125, -0.0122985839844, -0.0081787109375, -0.00479125976562, -0.0023193359375, -0.00115966796875, -0.0020751953125, 
--0.00482177734375, -0.00625610351562, -0.00543212890625, -0.00454711914062, -0.00448608398438, -0.00595092773438, -0.00906372070312, -0.0132446289062, 
--0.0160217285156, -0.0162658691406, -0.0163269042969, -0.0151672363281, -0.0135498046875, -0.0130310058594, -0.00863647460938, -0.001220703125, 
-0.00616455078125, 0.0119323730469, 0.0179748535156, 0.0251770019531, 0.02978515625, 0.0322570800781, 0.0337219238281, 0.034912109375, 
-0.0355224609375, 0.0349426269531, 0.0321960449219, 0.0264587402344, 0.0194702148438, 0.0161437988281, 0.0140075683594, 0.00921630859375, 
-0.0015869140625, -0.00692749023438, -0.0145568847656, -0.0208740234375, -0.0235290527344, -0.0230712890625, -0.0233154296875, -0.0249938964844, 
--0.0275573730469, -0.0299987792969, -0.0326538085938, -0.03662109375, -0.0412292480469, -0.046630859375, -0.0524291992188, -0.0563659667969, 
--0.0572814941406, -0.0551147460938, -0.0536193847656, -0.05419921875, -0.0548706054688, -0.0535888671875, -0.0511779785156, -0.0481872558594, 
--0.0460510253906, -0.0462951660156, -0.0445556640625, -0.0396423339844, -0.0312805175781, -0.0232849121094, -0.0177917480469, -0.0120849609375, 
--0.00656127929688, -0.00149536132812, 0.00308227539062, 0.00552368164062, 0.00555419921875, 0.00372314453125, 0.00271606445312, 0.00106811523438, 
--0.00601196289062, -0.0144958496094, -0.0193481445312, -0.0178833007812, -0.0156860351562, -0.0160522460938, -0.0172424316406, -0.0181274414062, 
--0.0186767578125, -0.0193176269531, -0.0181884765625, -0.0169372558594, -0.0154418945312, -0.0150451660156, -0.017822265625, -0.0196533203125, 
--0.0214538574219, -0.025146484375, -0.0302429199219, -0.0339965820312, -0.0332336425781, -0.0321044921875, -0.0314636230469, -0.0314636230469, 
--0.0329895019531, -0.0336303710938, -0.03173828125, -0.0287475585938, -0.022705078125, -0.013916015625, -0.0029296875, 0.009765625, 
-0.0213012695312, 0.0300598144531, 0.0364685058594, 0.0416259765625, 0.0439758300781, 0.0425415039062, 0.0379943847656, 0.0312805175781, 
-0.0249328613281, 0.0191955566406, 0.0139770507812, 0.00949096679688, 0.00491333007812, 0.002197265625, -0.000823974609375, -0.00482177734375, 
--0.0103149414062, -0.0186462402344, -0.0278625488281, -0.0369567871094, -0.0475463867188, -0.0593872070312, -0.0688171386719, -0.0745239257812, 
--0.077880859375, -0.0794067382812, -0.0763244628906, -0.0709228515625, -0.0651550292969, -0.0609436035156, -0.0578002929688, -0.0537414550781, 
--0.048095703125, -0.0454406738281, -0.0457458496094, -0.0448608398438, -0.0414428710938, -0.0361328125, -0.0310974121094, -0.0266418457031, 
--0.022705078125, -0.0196838378906, -0.0166015625, -0.0154724121094, -0.0141296386719, -0.0136108398438, -0.0157165527344, -0.018798828125, 
--0.0211486816406, -0.024169921875, -0.0269470214844, -0.0296020507812, -0.0324401855469, -0.0344848632812, -0.0390625, -0.0473022460938, 
--0.0548095703125, -0.0590515136719, -0.0615539550781, -0.0630187988281, -0.0645141601562, -0.0672912597656, -0.0669555664062, -0.0642395019531, 
--0.0611877441406, -0.0566711425781, -0.0509338378906, -0.0435485839844, -0.0354614257812, -0.0284729003906, -0.0230102539062, -0.020263671875, 
--0.0199584960938, -0.0223388671875, -0.0257263183594, -0.0269775390625, -0.0269775390625, -0.025390625, -0.0211486816406, -0.0160522460938, 
--0.0117492675781, -0.00869750976562, -0.0032958984375, 0.00311279296875, 0.00820922851562, 0.010986328125, 0.0119018554688, 0.0140380859375, 
-0.0155029296875, 0.0143127441406, 0.0124816894531, 0.0106811523438, 0.0119018554688, 0.0133972167969, 0.0113220214844, 0.00582885742188, 
-0.00155639648438, -0.000579833984375, -0.00473022460938, -0.0118103027344, -0.0193481445312, -0.0281677246094, -0.0372009277344, -0.0433044433594, 
--0.0481567382812, -0.051513671875, -0.0553588867188, -0.0603942871094, -0.0638732910156, -0.0654602050781, -0.064208984375, -0.0614929199219, 
--0.05908203125, -0.0584716796875, -0.0569763183594, -0.0542297363281, -0.0497131347656, -0.0448608398438, -0.0399475097656, -0.0341796875, 
--0.0293884277344, -0.0235595703125, -0.0172119140625, -0.0135803222656, -0.0126647949219, -0.0154113769531, -0.0193786621094, -0.0214538574219, 
--0.0248718261719, -0.0302429199219, -0.0363159179688, -0.0409545898438, -0.0432739257812, -0.0442199707031, -0.0475463867188, -0.0533752441406, 
--0.0581665039062, -0.0621643066406, -0.0654602050781, -0.066650390625, -0.0684814453125, -0.0700073242188, -0.0697021484375, -0.0697021484375, 
--0.0697326660156, -0.0684509277344, -0.0657348632812, -0.0640258789062, -0.0653991699219, -0.0687866210938, -0.0709228515625, -0.0724487304688, 
--0.0726928710938, -0.0709533691406, -0.0663146972656, -0.060302734375, -0.0536193847656, -0.0469970703125, -0.0423889160156, -0.0396423339844, 
--0.0379028320312, -0.0351257324219, -0.0314331054688, -0.0275573730469, -0.0230102539062, -0.0212097167969, -0.0220642089844, -0.0263366699219, 
--0.03271484375, -0.0360412597656, -0.03662109375, -0.0353393554688, -0.0334167480469, -0.0299682617188, -0.026611328125, -0.0248413085938, 
--0.0226745605469, -0.0196228027344, -0.0175170898438, -0.0166320800781, -0.0157470703125, -0.0117797851562, -0.0096435546875, -0.0120544433594, 
--0.0163269042969, -0.01904296875, -0.0217590332031, -0.0248107910156, -0.0278930664062, -0.0318298339844, -0.0338745117188, -0.0326538085938, 
--0.0293884277344, -0.0254211425781, -0.0205688476562, -0.0160522460938, -0.0129089355469, -0.00936889648438, -0.00656127929688, -0.00454711914062, 
--0.0029296875, -0.00177001953125, -0.00054931640625, -0.00018310546875, 0.000274658203125, 0.00161743164062, 0.00341796875, 0.00457763671875, 
-0.00341796875, 0.00125122070312, 0.00067138671875, 0.000335693359375, -0.00115966796875, -0.00411987304688, -0.00845336914062, -0.0111694335938, 
--0.0117492675781, -0.012939453125, -0.0148315429688, -0.0180969238281, -0.02392578125, -0.0306091308594, -0.0384216308594, -0.0457153320312, 
--0.05029296875, -0.0536193847656, -0.055419921875, -0.05517578125, -0.0541687011719, -0.0527648925781, -0.0523681640625, -0.0514831542969, 
--0.0499877929688, -0.0481567382812, -0.0469970703125, -0.0457153320312, -0.0445251464844, -0.0445861816406, -0.0442199707031, -0.0435485839844, 
--0.0424194335938, -0.0406799316406, -0.0381164550781, -0.0360717773438, -0.032958984375, -0.0293273925781, -0.0257263183594, -0.0218200683594, 
--0.017822265625, -0.0141906738281, -0.0105590820312, -0.007568359375, -0.00448608398438, -0.001708984375, -0.00030517578125, -0.000823974609375, 
--0.001708984375, -0.00146484375, -0.00177001953125, -0.00326538085938, -0.00628662109375, -0.01025390625, -0.0141906738281, -0.0191040039062, 
--0.0242004394531, -0.0302124023438, -0.0375671386719, -0.04541015625, -0.0527954101562, -0.0581665039062, -0.0615234375, -0.0651550292969, 
--0.069091796875, -0.0723876953125, -0.07275390625, -0.0718078613281, -0.0721435546875, -0.0718078613281, -0.0715026855469, -0.0681762695312, 
--0.0636291503906, -0.0600280761719, -0.0572509765625, -0.05517578125, -0.0523986816406, -0.0466613769531, -0.0402526855469, -0.035400390625, 
--0.0303039550781, -0.0260314941406, -0.0236206054688, -0.0220336914062, -0.0199584960938, -0.0169372558594, -0.0138549804688, -0.0126647949219, 
--0.0118103027344, -0.0119934082031, -0.0126953125, -0.0130004882812, -0.0150451660156, -0.0160217285156, -0.017822265625, -0.0217895507812, 
--0.0263366699219, -0.03173828125, -0.03759765625, -0.0439147949219, -0.0502624511719, -0.056640625, -0.0618286132812, -0.0639343261719, 
--0.0648193359375, -0.0666809082031, -0.0685424804688, -0.0687255859375, -0.0666198730469, -0.0648803710938, -0.0663452148438, -0.069091796875, 
--0.0700073242188, -0.0685119628906, -0.0663757324219, -0.0648193359375, -0.0634155273438, -0.0626831054688, -0.0624084472656, -0.0596313476562, 
--0.0570373535156, -0.0535583496094, -0.0479125976562, -0.0414733886719, -0.0350952148438, -0.0306396484375, -0.0274658203125, -0.0245666503906, 
--0.0214538574219, -0.0184020996094, -0.0156555175781, -0.0157775878906, -0.0172729492188, -0.0195617675781, -0.0227355957031, -0.0259704589844, 
--0.0278015136719, -0.0297546386719, -0.0320739746094, -0.0365905761719, -0.0426635742188, -0.0487976074219, -0.0548706054688, -0.0584716796875, 
--0.0596313476562, -0.06005859375, -0.0606079101562, -0.0587158203125, -0.0558471679688, -0.0514221191406, -0.0460510253906, -0.0408630371094, 
--0.0369567871094, -0.0360107421875, -0.0366516113281, -0.0375366210938, -0.0367126464844, -0.03662109375, -0.0371704101562, -0.0360412597656, 
--0.03125, -0.0238342285156, -0.018798828125, -0.0187377929688, -0.0196838378906, -0.0190124511719, -0.0187683105469, -0.0208740234375, 
--0.0260314941406, -0.0326538085938, -0.0372314453125, -0.0400390625, -0.04296875, -0.0454406738281, -0.0484313964844, -0.0512084960938, 
--0.0536193847656, -0.056640625, -0.0584716796875, -0.0591430664062, -0.0590515136719, -0.05908203125, -0.0590515136719, -0.0585021972656, 
--0.057861328125, -0.0581970214844, -0.0599365234375, -0.0612487792969, -0.0615234375, -0.0614929199219, -0.0597229003906, -0.0584716796875, 
--0.0587463378906, -0.0584716796875, -0.0585327148438, -0.0599365234375, -0.05908203125, -0.0567321777344, -0.0538330078125, -0.049072265625, 
--0.0448913574219, -0.0399169921875, -0.036376953125, -0.0345153808594, -0.0317993164062, -0.0271911621094, -0.0226745605469, -0.0193481445312, 
--0.0199890136719, -0.0223693847656, -0.022705078125, -0.022705078125, -0.0220642089844, -0.0199279785156, -0.0166015625, -0.0139465332031, 
--0.0157165527344, -0.0226745605469, -0.0308837890625, -0.0362854003906, -0.0406188964844, -0.0469055175781, -0.0542602539062, -0.0609130859375, 
--0.0651245117188, -0.0675659179688, -0.0700073242188, -0.0724487304688, -0.0730590820312, -0.0730285644531, -0.073974609375, -0.0775451660156, 
--0.0821838378906, -0.0827026367188, -0.0797729492188, -0.0748291015625, -0.0684509277344, -0.0606079101562, -0.0506591796875, -0.0393676757812, 
--0.0326538085938, -0.0308532714844, -0.0320739746094, -0.0330200195312, -0.0311889648438, -0.0272216796875, -0.0233154296875, -0.0214233398438, 
--0.0220947265625, -0.0238952636719, -0.0263366699219, -0.0302429199219, -0.0357666015625, -0.0414123535156, -0.0454711914062, -0.0469360351562, 
--0.0432739257812, -0.03515625, -0.0248413085938, -0.0159912109375, -0.00936889648438, -0.0047607421875, -0.00299072265625, -0.0059814453125, 
--0.0117492675781, -0.0164184570312, -0.0208129882812, -0.025390625, -0.0303039550781, -0.0363159179688, -0.0447998046875, -0.0538940429688, 
--0.0618591308594, -0.0679016113281, -0.0711975097656, -0.0736083984375, -0.0758056640625, -0.0754089355469, -0.0724792480469, -0.0681457519531, 
--0.0645141601562, -0.0615234375, -0.057861328125, -0.0551452636719, -0.0530395507812, -0.0520629882812, -0.0530395507812, -0.0548706054688, 
--0.0575561523438, -0.0614929199219, -0.0669555664062, -0.07275390625, -0.0745239257812, -0.0721130371094, -0.0672607421875, -0.0621032714844, 
--0.0567016601562, -0.0493774414062, -0.0430297851562, -0.0400390625, -0.0393371582031, -0.0375366210938, -0.0326232910156, -0.0282287597656, 
--0.0256958007812, -0.0247497558594, -0.0270080566406, -0.0312194824219, -0.036865234375, -0.042724609375, -0.0463562011719, -0.0478210449219, 
--0.0487976074219, -0.0481567382812, -0.0457153320312, -0.0439147949219, -0.041748046875, -0.0408935546875, -0.0421142578125, -0.0423889160156, 
--0.0424194335938, -0.0436706542969, -0.0462951660156, -0.0509033203125, -0.0575866699219, -0.0636596679688, -0.0678405761719, -0.0700073242188, 
--0.0684814453125, -0.06396484375, -0.0572509765625, -0.0508728027344, -0.0448913574219, -0.0365905761719, -0.025146484375, -0.0141906738281, 
--0.00723266601562, -0.00509643554688, -0.00692749023438, -0.0108337402344, -0.017578125, -0.025390625, -0.0338439941406, -0.043701171875, 
--0.0523986816406, -0.0605773925781, -0.0679321289062, -0.0741577148438, -0.0806274414062, -0.0848083496094, -0.0845642089844, -0.080078125, 
--0.0747985839844, -0.0667114257812, -0.0569763183594, -0.0484619140625, -0.0411682128906, -0.03662109375, -0.0342102050781, -0.036376953125, 
--0.041748046875, -0.0487365722656, -0.0548706054688, -0.0593566894531, -0.06396484375, -0.0697326660156, -0.0772094726562, -0.0855407714844, 
--0.089111328125, -0.0881652832031, -0.0848999023438, -0.079345703125, -0.0718383789062, -0.0618591308594, -0.0526733398438, -0.0457458496094, 
--0.0384521484375, -0.03271484375, -0.0285034179688, -0.0260009765625, -0.0257263183594, -0.0275268554688, -0.0299072265625, -0.0315246582031, 
--0.0324401855469, -0.0359497070312, -0.0418701171875, -0.048095703125, -0.0542602539062, -0.0596618652344, -0.0636596679688, -0.0654296875, 
--0.0645446777344, -0.0636596679688, -0.0639038085938, -0.0636596679688, -0.0617980957031, -0.0585632324219, -0.0563049316406, -0.0542602539062, 
--0.0505981445312, -0.0466918945312, -0.0447998046875, -0.0454711914062, -0.049072265625, -0.0539245605469, -0.0565795898438, -0.0564575195312, 
--0.0544738769531, -0.0536193847656, -0.0554809570312, -0.0575866699219, -0.059326171875, -0.060302734375, -0.0587768554688, -0.0569763183594, 
--0.0560607910156, -0.0563354492188, -0.0560302734375, -0.0545959472656, -0.0523681640625, -0.0536193847656, -0.0560302734375, -0.0560913085938, 
--0.0560302734375, -0.0581665039062, -0.0602722167969, -0.0597229003906, -0.0569458007812, -0.0535888671875, -0.0527648925781, -0.0530090332031, 
--0.0523986816406, -0.0512390136719, -0.0512390136719, -0.0514526367188, -0.0542602539062, -0.0578918457031, -0.0596923828125, -0.05908203125, 
--0.0578918457031, -0.0554504394531, -0.0526733398438, -0.0494079589844, -0.0456848144531, -0.0436706542969, -0.0436096191406, -0.044189453125, 
--0.0445556640625, -0.0448303222656, -0.0460205078125, -0.04638671875, -0.0475769042969, -0.0494079589844, -0.0514831542969, -0.0533142089844, 
--0.0560913085938, -0.0593872070312, -0.0642700195312, -0.0681457519531, -0.0697021484375, -0.0705871582031, -0.0712280273438, -0.0733337402344, 
--0.0770263671875, -0.0811767578125, -0.0848388671875, -0.0879516601562, -0.093017578125, -0.100067138672, -0.103637695312, -0.104553222656, 
--0.103668212891, -0.101501464844, -0.0955505371094, -0.0748291015625, -0.0327453613281, 0.0185546875, 0.0543518066406, 0.0610656738281, 
-0.0437316894531, 0.017333984375, -0.0163269042969, -0.0502319335938, -0.0657653808594, -0.0806579589844, -0.0924072265625, -0.0654602050781, 
--0.0365905761719, -0.0664367675781, -0.0802917480469, -0.0211791992188, 0.0170593261719, -0.0174865722656, -0.0473022460938, 0.0048828125, 
-0.105621337891, 0.137786865234, 0.09375, 0.114440917969, 0.252746582031, 0.380432128906, 0.391632080078, 0.305236816406, 
-0.183166503906, 0.0470886230469, -0.125183105469, -0.263519287109, -0.285369873047, -0.242889404297, -0.257446289062, -0.325103759766, 
--0.349029541016, -0.343017578125, -0.39208984375, -0.496795654297, -0.504638671875, -0.375152587891, -0.288055419922, -0.273254394531, 
--0.208068847656, -0.09814453125, -0.0105590820312, 0.0670776367188, 0.147766113281, 0.233306884766, 0.280975341797, 0.214172363281, 
-0.119537353516, 0.145050048828, 0.267944335938, 0.378875732422, 0.403503417969, 0.2939453125, 0.089599609375, -0.115844726562, 
--0.238647460938, -0.273193359375, -0.265075683594, -0.249237060547, -0.217681884766, -0.128021240234, -0.108520507812, -0.306610107422, 
--0.517456054688, -0.46728515625, -0.262023925781, -0.131561279297, -0.147979736328, -0.272918701172, -0.354522705078, -0.284454345703, 
--0.196746826172, -0.184051513672, -0.148254394531, -0.0275268554688, 0.0932006835938, 0.117706298828, 0.0671691894531, -0.0342407226562, 
--0.0982055664062, -0.0721130371094, 0.009765625, 0.115905761719, 0.218475341797, 0.225433349609, 0.205383300781, 0.184783935547, 
-0.118682861328, -0.02001953125, -0.0921325683594, -0.0563049316406, 0.148956298828, 0.300933837891, 0.0173645019531, -0.365478515625, 
--0.340270996094, -0.180419921875, -0.300750732422, -0.379455566406, -0.272277832031, -0.141021728516, -0.0960388183594, -0.0609130859375, 
-0.185424804688, 0.102233886719, 0.117156982422, 0.252990722656, 0.064697265625, -0.0708923339844, -0.134368896484, -0.146453857422, 
-0.0647277832031, 0.0922241210938, -0.0199584960938, -0.167633056641, -0.353973388672, -0.352081298828, -0.287750244141, -0.495819091797, 
--0.48681640625, -0.279266357422, -0.0342102050781, 0.181701660156, -0.00750732421875, -0.150024414062, 0.0395202636719, 0.164733886719, 
-0.171447753906, 0.189910888672, 0.278503417969, 0.255462646484, 0.185394287109, 0.0846862792969, 0.0197448730469, 0.0937805175781, 
-0.173614501953, 0.14501953125, 0.144165039062, 0.170806884766, 0.0213623046875, 0.0191650390625, -0.0636901855469, -0.288024902344, 
--0.328186035156, -0.384857177734, -0.450592041016, -0.428894042969, -0.298034667969, -0.250152587891, -0.299896240234, -0.265411376953, 
--0.278045654297, -0.147674560547, -0.00448608398438, -0.0687561035156, -0.0824890136719, 0.0559387207031, 0.11474609375, 0.0366821289062, 
--0.0375366210938, 0.0346069335938, 0.0750427246094, -0.0347900390625, -0.158264160156, -0.129455566406, 0.0810852050781, 0.111907958984, 
-0.130432128906, 0.147491455078, 0.0182800292969, 0.0231018066406, 0.104125976562, 0.208068847656, 0.147155761719, 0.0355834960938, 
-0.0161743164062, -0.021484375, -0.0818176269531, -0.0457763671875, -0.101837158203, -0.202239990234, -0.218322753906, -0.238311767578, 
--0.343933105469, -0.337768554688, -0.213470458984, -0.137634277344, -0.158599853516, -0.142486572266, -0.0906677246094, -0.0839538574219, 
--0.0281066894531, -0.0636596679688, -0.210418701172, -0.262298583984, -0.138214111328, -0.116760253906, -0.153411865234, -0.206207275391, 
--0.216491699219, -0.142242431641, 0.0204467773438, 0.175018310547, 0.151428222656, 0.126861572266, 0.0486755371094, 0.0457763671875, 
-0.0980529785156, 0.0846252441406, 0.0547485351562, 0.0843505859375, 0.0870666503906, 0.00555419921875, 0.0161743164062, 0.0970764160156, 
-0.152954101562, 0.152923583984, 0.126831054688, 0.0188903808594, -0.128265380859, -0.233184814453, -0.231658935547, -0.149169921875, 
--0.174285888672, -0.262969970703, -0.290252685547, -0.239532470703, -0.21435546875, -0.228088378906, -0.221008300781, -0.203216552734, 
--0.163391113281, -0.153137207031, -0.129150390625, -0.106689453125, -0.109130859375, -0.116424560547, -0.118194580078, -0.104949951172, 
--0.103912353516, -0.0730590820312, -0.0736389160156, -0.0775756835938, -0.0954895019531, -0.0890808105469, -0.029052734375, 0.0301208496094, 
-0.0798645019531, 0.0728149414062, -0.00662231445312, -0.146453857422, -0.180419921875, -0.103057861328, -0.0651245117188, -0.0345153808594, 
-0.0507202148438, 0.0892333984375, 0.0206909179688, -0.0226745605469, -0.00119018554688, 0.0240173339844, 0.0625915527344, 0.124755859375, 
-0.156555175781, 0.0831604003906, -0.0387268066406, -0.141876220703, -0.198638916016, -0.24169921875, -0.311370849609, -0.363311767578, 
--0.413970947266, -0.393646240234, -0.348449707031, -0.324432373047, -0.231109619141, -0.154022216797, -0.114562988281, -0.044189453125, 
-0.0209045410156, 0.0710754394531, 0.0913391113281, 0.0883178710938, 0.0981140136719, 0.118927001953, 0.109527587891, 0.0653076171875, 
-0.0370483398438, 0.0270385742188, 0.0258483886719, 0.0255432128906, 0.00393676757812, -0.0311584472656, -0.0190734863281, -0.0541687011719, 
--0.119506835938, -0.130645751953, -0.0915222167969, -0.0354309082031, 0.000946044921875, -0.00079345703125, -0.000885009765625, -0.0447998046875, 
--0.110931396484, -0.130737304688, -0.145172119141, -0.156494140625, -0.120666503906, -0.115478515625, -0.149780273438, -0.188629150391, 
--0.249877929688, -0.291351318359, -0.326019287109, -0.341430664062, -0.2880859375, -0.15673828125, -0.0581665039062, -0.0084228515625, 
--0.00180053710938, 0.0052490234375, 0.00155639648438, -0.020263671875, -0.0275268554688, -0.00656127929688, 0.0203552246094, 0.0176696777344, 
--0.0120849609375, -0.0633239746094, -0.0861206054688, -0.0717468261719, -0.0484924316406, -0.0115051269531, -0.0122985839844, -0.0530700683594, 
--0.0721435546875, -0.0721130371094, -0.0293579101562, 0.0358276367188, 0.0774230957031, 0.0519409179688, 0.0054931640625, -0.0262756347656, 
--0.0382080078125, -0.06787109375, -0.12060546875, -0.145202636719, -0.133148193359, -0.143432617188, -0.199768066406, -0.216186523438, 
--0.182495117188, -0.164367675781, -0.161926269531, -0.162506103516, -0.15283203125, -0.130950927734, -0.123718261719, -0.121520996094, 
--0.123352050781, -0.124298095703, -0.0972900390625, -0.0672302246094, -0.0791320800781, -0.0812072753906, -0.04150390625, 0.0337524414062, 
-0.0673522949219, 0.0711059570312, 0.0816345214844, 0.0859375, 0.0628051757812, 0.00701904296875, -0.0302429199219, -0.0679016113281, 
--0.106109619141, -0.0954895019531, -0.0657043457031, -0.0821838378906, -0.107269287109, -0.104583740234, -0.0697326660156, -0.0342102050781, 
--0.0621032714844, -0.122741699219, -0.176452636719, -0.209899902344, -0.198547363281, -0.179840087891, -0.173461914062, -0.175567626953, 
--0.179779052734, -0.171905517578, -0.188323974609, -0.206451416016, -0.197052001953, -0.150115966797, -0.0736083984375, -0.0217895507812, 
--0.0159912109375, -0.0329895019531, -0.0599975585938, -0.0560302734375, -0.0138854980469, 0.0377197265625, 0.0694885253906, 0.0637817382812, 
-0.0352172851562, -0.000823974609375, -0.0335998535156, -0.0482177734375, -0.0587463378906, -0.0614624023438, -0.0552062988281, -0.0487670898438, 
--0.0342102050781, -0.020263671875, -0.021728515625, -0.0314636230469, -0.0424194335938, -0.0511779785156, -0.0578308105469, -0.0700378417969, 
--0.0990905761719, -0.132843017578, -0.13525390625, -0.11181640625, -0.0969848632812, -0.11767578125, -0.131591796875, -0.106079101562, 
--0.0660400390625, -0.0478820800781, -0.0584716796875, -0.0888061523438, -0.109497070312, -0.105773925781, -0.118865966797, -0.160308837891, 
--0.195587158203, -0.185516357422, -0.142517089844, -0.0863647460938, -0.0391235351562, -0.0339050292969, -0.0478515625, -0.0569458007812, 
--0.0639953613281, -0.0578308105469, -0.0242004394531, 0.0273742675781, 0.06103515625, 0.0534362792969, 0.031005859375, 0.0203857421875, 
-0.0158081054688, -0.00869750976562, -0.053955078125, -0.0890197753906, -0.109466552734, -0.111297607422, -0.0966491699219, -0.0739135742188, 
--0.0576171875, -0.0578918457031, -0.0669250488281, -0.0715637207031, -0.0720825195312, -0.0687866210938, -0.0706176757812, -0.0945434570312, 
--0.129150390625, -0.160980224609, -0.182586669922, -0.177032470703, -0.137054443359, -0.0839538574219, -0.0497436523438, -0.0654602050781, 
--0.105712890625, -0.142883300781, -0.169830322266, -0.172149658203, -0.156768798828, -0.130676269531, -0.0848388671875, -0.0360717773438, 
--0.0199279785156, -0.0332946777344, -0.0414733886719, -0.025146484375, -0.00140380859375, 0.0143432617188, 0.00247192382812, -0.0178833007812, 
--0.0232238769531, -0.0317687988281, -0.0506286621094, -0.0687561035156, -0.0740051269531, -0.0784301757812, -0.102844238281, -0.140350341797, 
--0.157928466797, -0.150115966797, -0.137390136719, -0.131256103516, -0.119354248047, -0.09130859375, -0.0599365234375, -0.0473022460938, 
--0.0726928710938, -0.127685546875, -0.183746337891, -0.218902587891, -0.217132568359, -0.205871582031, -0.193756103516, -0.176788330078, 
--0.148254394531, -0.108825683594, -0.0660705566406, -0.029052734375, 0.0103759765625, 0.0452880859375, 0.0555419921875, 0.0361938476562, 
-0.00067138671875, -0.0214538574219, -0.0242614746094, -0.0166015625, -0.0265808105469, -0.0585021972656, -0.0951538085938, -0.118896484375, 
--0.125213623047, -0.117645263672, -0.106689453125, -0.0906066894531, -0.0608520507812, -0.0299682617188, -0.00698852539062, -0.00448608398438, 
--0.0156555175781, -0.0272521972656, -0.0387573242188, -0.0639343261719, -0.0973510742188, -0.132751464844, -0.170715332031, -0.2041015625, 
--0.204345703125, -0.166107177734, -0.132476806641, -0.136444091797, -0.148864746094, -0.134918212891, -0.0994262695312, -0.0775756835938, 
--0.0784912109375, -0.0827026367188, -0.0787963867188, -0.0730895996094, -0.0672607421875, -0.0572814941406, -0.0594177246094, -0.0726928710938, 
--0.0851745605469, -0.0785522460938, -0.0548095703125, -0.0332946777344, -0.0260620117188, -0.0287475585938, -0.0250854492188, -0.0105895996094, 
-0.00857543945312, 0.0115966796875, 0.00613403320312, 6.103515625e-05, -0.00567626953125, -0.01513671875, -0.0305480957031, -0.0512084960938, 
--0.0796813964844, -0.111877441406, -0.135528564453, -0.149719238281, -0.159790039062, -0.162811279297, -0.140625, -0.0946044921875, 
--0.0508422851562, -0.0415344238281, -0.062744140625, -0.0878601074219, -0.0831298828125, -0.0474548339844, -0.0230712890625, -0.0284423828125, 
--0.0453796386719, -0.0542297363281, -0.0509338378906, -0.0575866699219, -0.0687561035156, -0.0748901367188, -0.077880859375, -0.0678405761719, 
--0.0593872070312, -0.0621643066406, -0.0708312988281, -0.0779113769531, -0.0745849609375, -0.0636291503906, -0.0523986816406, -0.0487670898438, 
--0.0591430664062, -0.0693359375, -0.0661315917969, -0.064208984375, -0.0800170898438, -0.101226806641, -0.108489990234, -0.101287841797, 
--0.07421875, -0.0512084960938, -0.0427551269531, -0.0527038574219, -0.06298828125, -0.0636596679688, -0.0591125488281, -0.0553894042969, 
--0.0546264648438, -0.0557250976562, -0.0757446289062, -0.101226806641, -0.111267089844, -0.110076904297, -0.106323242188, -0.105499267578, 
--0.0951538085938, -0.0852355957031, -0.0872802734375, -0.0939025878906, -0.100982666016, -0.0900573730469, -0.0594177246094, -0.0362854003906, 
--0.0382385253906, -0.052001953125, -0.0585021972656, -0.0457458496094, -0.0321044921875, -0.0369567871094, -0.0542297363281, -0.080322265625, 
--0.102447509766, -0.108795166016, -0.104278564453, -0.0882568359375, -0.0805969238281, -0.0915222167969, -0.100341796875, -0.0982055664062, 
--0.0839538574219, -0.0712585449219, -0.0700073242188, -0.072998046875, -0.0742492675781, -0.0852355957031, -0.101531982422, -0.115814208984, 
--0.115753173828, -0.104522705078, -0.101318359375, -0.101531982422, -0.0990905761719, -0.0945739746094, -0.0857543945312, -0.0694885253906, 
--0.0459594726562, -0.0196838378906, -0.00387573242188, -0.00692749023438, -0.0134887695312, -0.00906372070312, 0.00091552734375, -0.0029296875, 
--0.0245361328125, -0.0450744628906, -0.0578918457031, -0.0743103027344, -0.0890808105469, -0.0969848632812, -0.107299804688, -0.108581542969, 
--0.0869445800781, -0.0573425292969, -0.0441284179688, -0.0348510742188, -0.0272216796875, -0.0284423828125, -0.0354614257812, -0.0460205078125, 
--0.0667114257812, -0.101501464844, -0.135498046875, -0.145904541016, -0.135833740234, -0.121246337891, -0.110321044922, -0.106628417969, 
--0.102172851562, -0.0912475585938, -0.0715637207031, -0.0548095703125, -0.0360107421875, -0.0169067382812, -0.0057373046875, -0.0171813964844, 
--0.0484924316406, -0.0751953125, -0.0936584472656, -0.0972900390625, -0.0858154296875, -0.0635986328125, -0.0481567382812, -0.0418090820312, 
--0.0387878417969, -0.0287475585938, -0.0122985839844, 0.00396728515625, 0.0185852050781, 0.0225524902344, 0.00634765625, -0.0250854492188, 
--0.0573425292969, -0.0772399902344, -0.0806579589844, -0.0741882324219, -0.0730590820312, -0.0851745605469, -0.0994262695312, -0.107879638672, 
--0.108245849609, -0.10400390625, -0.0978393554688, -0.0960998535156, -0.107299804688, -0.125457763672, -0.134979248047, -0.137969970703, 
--0.132171630859, -0.125518798828, -0.112182617188, -0.0890808105469, -0.0726928710938, -0.06884765625, -0.0739135742188, -0.0694274902344, 
--0.056640625, -0.0330200195312, -0.00570678710938, 0.00155639648438, -0.0126037597656, -0.0348205566406, -0.0567016601562, -0.0661010742188, 
--0.0635986328125, -0.0521240234375, -0.0439147949219, -0.0511779785156, -0.0661315917969, -0.0818176269531, -0.0885314941406, -0.0848388671875, 
--0.0660400390625, -0.0408630371094, -0.0254211425781, -0.025146484375, -0.0321044921875, -0.0442199707031, -0.0614929199219, -0.07666015625, 
--0.0906372070312, -0.104919433594, -0.117004394531, -0.120635986328, -0.1240234375, -0.125152587891, -0.121276855469, -0.109130859375, 
--0.0985107421875, -0.0918579101562, -0.0836181640625, -0.0797119140625, -0.0751342773438, -0.069091796875, -0.0523986816406, -0.0372619628906, 
--0.0347900390625, -0.0451354980469, -0.060302734375, -0.0709533691406, -0.0754699707031, -0.075439453125, -0.0721740722656, -0.0696716308594, 
--0.07275390625, -0.0733032226562, -0.0706176757812, -0.0730285644531, -0.07275390625, -0.0597229003906, -0.0393676757812, -0.0223693847656, 
--0.0160217285156, -0.0226440429688, -0.0342102050781, -0.0505981445312, -0.0706176757812, -0.0806274414062, -0.0833740234375, -0.0896911621094, 
--0.092529296875, -0.0933227539062, -0.0885314941406, -0.0812377929688, -0.0760498046875, -0.0729675292969, -0.0709533691406, -0.0681762695312, 
--0.0685119628906, -0.0679016113281, -0.0632629394531, -0.053955078125, -0.0502624511719, -0.0552062988281, -0.0571594238281, -0.0579223632812, 
--0.0593872070312, -0.0648498535156, -0.0696411132812, -0.0667419433594, -0.0548095703125, -0.0408325195312, -0.0281982421875, -0.0159606933594, 
--0.0081787109375, -0.00320434570312, -0.00387573242188, -0.00970458984375, -0.0153503417969, -0.0181274414062, -0.0172424316406, -0.0220947265625, 
--0.0365905761719, -0.05517578125, -0.0748901367188, -0.090576171875, -0.0940246582031, -0.0939025878906, -0.0949096679688, -0.09423828125, 
--0.0909729003906, -0.081787109375, -0.0709533691406, -0.0651550292969, -0.0712585449219, -0.0751037597656, -0.0763854980469, -0.0769958496094, 
--0.0814819335938, -0.086669921875, -0.0867004394531, -0.0823974609375, -0.0821838378906, -0.0878601074219, -0.0870666503906, -0.0733642578125, 
--0.0514526367188, -0.0347900390625, -0.0256958007812, -0.0236511230469, -0.0296325683594, -0.0372924804688, -0.0387268066406, -0.038818359375, 
--0.0408935546875, -0.0451354980469, -0.0520935058594, -0.0581970214844, -0.0614624023438, -0.0633239746094, -0.0673217773438, -0.0712280273438, 
--0.0738525390625, -0.0693969726562, -0.0609436035156, -0.0539245605469, -0.0442504882812, -0.0326843261719, -0.0232543945312, -0.0196838378906, 
--0.0233154296875, -0.0305786132812, -0.0400085449219, -0.0578002929688, -0.0748901367188, -0.085205078125, -0.0963439941406, -0.105224609375, 
--0.111572265625, -0.116394042969, -0.122406005859, -0.127349853516, -0.128234863281, -0.126403808594, -0.114288330078, -0.0927429199219, 
--0.0712890625, -0.0575561523438, -0.0547790527344, -0.0475463867188, -0.0362854003906, -0.0281677246094, -0.0233459472656, -0.0256652832031, 
--0.0326843261719, -0.0400390625, -0.0477905273438, -0.0524291992188, -0.0545043945312, -0.0554504394531, -0.0554504394531, -0.0545959472656, 
--0.0471801757812, -0.036376953125, -0.0320739746094, -0.0308532714844, -0.0296630859375, -0.0335998535156, -0.0400085449219, -0.0514526367188, 
--0.0675964355469, -0.0830383300781, -0.0963745117188, -0.103668212891, -0.109710693359, -0.114898681641, -0.116394042969, -0.112823486328, 
--0.107238769531, -0.100402832031, -0.0943298339844, -0.0881958007812, -0.0774841308594, -0.0682678222656, -0.0641784667969, -0.0612182617188, 
--0.0548400878906, -0.0433044433594, -0.033935546875, -0.0308532714844, -0.0314331054688, -0.0323791503906, -0.0351867675781, -0.0411987304688, 
--0.0484313964844, -0.0572814941406, -0.0614624023438, -0.0612182617188, -0.0621948242188, -0.0620727539062, -0.0599975585938, -0.0515441894531, 
--0.0451049804688, -0.04541015625, -0.0484924316406, -0.0515441894531, -0.0527038574219, -0.0505981445312, -0.0472717285156, -0.0520324707031, 
--0.06005859375, -0.0654296875, -0.0685119628906, -0.0654602050781, -0.0617980957031, -0.060302734375, -0.0639038085938, -0.0763854980469, 
--0.086669921875, -0.0892028808594, -0.0884704589844, -0.087890625, -0.0873107910156, -0.0845642089844, -0.0833129882812, -0.0834045410156, 
--0.0821228027344, -0.0820922851562, -0.0842895507812, -0.0815124511719, -0.0708923339844, -0.0594482421875, -0.0477905273438, -0.0393981933594, 
--0.0296936035156, -0.0239562988281, -0.0208435058594, -0.0160217285156, -0.0160217285156, -0.0223693847656, -0.0299987792969, -0.0393676757812, 
--0.0478210449219, -0.0536193847656, -0.0602416992188, -0.0636291503906, -0.0594482421875, -0.0524291992188, -0.05419921875, -0.0633850097656, 
--0.0678405761719, -0.0624389648438, -0.05419921875, -0.0543212890625, -0.0596008300781, -0.0654602050781, -0.0733642578125, -0.0787963867188, 
--0.0788269042969, -0.0796813964844, -0.0791320800781, -0.0714721679688, -0.0639953613281, -0.0581359863281, -0.0542602539062, -0.0559692382812, 
--0.0634155273438, -0.0709228515625, -0.0708618164062, -0.0643005371094, -0.0569763183594, -0.0502014160156, -0.0503234863281, -0.0535888671875, 
--0.0536499023438, -0.0487670898438, -0.0408935546875, -0.035400390625, -0.0348205566406, -0.0342407226562, -0.03173828125, -0.0321044921875, 
--0.0293579101562, -0.0312194824219, -0.0354309082031, -0.0426940917969, -0.0557861328125, -0.0671997070312, -0.0775451660156, -0.0834045410156, 
--0.0845031738281, -0.0830688476562, -0.0796813964844, -0.0743103027344, -0.0772705078125, -0.0800476074219, -0.0784301757812, -0.0739440917969, 
--0.0669860839844, -0.0605773925781, -0.0615234375, -0.066650390625, -0.0690612792969, -0.0697326660156, -0.0724182128906, -0.07666015625, 
--0.0754699707031, -0.0703125, -0.061279296875, -0.0523071289062, -0.0503234863281, -0.0496520996094, -0.0469665527344, -0.0451049804688, 
--0.0433349609375, -0.04150390625, -0.0436096191406, -0.0442199707031, -0.0457153320312, -0.0569458007812, -0.06884765625, -0.0754699707031, 
--0.0773315429688, -0.0757141113281, -0.0675964355469, -0.0560913085938, -0.0453796386719, -0.0397338867188, -0.0408630371094, -0.0399475097656, 
--0.0360412597656, -0.0332946777344, -0.0351257324219, -0.0433044433594, -0.0572204589844, -0.0694274902344, -0.0788269042969, -0.0818481445312, 
--0.0799865722656, -0.0782165527344, -0.0781860351562, -0.0784912109375, -0.0775756835938, -0.0782165527344, -0.07666015625, -0.0684814453125, 
--0.0536193847656, -0.0409240722656, -0.0399169921875, -0.0533447265625, -0.0660705566406, -0.0697021484375, -0.0715026855469, -0.0726928710938, 
--0.0712280273438, -0.0684814453125, -0.06396484375, -0.0608825683594, -0.057861328125, -0.0511779785156, -0.0469055175781, -0.0430603027344, 
--0.033935546875, -0.0281066894531, -0.0263671875, -0.0296630859375, -0.0375366210938, -0.0451354980469, -0.056396484375, -0.066650390625, 
--0.0782165527344, -0.0878601074219, -0.0919189453125, -0.0929870605469, -0.0882263183594, -0.0754699707031, -0.0632934570312, -0.060302734375, 
--0.0642700195312, -0.0709228515625, -0.0739440917969, -0.0648498535156, -0.0512084960938, -0.044189453125, -0.0414733886719, -0.0406494140625, 
--0.0386657714844, -0.0379028320312, -0.0372314453125, -0.0363464355469, -0.0387268066406, -0.0454406738281, -0.0502319335938, -0.0497741699219, 
--0.0474853515625, -0.0406188964844, -0.0302734375, -0.0308837890625, -0.0403137207031, -0.0478210449219, -0.0512390136719, -0.0529479980469, 
--0.0533447265625, -0.0569152832031, -0.0630187988281, -0.0645751953125, -0.0630798339844, -0.0599365234375, -0.0548706054688, -0.0566101074219, 
--0.0636596679688, -0.0684509277344, -0.0742492675781, -0.0773010253906, -0.0772094726562, -0.07373046875, -0.0724182128906, -0.0715637207031, 
--0.0702819824219, -0.0718078613281, -0.0724182128906, -0.0651550292969, -0.0578308105469, -0.0545654296875, -0.0505981445312, -0.051513671875, 
--0.052734375, -0.0520629882812, -0.049072265625, -0.0448303222656, -0.042724609375, -0.0436096191406, -0.0459899902344, -0.0515441894531, 
--0.0518188476562, -0.0496215820312, -0.0496826171875, -0.0505981445312, -0.0560302734375, -0.0627136230469, -0.0649108886719, -0.0614929199219, 
--0.0596313476562, -0.0630493164062, -0.0660400390625, -0.0645446777344, -0.0623779296875, -0.0612487792969, -0.0606384277344, -0.0603332519531, 
--0.0614624023438, -0.0624389648438, -0.0621337890625, -0.0596618652344, -0.0575866699219, -0.0584411621094, -0.0660400390625, -0.0748291015625, 
--0.0839538574219, -0.0927429199219, -0.0960998535156, -0.0927734375, -0.0881958007812, -0.0806579589844, -0.0720520019531, -0.0634155273438, 
--0.0541076660156, -0.0481872558594, -0.0424194335938, -0.0393676757812, -0.0382080078125, -0.0414733886719, -0.0484008789062, -0.0521240234375, 
--0.0557861328125, -0.0600280761719, -0.064208984375, -0.0705871582031, -0.0772705078125, -0.0819091796875, -0.0833740234375, -0.082763671875, 
--0.0775451660156, -0.0700073242188, -0.0626831054688, -0.0542907714844, -0.0508422851562, -0.05029296875, -0.0500183105469, -0.0493774414062, 
--0.0494079589844, -0.0472106933594, -0.0469665527344, -0.0521240234375, -0.05908203125, -0.0654602050781, -0.0666198730469, -0.0660400390625, 
--0.0639343261719, -0.0603637695312, -0.0566101074219, -0.0530395507812, -0.0524291992188, -0.052734375, -0.0536193847656, -0.0530395507812, 
--0.0521240234375, -0.0523986816406, -0.0533447265625, -0.0563659667969, -0.0617980957031, -0.0649108886719, -0.06298828125, -0.0599670410156, 
--0.0563354492188, -0.0533752441406, -0.0491027832031, -0.046875, -0.049072265625, -0.0512084960938, -0.0475769042969, -0.0445251464844, 
--0.0435791015625, -0.0429992675781, -0.0433349609375, -0.0487670898438, -0.0581970214844, -0.0651245117188, -0.0699768066406, -0.0742492675781, 
--0.0803527832031, -0.0836181640625, -0.080322265625, -0.0758361816406, -0.0687561035156, -0.0639343261719, -0.0596923828125, -0.0569458007812, 
--0.0530090332031, -0.0499572753906, -0.0496826171875, -0.0499877929688, -0.0514831542969, -0.0557861328125, -0.0600280761719, -0.0584716796875, 
--0.0533142089844, -0.0521240234375, -0.0539245605469, -0.0551147460938, -0.0593566894531, -0.0648803710938, -0.066650390625, -0.0657958984375, 
--0.06396484375, -0.0575256347656, -0.0518188476562, -0.0512084960938, -0.051513671875, -0.0509033203125, -0.0487670898438, -0.0475463867188, 
--0.0475463867188, -0.0536193847656, -0.060546875, -0.0636596679688, -0.0632934570312, -0.0609436035156, -0.0570068359375, -0.05029296875, 
--0.0471801757812, -0.0491027832031, -0.0523376464844, -0.0545349121094, -0.0542602539062, -0.0520935058594, -0.0502624511719, -0.0466613769531, 
--0.0429992675781, -0.045166015625, -0.05029296875, -0.0560302734375, -0.0603637695312, -0.0626525878906, -0.0627746582031, -0.0614929199219, 
--0.0563659667969, -0.0505981445312, -0.0472412109375, -0.0459899902344, -0.0439147949219, -0.0369262695312, -0.0296630859375, -0.0263671875, 
--0.0293579101562, -0.0345153808594, -0.0399780273438, -0.0478820800781, -0.0545654296875, -0.0556640625, -0.0546264648438, -0.0511169433594, 
--0.0469055175781, -0.0491027832031, -0.053955078125, -0.0533447265625, -0.0508728027344, -0.0530395507812, -0.0581970214844, -0.0591125488281, 
--0.0572814941406, -0.0556945800781, -0.0612182617188, -0.0691223144531, -0.0702819824219, -0.0657958984375, -0.0599975585938, -0.0578308105469, 
--0.0596923828125, -0.0608825683594, -0.0578918457031, -0.0545654296875, -0.0502624511719, -0.0438842773438, -0.0421447753906, -0.0418090820312, 
--0.0400085449219, -0.0399780273438, -0.0453796386719, -0.0533447265625, -0.057861328125, -0.0569152832031, -0.0517883300781, -0.048828125, 
--0.0511779785156, -0.0557250976562, -0.0552368164062, -0.0505676269531, -0.0475463867188, -0.0445556640625, -0.0442504882812, -0.0451049804688, 
--0.047607421875, -0.0484008789062, -0.0478515625, -0.0463256835938, -0.0396728515625, -0.0369873046875, -0.0383911132812, -0.0405578613281, 
--0.0445251464844, -0.0478820800781, -0.0526733398438, -0.0596923828125, -0.0627746582031, -0.0597229003906, -0.0538940429688, -0.0497741699219, 
--0.0486755371094, -0.0478515625, -0.0475769042969, -0.0442504882812, -0.0381774902344, -0.0329284667969, -0.0329895019531, -0.03369140625, 
--0.0332641601562, -0.0317993164062, -0.0326538085938, -0.0360717773438, -0.035400390625, -0.0339050292969, -0.0344848632812, -0.0379028320312, 
--0.0453796386719, -0.0536499023438, -0.0530700683594, -0.0474548339844, -0.0464477539062, -0.0457153320312, -0.0430297851562, -0.0405578613281, 
--0.0372314453125, -0.0345153808594, -0.0306091308594, -0.0284729003906, -0.0326843261719, -0.0381469726562, -0.0415344238281, -0.0429992675781, 
--0.0469055175781, -0.0496520996094, -0.0484313964844, -0.0460815429688, -0.0460205078125, -0.0497131347656, -0.0557250976562, -0.0591125488281, 
--0.0606384277344, -0.0614624023438, -0.0585021972656, -0.0572204589844, -0.0567016601562, -0.0547790527344, -0.0485229492188, -0.0383605957031, 
--0.0315246582031, -0.0299682617188, -0.0284729003906, -0.0266418457031, -0.0251159667969, -0.0278015136719, -0.03271484375, -0.0375061035156, 
--0.04296875, -0.0457458496094, -0.0485229492188, -0.0542297363281, -0.0559997558594, -0.0542602539062, -0.053955078125, -0.0526733398438, 
--0.05029296875, -0.0523986816406, -0.0572814941406, -0.0599975585938, -0.0572509765625, -0.051513671875, -0.049072265625, -0.049072265625, 
--0.0509033203125, -0.0512390136719, -0.0478210449219, -0.0433044433594, -0.0423889160156, -0.0433654785156, -0.0451049804688, -0.0466918945312, 
--0.0469665527344, -0.0454406738281, -0.0411987304688, -0.0375366210938, -0.0382080078125, -0.0426635742188, -0.0448303222656, -0.0418090820312, 
--0.0384216308594, -0.0388488769531, -0.0435485839844, -0.0493774414062, -0.0518188476562, -0.052978515625, -0.0512390136719, -0.0477905273438, 
--0.0424194335938, -0.0372619628906, -0.0356750488281, -0.0372924804688, -0.0372314453125, -0.0345764160156, -0.0311279296875, -0.029052734375, 
--0.0311584472656, -0.0342407226562, -0.0342102050781, -0.0345458984375, -0.0387573242188, -0.0442504882812, -0.0487976074219, -0.0517578125, 
--0.0527648925781, -0.0490417480469, -0.0451965332031, -0.0435791015625, -0.0417785644531, -0.0403137207031, -0.0381774902344, -0.0381469726562, 
--0.0396728515625, -0.0426635742188, -0.0503234863281, -0.0536804199219, -0.0518188476562, -0.0496826171875, -0.0517578125, -0.0551452636719, 
--0.0585021972656, -0.0624389648438, -0.0642395019531, -0.0642395019531, -0.0624084472656, -0.0581665039062, -0.0515441894531, -0.0451049804688, 
--0.0408630371094, -0.0376281738281, -0.0345153808594, -0.0330200195312, -0.0369262695312, -0.04541015625, -0.0506591796875, -0.0520629882812, 
--0.0548400878906, -0.0567016601562, -0.0557250976562, -0.0542602539062, -0.0536193847656, -0.0560607910156, -0.0560607910156, -0.0530090332031, 
--0.0477905273438, -0.0440063476562, -0.046875, -0.0518493652344, -0.0572814941406, -0.0624389648438, -0.0654296875, -0.0669555664062, 
--0.0682067871094, -0.0693664550781, -0.0679016113281, -0.0651550292969, -0.062744140625, -0.0596923828125, -0.055419921875, -0.0530700683594, 
--0.0526733398438, -0.0518188476562, -0.05029296875, -0.0487060546875, -0.0487976074219, -0.0478515625, -0.0484924316406, -0.0538940429688, 
--0.0618286132812, -0.0663757324219, -0.0678405761719, -0.0688171386719, -0.0663452148438, -0.061767578125, -0.056396484375, -0.0509033203125, 
--0.047607421875, -0.0439147949219, -0.0432434082031, -0.0423889160156, -0.0405883789062, -0.0400390625, -0.0393371582031, -0.0408630371094, 
--0.0448608398438, -0.0502624511719, -0.0545349121094, -0.0542297363281, -0.0518188476562, -0.0509033203125, -0.0465698242188, -0.0397338867188, 
--0.0335693359375, -0.031494140625, -0.034423828125, -0.0364074707031, -0.036376953125, -0.039306640625, -0.0439453125, -0.0474853515625, 
--0.0487670898438, -0.0509033203125, -0.0533447265625, -0.0548095703125, -0.0545959472656, -0.0523681640625, -0.0548706054688, -0.0581665039062, 
--0.0566101074219, -0.0503234863281, -0.0442199707031, -0.0405883789062, -0.03564453125, -0.0303039550781, -0.0281372070312, -0.0305480957031, 
--0.0333251953125, -0.0363464355469, -0.0396728515625, -0.0426635742188, -0.0448608398438, -0.0436401367188, -0.0451049804688, -0.0518188476562, 
--0.0572814941406, -0.0581359863281, -0.0554504394531, -0.0509033203125, -0.0460510253906, -0.0420532226562, -0.0387573242188, -0.03759765625, 
--0.0372314453125, -0.037841796875, -0.0384521484375, -0.0353698730469, -0.0372619628906, -0.0393676757812, -0.0408935546875, -0.0451049804688, 
--0.045166015625, -0.0457153320312, -0.0511474609375, -0.0551147460938, -0.0569763183594, -0.0605773925781, -0.0606079101562, -0.0560913085938, 
--0.0481567382812, -0.0405578613281, -0.03515625, -0.0317687988281, -0.0332336425781, -0.034912109375, -0.037841796875, -0.0411376953125, 
--0.0417785644531, -0.0418395996094, -0.0423583984375, -0.0424194335938, -0.0406188964844, -0.0387268066406, -0.0399780273438, -0.0424499511719, 
--0.0451049804688, -0.0472412109375, -0.0469970703125, -0.0448608398438, -0.0436401367188, -0.0435791015625, -0.0445251464844, -0.0457153320312, 
--0.0469970703125, -0.0466613769531, -0.0478210449219, -0.0494079589844, -0.0487670898438, -0.0484924316406, -0.0479125976562, -0.0462951660156, 
--0.0432434082031, -0.0427856445312, -0.0414733886719, -0.0375671386719, -0.0360107421875, -0.0357666015625, -0.0345153808594, -0.0382080078125, 
--0.044189453125, -0.0481567382812, -0.0532836914062, -0.0536499023438, -0.0520935058594, -0.05029296875, -0.0454711914062, -0.0420837402344, 
--0.0390319824219, -0.0342102050781, -0.0311584472656, -0.0281677246094, -0.0238952636719, -0.0199279785156, -0.0202331542969, -0.0242614746094, 
--0.0284423828125, -0.0281677246094, -0.0311889648438, -0.0372314453125, -0.0439453125, -0.0505676269531, -0.0560607910156, -0.0581359863281, 
--0.05517578125, -0.0524291992188, -0.05126953125, -0.0508728027344, -0.0487670898438, -0.0462951660156, -0.0430908203125, -0.0396118164062, 
--0.0391540527344, -0.0405883789062, -0.0433044433594, -0.0442199707031, -0.0432434082031, -0.0451354980469, -0.0482177734375, -0.049072265625, 
--0.0475463867188, -0.0445251464844, -0.0405883789062, -0.0360107421875, -0.0317993164062, -0.029052734375, -0.025146484375, -0.0223693847656, 
--0.02392578125, -0.0254211425781, -0.0242004394531, -0.0223083496094, -0.023681640625, -0.0283813476562, -0.0354919433594, -0.0418395996094, 
--0.0447692871094, -0.0445861816406, -0.0423583984375, -0.0387878417969, -0.0347900390625, -0.0306091308594, -0.0275573730469, -0.0284423828125, 
--0.0320434570312, -0.0339050292969, -0.0357055664062, -0.0372619628906, -0.0357360839844, -0.0335693359375, -0.0341491699219, -0.03515625, 
--0.0360412597656, -0.0387268066406, -0.0397033691406, -0.0393676757812, -0.0396423339844, -0.040283203125, -0.0390930175781, -0.0365905761719, 
--0.0354919433594, -0.0377807617188, -0.0397033691406, -0.0375366210938, -0.0363159179688, -0.0369873046875, -0.0372314453125, -0.0384521484375, 
--0.0393371582031, -0.0418395996094, -0.0432739257812, -0.0426940917969, -0.038818359375, -0.0342407226562, -0.0344543457031, -0.0369873046875, 
--0.03662109375, -0.0345458984375, -0.0348205566406, -0.0350952148438, -0.03759765625, -0.0429992675781, -0.0484619140625, -0.0523681640625, 
--0.052978515625, -0.0497131347656, -0.0463256835938, -0.0445556640625, -0.0439147949219, -0.0423583984375, -0.0405578613281, -0.0379028320312, 
--0.0360412597656, -0.0375366210938, -0.0366516113281, -0.0345153808594, -0.0317687988281, -0.0317993164062, -0.0342407226562, -0.0362854003906, 
--0.0354309082031, -0.0338745117188, -0.0345458984375, -0.0366821289062, -0.0390319824219, -0.0409240722656, -0.0417785644531, -0.04296875, 
--0.043701171875, -0.0426635742188, -0.0423583984375, -0.0433654785156, -0.046875, -0.05029296875, -0.052734375, -0.0512084960938, 
--0.04541015625, -0.0418395996094, -0.0405578613281, -0.04150390625, -0.0414733886719, -0.0387268066406, -0.0357360839844, -0.03662109375, 
--0.0369262695312, -0.0315551757812, -0.0269165039062, -0.0260314941406, -0.026611328125, -0.0281066894531, -0.0308532714844, -0.0324401855469, 
--0.0302734375, -0.0263671875, -0.0263061523438, -0.031494140625, -0.0390319824219, -0.0439758300781, -0.04296875, -0.0393371582031, 
--0.033935546875, -0.0296325683594, -0.030029296875, -0.0305786132812, -0.0321044921875, -0.031494140625, -0.0293273925781, -0.0287780761719, 
--0.0268859863281, -0.02392578125, -0.022705078125, -0.0214538574219, -0.020263671875, -0.0208435058594, -0.0217895507812, -0.0223999023438, 
--0.0211791992188, -0.0205688476562, -0.0226745605469, -0.0257568359375, -0.0272216796875, -0.0263061523438, -0.025390625, -0.0263366699219, 
--0.0272521972656, -0.0293273925781, -0.0302734375, -0.0293273925781, -0.0318603515625, -0.035400390625, -0.0360107421875, -0.0366821289062, 
--0.0387878417969, -0.0381164550781, -0.0393676757812, -0.0405578613281, -0.0384826660156, -0.0354309082031, -0.0314331054688, -0.0290832519531, 
--0.0271911621094, -0.0236511230469, -0.0205993652344, -0.0217590332031, -0.0242309570312, -0.0259704589844, -0.0284423828125, -0.02880859375, 
--0.03173828125, -0.033935546875, -0.03173828125, -0.0311889648438, -0.0332641601562, -0.0339660644531, -0.0317993164062, -0.0296325683594, 
--0.0302734375, -0.0312194824219, -0.0309143066406, -0.0308227539062, -0.0296325683594, -0.0281677246094, -0.02783203125, -0.0296936035156, 
--0.0299072265625, -0.0296936035156, -0.0299377441406, -0.0309143066406, -0.0320434570312, -0.0308837890625, -0.02783203125, -0.0238647460938, 
--0.0217895507812, -0.0203247070312, -0.0205383300781, -0.0232543945312, -0.0257873535156, -0.0289916992188, -0.0318298339844, -0.0335998535156, 
--0.0369567871094, -0.0420227050781, -0.0439758300781, -0.040283203125, -0.0332946777344, -0.0285034179688, -0.0284423828125, -0.0272216796875, 
--0.0223693847656, -0.0187683105469, -0.0165710449219, -0.0126953125, -0.00961303710938, -0.00994873046875, -0.0121154785156, -0.0163269042969, 
--0.0196228027344, -0.0205688476562, -0.0220947265625, -0.0251159667969, -0.02783203125, -0.0296936035156, -0.0299682617188, -0.0323791503906, 
--0.0342102050781, -0.0321350097656, -0.0291137695312, -0.0277709960938, -0.0287475585938, -0.0284118652344, -0.0238952636719, -0.0202941894531, 
--0.0215148925781, -0.0235900878906, -0.0265808105469, -0.0287475585938, -0.0305786132812, -0.0321350097656, -0.0330200195312, -0.0345153808594, 
--0.03662109375, -0.0357360839844, -0.0339050292969, -0.0342407226562, -0.03271484375, -0.0287170410156, -0.0245056152344, -0.0215148925781, 
--0.0193481445312, -0.0177917480469, -0.0172119140625, -0.0184631347656, -0.0208740234375, -0.0238647460938, -0.0263671875, -0.026611328125, 
--0.0269165039062, -0.02490234375, -0.0232543945312, -0.0220642089844, -0.0232849121094, -0.0245666503906, -0.026611328125, -0.0296325683594, 
--0.0293884277344, -0.026611328125, -0.0220642089844, -0.0254211425781, -0.0305480957031, -0.0318298339844, -0.0323486328125, -0.03515625, 
--0.0360412597656, -0.0350952148438, -0.0335998535156, -0.0330505371094, -0.0317687988281, -0.0281982421875, -0.0238647460938, -0.0206298828125, 
--0.0166015625, -0.012939453125, -0.0120849609375, -0.0126342773438, -0.01513671875, -0.0184020996094, -0.0208435058594, -0.0227661132812, 
--0.025146484375, -0.0281066894531, -0.0281066894531, -0.0269470214844, -0.02880859375, -0.0293884277344, -0.0281066894531, -0.0248413085938, 
--0.0206298828125, -0.0205383300781, -0.0220336914062, -0.0217895507812, -0.0235900878906, -0.0278015136719, -0.0291137695312, -0.0272216796875, 
--0.0238952636719, -0.0218505859375, -0.0242004394531, -0.0268859863281, -0.0306396484375, -0.0341796875, -0.0345458984375, -0.03515625, 
--0.0338745117188, -0.0306091308594, -0.0277709960938, -0.0275573730469, -0.0266418457031, -0.0242309570312, -0.0238952636719, -0.0266723632812, 
--0.0284729003906, -0.028076171875, -0.0296630859375, -0.0360717773438, -0.0420532226562]
+# 6077 samples, in tables/ (see utils/radio_pyo_tables.py)
+buff = 'fc64dd78099dab016499d80683cdbbd2b6edbc59'
 
 
 #PLAYERS-----------------------------------------------------------------------------------------------------------------------------
-crunchtable = DataTable(size=len(buff), init=buff)
+crunchtable = load_table(buff)
 crunchrand = Randi(freq=5)
 crunchfade = Fader(0.1,0.2)
 crunchpointer = Pointer([crunchtable,crunchtable], index=crunchrand, mul=crunchfade*2)
@@ -821,93 +64,127 @@ osca = Osc(crunchtable, freq=[4.75+jitosc, 5, 5, 5.25+jitosc, 101*oscmove, 100*o
 oscamix = osca.mix(2)
 
 #SEQUENCE----------------------------------------------------------------------------------------------------------------------------
-temps = -0.5
-def timecontrol():
-    global temps
-    temps += 0.5
-    if temps == 0:
-        crunchverb.out()
-        crunchfade.play()
-        crunchsamp.play()
-    elif temps == 2:
-        crunchfade.stop()
-        c1fade.play()
-        crunchlooper.out(0)
-    elif temps == 10.5:
-        crunchfade.play()
-        crunchsamp2.play()
-    elif temps == 13:
-        crunchfade.stop()
-        c2fade.play()
-        crunchlooper2.out(1)
-    elif temps == 18:
-        crunchfade.play()
-        c3fade.play()
-        crunchsamp3.play()
-    elif temps == 19:
-        crunchfade.stop()
-        cloop3pan.out()
-    elif temps == 31:
-        c1fade.stop()
-        c2fade.stop()
-        c3fade.stop()
-        jitosc.play()
-    elif temps == 32.5:
-        crunchverb.stop()
-        sinekick.out()
-        sinekick2.out()
-        selkick.play()
-        bassverb.out()
-        oscamix.out()
-    elif temps == 38:
-        oscmove.play()
-        crunchfade.stop()
-    elif temps == 40:
-        crunchverb.stop()
-        sinekick.stop()
-        sinekick2.stop()
-    elif temps == 79:
-        sinekick.out()
-        sinekick2.out()
-        selkick.play()
-        oscmove.play()
-    elif temps == 87:
-        sinekick.stop()
-        sinekick2.stop()
-    elif temps == 109:
-        oscamix.stop()
-        bassverb.stop()
-        crunchverb.out()
-        crunchfade.play()
-        crunchsamp.play()
-    elif temps == 111:
-        crunchfade.stop()
-        c1fade.play()
-        crunchlooper.out(0)
-    elif temps == 118:
-        crunchfade.play()
-        crunchsamp2.play()
-    elif temps == 123:
-        crunchfade.stop()
-        c2fade.play()
-        crunchlooper2.out(1)
-    elif temps == 125:
-        crunchfade.play()
-        c3fade.play()
-        crunchsamp3.play()
-    elif temps == 131:
-        crunchfade.stop()
-        cloop3pan.out()
-    elif temps == 140:
-        durramp.play()
-    elif temps == 170:
-        c1fade.stop()
-        c2fade.stop()
-        c3fade.stop()
-    else:
-        pass
-        
-mainp = Pattern(timecontrol, 0.5)
+mainp = Score(server=s)
+
+@mainp.at(0)
+def at_0():
+    crunchverb.out()
+    crunchfade.play()
+    crunchsamp.play()
+
+@mainp.at(2)
+def at_2():
+    crunchfade.stop()
+    c1fade.play()
+    crunchlooper.out(0)
+
+@mainp.at(10.5)
+def at_10_5():
+    crunchfade.play()
+    crunchsamp2.play()
+
+@mainp.at(13)
+def at_13():
+    crunchfade.stop()
+    c2fade.play()
+    crunchlooper2.out(1)
+
+@mainp.at(18)
+def at_18():
+    crunchfade.play()
+    c3fade.play()
+    crunchsamp3.play()
+
+@mainp.at(19)
+def at_19():
+    crunchfade.stop()
+    cloop3pan.out()
+
+@mainp.at(31)
+def at_31():
+    c1fade.stop()
+    c2fade.stop()
+    c3fade.stop()
+    jitosc.play()
+
+@mainp.at(32.5)
+def at_32_5():
+    crunchverb.stop()
+    sinekick.out()
+    sinekick2.out()
+    selkick.play()
+    bassverb.out()
+    oscamix.out()
+
+@mainp.at(38)
+def at_38():
+    oscmove.play()
+    crunchfade.stop()
+
+@mainp.at(40)
+def at_40():
+    crunchverb.stop()
+    sinekick.stop()
+    sinekick2.stop()
+
+@mainp.at(79)
+def at_79():
+    sinekick.out()
+    sinekick2.out()
+    selkick.play()
+    oscmove.play()
+
+@mainp.at(87)
+def at_87():
+    sinekick.stop()
+    sinekick2.stop()
+
+@mainp.at(109)
+def at_109():
+    oscamix.stop()
+    bassverb.stop()
+    crunchverb.out()
+    crunchfade.play()
+    crunchsamp.play()
+
+@mainp.at(111)
+def at_111():
+    crunchfade.stop()
+    c1fade.play()
+    crunchlooper.out(0)
+
+@mainp.at(118)
+def at_118():
+    crunchfade.play()
+    crunchsamp2.play()
+
+@mainp.at(123)
+def at_123():
+    crunchfade.stop()
+    c2fade.play()
+    crunchlooper2.out(1)
+
+@mainp.at(125)
+def at_125():
+    crunchfade.play()
+    c3fade.play()
+    crunchsamp3.play()
+
+@mainp.at(131)
+def at_131():
+    crunchfade.stop()
+    cloop3pan.out()
+
+@mainp.at(140)
+def at_140():
+    durramp.play()
+
+@mainp.at(170)
+def at_170():
+    c1fade.stop()
+    c2fade.stop()
+    c3fade.stop()
+
 mainp.play()
 
 s.start()
@@ -9,6 +9,7 @@ Created by jmdumas
 from pyo import *
 from random import shuffle
 import sys
+from radio_pyo_score import Score
 
 TITLE = 'Kraut'
 ARTIST = 'jmdumas'
@@ -79,42 +80,48 @@ fmstringslowverb = WGVerb(fmstringschoruslow+fmstringsdelaylow+fmstringschoruslo
 sineenv = LFO(freq=2.5,type=1,sharp=0.9,add=0.01).play()
 sinelow = SineLoop(fmstringspitch, feedback=jit*0.55, mul=stringsmul*sineenv*0.2).mix(1).mix(2)
 
-temps = -1
-def timecontrol():
-    global temps
-    temps += 1
-    if temps == 0:
-        fmstringschoruslow.out()
-        fmstringschoruslow2.out()
-        fmstringsdelaylow.out()
-        fmstringsdelaylow2.out()
-        fmstringslowverb.out()
-        sinelow.out()
-        selstrings.play()
-        fmstringschorus.out()
-        fmstringsdelay.out()
-        krautbeat.play()
-        krautrev.out()
-        selbass.play()
-        bass.out()
-        fmbasschorus.out()
-        fmbassdisto.out()
-    elif temps == 20:
-        stringsfader.base.play()
-    elif temps == 60:
-        selbass.recall(1)
-    elif temps == 120:
-        selbass.recall(2)
-    elif temps == 169:
-        selstrings.stop()
-        selbass.recall(3)
-    elif temps == 179:
-        krautbeat.stop()
-        selbass.stop()
-    else:
-        pass
-        
-mainp = Pattern(timecontrol, 1)
+mainp = Score(server=s)
+
+@mainp.at(0)
+def at_0():
+    fmstringschoruslow.out()
+    fmstringschoruslow2.out()
+    fmstringsdelaylow.out()
+    fmstringsdelaylow2.out()
+    fmstringslowverb.out()
+    sinelow.out()
+    selstrings.play()
+    fmstringschorus.out()
+    fmstringsdelay.out()
+    krautbeat.play()
+    krautrev.out()
+    selbass.play()
+    bass.out()
+    fmbasschorus.out()
+    fmbassdisto.out()
+
+@mainp.at(20)
+def at_20():
+    stringsfader.base.play()
+
+@mainp.at(60)
+def at_60():
+    selbass.recall(1)
+
+@mainp.at(120)
+def at_120():
+    selbass.recall(2)
+
+@mainp.at(169)
+def at_169():
+    selstrings.stop()
+    selbass.recall(3)
+
+@mainp.at(179)
+def at_179():
+    krautbeat.stop()
+    selbass.stop()
+
 mainp.play()
 
 s.start()
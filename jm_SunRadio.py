@@ -7,6 +7,7 @@ Created by jmdumas
 #IMPORTS
 from pyo import *
 import sys
+from radio_pyo_score import Score
 #CONSTANTS
 
 TITLE = 'SunRadio'
@@ -87,49 +88,55 @@ acid = Sine([prog*10,prog*10.1], mul=0.1)
 sindel = Delay(acid,jit,0.8,mul=0.1)
 mainfilter = Biquad(revbass2,freq=filtfade+filtfade1, type=1, mul=0.7*filterfader)
 #FUNCTIONS
-temps = -1
-def timecontrol():
-    global temps
-    temps += 1
-    if temps == 0:
-        fmhh2.out()
-        filtfade.play()
-        filterfader.play()
-        mainfilter.out()
-    elif temps == 36:
-        fmsnare.out()
-        delsnare.out()
-        degdel.out()
-        tom.out()
-        fmhh.out()
-        fmkick.out()
-        revkick.out()
-        sinekick.out()
-    elif temps == 57:
-        bassfade.play()
-        fmbass.out()
-    elif temps == 89:
-        sindel.out()
-    elif temps == 240:
-        filtfade1.play()
-        sindel.stop()
-        bassfade.stop()
-        fmkick.stop()
-        revkick.stop()
-        sinekick.stop()
-        fmhh.stop()
-    elif temps == 272:
-        mainfilter.stop()
-        fmbass.stop()
-        fmsnare.stop()
-        delsnare.stop()
-        degdel.stop()
-        tom.stop()
-        fmhh2.stop()
-    else:
-        pass
-        
+mainp = Score(server=s)
+
+@mainp.at(0)
+def at_0():
+    fmhh2.out()
+    filtfade.play()
+    filterfader.play()
+    mainfilter.out()
+
+@mainp.at(36)
+def at_36():
+    fmsnare.out()
+    delsnare.out()
+    degdel.out()
+    tom.out()
+    fmhh.out()
+    fmkick.out()
+    revkick.out()
+    sinekick.out()
+
+@mainp.at(57)
+def at_57():
+    bassfade.play()
+    fmbass.out()
+
+@mainp.at(89)
+def at_89():
+    sindel.out()
+
+@mainp.at(240)
+def at_240():
+    filtfade1.play()
+    sindel.stop()
+    bassfade.stop()
+    fmkick.stop()
+    revkick.stop()
+    sinekick.stop()
+    fmhh.stop()
+
+@mainp.at(272)
+def at_272():
+    mainfilter.stop()
+    fmbass.stop()
+    fmsnare.stop()
+    delsnare.stop()
+    degdel.stop()
+    tom.stop()
+    fmhh2.stop()
+
 #PATTERNS
-mainp = Pattern(timecontrol, 1)
 mainp.play()
 s.start()
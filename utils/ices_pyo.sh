@@ -1,5 +1,9 @@
 #!/bin/sh
 
+# songs import the pipeline's modules, which live next to this script
+PYTHONPATH="$(cd "$(dirname "$0")" && pwd)${PYTHONPATH:+:$PYTHONPATH}"
+export PYTHONPATH
+
 while true; do
   if [ "$(pidof ices2)" ] 
   then
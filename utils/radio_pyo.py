@@ -1,26 +1,115 @@
 #!/usr/bin/env python
 
 import os
+import errno
+import socket
 import string
 import random
 import datetime
+import time
 import glob
 import sys
 import shutil
-import tokenize
-import io
 import subprocess
 import logging
+import heapq
+import threading
+import multiprocessing
+import json
 
-from pyo import sndinfo
+import radio_pyo_ogg
+from radio_pyo_history import PlayHistory
+from radio_pyo_meta import MetadataCache
+from radio_pyo_cache import RenderCache, render_key, script_interpreter
+from radio_pyo_farm import Spool
+from radio_pyo_warm import WarmPool
+import radio_pyo_sandbox
 
 logging.basicConfig(filename='radiopyo.log', level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 RADIOPYO_PATH = '/xxxxxxxx/radiopyo/'
-PLAYLIST_NO_REPEAT_LEN = len(glob.glob(RADIOPYO_PATH + '*.py')) // 2
+# how many of the last played songs can't be picked again; keep it well
+# under the number of songs of the station (about half of them is good)
+PLAYLIST_NO_REPEAT_LEN = 11
 QUEUE_HISTORY_FILE = 'queue_history'
 CURRENT_SONG_INFO_FILE = 'current_info.txt'
+# sidecar written next to each rendered ogg, see write_render_info
+RENDER_INFO_EXT = '.info'
+METADATA_CACHE_FILE = 'song_metadata.json'
+RENDER_CACHE_DIR = 'render_cache'
+# what the pipeline itself does to every render; part of the cache key
+RENDER_OPTIONS = {'tags': ['TITLE', 'ARTIST', 'DURATION']}
+# renders are piped into this encoder (reading raw PCM on stdin) while
+# they are computed, instead of going through a temporary file first
+RENDER_ENCODER = (['oggenc', '--quiet', '--quality', '4']
+                  if shutil.which('oggenc') else None)
+# number of distinct seeded versions of each song to cycle through, or
+# None to draw a new seed (and get a new version) for every render
+RENDER_VARIANTS = None
+# fresh variants kept per song; selection plays these first, and played
+# ones are replaced by background renders when the box is idle. Only the
+# selector service (radio_pyo_selector) plays variants, `select_song`
+# does not: enable this only when ices2 goes through the selector.
+VARIANT_POOL_SIZE = 0
+VARIANTS_DIR = 'variants'
+# load average (per render worker) under which the box counts as idle
+VARIANT_IDLE_LOAD = 0.5
+RENDER_RUNNER = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'radio_pyo_run.py')
+# one offline render keeps one core busy
+RENDER_WORKERS = multiprocessing.cpu_count()
+# assumed render cost (in seconds of audio) when a script gives no DURATION
+DEFAULT_RENDER_COST = 300.
+# expected cost of the renders a RenderPool runs at once; past it, queued
+# renders wait for running ones to finish, unless the pool is idle
+RENDER_COST_BUDGET = RENDER_WORKERS * DEFAULT_RENDER_COST
+# a song's .lock older than that was left behind and is taken over
+RENDER_LOCK_MAX_AGE = 6 * 3600.
+# wall seconds a render may take per second of audio, past a grace period
+# for the song's setup; slower renders are aborted
+RENDER_MAX_RTF = 1.
+RENDER_GRACE = 30.
+# progress of the running render of an ogg (see radio_pyo_run.py), and
+# then how it ended and under which limits
+RENDER_STATUS_EXT = '.status'
+# megabytes of address space a render may use on top of the interpreter
+RENDER_MEMORY_LIMIT = 2048
+# how much longer than its CPU time budget a render may take in wall time
+RENDER_WALL_FACTOR = 2.
+# priorities of the render processes, and properties of the cgroup they
+# get through systemd-run (e.g. {'MemoryMax': '3G'}), None for no cgroup
+RENDER_NICE = 10
+RENDER_IONICE = 3
+RENDER_CGROUP = None
+# songs whose render failed are left alone that long, doubled after each
+# further failure
+RENDER_FAILURES_FILE = 'render_failures.json'
+RENDER_BACKOFF = 600.
+RENDER_BACKOFF_MAX = 86400.
+# renders done by a warm worker (see radio_pyo_warm.py) before it is
+# replaced, or None to start a new interpreter for every render
+WARM_WORKER_JOBS = 20
+# megabytes a warm worker may grow by before it is replaced
+WARM_WORKER_GROWTH = 256
+# render processes get a fixed hash seed, for reproducible renders
+RENDER_ENV = dict(os.environ, PYTHONHASHSEED='0')
+# spool directory shared with the render farm workers (see
+# radio_pyo_farm.py), or None to render songs in this process
+RENDER_SPOOL = None
+
+
+_queue_history = None
+
+
+def queue_history():
+    """The station's play history, loaded once per process."""
+    global _queue_history
+    if _queue_history is None:
+        _queue_history = PlayHistory(
+            os.path.join(RADIOPYO_PATH, QUEUE_HISTORY_FILE),
+            PLAYLIST_NO_REPEAT_LEN)
+    return _queue_history
 
 
 def read_queue_history():
@@ -28,29 +117,12 @@ def read_queue_history():
     radio has recently played. Keep things interesting by not over-playing
     any tracks.
     """
-    try:
-        with open(os.path.join(RADIOPYO_PATH, QUEUE_HISTORY_FILE)) \
-                as queue_hist:
-            last_n = queue_hist.readlines()[-PLAYLIST_NO_REPEAT_LEN:]
-    except IOError:
-        open(os.path.join(RADIOPYO_PATH, QUEUE_HISTORY_FILE), 'w+').close()
-        with open(os.path.join(RADIOPYO_PATH, QUEUE_HISTORY_FILE)) \
-                as queue_hist:
-            last_n = queue_hist.readlines()[-PLAYLIST_NO_REPEAT_LEN:]
-    return [songitem.strip() for songitem in last_n]
+    return queue_history().songs()
 
 
 def write_queue_history(songname):
-    """A helper function that reads a history queue file, to see what the
-    radio has recently played. Keep things interesting by not over-playing
-    any tracks.
-    """
-    last_n = read_queue_history()
-    last_n.append('{0}'.format(songname))
-    last_n = last_n[-PLAYLIST_NO_REPEAT_LEN:]
-    with open(os.path.join(RADIOPYO_PATH, QUEUE_HISTORY_FILE), 'w') \
-            as queue_hist:
-        queue_hist.write('\n'.join(last_n))
+    """Record a freshly selected song in the history queue."""
+    queue_history().append(songname)
     return None
 
 
@@ -73,54 +145,144 @@ def get_random_song(path=None):
     return song
 
 
+_song_metadata = None
+
+
+def song_metadata():
+    """The metadata cache of the song scripts, loaded once per process."""
+    global _song_metadata
+    if _song_metadata is None:
+        _song_metadata = MetadataCache(
+            os.path.join(RADIOPYO_PATH, METADATA_CACHE_FILE))
+    return _song_metadata
+
+
+_render_cache = None
+
+
+def render_cache():
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = RenderCache(
+            os.path.join(RADIOPYO_PATH, RENDER_CACHE_DIR))
+    return _render_cache
+
+
+_warm_pool = None
+
+
+def warm_pool():
+    global _warm_pool
+    if _warm_pool is None:
+        _warm_pool = WarmPool(RENDER_RUNNER, WARM_WORKER_JOBS,
+                              WARM_WORKER_GROWTH, RENDER_ENV,
+                              render_prefix())
+    return _warm_pool
+
+
+_render_failures = None
+
+
+def render_failures():
+    global _render_failures
+    if _render_failures is None:
+        _render_failures = radio_pyo_sandbox.FailureLog(
+            os.path.join(RADIOPYO_PATH, RENDER_FAILURES_FILE),
+            RENDER_BACKOFF, RENDER_BACKOFF_MAX)
+    return _render_failures
+
+
+def render_backoff(script_file):
+    """Until when a song that failed to render is left alone, or None."""
+    return render_failures().backoff_until(script_file)
+
+
+def render_prefix():
+    return radio_pyo_sandbox.command_prefix(RENDER_NICE, RENDER_IONICE,
+                                            RENDER_CGROUP)
+
+
+_render_spool = None
+
+
+def render_spool():
+    global _render_spool
+    if _render_spool is None:
+        _render_spool = Spool(os.path.join(RADIOPYO_PATH, RENDER_SPOOL))
+    return _render_spool
+
+
 def get_song_info(script_file):
-    song_info_dict = {'TITLE': '',
-                      'ARTIST': '',
-                      'DURATION': ''}
-    # TODO: use python import for that
-    for l in open(script_file, 'r').readlines():
-        if l.split('=')[0].strip() == 'TITLE':
-            song_info_dict['TITLE'] = clean_string(nocomment(l.split('=')[1]))
-        if l.split('=')[0].strip() == 'ARTIST':
-            song_info_dict['ARTIST'] = clean_string(nocomment(l.split('=')[1]))
-        if l.split('=')[0].strip() == 'DURATION':
-            song_info_dict['DURATION'] = clean_string(os.path.splitext(
-                nocomment(l.split('=')[1]))[0])
+    cache = song_metadata()
+    song_info_dict = cache.get(script_file)
+    cache.save()
     return song_info_dict
 
 
-def nocomment(string):
-    return string.split('#')[0]
-    #result = []
-    #g = tokenize.tokenize(io.BytesIO(string.encode('utf8')).readline)
-    #for toknum, tokval, _, _, _ in g:
-    #    if toknum != tokenize.COMMENT:
-    #        result.append((toknum, tokval))
-    #return tokenize.untokenize(result).decode('utf8')
+def index_songs(path=None):
+    """Refresh the metadata cache of every script of the station."""
+    return song_metadata().index(path)
 
 
-def clean_string(string):
-    punctuations = '''!()-[]{};:'"\,<>./?@#$%^&*_~'''
-    no_punct = ""
-    for char in string:
-        if char not in punctuations:
-            no_punct = no_punct + char
-    return no_punct.strip()
+def write_render_info(ogg_file, song_info, seed=None, audio_file=None):
+    """Record the tags, the actual length and the seed of a freshly
+    rendered song next to it, so that selecting it needs neither the
+    script nor the audio file. This is done before the song is published,
+    as `audio_file`, so that no published song lacks them."""
+    song_info = dict(song_info)
+    try:
+        song_info['LENGTH'] = radio_pyo_ogg.duration(audio_file or ogg_file)
+    except (IOError, ValueError):
+        song_info['LENGTH'] = float(song_info['DURATION'] or 0)
+    song_info['SEED'] = seed
+    info_file = os.path.splitext(ogg_file)[0] + RENDER_INFO_EXT
+    with open(info_file + '.tmp', 'w') as f:
+        json.dump(song_info, f)
+    os.rename(info_file + '.tmp', info_file)
 
 
-def select_song(path=None):
-    # call out to the newer helper function:
-    song = get_random_song(path)
-    # ices2 needs this
-    logger.debug('Selected song: {0}'.format(song))
-    song_duration = sndinfo(song)[1]
+def next_seed(ogg_file):
+    """The seed of the next render of a song: the following variant
+    after the one currently published, or a fresh one."""
+    if RENDER_VARIANTS is None:
+        return random.randrange(1, 2 ** 31)
+    try:
+        with open(os.path.splitext(ogg_file)[0] + RENDER_INFO_EXT) as f:
+            seed = json.load(f).get('SEED')
+    except (IOError, ValueError):
+        seed = None
+    if not isinstance(seed, int):
+        return 1
+    return seed % RENDER_VARIANTS + 1
+
+
+def read_render_info(song):
+    """Tags and length (in seconds, as LENGTH) of a rendered song. Songs
+    rendered before the sidecar existed are probed once with pyo."""
+    try:
+        with open(os.path.splitext(song)[0] + RENDER_INFO_EXT) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        from pyo import sndinfo
+        song_info = get_song_info(os.path.splitext(song)[0] + '.py')
+        song_info['LENGTH'] = sndinfo(song)[1]
+        return song_info
+
+
+def announce_song(song, song_info):
+    """Stamp a song that is about to be played, so it gets re-rendered once
+    it is over, and publish its infos for the web player."""
     now = datetime.datetime.now()
     # tag for update at now + song duration
-    removal_date = now + datetime.timedelta(seconds=song_duration)
+    removal_date = now + datetime.timedelta(seconds=song_info['LENGTH'])
     song_stamp = '{0}({1}).stamp'.format(song, removal_date)
     open(song_stamp, 'a').close()
-    # write music info to a txt which will be available in the web player
-    song_info = get_song_info(os.path.splitext(song)[0] + '.py')
+    write_current_info(song_info)
+
+
+def write_current_info(song_info):
+    """Write music info to a txt which will be available in the web
+    player."""
     f = open(os.path.join(RADIOPYO_PATH, CURRENT_SONG_INFO_FILE), 'w+')
     current_info = ('<h6>Now playing <em>{0}</em> by {1}</h6> ({2} sec)'
                     .format(song_info['TITLE'], song_info['ARTIST'],
@@ -129,19 +291,217 @@ def select_song(path=None):
     f.close()
 
 
+def select_song(path=None):
+    # call out to the newer helper function:
+    song = get_random_song(path)
+    # ices2 needs this
+    logger.debug('Selected song: {0}'.format(song))
+    announce_song(song, read_render_info(song))
+    return song
+
+
+def lock_owner():
+    return '{0} {1}'.format(socket.gethostname(), os.getpid())
+
+
+def acquire_lock(lock_file):
+    """Atomically create a song's lock file, naming its owner. Returns
+    False if the song is already locked, i.e. being rendered by someone
+    else. A stale lock (see `stale_lock`) is taken over."""
+    for attempt in range(2):
+        try:
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            if attempt or not reclaim_lock(lock_file):
+                return False
+            continue
+        with os.fdopen(fd, 'w') as f:
+            f.write(lock_owner())
+        return True
+
+
+def set_lock_owner(lock_file, owner):
+    """Hand a lock over, e.g. to the render farm."""
+    with open(lock_file + '.tmp', 'w') as f:
+        f.write(owner)
+    os.rename(lock_file + '.tmp', lock_file)
+
+
+def stale_lock(lock_file):
+    """Whether a lock was left behind: its owner, a process of this host,
+    is gone, or it is older than RENDER_LOCK_MAX_AGE."""
+    try:
+        age = time.time() - os.path.getmtime(lock_file)
+        with open(lock_file) as f:
+            owner = f.read().split()
+    except (IOError, OSError):
+        return False
+    if age > RENDER_LOCK_MAX_AGE:
+        return True
+    if len(owner) != 2 or owner[0] != socket.gethostname():
+        return False
+    try:
+        os.kill(int(owner[1]), 0)
+    except ValueError:
+        return False
+    except OSError as error:
+        return error.errno == errno.ESRCH
+    return False
+
+
+def reclaim_lock(lock_file):
+    """Remove a stale lock. The rename makes sure that only one of the
+    processes finding it stale gets to do so."""
+    if not stale_lock(lock_file):
+        return False
+    stale_file = '{0}.{1}.stale'.format(lock_file, os.getpid())
+    try:
+        os.rename(lock_file, stale_file)
+    except OSError:
+        return False
+    os.remove(stale_file)
+    logger.debug('Took over the stale lock {0}'.format(lock_file))
+    return True
+
+
+def publish_ogg(source_file, ogg_file):
+    """Atomically put a finished ogg in place. ices2 keeps reading the
+    previous render if it is playing it."""
+    if os.path.exists(ogg_file) and os.path.samefile(source_file, ogg_file):
+        return
+    part_file = ogg_file + '.part'
+    if os.path.exists(part_file):
+        os.remove(part_file)
+    os.link(source_file, part_file)
+    os.rename(part_file, ogg_file)
+
+
+def read_render_report(ogg_file):
+    try:
+        with open(os.path.splitext(ogg_file)[0] + RENDER_STATUS_EXT) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return None
+
+
+def write_render_report(ogg_file, report):
+    """Complete the progress report of a render with its outcome."""
+    status_file = os.path.splitext(ogg_file)[0] + RENDER_STATUS_EXT
+    full_report = read_render_report(ogg_file) or {}
+    full_report.update(report)
+    with open(status_file + '.tmp', 'w') as f:
+        json.dump(full_report, f)
+    os.rename(status_file + '.tmp', status_file)
+
+
+def render_failed(script_file, ogg_file, report, kind):
+    entry = render_failures().record(script_file, kind)
+    logger.debug('{0} failed ({1}), leaving it alone for {2:.0f}s'.format(
+        script_file, kind, entry['until'] - entry['time']))
+    write_render_report(ogg_file, dict(report, state='failed', failure=kind,
+                                       failures=entry['count']))
+
+
+def render_ogg(script_file, ogg_file, seed):
+    """Render a script with the given seed and publish the tagged result
+    as `ogg_file`, or reuse an identical cached render."""
+    song_info = get_song_info(script_file)
+    options = dict(RENDER_OPTIONS, encoder=RENDER_ENCODER)
+    key = render_key(script_file, seed, options)
+    # the seedless key catches songs that don't use randomness at all
+    any_seed_key = render_key(script_file, None, options)
+    cached_file = (render_cache().lookup(any_seed_key) or
+                   render_cache().lookup(key))
+    if cached_file is not None:
+        logger.debug('{0} is unchanged, reusing {1}'.format(
+            script_file, cached_file))
+        write_render_info(ogg_file, song_info, seed, cached_file)
+        publish_ogg(cached_file, ogg_file)
+        return
+    tags = [(tag, song_info[tag]) for tag in RENDER_OPTIONS['tags']]
+    runner_args = ['--seed', str(seed)]
+    # the runner only sees the progress of streamed renders, so the budget
+    # for the whole song is enforced as a CPU time limit too; the wall time
+    # limit is only a backstop, renders are niced and may wait for the CPU
+    budget = RENDER_GRACE + RENDER_MAX_RTF * expected_render_cost(
+        script_file)
+    timeout = budget * RENDER_WALL_FACTOR
+    limits = {'memory': RENDER_MEMORY_LIMIT, 'cpu': budget}
+    report = {'limits': dict(limits, nice=RENDER_NICE, ionice=RENDER_IONICE,
+                             cgroup=RENDER_CGROUP),
+              'seed': seed, 'time': time.time()}
+    runner_args += ['--limits', json.dumps(limits)]
+    # published once its infos are written
+    part_file = ogg_file + '.part'
+    if RENDER_ENCODER:
+        # the runner encodes and tags the file itself
+        ogg_file_tmp = None
+        runner_args += ['--encoder', json.dumps(RENDER_ENCODER),
+                       '--status',
+                       os.path.splitext(ogg_file)[0] + RENDER_STATUS_EXT,
+                       '--max-rtf', str(RENDER_MAX_RTF),
+                       '--grace', str(RENDER_GRACE)]
+        for tag, value in tags:
+            runner_args += ['--tag', u'{0}={1}'.format(tag, value)]
+        runner_args += [script_file, part_file]
+    else:
+        ogg_file_tmp = ''.join([random.choice(
+            string.ascii_letters + string.digits)
+            for n in range(10)]) + '.ogg'
+        runner_args += [script_file, ogg_file_tmp]
+    logger.debug('rendering {0} with seed {1}'.format(ogg_file, seed))
+    try:
+        if WARM_WORKER_JOBS:
+            warm_pool().render(script_interpreter(script_file), runner_args,
+                               timeout)
+        else:
+            subprocess.check_output(
+                render_prefix() + script_interpreter(script_file) +
+                [RENDER_RUNNER] + runner_args, stderr=subprocess.STDOUT,
+                env=RENDER_ENV, timeout=timeout)
+    except subprocess.CalledProcessError as process_error:
+        logger.debug(process_error.output)
+        render_failed(script_file, ogg_file, report,
+                      radio_pyo_sandbox.classify(
+                          process_error.returncode, process_error.output,
+                          read_render_report(ogg_file),
+                          limits=report['limits']))
+        raise
+    except subprocess.TimeoutExpired:
+        logger.debug('{0} took more than {1:.0f}s, giving up'.format(
+            script_file, timeout))
+        for name in (part_file, part_file + '.part', ogg_file_tmp):
+            if name is not None and os.path.exists(name):
+                os.remove(name)
+        render_failed(script_file, ogg_file, report,
+                      radio_pyo_sandbox.classify(
+                          None, killed=radio_pyo_sandbox.TIMEOUT))
+        raise
+    if ogg_file_tmp is not None:
+        radio_pyo_ogg.write_comments(ogg_file_tmp, part_file, tags)
+        os.remove(ogg_file_tmp)
+    write_render_info(ogg_file, song_info, seed, part_file)
+    os.rename(part_file, ogg_file)
+    write_render_report(ogg_file, dict(report, state='done'))
+    render_failures().clear(script_file)
+    render_cache().store(key, ogg_file, script_file)
+    render_cache().store(any_seed_key, ogg_file, script_file)
+
+
 def update_song(script_file):
     """Here is where a song first gets rendered to ogg"""
-    ogg_file_tmp = ''.join([random.choice(
-        string.ascii_letters + string.digits) for n in range(10)]) + '.ogg'
     path = os.path.dirname(script_file)
     basename = os.path.basename(os.path.splitext(script_file)[0])
     full_basename = os.path.join(path, basename)
     ogg_file = full_basename + '.ogg'
     lock_file = full_basename + '.lock'
     stamp_glob = full_basename + '*.stamp'
+    # lock it to not be played during rendering
+    if not acquire_lock(lock_file):
+        logger.debug('{0} is already being rendered'.format(basename))
+        return
     stamp_files = [i for i in glob.glob(stamp_glob)]
-    update_msg = '# updating {0}; tmp_file: {1} #'.format(
-        basename, ogg_file_tmp)
+    update_msg = '# updating {0} #'.format(basename)
     update_msg = ''.join(['\n', '#' * len(update_msg), '\n', 
                           update_msg, '\n',
                           '#' * len(update_msg)])
@@ -150,53 +510,265 @@ def update_song(script_file):
     for f in stamp_files:
         logger.debug('Removing {0}'.format(f))
         os.remove(f)
-    # lock it to not be played during rendering
-    open(lock_file, 'a').close()
-    render_cmd = '{0} {1}'.format(script_file, ogg_file_tmp)
-    try:
-        result = subprocess.check_output(render_cmd,
-                                         stderr=subprocess.STDOUT,
-                                         shell=True)
-    except subprocess.CalledProcessError as process_error:
-        logger.debug(process_error.output)
+    handed_over = False
     try:
-        song_info = get_song_info(script_file)
-        # TODO: use a proper python library for this
-        cmd_tags = ('oggz comment -c vorbis -o {0} {1} '
-                    'TITLE="{2}" ARTIST="{3}" DURATION="{4}"'
-                    .format(ogg_file, ogg_file_tmp,
-                            song_info['TITLE'], song_info['ARTIST'],
-                            song_info['DURATION']))
-        result = subprocess.check_output(cmd_tags,
-                                         stderr=subprocess.STDOUT,
-                                         shell=True)
-        os.remove(ogg_file_tmp)
+        seed = next_seed(ogg_file)
+        if RENDER_SPOOL is not None:
+            # a farm worker renders it, then removes the lock; until then
+            # only its age tells whether it was forgotten
+            set_lock_owner(lock_file, 'spool')
+            render_spool().submit(script_file, seed, ogg_file, lock_file,
+                                  expected_render_cost(script_file))
+            handed_over = True
+        else:
+            render_ogg(script_file, ogg_file, seed)
     except:
         logger.debug('There were errors creating the ogg file'
                      ' for {0}.\n'.format(script_file))
     finally:
-        # unlock it
-        os.remove(lock_file)
+        if not handed_over:
+            # unlock it
+            os.remove(lock_file)
+
+
+def variant_file(script_file, seed):
+    path = os.path.dirname(script_file)
+    basename = os.path.basename(os.path.splitext(script_file)[0])
+    return os.path.join(path, VARIANTS_DIR,
+                        '{0}.{1}.ogg'.format(basename, seed))
+
+
+def song_variants(script_file):
+    """The variants of a song currently on disk, mapped to whether they
+    are still fresh (True) or already handed out for playing (False)."""
+    variants = {}
+    prefix = os.path.basename(os.path.splitext(script_file)[0]) + '.'
+    variants_path = os.path.join(os.path.dirname(script_file), VARIANTS_DIR)
+    try:
+        names = os.listdir(variants_path)
+    except OSError:
+        return variants
+    for name in names:
+        if not name.startswith(prefix):
+            continue
+        if name.endswith('.ogg'):
+            variants.setdefault(os.path.join(variants_path, name), True)
+        elif name.endswith('.stamp'):
+            variants[os.path.join(variants_path, name.split('(')[0])] = False
+    return variants
+
+
+def render_variant(script_file):
+    """Add one freshly rendered variant to a song's pool. Variants never
+    replace a published file and take no lock, so rendering them doesn't
+    make the song unavailable."""
+    variants = song_variants(script_file)
+    if RENDER_VARIANTS is None:
+        seed = random.randrange(1, 2 ** 31)
+    else:
+        seeds = [seed for seed in range(1, RENDER_VARIANTS + 1)
+                 if variant_file(script_file, seed) not in variants]
+        if not seeds:
+            return
+        seed = seeds[0]
+    ogg_file = variant_file(script_file, seed)
+    if not os.path.isdir(os.path.dirname(ogg_file)):
+        os.makedirs(os.path.dirname(ogg_file))
+    try:
+        render_ogg(script_file, ogg_file, seed)
+    except:
+        logger.debug('There were errors creating the variant {0}.\n'
+                     .format(ogg_file))
+        # a variant that failed or timed out is never retired: its
+        # report would be left behind, one per random seed
+        status_file = os.path.splitext(ogg_file)[0] + RENDER_STATUS_EXT
+        if os.path.exists(status_file):
+            os.remove(status_file)
+
+
+def retire_variant(ogg_file):
+    """Delete a variant that has been played, with its infos, render
+    report and stamps."""
+    base = os.path.splitext(ogg_file)[0]
+    for name in [ogg_file, base + RENDER_INFO_EXT,
+                 base + RENDER_STATUS_EXT] + \
+            glob.glob(glob.escape(ogg_file) + '(*).stamp'):
+        if os.path.exists(name):
+            os.remove(name)
+
+
+def render_idle():
+    """Whether the box has spare cores for background renders."""
+    return os.getloadavg()[0] < RENDER_WORKERS * VARIANT_IDLE_LOAD
+
+
+def missing_variants(path=None):
+    """The scripts whose pool holds fewer fresh variants than wanted."""
+    if not VARIANT_POOL_SIZE:
+        return []
+    missing = []
+    for script_file in glob.glob(path + '*.py'):
+        fresh = [v for v in song_variants(script_file).values() if v]
+        if len(fresh) < VARIANT_POOL_SIZE and \
+                render_backoff(script_file) is None:
+            missing.append(script_file)
+    return missing
+
+
+def expected_render_cost(script_file):
+    """How expensive a render is expected to be, in seconds of audio."""
+    try:
+        return float(get_song_info(script_file)['DURATION'])
+    except (IOError, ValueError, TypeError):
+        return DEFAULT_RENDER_COST
+
+
+class RenderPool(object):
+    """A bounded pool of render threads, each one driving a single offline
+    render subprocess at a time.
+
+    Renders are admitted against a budget of expected cost (see
+    `expected_render_cost`) as well as one per worker: the most expensive
+    queued song that fits in what is left of the budget starts first, so
+    that long renders start early instead of being left alone at the end
+    of a cold fill, without all the cores being taken by them while short
+    due songs wait. An idle pool admits a song whatever its cost.
+    A song that is already queued or rendering is not queued twice, and
+    `update_song` still takes the song's `.lock` before rendering it.
+    """
+
+    def __init__(self, workers=None, budget=None):
+        self.workers = workers or RENDER_WORKERS
+        self.budget = budget or RENDER_COST_BUDGET
+        self._queue = []
+        self._pending = set()
+        self._threads = []
+        self._count = 0
+        self._running = 0
+        self._running_cost = 0.
+        self._cond = threading.Condition()
+
+    def submit(self, script_file, cost=None, job=None):
+        """Queue `job(script_file)`, `update_song` by default."""
+        job = job or update_song
+        if cost is None:
+            cost = expected_render_cost(script_file)
+        with self._cond:
+            if (script_file, job) in self._pending:
+                return False
+            self._pending.add((script_file, job))
+            self._count += 1
+            heapq.heappush(self._queue,
+                           (-cost, self._count, script_file, job))
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return True
+
+    def _admit(self):
+        """Take the most expensive queued render that fits in the budget
+        off the queue, or None."""
+        for entry in sorted(self._queue):
+            cost = -entry[0]
+            if self._running and self._running_cost + cost > self.budget:
+                continue
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+            self._running += 1
+            self._running_cost += cost
+            return entry
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                entry = self._admit()
+                while entry is None:
+                    self._cond.wait()
+                    entry = self._admit()
+            cost, script_file, job = -entry[0], entry[2], entry[3]
+            try:
+                job(script_file)
+            except Exception:
+                logger.exception('Rendering {0} failed'.format(script_file))
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._running_cost -= cost
+                    self._pending.discard((script_file, job))
+                    self._cond.notify_all()
+
+    def busy(self):
+        with self._cond:
+            return bool(self._pending)
+
+    def join(self):
+        """Wait until everything submitted so far has been rendered."""
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
+
+
+def prefork_workers(script_files, workers=None):
+    """Start the warm workers that rendering these scripts here will use:
+    at most one per render worker in all, shared out between the
+    interpreters by their share of the scripts."""
+    if not WARM_WORKER_JOBS or RENDER_SPOOL is not None:
+        return
+    counts = {}
+    for script_file in script_files:
+        interpreter = tuple(script_interpreter(script_file))
+        counts[interpreter] = counts.get(interpreter, 0) + 1
+    total = min(workers or RENDER_WORKERS, len(script_files))
+    shares = dict((interpreter, total * count // len(script_files))
+                  for interpreter, count in counts.items())
+    # the workers left over by the rounding go to the largest remainders
+    leftover = sorted(counts, key=lambda i: -(total * counts[i]
+                                              % len(script_files)))
+    for interpreter in leftover[:total - sum(shares.values())]:
+        shares[interpreter] += 1
+    for interpreter, share in shares.items():
+        if share:
+            warm_pool().prefork(list(interpreter), share)
+
+
+def render_songs(script_files, workers=None):
+    prefork_workers(script_files, workers)
+    pool = RenderPool(workers)
+    for script_file in script_files:
+        pool.submit(script_file)
+    pool.join()
+
+
+def parse_stamp(name):
+    """Split a stamp file name, as written by `select_song`, into the
+    script it belongs to and the time at which it is due for update.
+    """
+    scheduled_time = datetime.datetime.strptime(name.split(
+        '(')[1].split(')')[0].split('.')[0], '%Y-%m-%d %H:%M:%S')
+    script_file = os.path.splitext(name.split('(')[0])[0] + '.py'
+    return script_file, scheduled_time
 
 
 def update_songs(path=None):
+    due = []
+    now = datetime.datetime.now()
     for name in glob.glob(path + '*.stamp'):
-        now = datetime.datetime.now()
-        scheduled_time = datetime.datetime.strptime(name.split(
-            '(')[1].split(')')[0].split('.')[0], '%Y-%m-%d %H:%M:%S')
-        if now > scheduled_time:
-            script_file = os.path.splitext(name.split('(')[0])[0] + '.py'
-            update_song(script_file)
-            # avoid generating same file twice, go to a new loop
-            break
+        script_file, scheduled_time = parse_stamp(name)
+        # a song may have several stamps, only render it once
+        if now > scheduled_time and script_file not in due and \
+                render_backoff(script_file) is None:
+            due.append(script_file)
+    render_songs(due)
 
 
 def update_all_songs(path=None):
     all_songs = [i for i in glob.glob(path + '*.ogg')]
-    import string
-    for name in glob.glob(path + '*.py'):
-        if name.replace('.py', '.ogg') not in all_songs:
-            update_song(name)
+    render_songs([name for name in glob.glob(path + '*.py')
+                  if name.replace('.py', '.ogg') not in all_songs])
 
 
 def main():
@@ -210,6 +782,8 @@ def main():
             update_song(cmdargs[2])
         elif cmdargs[1] == 'update_all':
             update_all_songs(RADIOPYO_PATH)
+        elif cmdargs[1] == 'index':
+            index_songs(RADIOPYO_PATH)
 
 if __name__ == '__main__':
     main()
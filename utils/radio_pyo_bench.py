@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""Render cost benchmark of the songs.
+
+Every song is rendered offline in a fresh interpreter, optionally cut to
+a fixed number of seconds, and the following is recorded for it:
+
+    wall      seconds taken by the whole run, interpreter startup included
+    rendered  seconds of audio produced
+    rtf       wall seconds per rendered second (real-time factor)
+    max_rss   peak resident memory of the render process, in kilobytes
+    objects   pyo objects alive when the song's server was started
+    size      bytes of the output file
+
+With `--callbacks`, the python functions the song calls from the audio
+loop (Pattern, TrigFunc, CallAfter) are timed too: count, total, max and
+99th percentile per function. The slowest ones stall the audio the
+longest, which matters for live rendering.
+
+Results are written as JSON. Given a baseline (a previous result file),
+songs whose real-time factor or peak memory grew by more than the
+tolerance are reported as regressions, and the exit status is 1.
+
+    radio_pyo_bench.py [--path DIR] [--truncate S] [--output FILE]
+                       [--baseline FILE] [--tolerance X] [--callbacks]
+                       [song.py ...]
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+
+import radio_pyo
+import radio_pyo_ogg
+from radio_pyo_meta import MetadataCache
+from radio_pyo_cache import pyo_version, script_interpreter
+
+# relative growth over the baseline that counts as a regression
+DEFAULT_TOLERANCE = 0.2
+COMPARED = ('rtf', 'max_rss')
+# bytes of a failed render's output kept in the results
+ERROR_TAIL = 2000
+# slowest callbacks printed per song
+WORST_CALLBACKS = 3
+
+
+def bench_song(script_file, truncate=None, timeout=None, callbacks=False):
+    directory = tempfile.mkdtemp(prefix='radiopyo-bench')
+    output_file = os.path.join(directory, 'song.ogg')
+    report_file = os.path.join(directory, 'report.json')
+    log_file = os.path.join(directory, 'output.log')
+    command = script_interpreter(script_file) + [
+        radio_pyo.RENDER_RUNNER, '--seed', '1', '--report', report_file]
+    if truncate is not None:
+        command += ['--truncate', str(truncate)]
+    if callbacks:
+        command += ['--time-callbacks']
+    command += [script_file, output_file]
+    result = {'ok': False}
+    try:
+        started = time.time()
+        with open(log_file, 'wb') as log:
+            process = subprocess.Popen(command, stdout=log,
+                                       stderr=subprocess.STDOUT,
+                                       env=radio_pyo.RENDER_ENV)
+        killer = None
+        if timeout is not None:
+            killer = threading.Timer(timeout, process.kill)
+            killer.start()
+        # reap it ourselves to get its resource usage
+        _, status, usage = os.wait4(process.pid, 0)
+        if killer is not None:
+            killer.cancel()
+        process.returncode = os.waitstatus_to_exitcode(status)
+        result['wall'] = time.time() - started
+        result['max_rss'] = usage.ru_maxrss
+        if process.returncode != 0 or not os.path.exists(output_file):
+            with open(log_file, 'rb') as log:
+                result['error'] = log.read()[-ERROR_TAIL:].decode(
+                    'utf-8', 'replace')
+            return result
+        result['size'] = os.path.getsize(output_file)
+        try:
+            result['rendered'] = radio_pyo_ogg.duration(output_file)
+        except ValueError:
+            # not an Ogg Vorbis file, trust the script
+            duration = float(MetadataCache().get(script_file)['DURATION'])
+            result['rendered'] = min(duration, truncate or duration)
+        result['rtf'] = result['wall'] / result['rendered']
+        with open(report_file) as f:
+            result.update(json.load(f))
+        result['ok'] = True
+        return result
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """List the (song, measure, baseline value, new value) that grew by
+    more than the tolerance, and the songs that stopped rendering."""
+    regressions = []
+    for song, previous in baseline['songs'].items():
+        current = results['songs'].get(song)
+        if current is None or not previous['ok']:
+            continue
+        if not current['ok']:
+            regressions.append((song, 'ok', True, False))
+            continue
+        for measure in COMPARED:
+            if current[measure] > previous[measure] * (1 + tolerance):
+                regressions.append((song, measure, previous[measure],
+                                    current[measure]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default=radio_pyo.RADIOPYO_PATH)
+    parser.add_argument('--truncate', type=float, default=None,
+                        help='render at most that many seconds per song')
+    parser.add_argument('--timeout', type=float, default=None)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--callbacks', action='store_true',
+                        help='time the python callbacks of the songs')
+    parser.add_argument('songs', nargs='*')
+    args = parser.parse_args()
+    songs = args.songs or sorted(glob.glob(os.path.join(args.path, '*.py')))
+    results = {'host': platform.node(), 'time': time.time(),
+               'truncate': args.truncate, 'songs': {}}
+    for script_file in songs:
+        result = bench_song(script_file, args.truncate, args.timeout,
+                            args.callbacks)
+        result['pyo'] = pyo_version(script_interpreter(script_file))
+        results['songs'][os.path.basename(script_file)] = result
+        if result['ok']:
+            print('{0:40} {1:8.1f}s {2:6.3f} rtf {3:8d}kB {4:6d} objects'
+                  .format(os.path.basename(script_file), result['wall'],
+                          result['rtf'], result['max_rss'],
+                          result['objects'] or 0))
+        else:
+            print('{0:40} failed'.format(os.path.basename(script_file)))
+        worst = sorted(result.get('callbacks', {}).items(),
+                       key=lambda item: -item[1]['max'])
+        for name, timing in worst[:WORST_CALLBACKS]:
+            print('    {0:50} {1:6d} calls, max {2:.2f}ms, p99 {3:.2f}ms, '
+                  'total {4:.3f}s'.format(name, timing['count'],
+                                          timing['max'] * 1000,
+                                          timing['p99'] * 1000,
+                                          timing['total']))
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for song, measure, before, after in regressions:
+            print('REGRESSION {0}: {1} {2} -> {3}'.format(
+                song, measure, before, after))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""Content-addressed cache of rendered songs.
+
+A render is identified by the hash of the script bytes, the sources of
+the pipeline's modules it imports (e.g. radio_pyo_score, directly or
+through each other), the pyo version of the interpreter that runs it,
+the render options of the pipeline and the random seed. The cache keeps
+the last output produced for each key with the digest of its audio.
+When a second render of the same key gives the same audio, the key is
+marked deterministic, and from then on refreshing that song hands back
+the cached file without starting an offline server.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import tempfile
+import subprocess
+import logging
+
+import radio_pyo_ogg
+
+logger = logging.getLogger(__name__)
+
+_pyo_versions = {}
+
+# where the pipeline's modules are, songs import them from there
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_LINE = re.compile(
+    br'^[ \t]*(?:from[ \t]+(\w+)[ \t.]|import[ \t]+([\w., \t]+))', re.M)
+
+
+def script_interpreter(script_file):
+    """The interpreter named on the script's shebang line."""
+    with open(script_file, 'rb') as f:
+        first_line = f.readline().decode('utf-8', 'replace').strip()
+    if first_line.startswith('#!'):
+        return first_line[2:].split()
+    return ['python']
+
+
+def pyo_version(interpreter):
+    key = tuple(interpreter)
+    if key not in _pyo_versions:
+        try:
+            _pyo_versions[key] = subprocess.check_output(
+                list(interpreter) + ['-c', 'from pyo import PYO_VERSION; '
+                                     'print(PYO_VERSION)'],
+                stderr=subprocess.STDOUT).decode('utf-8').strip()
+        except (OSError, subprocess.CalledProcessError):
+            _pyo_versions[key] = 'unknown'
+    return _pyo_versions[key]
+
+
+def pipeline_modules(source):
+    """The files of the pipeline's modules a script's source imports,
+    directly or through each other."""
+    found = set()
+    pending = [source]
+    while pending:
+        for match in IMPORT_LINE.finditer(pending.pop()):
+            if match.group(1):
+                names = [match.group(1)]
+            else:
+                names = [name.split()[0] for name in
+                         match.group(2).split(b',') if name.strip()]
+            for name in names:
+                module_file = os.path.join(UTILS_DIR, name.split(b'.')[0]
+                                           .decode('ascii') + '.py')
+                if module_file in found or not os.path.isfile(module_file):
+                    continue
+                found.add(module_file)
+                with open(module_file, 'rb') as f:
+                    pending.append(f.read())
+    return sorted(found)
+
+
+def render_key(script_file, seed=None, options=None):
+    digest = hashlib.sha1()
+    with open(script_file, 'rb') as f:
+        source = f.read()
+    digest.update(source)
+    for module_file in pipeline_modules(source):
+        with open(module_file, 'rb') as f:
+            digest.update(f.read())
+    digest.update(pyo_version(script_interpreter(script_file))
+                  .encode('utf-8'))
+    digest.update(json.dumps(options or {}, sort_keys=True).encode('utf-8'))
+    digest.update(repr(seed).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class RenderCache(object):
+
+    def __init__(self, directory, max_entries=100):
+        self.directory = directory
+        self.max_entries = max_entries
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + '.ogg', base + '.json'
+
+    def _read(self, key):
+        try:
+            with open(self._paths(key)[1]) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return None
+
+    def lookup(self, key):
+        """Path of a cached render that can stand for a new one, or None
+        if the song has to be rendered."""
+        ogg_file, meta_file = self._paths(key)
+        entry = self._read(key)
+        if entry is None or not entry['deterministic'] or \
+                not os.path.exists(ogg_file):
+            return None
+        # keep track of use for pruning
+        os.utime(meta_file, None)
+        return ogg_file
+
+    def store(self, key, rendered_file, script_file):
+        ogg_file, meta_file = self._paths(key)
+        digest = radio_pyo_ogg.audio_digest(rendered_file)
+        entry = self._read(key)
+        deterministic = entry is not None and entry['digest'] == digest
+        if deterministic:
+            logger.debug('{0} renders deterministically, caching it'
+                         .format(script_file))
+        # renders of the same key may be stored at once, from this pool
+        # or other hosts: every one goes through names of its own
+        tmp_ogg, tmp_meta = self._tmp_file(key), self._tmp_file(key)
+        try:
+            os.remove(tmp_ogg)
+            os.link(rendered_file, tmp_ogg)
+            # a no-op, leaving tmp_ogg, if the cached ogg is that file
+            os.rename(tmp_ogg, ogg_file)
+            with open(tmp_meta, 'w') as f:
+                json.dump({'script': script_file, 'digest': digest,
+                           'deterministic': deterministic,
+                           'time': time.time()}, f)
+            os.chmod(tmp_meta, 0o644)
+            os.rename(tmp_meta, meta_file)
+        finally:
+            for tmp_file in (tmp_ogg, tmp_meta):
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+        self.prune()
+
+    def _tmp_file(self, key):
+        fd, tmp_file = tempfile.mkstemp(prefix=key + '.', suffix='.tmp',
+                                        dir=self.directory)
+        os.close(fd)
+        return tmp_file
+
+    def prune(self):
+        entries = [os.path.join(self.directory, name)
+                   for name in os.listdir(self.directory)
+                   if name.endswith('.json')]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=_mtime)
+        for meta_file in entries[:len(entries) - self.max_entries]:
+            for name in (meta_file, meta_file[:-5] + '.ogg'):
+                try:
+                    os.remove(name)
+                except OSError:
+                    # pruned by another process meanwhile
+                    pass
+
+
+def _mtime(filename):
+    try:
+        return os.path.getmtime(filename)
+    except OSError:
+        return 0.
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+"""In-memory index of the song directory.
+
+The directory is scanned once; after that every `.ogg`, `.info`, `.lock`,
+`.stamp` and `.py` creation, deletion or rename reported by
+`radio_pyo_watch` is applied to the index incrementally. The songs that
+may be played next (rendered, not locked, not recently heard) are kept in
+an array with a position map, so drawing one, adding one or removing one
+are all O(1) whatever the size of the catalog.
+
+When a variants directory is given, the pre-rendered variants of each
+song are followed too. A song with fresh variants is playable even while
+its main ogg is locked, and playing it hands out its oldest variant.
+"""
+
+import os
+import glob
+import random
+import logging
+
+from radio_pyo_history import PlayHistory
+from radio_pyo_watch import Watcher, ADDED, REMOVED, OVERFLOW
+
+logger = logging.getLogger(__name__)
+
+EXTENSIONS = ('.ogg', '.info', '.lock', '.stamp', '.py')
+
+
+def song_key(name):
+    """Every file belonging to a song maps to the song's ogg path, which
+    is also what the play history records."""
+    if name.endswith('.stamp'):
+        return name.split('(')[0]
+    return os.path.splitext(name)[0] + '.ogg'
+
+
+class SongEntry(object):
+    __slots__ = ('ogg', 'script', 'locked', 'stamps', 'info', 'variants',
+                 'spent')
+
+    def __init__(self):
+        self.ogg = False
+        self.script = False
+        self.locked = False
+        self.stamps = set()
+        self.info = None
+        self.variants = []
+        self.spent = set()
+
+    def empty(self):
+        return not (self.ogg or self.script or self.locked or self.stamps
+                    or self.variants or self.spent)
+
+
+class Catalog(object):
+
+    def __init__(self, path, history=None, watch=True, variants_path=None):
+        self.path = path
+        self.variants_path = variants_path
+        if history is None:
+            history = PlayHistory(None, 0)
+        self.history = history
+        self.watchers = []
+        if watch:
+            self.watchers.append(Watcher(path))
+            if variants_path is not None:
+                if not os.path.isdir(variants_path):
+                    os.makedirs(variants_path)
+                self.watchers.append(Watcher(variants_path))
+        self.rescan()
+
+    def rescan(self):
+        self.entries = {}
+        self._eligible = []
+        self._position = {}
+        for ext in EXTENSIONS:
+            for name in glob.glob(self.path + '*' + ext):
+                self.apply(ADDED, name)
+        if self.variants_path is not None:
+            for ext in ('.ogg', '.stamp'):
+                for name in glob.glob(
+                        os.path.join(self.variants_path, '*' + ext)):
+                    self.apply(ADDED, name)
+
+    def sync(self, timeout=0):
+        """Apply whatever the watchers reported since the last call."""
+        for watcher in self.watchers:
+            self.update(watcher.wait(timeout))
+
+    def update(self, events):
+        for kind, name in events:
+            if kind == OVERFLOW:
+                self.rescan()
+                return
+            self.apply(kind, name)
+
+    def apply(self, kind, name):
+        ext = os.path.splitext(name)[1]
+        if ext not in EXTENSIONS:
+            return
+        if self.variants_path is not None and \
+                os.path.dirname(name) == os.path.normpath(self.variants_path):
+            self.apply_variant(kind, name)
+            return
+        key = song_key(name)
+        entry = self.entries.get(key)
+        if entry is None:
+            if kind != ADDED:
+                return
+            entry = self.entries[key] = SongEntry()
+        present = kind != REMOVED
+        if ext == '.ogg':
+            entry.ogg = present
+            # a new render may not have the same length as the previous one
+            entry.info = None
+        elif ext == '.info':
+            entry.info = None
+        elif ext == '.lock':
+            entry.locked = present
+        elif ext == '.py':
+            entry.script = present
+        elif present:
+            entry.stamps.add(name)
+        else:
+            entry.stamps.discard(name)
+        if entry.empty():
+            del self.entries[key]
+        self._refresh(key)
+
+    def apply_variant(self, kind, name):
+        """Variants are named `<song>.<seed>.ogg`; a stamp next to one
+        means it has been handed out and is waiting to be retired."""
+        ext = os.path.splitext(name)[1]
+        variant = name.split('(')[0] if ext == '.stamp' else name
+        if not variant.endswith('.ogg'):
+            return
+        key = self.path + os.path.basename(variant)[:-4].rsplit('.', 1)[0] \
+            + '.ogg'
+        entry = self.entries.get(key)
+        if entry is None:
+            if kind != ADDED:
+                return
+            entry = self.entries[key] = SongEntry()
+        if kind == REMOVED:
+            if variant in entry.variants and ext == '.ogg':
+                entry.variants.remove(variant)
+            if ext == '.ogg':
+                entry.spent.discard(variant)
+        elif ext == '.stamp':
+            if variant in entry.variants:
+                entry.variants.remove(variant)
+            entry.spent.add(variant)
+        elif variant not in entry.variants and variant not in entry.spent:
+            entry.variants.append(variant)
+        if entry.empty():
+            del self.entries[key]
+        self._refresh(key)
+
+    def _refresh(self, key):
+        entry = self.entries.get(key)
+        eligible = (entry is not None and key not in self.history and
+                    (entry.variants or (entry.ogg and not entry.locked)))
+        if eligible and key not in self._position:
+            self._position[key] = len(self._eligible)
+            self._eligible.append(key)
+        elif not eligible and key in self._position:
+            index = self._position.pop(key)
+            last = self._eligible.pop()
+            if index < len(self._eligible):
+                self._eligible[index] = last
+                self._position[last] = index
+
+    def _remember(self, song):
+        evicted = self.history.append(song)
+        self._refresh(song)
+        if evicted is not None:
+            self._refresh(evicted)
+
+    def eligible(self):
+        return list(self._eligible)
+
+    def choose(self):
+        """Draw a song among the eligible ones, record it as played and
+        return the file to play: its oldest fresh variant if it has one,
+        its main ogg otherwise."""
+        if not self._eligible:
+            raise IndexError('No song available')
+        song = random.choice(self._eligible)
+        self._remember(song)
+        entry = self.entries[song]
+        if entry.variants:
+            variant = entry.variants.pop(0)
+            entry.spent.add(variant)
+            self._refresh(song)
+            return variant
+        return song
+
+    def info(self, song, load):
+        """The render infos of a song (see `radio_pyo.read_render_info`),
+        loaded with `load(song)` at most once per render and then served
+        from memory."""
+        entry = self.entries.get(song)
+        if entry is None or entry.info is None:
+            info = load(song)
+            if entry is not None:
+                entry.info = info
+            return info
+        return entry.info
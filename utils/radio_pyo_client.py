@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""Thin ices2 entry point: ask the resident selector for the next song
+and print its path.
+
+This module deliberately imports nothing heavy. Only if the selector
+service is not running does it fall back to `radio_pyo.select_song`,
+which does the whole job in this process.
+"""
+
+import sys
+import socket
+
+SELECTOR_SOCKET = '/xxxxxxxx/radiopyo/selector.sock'
+SELECTOR_TIMEOUT = 2.0
+
+
+def request(command, socket_file=SELECTOR_SOCKET, timeout=SELECTOR_TIMEOUT):
+    """Send one command line to the selector and return its one line
+    answer."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(socket_file)
+        client.sendall(command.encode('utf-8') + b'\n')
+        answer = b''
+        while not answer.endswith(b'\n'):
+            chunk = client.recv(4096)
+            if not chunk:
+                break
+            answer += chunk
+    finally:
+        client.close()
+    return answer.decode('utf-8').strip()
+
+
+def next_song():
+    try:
+        song = request('next')
+    except (socket.error, socket.timeout):
+        song = ''
+    if not song:
+        import radio_pyo
+        song = radio_pyo.select_song(radio_pyo.RADIOPYO_PATH)
+    return song
+
+
+def main():
+    sys.stdout.write(next_song() + '\n')
+    sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
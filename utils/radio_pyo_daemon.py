@@ -1,8 +1,161 @@
 #!/usr/bin/python
+"""Long-running render scheduler.
 
-from os import system
-from time import sleep
+Keeps every pending `.stamp` deadline in a min-heap and sleeps until the
+earliest one expires, waking up early only when a new stamp shows up in
+the song directory. The song directory is scanned once at startup (or
+after the watcher lost events); after that no scan happens. Due songs are
+handed to a `radio_pyo.RenderPool`, so the scheduler never blocks on a
+render. Songs whose last render failed wait until their backoff is over
+(see `radio_pyo.render_backoff`).
 
-while True:
-    system('/xxxx/radio_pyo.py update')
-    sleep(1)
+With variant pools enabled (`radio_pyo.VARIANT_POOL_SIZE`), a second
+scheduler watches the variants directory and retires each variant once
+it has been played, and the pools are topped up by background renders
+whenever the box is idle.
+"""
+
+import os
+import time
+import heapq
+import glob
+import threading
+import logging
+
+import radio_pyo
+from radio_pyo_watch import Watcher, ADDED, OVERFLOW
+
+logger = logging.getLogger(__name__)
+
+# how often to check whether variant pools need (and can get) a refill
+VARIANT_REFILL_INTERVAL = 60
+
+
+class Scheduler(object):
+    # whether this scheduler also tops up the variant pools
+    refills = True
+
+    def __init__(self, path=None):
+        self.path = path or radio_pyo.RADIOPYO_PATH
+        self.heap = []
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        self.watcher = Watcher(self.path)
+        self.pool = radio_pyo.RenderPool()
+        radio_pyo.prefork_workers(glob.glob(os.path.join(self.path, '*.py')),
+                                  self.pool.workers)
+        self.next_refill = 0
+
+    def push(self, stamp_file):
+        try:
+            script_file, scheduled_time = radio_pyo.parse_stamp(stamp_file)
+        except (IndexError, ValueError):
+            logger.debug('Ignoring malformed stamp {0}'.format(stamp_file))
+            return
+        deadline = time.mktime(scheduled_time.timetuple())
+        heapq.heappush(self.heap, (deadline, stamp_file,
+                                   self.target(stamp_file, script_file)))
+
+    def target(self, stamp_file, script_file):
+        """What a due stamp is about; here the script to render again."""
+        return script_file
+
+    def deferred(self, target):
+        """Until when a due target has to wait, or None. Songs whose
+        render failed lately are backed off."""
+        return radio_pyo.render_backoff(target)
+
+    def rescan(self):
+        self.heap = []
+        for name in glob.glob(os.path.join(self.path, '*.stamp')):
+            self.push(name)
+
+    def timeout(self):
+        timeouts = []
+        if self.heap:
+            timeouts.append(self.heap[0][0])
+        if self.refills and radio_pyo.VARIANT_POOL_SIZE:
+            timeouts.append(self.next_refill)
+        if not timeouts:
+            return None
+        return max(min(timeouts) - time.time(), 0)
+
+    def pop_due(self):
+        """Pop every entry whose deadline has passed. Stamps that were
+        already removed (an update of the same song clears all of its
+        stamps) are dropped lazily here."""
+        due = []
+        now = time.time()
+        while self.heap and self.heap[0][0] <= now:
+            deadline, stamp_file, script_file = heapq.heappop(self.heap)
+            if not os.path.exists(stamp_file) or script_file in due:
+                continue
+            until = self.deferred(script_file)
+            if until is not None:
+                heapq.heappush(self.heap, (until, stamp_file, script_file))
+                continue
+            due.append(script_file)
+        return due
+
+    def run_pending(self, due):
+        for script_file in due:
+            self.pool.submit(script_file)
+
+    def refill(self):
+        """Top up the variant pools, but only while nothing else renders
+        and with no more jobs than there are idle cores."""
+        if not (self.refills and radio_pyo.VARIANT_POOL_SIZE) or \
+                time.time() < self.next_refill:
+            return
+        self.next_refill = time.time() + VARIANT_REFILL_INTERVAL
+        if self.pool.busy() or not radio_pyo.render_idle():
+            return
+        idle_cores = max(int(self.pool.workers - os.getloadavg()[0]), 1)
+        for script_file in radio_pyo.missing_variants(self.path)[:idle_cores]:
+            self.pool.submit(script_file, job=radio_pyo.render_variant)
+
+    def handle(self, events):
+        for kind, name in events:
+            if kind == OVERFLOW:
+                self.rescan()
+                return
+            if kind == ADDED and name.endswith('.stamp'):
+                self.push(name)
+
+    def run(self):
+        self.rescan()
+        while True:
+            self.handle(self.watcher.wait(self.timeout()))
+            self.run_pending(self.pop_due())
+            self.refill()
+
+
+class VariantScheduler(Scheduler):
+    """Retires played variants when their stamp expires."""
+    refills = False
+
+    def target(self, stamp_file, script_file):
+        return stamp_file.split('(')[0]
+
+    def deferred(self, target):
+        return None
+
+    def run_pending(self, due):
+        for ogg_file in due:
+            logger.debug('Retiring {0}'.format(ogg_file))
+            radio_pyo.retire_variant(ogg_file)
+
+
+def main():
+    scheduler = Scheduler()
+    if radio_pyo.VARIANT_POOL_SIZE:
+        retirer = VariantScheduler(
+            os.path.join(scheduler.path, radio_pyo.VARIANTS_DIR))
+        thread = threading.Thread(target=retirer.run)
+        thread.daemon = True
+        thread.start()
+    scheduler.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+"""Render farm: spread song renders over any number of worker processes,
+on this box or on others sharing the radio directory.
+
+Jobs go through a spool directory with four subdirectories:
+
+    new/      job descriptors waiting for a worker
+    claimed/  jobs being rendered, one file per job and worker
+    done/     finished jobs
+    failed/   jobs that could not be rendered
+
+A descriptor is a small JSON file naming the script (and the sha1 of its
+content), the seed and the output ogg. Workers claim one by renaming it
+from `new/` to `claimed/`, which only one of them can do. While it
+renders, a worker keeps touching its claim; a claim that has not been
+touched for the lease time belongs to a dead worker and is put back in
+`new/` by whoever notices it first. Every step is a rename, so nothing
+but a shared filesystem is needed between the hosts, and the hosts'
+clocks should agree to within a fraction of the lease. A worker that
+lost its lease (too slow to renew it, or cut off from the filesystem)
+leaves the job, its lock and its claim to whoever took it over.
+
+    radio_pyo_farm.py worker SPOOL [--processes N] [--once]
+    radio_pyo_farm.py status SPOOL
+    radio_pyo_farm.py check [--processes N] [--jobs N]
+
+`check` runs worker processes against a temporary spool, with dummy
+renders and a claim left behind by a dead worker, and reports whether
+every job was done exactly once.
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import shutil
+import socket
+import hashlib
+import tempfile
+import argparse
+import threading
+import multiprocessing
+import logging
+
+logger = logging.getLogger(__name__)
+
+QUEUES = ('new', 'claimed', 'done', 'failed')
+# seconds without news from a worker before its job is given to another
+LEASE_TIME = 60.
+# a job that was claimed that many times without finishing is given up
+MAX_ATTEMPTS = 3
+POLL_INTERVAL = 1.
+# finished jobs kept in done/ and failed/
+KEEP_FINISHED = 200
+# lease and length of the dummy renders of `check`, in seconds
+CHECK_LEASE_TIME = 1.
+CHECK_RENDER_TIME = .2
+
+
+def script_digest(script_file):
+    with open(script_file, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def worker_name():
+    return '{0}.{1}'.format(socket.gethostname(), os.getpid())
+
+
+class Spool(object):
+
+    def __init__(self, directory, lease_time=LEASE_TIME):
+        self.directory = directory
+        self.lease_time = lease_time
+        for queue in QUEUES:
+            path = os.path.join(directory, queue)
+            if not os.path.isdir(path):
+                try:
+                    os.makedirs(path)
+                except OSError:
+                    # another process created it meanwhile
+                    pass
+
+    def _path(self, queue, name=''):
+        return os.path.join(self.directory, queue, name)
+
+    def submit(self, script_file, seed, ogg_file, lock_file=None, cost=0.):
+        """Queue the render of a script. The lock file, if any, is removed
+        by the worker once the job is over."""
+        job_id = '{0:.6f}-{1}-{2}'.format(
+            time.time(), os.path.basename(os.path.splitext(ogg_file)[0]),
+            seed)
+        job = {'id': job_id, 'script': script_file,
+               'sha1': script_digest(script_file), 'seed': seed,
+               'output': ogg_file, 'lock': lock_file, 'cost': cost,
+               'attempts': 0}
+        tmp_file = os.path.join(self.directory, job_id + '.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(job, f)
+        os.rename(tmp_file, self._path('new', job_id + '.json'))
+        return job_id
+
+    def _read(self, job_file):
+        try:
+            with open(job_file) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return None
+
+    def claim(self, worker):
+        """Take the most expensive waiting job, oldest first among equals.
+        Returns the path of the claim and the job, or None if there is
+        nothing to do."""
+        waiting = []
+        for job_file in glob.glob(self._path('new', '*.json')):
+            job = self._read(job_file)
+            if job is not None:
+                waiting.append((-job['cost'], job['id'], job_file))
+        for _, job_id, job_file in sorted(waiting):
+            claim_file = self._path('claimed', '{0}@{1}.json'.format(
+                job_id, worker))
+            try:
+                # the lease starts now, not when the job was queued
+                os.utime(job_file, None)
+                os.rename(job_file, claim_file)
+            except OSError:
+                # somebody else was faster
+                continue
+            job = self._read(claim_file)
+            job['attempts'] += 1
+            job['worker'] = worker
+            with open(claim_file + '.tmp', 'w') as f:
+                json.dump(job, f)
+            os.rename(claim_file + '.tmp', claim_file)
+            return claim_file, job
+        return None
+
+    def renew(self, claim_file):
+        """Extend the lease of a claim. False if it was lost."""
+        try:
+            os.utime(claim_file, None)
+        except OSError:
+            return False
+        return True
+
+    def finish(self, claim_file, job, ok):
+        """Move a claim to `done/` or `failed/`. The claim is moved first,
+        so that a claim that was requeued meanwhile is left alone; returns
+        False in that case."""
+        queue = 'done' if ok else 'failed'
+        finished_file = self._path(queue, os.path.basename(claim_file))
+        try:
+            os.rename(claim_file, finished_file)
+        except OSError:
+            logger.debug('Lost the lease on {0}'.format(job['id']))
+            return False
+        job['finished'] = time.time()
+        with open(finished_file + '.tmp', 'w') as f:
+            json.dump(job, f)
+        os.rename(finished_file + '.tmp', finished_file)
+        self.prune(queue)
+        return True
+
+    def recover(self):
+        """Put the jobs of workers that stopped renewing their lease back
+        in the queue."""
+        now = time.time()
+        for claim_file in glob.glob(self._path('claimed', '*.json')):
+            try:
+                expired = now - os.path.getmtime(claim_file) > self.lease_time
+            except OSError:
+                continue
+            if not expired:
+                continue
+            job_id = os.path.basename(claim_file).split('@')[0]
+            try:
+                os.rename(claim_file, self._path('new', job_id + '.json'))
+            except OSError:
+                continue
+            logger.debug('Lease of {0} expired, requeued'.format(job_id))
+
+    def prune(self, queue):
+        finished = sorted(glob.glob(self._path(queue, '*.json')),
+                          key=os.path.basename)
+        for job_file in finished[:max(len(finished) - KEEP_FINISHED, 0)]:
+            try:
+                os.remove(job_file)
+            except OSError:
+                pass
+
+    def status(self):
+        return dict((queue, len(glob.glob(self._path(queue, '*.json'))))
+                    for queue in QUEUES)
+
+
+class Lease(threading.Thread):
+    """Keeps renewing a claim in the background while its job runs. Once
+    a renewal fails, the claim is `lost`: it was requeued."""
+
+    def __init__(self, spool, claim_file):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.spool = spool
+        self.claim_file = claim_file
+        self.lost = False
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.spool.lease_time / 3.):
+            if not self.held():
+                return
+
+    def held(self):
+        """Renew the claim now, and tell whether it is still ours."""
+        if not self.lost and not self.spool.renew(self.claim_file):
+            self.lost = True
+        return not self.lost
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def render_job(job):
+    import radio_pyo
+    radio_pyo.render_ogg(job['script'], job['output'], job['seed'])
+
+
+def run_job(job, lease=None, render=render_job):
+    """Render a job's script here. The script must still be the one the
+    job was made for. The song's lock is released afterwards, unless the
+    job was taken over by another worker meanwhile."""
+    try:
+        if job['attempts'] > MAX_ATTEMPTS:
+            logger.debug('Giving up on {0}'.format(job['id']))
+            return False
+        if script_digest(job['script']) != job['sha1']:
+            logger.debug('{0} changed since {1} was queued'.format(
+                job['script'], job['id']))
+            return False
+        render(job)
+        return True
+    except Exception:
+        logger.exception('Rendering {0} failed'.format(job['id']))
+        return False
+    finally:
+        if job.get('lock') and (lease is None or lease.held()) and \
+                os.path.exists(job['lock']):
+            os.remove(job['lock'])
+
+
+def work(spool_dir, once=False, render=render_job, lease_time=LEASE_TIME):
+    spool = Spool(spool_dir, lease_time)
+    worker = worker_name()
+    while True:
+        spool.recover()
+        claimed = spool.claim(worker)
+        if claimed is None:
+            if once:
+                return
+            time.sleep(POLL_INTERVAL)
+            continue
+        claim_file, job = claimed
+        logger.debug('{0} rendering {1}'.format(worker, job['id']))
+        lease = Lease(spool, claim_file)
+        lease.start()
+        try:
+            ok = run_job(job, lease, render)
+        finally:
+            lease.stop()
+        if not lease.held():
+            logger.debug('{0} lost {1} to another worker'.format(
+                worker, job['id']))
+            continue
+        spool.finish(claim_file, job, ok)
+
+
+def check_render(job):
+    """A dummy render: one line per render in the job's output."""
+    with open(job['output'], 'a') as f:
+        f.write(worker_name() + '\n')
+    time.sleep(CHECK_RENDER_TIME)
+
+
+def check(processes=2, jobs=8):
+    """Run worker processes against a temporary spool, and return what
+    went wrong, if anything. One of the jobs is first claimed by a worker
+    that dies: it must be recovered, rendered once by the others, and the
+    dead worker must not be able to finish it afterwards."""
+    directory = tempfile.mkdtemp(prefix='radiopyo-farm')
+    try:
+        spool = Spool(directory, CHECK_LEASE_TIME)
+        script_file = os.path.join(directory, 'song.py')
+        open(script_file, 'w').close()
+        outputs, locks = [], []
+        for n in range(jobs):
+            outputs.append(os.path.join(directory, 'song{0}.ogg'.format(n)))
+            locks.append(os.path.join(directory, 'song{0}.lock'.format(n)))
+            open(locks[-1], 'w').close()
+            spool.submit(script_file, n, outputs[-1], locks[-1], cost=n)
+        dead_claim, dead_job = spool.claim('dead')
+        expired = time.time() - 2 * CHECK_LEASE_TIME
+        os.utime(dead_claim, (expired, expired))
+        workers = [multiprocessing.Process(
+            target=work, args=(directory, True, check_render,
+                               CHECK_LEASE_TIME))
+                   for _ in range(processes)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+        problems = []
+        if Lease(spool, dead_claim).held() or \
+                spool.finish(dead_claim, dead_job, True):
+            problems.append('the dead worker finished {0}'.format(
+                dead_job['id']))
+        for output, lock in zip(outputs, locks):
+            try:
+                with open(output) as f:
+                    renders = len(f.readlines())
+            except IOError:
+                renders = 0
+            if renders != 1:
+                problems.append('{0} rendered {1} times'.format(
+                    os.path.basename(output), renders))
+            if os.path.exists(lock):
+                problems.append('{0} left behind'.format(
+                    os.path.basename(lock)))
+        status = spool.status()
+        if status != {'new': 0, 'claimed': 0, 'done': jobs, 'failed': 0}:
+            problems.append('spool left as {0}'.format(status))
+        return problems
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('command', choices=['worker', 'status', 'check'])
+    parser.add_argument('spool', nargs='?')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--once', action='store_true',
+                        help='exit when the queue is empty')
+    parser.add_argument('--jobs', type=int, default=8,
+                        help='jobs queued by check')
+    args = parser.parse_args()
+    if args.command == 'check':
+        problems = check(args.processes or 2, args.jobs)
+        for problem in problems:
+            print(problem)
+        print('ok' if not problems else 'FAILED')
+        sys.exit(1 if problems else 0)
+    if args.spool is None:
+        parser.error('a spool directory is needed')
+    if args.command == 'status':
+        print(json.dumps(Spool(args.spool).status()))
+        return
+    workers = [multiprocessing.Process(target=work,
+                                       args=(args.spool, args.once))
+               for _ in range(args.processes or 1)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+
+if __name__ == '__main__':
+    main()
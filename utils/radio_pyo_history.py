@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Play history of the station.
+
+The last `capacity` songs are held in memory, with a counter so that
+"was this heard recently?" is a dictionary lookup. On disk the history
+is an append-only log of one song per line: recording a play appends a
+single line instead of rewriting the file. Once the log reaches twice
+the capacity it is compacted by writing the live entries to a temporary
+file that atomically replaces the log, so a crash leaves either the old
+or the new file, never a torn one.
+"""
+
+import os
+import collections
+
+
+class PlayHistory(object):
+
+    def __init__(self, filename, capacity):
+        self.filename = filename
+        self.capacity = capacity
+        self._songs = collections.deque()
+        self._count = collections.Counter()
+        self._lines = 0
+        self._newline = False
+        self._load()
+
+    def _load(self):
+        if self.filename is None:
+            return
+        try:
+            with open(self.filename) as queue_hist:
+                content = queue_hist.read()
+        except IOError:
+            return
+        lines = content.splitlines()
+        self._lines = len(lines)
+        # older files were written without a trailing newline
+        self._newline = bool(content) and not content.endswith('\n')
+        for song in lines[-self.capacity:] if self.capacity else []:
+            if song.strip():
+                self._push(song.strip())
+
+    def _push(self, song):
+        self._songs.append(song)
+        self._count[song] += 1
+        if len(self._songs) > self.capacity:
+            old = self._songs.popleft()
+            self._count[old] -= 1
+            if not self._count[old]:
+                del self._count[old]
+            return old
+        return None
+
+    def __contains__(self, song):
+        return song in self._count
+
+    def __len__(self):
+        return len(self._songs)
+
+    def __iter__(self):
+        return iter(self._songs)
+
+    def songs(self):
+        return list(self._songs)
+
+    def append(self, song):
+        """Record a play. Returns the song that fell out of the history,
+        if any."""
+        if not self.capacity:
+            return None
+        evicted = self._push(song)
+        if self.filename is not None:
+            with open(self.filename, 'a') as queue_hist:
+                queue_hist.write(('\n' if self._newline else '') +
+                                 song + '\n')
+            self._newline = False
+            self._lines += 1
+            if self._lines >= 2 * self.capacity:
+                self.compact()
+        return evicted
+
+    def compact(self):
+        tmp_file = self.filename + '.tmp'
+        with open(tmp_file, 'w') as queue_hist:
+            queue_hist.write(''.join([song + '\n' for song in self._songs]))
+            queue_hist.flush()
+            os.fsync(queue_hist.fileno())
+        os.rename(tmp_file, self.filename)
+        self._lines = len(self._songs)
@@ -0,0 +1,598 @@
+#!/usr/bin/env python
+"""Live engine: play the songs in real time on one persistent server
+instead of rendering them to files.
+
+The engine's server runs in pyo's manual mode: it computes one block
+when asked to, and the engine asks once per block duration, so it knows
+how long every block took. Its output is recorded continuously to a
+sink, either a file or the stdin of a command (raw 16 bits PCM, e.g. an
+encoder feeding the stream).
+
+Songs are run unchanged. While one is loaded, `pyo.Server` stands for
+the engine's server (booting, recording and starting it do nothing, its
+gain is the song's own, and only what it can tell is read from the real
+one), and everything a song sends `out()` goes through a fader of its
+own, so that the next song can fade in over the end of the previous one.
+When a song is over, its objects are stopped and its namespace is
+dropped.
+
+A song's script runs in a thread of its own, ahead of the song's time
+by about how long it took to load last time, while the audio loop keeps
+computing blocks on schedule. Until the song starts, what it plays or
+sends out is held, and the objects that start on their own are stopped
+as soon as they are built; all of it is started along with the song's
+fader, so its envelopes, patterns and score run from there. The loop
+never skips blocks to catch up: the stream's timing is the sink's.
+
+Only python code of the loading song gives the interpreter back to the
+audio loop in time. Tables built in one C call (HarmTable, PadSynthTable,
+SndTable...) keep it for as long as they take, and the blocks due
+meanwhile are late: the worst lag seen while each song loaded is kept in
+the stats (`load_lag`), to spot the songs that should share or cache
+their tables (see radio_pyo_wavetables.py).
+
+The real-time budget is enforced twice. Songs whose offline real-time
+factor, as measured by radio_pyo_bench.py, leaves no room are never
+played. While playing, a song that keeps the blocks over budget for too
+long is faded out early and is not played again. Block times are split
+between the songs that overlap, each one being charged what it takes
+when playing alone, so the right song is blamed. The per-song load is
+kept in a stats file.
+
+    radio_pyo_live.py [--path DIR] (--output FILE | --command CMD)
+                      [--bench FILE] [--songs N]
+"""
+
+import os
+import sys
+import gc
+import json
+import glob
+import time
+import random
+import shlex
+import argparse
+import tempfile
+import threading
+import subprocess
+import runpy
+import logging
+
+import radio_pyo
+from radio_pyo_catalog import song_key
+
+logger = logging.getLogger(__name__)
+
+LIVE_SR = 44100
+LIVE_CHANNELS = 2
+LIVE_BUFFER = 512
+# seconds during which two songs overlap
+CROSSFADE = 8.
+# share of a block's duration the whole graph may take
+BLOCK_BUDGET = .7
+# consecutive blocks over budget before the newest song is cut short
+OVERRUN_LIMIT = 100
+# seconds the offline server took per rendered second (see
+# radio_pyo_bench.py, setup excluded) over which a song is not played
+# live; two songs have to fit in a block during crossfades
+MAX_OFFLINE_RTF = BLOCK_BUDGET / 2
+# a song starts loading at least that many seconds before its time, or
+# its last load time times the margin
+LOAD_AHEAD = 2.
+LOAD_MARGIN = 1.5
+# seconds the loading thread may keep the interpreter from the audio loop
+LOAD_SWITCH_INTERVAL = .001
+# what a song may ask its server, answered by the engine's
+LIVE_SERVER_CALLS = ('getSamplingRate', 'getNchnls', 'getBufferSize',
+                     'getCurrentTime', 'getCurrentTimeInSamples',
+                     'getIsBooted', 'getIsStarted')
+LIVE_STATS_FILE = 'live_stats.json'
+
+clock = getattr(time, 'perf_counter', time.time)
+
+
+class LiveServer(object):
+    """What `Server` is for a song played live: a stand-in for the
+    engine's server. Its gain is the song's."""
+
+    engine = None
+
+    def __init__(self, *args, **kwargs):
+        self.song = LiveServer.engine.creator()
+
+    def boot(self, *args, **kwargs):
+        return self
+
+    def start(self, *args, **kwargs):
+        return self
+
+    def _ignored(self, *args, **kwargs):
+        pass
+
+    stop = shutdown = recordOptions = recstart = recstop = gui = \
+        setStartOffset = setGlobalSeed = setVerbosity = _ignored
+
+    def setAmp(self, x):
+        if self.song is not None:
+            LiveServer.engine.set_gain(self.song, x)
+
+    @property
+    def amp(self):
+        return self.song.gain if self.song is not None else 1.
+
+    @amp.setter
+    def amp(self, x):
+        self.setAmp(x)
+
+    def __getattr__(self, name):
+        if name not in LIVE_SERVER_CALLS:
+            raise AttributeError(
+                "a live song's server has no {0!r}".format(name))
+        return getattr(LiveServer.engine.server, name)
+
+
+class LiveSong(object):
+
+    def __init__(self, script_file, info, length):
+        self.script_file = script_file
+        self.info = info
+        # in blocks; start and end are set when the song starts
+        self.length = length
+        self.start_block = None
+        self.end_block = None
+        self.loader = None
+        self.failed = False
+        self.namespace = None
+        self.objects = []
+        # built while loading, not yet checked for playing on their own
+        self.pending = []
+        # (object, method, args, kwargs) to call when the song starts
+        self.held = []
+        self.faded = {}
+        self.fader = None
+        self.gain = 1.
+        self.fading = False
+        self.busy = 0.
+        self.blocks = 0
+        self.solo_busy = 0.
+        self.solo_blocks = 0
+        self.worst = 0.
+        self.overruns = 0
+        self.cut = False
+        self.load_time = 0.
+        self.load_lag = 0.
+
+    def solo_time(self):
+        """Seconds a block takes with only this song, or None if it has
+        not been playing alone yet."""
+        if not self.solo_blocks:
+            return None
+        return self.solo_busy / self.solo_blocks
+
+
+class Sink(object):
+    """Where the engine's output goes: a file pyo writes itself, or a fifo
+    read by a command."""
+
+    def __init__(self, output_file=None, command=None):
+        self.process = None
+        self.directory = None
+        if command is None:
+            self.filename = output_file
+            # 7 is ogg vorbis, 0 wav
+            self.fileformat = 7 if output_file.endswith('.ogg') else 0
+            return
+        self.directory = tempfile.mkdtemp(prefix='radiopyo-live')
+        self.filename = os.path.join(self.directory, 'pcm')
+        # 3 is raw samples
+        self.fileformat = 3
+        os.mkfifo(self.filename)
+        # open our end first, so that pyo does not block opening its own
+        fd = os.open(self.filename, os.O_RDONLY | os.O_NONBLOCK)
+        os.set_blocking(fd, True)
+        self.process = subprocess.Popen(command, stdin=fd)
+        os.close(fd)
+
+    def close(self):
+        if self.process is not None:
+            self.process.wait()
+        if self.directory is not None:
+            os.remove(self.filename)
+            os.rmdir(self.directory)
+
+
+class LiveEngine(object):
+
+    def __init__(self, path, sink, bench=None, stats_file=None,
+                 max_songs=None):
+        import pyo
+        self.pyo = pyo
+        self.path = path
+        self.sink = sink
+        self.bench = bench or {}
+        self.stats_file = stats_file
+        self.stats = {}
+        if stats_file is not None:
+            try:
+                with open(stats_file) as f:
+                    self.stats = json.load(f)
+            except (IOError, ValueError):
+                pass
+        self.server = pyo.Server(sr=LIVE_SR, nchnls=LIVE_CHANNELS,
+                                 buffersize=LIVE_BUFFER, duplex=0,
+                                 audio='manual').boot()
+        self.server.recordOptions(dur=-1, filename=sink.filename,
+                                  fileformat=sink.fileformat, sampletype=0)
+        self.block_time = LIVE_BUFFER / float(LIVE_SR)
+        self.block = 0
+        self.remaining = max_songs
+        # loading, playing and fading out, oldest first
+        self.songs = []
+        self.loading = None
+        self.upcoming = None
+        self.owners = {}
+        self._install()
+
+    def _install(self):
+        """Route the songs' servers and outputs through the engine, and
+        hold what loading songs start."""
+        pyo = self.pyo
+        engine = self
+        LiveServer.engine = self
+        pyo.Server = LiveServer
+        base = getattr(pyo, 'PyoObjectBase', pyo.PyoObject)
+        init = base.__init__
+        out = pyo.PyoObject.out
+
+        def owned_init(obj, *args, **kwargs):
+            init(obj, *args, **kwargs)
+            song = engine.creator()
+            if song is not None:
+                song.objects.append(obj)
+                engine.owners[id(obj)] = song
+                if song.start_block is None:
+                    # the previous ones are built by now
+                    engine.hold_started(song)
+                    song.pending.append(obj)
+
+        def faded_out(obj, chnl=0, inc=1, dur=0, delay=0):
+            song = engine.owners.get(id(obj))
+            if song is None:
+                return out(obj, chnl, inc, dur, delay)
+            faded = song.faded.get(id(obj))
+            if faded is None:
+                faded = song.faded[id(obj)] = obj * song.fader
+            obj.play(dur, delay)
+            out(faded, chnl, inc, dur, delay)
+            return obj
+
+        def held(name, method):
+            def held_call(obj, *args, **kwargs):
+                song = engine.owners.get(id(obj))
+                if song is None or song.start_block is not None:
+                    return method(obj, *args, **kwargs)
+                if name == 'stop':
+                    song.held = [entry for entry in song.held
+                                 if entry[0] is not obj]
+                    return method(obj, *args, **kwargs)
+                song.held.append((obj, name, args, kwargs))
+                return obj
+            held_call.method = method
+            return held_call
+
+        base.__init__ = owned_init
+        pyo.PyoObject.out = held('out', faded_out)
+        # subclasses starting their parts themselves have their own
+        for cls in list(vars(pyo).values()):
+            if not isinstance(cls, type) or not issubclass(cls, base):
+                continue
+            for name in ('play', 'stop'):
+                method = vars(cls).get(name)
+                # classes can be exported under several names
+                if method is not None and not hasattr(method, 'method'):
+                    setattr(cls, name, held(name, method))
+
+    def hold_started(self, song):
+        """Stop the objects a loading song built that started on their
+        own, to start them with the song."""
+        pending = []
+        for obj in song.pending:
+            try:
+                playing = obj.isPlaying()
+            except AttributeError:
+                # tables and matrices don't play
+                continue
+            except IndexError:
+                # no stream yet, still being built
+                pending.append(obj)
+                continue
+            if playing:
+                # not through the held stop, which would forget its calls
+                stop = type(obj).stop
+                getattr(stop, 'method', stop)(obj)
+                song.held.append((obj, 'play', (), {}))
+        song.pending = pending
+
+    def set_gain(self, song, gain):
+        song.gain = gain
+        song.fader.setMul(gain)
+
+    def creator(self):
+        """The song whose code is creating an object, if any."""
+        scripts = dict((song.script_file, song) for song in self.songs)
+        frame = sys._getframe(2)
+        while frame is not None:
+            song = scripts.get(frame.f_code.co_filename)
+            if song is not None:
+                return song
+            frame = frame.f_back
+        return None
+
+    def playable(self, script_file):
+        name = os.path.basename(script_file)
+        if self.stats.get(name, {}).get('cut'):
+            return False
+        # the server's time only: loading is done ahead, see `load`
+        bench = self.bench.get(name, {})
+        if bench.get('render_time') is not None and bench.get('rendered') \
+                and bench['render_time'] / bench['rendered'] > \
+                MAX_OFFLINE_RTF:
+            return False
+        # songs only the other python can run
+        with open(script_file, 'rb') as f:
+            try:
+                compile(f.read(), script_file, 'exec')
+            except SyntaxError:
+                return False
+        return True
+
+    def choose(self):
+        history = radio_pyo.queue_history()
+        playing = [song.script_file for song in self.songs]
+        playable = [script_file for script_file
+                    in glob.glob(os.path.join(self.path, '*.py'))
+                    if script_file not in playing and
+                    self.playable(script_file)]
+        # with few live songs, repeating one beats silence
+        candidates = ([script_file for script_file in playable
+                       if song_key(script_file) not in history] or
+                      playable)
+        if not candidates:
+            raise IndexError('No song can be played live')
+        script_file = random.choice(candidates)
+        history.append(song_key(script_file))
+        return script_file
+
+    def lead_blocks(self, script_file):
+        """How long before its time a song starts loading."""
+        load_time = self.stats.get(os.path.basename(script_file), {}).get(
+            'load_time') or 0.
+        return int(max(LOAD_AHEAD, LOAD_MARGIN * load_time) /
+                   self.block_time)
+
+    def due_block(self):
+        """When the next song starts: as soon as the newest one playing
+        starts fading in its last crossfade, or now."""
+        playing = [song for song in self.songs if song.start_block is not None]
+        if not playing:
+            return self.block
+        return playing[-1].end_block - 2 * int(CROSSFADE / 2 /
+                                               self.block_time)
+
+    def load(self, script_file):
+        """Start running a song's script next to the audio loop."""
+        info = radio_pyo.get_song_info(script_file)
+        try:
+            duration = float(info['DURATION'])
+        except (ValueError, TypeError):
+            duration = radio_pyo.DEFAULT_RENDER_COST
+        song = LiveSong(script_file, info, int(duration / self.block_time))
+        logger.debug('live: loading {0}'.format(script_file))
+        self.songs.append(song)
+        song.fader = self.pyo.Fader(fadein=CROSSFADE / 2,
+                                    fadeout=CROSSFADE / 2)
+        song.loader = threading.Thread(target=self.run_script, args=(song,))
+        song.loader.daemon = True
+        song.loader.start()
+        return song
+
+    def run_script(self, song):
+        seed = random.randint(1, 2 ** 31 - 1)
+        random.seed(seed)
+        self.server.setGlobalSeed(seed)
+        saved_argv = sys.argv
+        sys.argv = [song.script_file, os.devnull]
+        # the audio loop must get the interpreter back within a block
+        saved_interval = sys.getswitchinterval()
+        sys.setswitchinterval(LOAD_SWITCH_INTERVAL)
+        started = clock()
+        try:
+            song.namespace = runpy.run_path(song.script_file,
+                                            run_name='__main__')
+        except Exception:
+            logger.exception('live: {0} failed to load'.format(
+                song.script_file))
+            song.failed = True
+        finally:
+            sys.argv = saved_argv
+            sys.setswitchinterval(saved_interval)
+        self.hold_started(song)
+        song.load_time = clock() - started
+
+    def start(self, song):
+        logger.debug('live: starting {0}'.format(song.script_file))
+        song.start_block = self.block
+        song.end_block = self.block + song.length
+        song.fader.play()
+        held, song.held = song.held, []
+        song.pending = []
+        for obj, name, args, kwargs in held:
+            getattr(obj, name)(*args, **kwargs)
+        radio_pyo.write_current_info(dict(
+            song.info, LENGTH=song.length * self.block_time))
+
+    def shares(self, busy):
+        """How a block's time splits between the songs: the ones that
+        played alone before take what they took then (scaled to the
+        block), the others share the rest."""
+        shares = {}
+        unknown = []
+        expected = 0.
+        for song in self.songs:
+            solo_time = song.solo_time()
+            if solo_time is None:
+                unknown.append(song)
+            else:
+                shares[song] = solo_time
+                expected += solo_time
+        if unknown and expected < busy:
+            for song in unknown:
+                shares[song] = (busy - expected) / len(unknown)
+            return shares
+        for song in unknown:
+            shares[song] = 0.
+        for song in shares:
+            if expected:
+                shares[song] *= busy / expected
+            else:
+                shares[song] = busy / len(shares)
+        return shares
+
+    def account(self, busy):
+        """Charge the block's time to the songs it was spent on. Over the
+        budget, the song taking the largest share is blamed, and cut
+        short when it keeps being."""
+        if not self.songs:
+            return
+        shares = self.shares(busy)
+        blamed = None
+        if busy > BLOCK_BUDGET * self.block_time:
+            blamed = max(self.songs, key=lambda song: shares[song])
+        for song in self.songs:
+            song.busy += shares[song]
+            song.blocks += 1
+            song.worst = max(song.worst, shares[song])
+            if len(self.songs) == 1:
+                song.solo_busy += busy
+                song.solo_blocks += 1
+            song.overruns = song.overruns + 1 if song is blamed else 0
+            if song.overruns > OVERRUN_LIMIT and not song.cut:
+                logger.debug('live: {0} is over budget, cutting it'.format(
+                    song.script_file))
+                song.cut = True
+                if song.start_block is not None:
+                    song.end_block = min(song.end_block, self.block + int(
+                        CROSSFADE / 2 / self.block_time))
+
+    def advance(self):
+        """Fade out, retire, load and start songs as their time comes."""
+        fade_blocks = int(CROSSFADE / 2 / self.block_time)
+        for song in list(self.songs):
+            if song.start_block is None:
+                continue
+            if not song.fading and self.block >= song.end_block - fade_blocks:
+                song.fading = True
+                song.fader.stop()
+            if self.block >= song.end_block:
+                self.retire(song)
+        song = self.loading
+        if song is not None and not song.loader.is_alive():
+            if song.failed or song.cut:
+                song.cut = True
+                self.loading = None
+                self.retire(song)
+            elif self.block >= self.due_block():
+                self.loading = None
+                self.start(song)
+        if self.loading is None and self.remaining != 0:
+            if self.upcoming is None:
+                self.upcoming = self.choose()
+            if self.block >= self.due_block() - \
+                    self.lead_blocks(self.upcoming):
+                if self.remaining is not None:
+                    self.remaining -= 1
+                self.loading = self.load(self.upcoming)
+                self.upcoming = None
+
+    def retire(self, song):
+        self.songs.remove(song)
+        for obj in song.objects:
+            try:
+                obj.stop()
+            except Exception:
+                pass
+            self.owners.pop(id(obj), None)
+        song.fader.stop()
+        song.objects = []
+        song.faded = {}
+        song.namespace = None
+        gc.collect()
+        name = os.path.basename(song.script_file)
+        self.stats[name] = {
+            'load': song.busy / (max(song.blocks, 1) * self.block_time),
+            'worst_block': song.worst / self.block_time,
+            'load_time': song.load_time, 'load_lag': song.load_lag,
+            'cut': song.cut,
+            'time': time.time()}
+        if self.stats_file is not None:
+            with open(self.stats_file + '.tmp', 'w') as f:
+                json.dump(self.stats, f)
+            os.rename(self.stats_file + '.tmp', self.stats_file)
+
+    def run(self):
+        self.server.start()
+        self.server.recstart()
+        deadline = clock()
+        late = False
+        try:
+            while True:
+                self.advance()
+                if not self.songs:
+                    break
+                before = clock()
+                self.server.process()
+                self.account(clock() - before)
+                self.block += 1
+                deadline += self.block_time
+                delay = deadline - clock()
+                if self.loading is not None:
+                    self.loading.load_lag = max(self.loading.load_lag,
+                                                -delay)
+                if delay > 0:
+                    time.sleep(delay)
+                    late = False
+                elif not late:
+                    # the next blocks are computed right away until the
+                    # loop is back on schedule
+                    logger.debug('live: {0:.3f}s late'.format(-delay))
+                    late = True
+        finally:
+            self.server.recstop()
+            self.server.stop()
+            self.sink.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--path', default=radio_pyo.RADIOPYO_PATH)
+    sink = parser.add_mutually_exclusive_group(required=True)
+    sink.add_argument('--output', help='file to record the stream to')
+    sink.add_argument('--command',
+                      help='command reading raw 16 bits PCM on stdin')
+    parser.add_argument('--bench', default=None,
+                        help='results of radio_pyo_bench.py')
+    parser.add_argument('--songs', type=int, default=None,
+                        help='stop after that many songs')
+    args = parser.parse_args()
+    bench = None
+    if args.bench is not None:
+        with open(args.bench) as f:
+            bench = json.load(f)['songs']
+    command = shlex.split(args.command) if args.command else None
+    engine = LiveEngine(args.path, Sink(args.output, command), bench,
+                        os.path.join(args.path, LIVE_STATS_FILE), args.songs)
+    engine.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""Wave terrains for `MatrixPointer` songs, computed once and cached.
+
+A terrain is the matrix of sin(2 pi freq x + sin(y / phase)) for x in
+[0, 1) along each row and y the row number. Computing one with python
+loops costs a `math.sin` call per cell, too slow past 128x128. Terrains
+are computed with NumPy when it is there, written as raw little-endian
+32 bits floats (what a matrix holds) to `matrix_cache/` next to the
+songs, keyed by size, frequency and phase, and from then on mapped from
+that file and copied into the song's `NewMatrix` in one go:
+
+    from radio_pyo_matrices import terrain_matrix
+    m1 = terrain_matrix(SIZE, 1, 4, NewMatrix)
+
+This file is imported by the songs' own interpreters, so it has to stay
+compatible with python 2.
+"""
+
+import os
+import sys
+import math
+import mmap
+import array
+
+from radio_pyo_tables import song_directory, save_samples, unpack
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MATRIX_CACHE_DIR = 'matrix_cache'
+MATRIX_EXT = '.f32'
+
+
+def terrain(size, freq, phase):
+    """The terrain as little-endian 32 bits floats, row after row."""
+    xfreq = 2 * math.pi * freq
+    if numpy is not None:
+        xs = xfreq * (numpy.arange(size) / float(size))
+        ys = numpy.sin(numpy.arange(size) / float(phase))
+        values = numpy.sin(xs[numpy.newaxis, :] + ys[:, numpy.newaxis])
+        return values.astype('<f4').tobytes()
+    values = array.array('f', [
+        math.sin(xfreq * (j / float(size)) + math.sin(i / float(phase)))
+        for i in range(size) for j in range(size)])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tostring() if sys.version_info[0] < 3 else values.tobytes()
+
+
+def cached_terrain(size, freq, phase, directory=None):
+    """The terrain's bytes, from the cache (mapped) or computed. A cache
+    that can't be written only costs the computation."""
+    directory = directory or song_directory(MATRIX_CACHE_DIR)
+    filename = os.path.join(directory, 'terrain-{0}-{1!r}-{2!r}{3}'.format(
+        size, freq, phase, MATRIX_EXT))
+    try:
+        with open(filename, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) == size * size * 4:
+            return mapped
+    except (IOError, OSError, ValueError):
+        pass
+    data = terrain(size, freq, phase)
+    try:
+        save_samples(filename, data)
+    except (IOError, OSError):
+        pass
+    return data
+
+
+def load_matrix(data, width, height, matrix_class=None):
+    """A `NewMatrix` (or `matrix_class`) holding the given rows of 32 bits
+    floats, through its buffer when pyo gives access to it."""
+    if matrix_class is None:
+        from pyo import NewMatrix as matrix_class
+    matrix = matrix_class(width, height)
+    if sys.version_info[0] >= 3 and sys.byteorder == 'little':
+        try:
+            view = memoryview(matrix.getBuffer())
+        except (AttributeError, TypeError):
+            view = None
+        if view is not None and view.format == 'f' and \
+                view.nbytes == len(data):
+            view.cast('B')[:] = memoryview(data).cast('B')
+            return matrix
+    samples = unpack(data)
+    matrix.replace([samples[row * width:(row + 1) * width].tolist()
+                    for row in range(height)])
+    return matrix
+
+
+def terrain_matrix(size, freq=3, phase=16, matrix_class=None,
+                   normalize=True, directory=None):
+    """A square wave terrain matrix, normalized between -1 and 1 by pyo
+    as songs do."""
+    matrix = load_matrix(cached_terrain(size, freq, phase, directory),
+                         size, size, matrix_class)
+    if normalize:
+        matrix.normalize()
+    return matrix
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""Song metadata extraction.
+
+The user-defined variables of a song (see radiopyo_template.py) are read
+from the top-level constant assignments of the script with `ast`, without
+running it. Scripts that only parse with python 2 are handled by a
+line-based fallback that evaluates the same assignments one by one.
+
+Results are cached per script, keyed by modification time and size, and
+backed by a hash of the content so that touching a file does not force
+a re-parse. The cache can be kept on disk and filled for a whole
+directory in one pass. Several processes may save it at once: the last
+one wins, and a save that fails only costs a re-parse later.
+"""
+
+import os
+import io
+import ast
+import json
+import glob
+import hashlib
+import logging
+import tempfile
+import tokenize
+import threading
+
+logger = logging.getLogger(__name__)
+
+KEYS = ('TITLE', 'ARTIST', 'DURATION', 'GENRE', 'DATE', 'READY')
+DEFAULTS = {'TITLE': '', 'ARTIST': '', 'DURATION': ''}
+
+
+def _decode(source):
+    encoding = tokenize.detect_encoding(io.BytesIO(source).readline)[0]
+    return source.decode(encoding, 'replace')
+
+
+def _scan_lines(source):
+    """Fallback for scripts the running interpreter can't parse."""
+    found = {}
+    for line in _decode(source).splitlines():
+        if line[:1].isspace() or '=' not in line:
+            continue
+        name, value = line.split('=', 1)
+        name = name.strip()
+        if name not in KEYS:
+            continue
+        for candidate in (value, value.split('#')[0]):
+            try:
+                found[name] = ast.literal_eval(candidate.strip())
+                break
+            except (ValueError, SyntaxError):
+                pass
+    return found
+
+
+def extract(source):
+    """Return the song variables assigned at the top level of `source`
+    (bytes) as python values. Only the last assignment of each name
+    counts, as when the script runs."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        found = _scan_lines(source)
+    else:
+        found = {}
+        for node in tree.body:
+            if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+                continue
+            target = node.targets[0]
+            if not isinstance(target, ast.Name) or target.id not in KEYS:
+                continue
+            try:
+                found[target.id] = ast.literal_eval(node.value)
+            except ValueError:
+                pass
+    info = dict(DEFAULTS)
+    info.update(found)
+    return info
+
+
+class MetadataCache(object):
+
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file
+        self.entries = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        if cache_file is not None:
+            try:
+                with open(cache_file) as f:
+                    self.entries = json.load(f)
+            except (IOError, ValueError):
+                pass
+
+    def get(self, script_file):
+        with self._lock:
+            return self._get(script_file)
+
+    def _get(self, script_file):
+        st = os.stat(script_file)
+        entry = self.entries.get(script_file)
+        if entry is not None and entry['mtime'] == st.st_mtime \
+                and entry['size'] == st.st_size:
+            return dict(entry['info'])
+        with open(script_file, 'rb') as f:
+            source = f.read()
+        digest = hashlib.sha1(source).hexdigest()
+        if entry is None or entry['sha1'] != digest:
+            entry = {'sha1': digest, 'info': extract(source)}
+        entry['mtime'] = st.st_mtime
+        entry['size'] = st.st_size
+        self.entries[script_file] = entry
+        self.dirty = True
+        return dict(entry['info'])
+
+    def index(self, path):
+        """Batch mode: extract (or validate) the metadata of every script
+        of a directory, then write the cache once."""
+        songs = {}
+        for script_file in glob.glob(os.path.join(path, '*.py')):
+            songs[script_file] = self.get(script_file)
+        # forget the scripts that were removed from that directory
+        directory = os.path.normpath(path)
+        with self._lock:
+            for script_file in list(self.entries):
+                if script_file not in songs and os.path.dirname(
+                        os.path.normpath(script_file)) == directory:
+                    del self.entries[script_file]
+                    self.dirty = True
+        self.save()
+        return songs
+
+    def save(self):
+        with self._lock:
+            if self.cache_file is None or not self.dirty:
+                return
+            tmp_file = None
+            try:
+                fd, tmp_file = tempfile.mkstemp(
+                    prefix=os.path.basename(self.cache_file) + '.',
+                    suffix='.tmp',
+                    dir=os.path.dirname(os.path.abspath(self.cache_file)))
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.entries, f)
+                os.chmod(tmp_file, 0o644)
+                os.rename(tmp_file, self.cache_file)
+                tmp_file = None
+                self.dirty = False
+            except (IOError, OSError) as error:
+                logger.warning('Could not save {0}: {1}'.format(
+                    self.cache_file, error))
+            finally:
+                if tmp_file is not None and os.path.exists(tmp_file):
+                    os.remove(tmp_file)
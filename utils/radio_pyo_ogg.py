@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+"""Small pure python helpers for the Ogg Vorbis files the radio plays.
+
+Only the container is looked at, so none of this needs pyo or libogg.
+"""
+
+import os
+import struct
+import hashlib
+
+PAGE_HEADER = struct.Struct('<4sBBqIIIB')
+CAPTURE = b'OggS'
+# the last page of a stream always fits in there
+TAIL_SIZE = 65536 + 27 + 255
+
+
+def _sample_rate(f):
+    """Read the sample rate from the Vorbis identification header, which
+    is alone on the first page of the stream."""
+    header = f.read(PAGE_HEADER.size)
+    capture, _, _, _, _, _, _, segments = PAGE_HEADER.unpack(header)
+    if capture != CAPTURE:
+        raise ValueError('Not an Ogg file')
+    f.seek(segments, os.SEEK_CUR)
+    packet = f.read(16)
+    if packet[:7] != b'\x01vorbis':
+        raise ValueError('Not an Ogg Vorbis file')
+    return struct.unpack('<I', packet[12:16])[0]
+
+
+def duration(filename):
+    """Length in seconds of an Ogg Vorbis file, from the granule position
+    of its last page."""
+    with open(filename, 'rb') as f:
+        rate = _sample_rate(f)
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(size - TAIL_SIZE, 0))
+        tail = f.read()
+    offset = tail.rfind(CAPTURE)
+    while offset >= 0:
+        if offset + PAGE_HEADER.size <= len(tail):
+            granule = PAGE_HEADER.unpack_from(tail, offset)[3]
+            if granule >= 0:
+                return granule / float(rate)
+        offset = tail.rfind(CAPTURE, 0, offset)
+    raise ValueError('No audio page found in {0}'.format(filename))
+
+
+def pages(f):
+    """Iterate over the pages of an open Ogg file, yielding the unpacked
+    page header, the lacing values and the page body."""
+    while True:
+        header = f.read(PAGE_HEADER.size)
+        if len(header) < PAGE_HEADER.size:
+            return
+        fields = PAGE_HEADER.unpack(header)
+        if fields[0] != CAPTURE:
+            raise ValueError('Lost sync at offset {0}'.format(
+                f.tell() - len(header)))
+        lacing = f.read(fields[7])
+        body = f.read(sum(bytearray(lacing)))
+        yield fields, lacing, body
+
+
+def audio_digest(filename):
+    """Hash of the packets and granule positions of an Ogg file. Unlike
+    a hash of the file itself, it ignores the stream serial number, which
+    the encoder picks at random for every file, so two renders of the
+    same audio give the same digest."""
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for fields, lacing, body in pages(f):
+            digest.update(struct.pack('<q', fields[3]))
+            digest.update(lacing)
+            digest.update(body)
+    return digest.hexdigest()
+
+
+def _crc_table():
+    table = []
+    for i in range(256):
+        r = i << 24
+        for _ in range(8):
+            r = ((r << 1) ^ 0x04c11db7) if r & 0x80000000 else (r << 1)
+        table.append(r & 0xffffffff)
+    return table
+
+
+CRC_TABLE = _crc_table()
+
+
+def crc32(data):
+    """The Ogg page checksum (direct CRC-32, polynomial 0x04c11db7, no
+    reflection, no final xor)."""
+    crc = 0
+    table = CRC_TABLE
+    for byte in bytearray(data):
+        crc = ((crc << 8) & 0xffffffff) ^ table[(crc >> 24) ^ byte]
+    return crc
+
+
+def make_page(header_type, granule, serial, sequence, lacing, body):
+    page = PAGE_HEADER.pack(CAPTURE, 0, header_type, granule, serial,
+                            sequence, 0, len(lacing)) + lacing + body
+    return page[:22] + struct.pack('<I', crc32(page)) + page[26:]
+
+
+def paginate(packets, serial, sequence):
+    """Lay out whole packets on as few pages as possible, the way libogg
+    flushes the header packets: granule position 0 on pages where a
+    packet ends, -1 on the others."""
+    segments = []
+    for packet in packets:
+        size = len(packet)
+        offset = 0
+        while True:
+            length = min(size - offset, 255)
+            segments.append((packet[offset:offset + length],
+                             length < 255, offset > 0))
+            offset += length
+            if length < 255:
+                break
+    result = []
+    for start in range(0, len(segments), 255):
+        chunk = segments[start:start + 255]
+        continued = 0x01 if chunk[0][2] else 0x00
+        granule = 0 if any(last for _, last, _ in chunk) else -1
+        lacing = bytes(bytearray([len(data) for data, _, _ in chunk]))
+        body = b''.join([data for data, _, _ in chunk])
+        result.append(make_page(continued, granule, serial,
+                                sequence + len(result), lacing, body))
+    return result
+
+
+def read_headers(f):
+    """Read the three Vorbis header packets at the start of the file.
+    Returns the raw first page, the comment and setup packets, the
+    stream serial number, the number of pages after the first one that
+    hold headers, and the offset where the audio pages begin."""
+    first_page = None
+    packets = []
+    current = b''
+    header_pages = 0
+    serial = None
+    for fields, lacing, body in pages(f):
+        if first_page is None:
+            serial = fields[4]
+            first_page = PAGE_HEADER.pack(*fields) + lacing + body
+        else:
+            header_pages += 1
+        offset = 0
+        for value in bytearray(lacing):
+            current += body[offset:offset + value]
+            offset += value
+            if value < 255:
+                packets.append(current)
+                current = b''
+        if len(packets) >= 3:
+            break
+    if len(packets) != 3 or current or \
+            not packets[0].startswith(b'\x01vorbis') or \
+            not packets[1].startswith(b'\x03vorbis'):
+        raise ValueError('Unexpected Vorbis headers layout')
+    return (first_page, packets[1], packets[2], serial, header_pages,
+            f.tell())
+
+
+def parse_comments(packet):
+    """Split a comment header packet into its vendor string and its list
+    of 'KEY=value' comments (as bytes)."""
+    offset = 7
+    length = struct.unpack_from('<I', packet, offset)[0]
+    vendor = packet[offset + 4:offset + 4 + length]
+    offset += 4 + length
+    count = struct.unpack_from('<I', packet, offset)[0]
+    offset += 4
+    comments = []
+    for _ in range(count):
+        length = struct.unpack_from('<I', packet, offset)[0]
+        comments.append(packet[offset + 4:offset + 4 + length])
+        offset += 4 + length
+    return vendor, comments
+
+
+def build_comments(vendor, comments):
+    packet = [b'\x03vorbis', struct.pack('<I', len(vendor)), vendor,
+              struct.pack('<I', len(comments))]
+    for comment in comments:
+        packet += [struct.pack('<I', len(comment)), comment]
+    packet.append(b'\x01')
+    return b''.join(packet)
+
+
+def _copy_range(src, dst, offset):
+    """Copy the rest of `src` from `offset` to the end of `dst` without
+    going through python buffers when the kernel allows it."""
+    count = os.fstat(src.fileno()).st_size - offset
+    dst.flush()
+    for name in ('copy_file_range', 'sendfile'):
+        copy = getattr(os, name, None)
+        if copy is None:
+            continue
+        position = offset
+        try:
+            while position - offset < count:
+                if name == 'sendfile':
+                    sent = copy(dst.fileno(), src.fileno(), position,
+                                count - (position - offset))
+                else:
+                    sent = copy(src.fileno(), dst.fileno(),
+                                count - (position - offset), position)
+                if not sent:
+                    break
+                position += sent
+        except OSError:
+            if position == offset:
+                continue
+            raise
+        dst.seek(0, os.SEEK_END)
+        return
+    src.seek(offset)
+    while True:
+        chunk = src.read(1 << 20)
+        if not chunk:
+            break
+        dst.write(chunk)
+
+
+def write_comments(src_file, dst_file, tags):
+    """Copy an Ogg Vorbis file, setting the given tags (a list of
+    (KEY, value) pairs) in its comment header. Existing comments with the
+    same keys are replaced, the others are kept.
+
+    Only the header pages are rebuilt. When they take as many pages as
+    before, which is the usual case, the audio pages are copied by the
+    kernel untouched; otherwise they are renumbered on the way."""
+    keys = set([key.upper() for key, _ in tags])
+    with open(src_file, 'rb') as src:
+        (first_page, comment, setup, serial, header_pages,
+         audio_offset) = read_headers(src)
+        vendor, comments = parse_comments(comment)
+        comments = [c for c in comments
+                    if c.split(b'=')[0].decode('utf-8', 'replace').upper()
+                    not in keys]
+        comments += [u'{0}={1}'.format(key, value).encode('utf-8')
+                     for key, value in tags]
+        new_pages = paginate([build_comments(vendor, comments), setup],
+                             serial, 1)
+        with open(dst_file, 'wb') as dst:
+            dst.write(first_page)
+            dst.write(b''.join(new_pages))
+            shift = len(new_pages) - header_pages
+            if not shift:
+                _copy_range(src, dst, audio_offset)
+                return
+            src.seek(audio_offset)
+            for fields, lacing, body in pages(src):
+                dst.write(make_page(fields[2], fields[3], fields[4],
+                                    fields[5] + shift, lacing, body))
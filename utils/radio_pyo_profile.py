@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""Where does the render time of a song go?
+
+pyo does not time its objects, and its offline loop runs in C where a
+python sampler sees nothing, so the cost of each object is measured by
+ablation instead. The song is first rendered as is (cut to a few
+seconds), with every pyo object it creates recorded along with the line
+of the song that created it. Then it is rendered again once per
+creation site, with the objects of that site stopped before the server
+starts. What a site costs is the render time it saves when it is
+silent.
+
+Stopping an object also spares whatever only it was feeding, so costs
+overlap a little and don't add up to the exact total; they are meant to
+rank the sites, not to account for every millisecond.
+
+    radio_pyo_profile.py [--truncate S] [--repeat N] [--folded FILE] song.py
+"""
+
+import os
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+import radio_pyo
+from radio_pyo_cache import script_interpreter
+
+DEFAULT_TRUNCATE = 10.
+BAR_WIDTH = 30
+
+
+def render_time(script_file, truncate, repeat, mute=()):
+    """Best render time (seconds spent in `Server.start`) over a few
+    runs, and the report of the last run."""
+    directory = tempfile.mkdtemp(prefix='radiopyo-profile')
+    report_file = os.path.join(directory, 'report.json')
+    command = script_interpreter(script_file) + [
+        radio_pyo.RENDER_RUNNER, '--seed', '1', '--truncate', str(truncate),
+        '--report', report_file, '--profile']
+    for site in mute:
+        command += ['--mute', site]
+    command += [script_file, os.path.join(directory, 'song.ogg')]
+    best = None
+    try:
+        for _ in range(repeat):
+            subprocess.check_output(command, stderr=subprocess.STDOUT,
+                                    env=radio_pyo.RENDER_ENV)
+            with open(report_file) as f:
+                report = json.load(f)
+            if best is None or report['render_time'] < best:
+                best = report['render_time']
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return best, report
+
+
+def profile(script_file, truncate=DEFAULT_TRUNCATE, repeat=1):
+    """Returns the baseline render time and a list of (cost, site,
+    {class: count}), most expensive first."""
+    total, report = render_time(script_file, truncate, repeat)
+    costs = []
+    for site, classes in report['sites'].items():
+        muted = render_time(script_file, truncate, repeat, [site])[0]
+        costs.append((max(total - muted, 0.), site, classes))
+    costs.sort(key=lambda cost: -cost[0])
+    return total, costs
+
+
+def class_costs(costs):
+    """Spread the cost of each site over its classes, by object count."""
+    by_class = {}
+    for cost, site, classes in costs:
+        count = sum(classes.values())
+        for name, number in classes.items():
+            by_class[name] = by_class.get(name, 0.) + cost * number / count
+    return sorted(by_class.items(), key=lambda item: -item[1])
+
+
+def print_report(total, costs, truncate):
+    print('{0:.3f}s to render {1:g}s of audio'.format(total, truncate))
+    print('')
+    print('by creation site:')
+    for cost, site, classes in costs:
+        share = cost / total if total else 0.
+        names = ', '.join('{0} x{1}'.format(name, number)
+                          for name, number in sorted(classes.items()))
+        print('{0:6.1%} {1:8.3f}s  {2:<32} {3:<{4}} {5}'.format(
+            share, cost, site, '#' * int(round(share * BAR_WIDTH)),
+            BAR_WIDTH, names))
+    print('')
+    print('by class:')
+    for name, cost in class_costs(costs):
+        share = cost / total if total else 0.
+        print('{0:6.1%} {1:8.3f}s  {2:<32} {3}'.format(
+            share, cost, name, '#' * int(round(share * BAR_WIDTH))))
+
+
+def write_folded(costs, folded_file):
+    """Write the costs as folded stacks (file;line;class microseconds),
+    the input format of the usual flame graph tools."""
+    with open(folded_file, 'w') as f:
+        for cost, site, classes in costs:
+            count = sum(classes.values())
+            song, line = site.rsplit(':', 1) if ':' in site else (site, '?')
+            for name, number in sorted(classes.items()):
+                f.write('{0};{1};{2} {3}\n'.format(
+                    song, line, name, int(cost * number / count * 1e6)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--truncate', type=float, default=DEFAULT_TRUNCATE,
+                        help='seconds of audio rendered per run')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='runs per measure, the fastest one counts')
+    parser.add_argument('--folded', default=None)
+    parser.add_argument('script_file')
+    args = parser.parse_args()
+    total, costs = profile(args.script_file, args.truncate, args.repeat)
+    print_report(total, costs, args.truncate)
+    if args.folded is not None:
+        write_folded(costs, args.folded)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,606 @@
+#!/usr/bin/env python
+"""Run a song script for an offline render, under the pipeline's control.
+
+    radio_pyo_run.py [--seed N] [--encoder JSON --tag KEY=VALUE...]
+                     [--status FILE --max-rtf X --grace S]
+                     [--truncate S] [--report FILE]
+                     [--profile] [--mute FILE:LINE...] [--time-callbacks]
+                     [--limits JSON]
+                     song.py output.ogg
+    radio_pyo_run.py --serve [--max-jobs N] [--max-growth MB]
+
+The song is executed as `__main__` exactly as if it had been started on
+its own, with `sys.argv` set to `[song.py, output.ogg]`. Before it runs,
+python's `random` module is seeded and pyo's `Server.boot` is wrapped so
+that the global seed of pyo's random objects is set as soon as the
+song's server exists. The same seed thus always gives the same render.
+
+Songs import the pipeline's modules (radio_pyo_score, radio_pyo_tables,
+...) directly: the directory of this file is on `sys.path` while they
+run. Anything else running songs needs it on PYTHONPATH, as ices_pyo.sh
+sets it.
+
+With `--encoder` (a JSON list, e.g. `["oggenc", "--quality", "4"]`), the
+song's `recordOptions` are redirected to a fifo carrying raw 16 bits
+PCM. Blocks are pulled from it while the offline server runs and fed to
+the encoder, which writes the tagged ogg next to the output. That file is
+renamed over the output once the last block is flushed, so no full
+length intermediate file is ever written.
+
+Streaming renders also report their progress (rendered and wall seconds)
+to the `--status` file as JSON, and are killed once they fall behind the
+`--max-rtf` budget: more wall seconds per rendered second than allowed,
+after a `--grace` period for the song's setup.
+
+With `--serve`, the runner stays up as a warm worker and renders the
+songs it is sent on stdin one after the other, each in a namespace of
+its own, which spares every render the interpreter startup and the pyo
+import (see `serve`).
+
+`--limits` (a JSON object, e.g. `{"memory": 2048, "cpu": 600}`) caps
+the address space, in megabytes, and the CPU seconds of each render.
+
+This file is run by the song's own interpreter, so it has to stay
+compatible with python 2.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import signal
+import random
+import shutil
+import threading
+import argparse
+import tempfile
+import subprocess
+import traceback
+import runpy
+import weakref
+
+# where the pipeline's modules are, which songs import without setting
+# up the path themselves
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+# pyo objects calling python functions from the audio loop, with the
+# position of the function among their arguments
+CALLBACK_OBJECTS = {'Pattern': 0, 'TrigFunc': 1, 'CallAfter': 0}
+clock = getattr(time, 'perf_counter', time.time)
+# bytes pulled from the fifo at a time
+BLOCK_SIZE = 65536
+# seconds between two progress reports
+STATUS_INTERVAL = 1.
+
+
+# what the hooks below apply to the song being run, see `reset_job`
+JOB_SETTINGS = {'script': None, 'seed': None, 'recorder': None,
+                'truncate': None, 'profile': False, 'mute': (),
+                'time_callbacks': False}
+_job = {}
+
+
+def reset_job(**settings):
+    """Start over with the given settings, and nothing recorded yet."""
+    _job.clear()
+    _job.update(JOB_SETTINGS)
+    _job.update(settings)
+    _job.update(servers=[], objects=None, render_time=None, created=[],
+                callbacks={})
+
+
+reset_job()
+
+
+def install_hooks():
+    """Wrap a few pyo methods once per process, so that every song run
+    here gets the seed, the recorder and the profiling of its own job."""
+    import pyo
+    if getattr(pyo.Server, '_radiopyo_hooks', False):
+        return
+    boot = pyo.Server.boot
+    record_options = pyo.Server.recordOptions
+    start = pyo.Server.start
+    base = getattr(pyo, 'PyoObjectBase', pyo.PyoObject)
+    init = base.__init__
+
+    def hooked_boot(self, *args, **kwargs):
+        result = boot(self, *args, **kwargs)
+        _job['servers'].append(self)
+        if _job['seed'] is not None:
+            # 0 would mean "seed from the clock" to pyo
+            self.setGlobalSeed(_job['seed'] or 1)
+        return result
+
+    def hooked_record_options(server, dur=-1, filename=None, fileformat=0,
+                              sampletype=0, **kwargs):
+        if _job['truncate'] is not None:
+            dur = min(dur, _job['truncate']) if dur > 0 else _job['truncate']
+        recorder = _job['recorder']
+        if recorder is None:
+            return record_options(server, dur=dur, filename=filename,
+                                  fileformat=fileformat,
+                                  sampletype=sampletype, **kwargs)
+        recorder.start(server.getSamplingRate(), server.getNchnls(), dur)
+        # 3 is raw samples, 0 is 16 bits integers
+        return record_options(server, dur=dur, filename=recorder.fifo,
+                              fileformat=3, sampletype=0)
+
+    def hooked_start(self, *args, **kwargs):
+        # by now the song has built its whole graph
+        _job['objects'] = count_pyo_objects()
+        for ref, site in _job['created']:
+            obj = ref()
+            if obj is not None and site in _job['mute']:
+                try:
+                    obj.stop()
+                except Exception:
+                    pass
+        started = time.time()
+        result = start(self, *args, **kwargs)
+        _job['render_time'] = time.time() - started
+        return result
+
+    def hooked_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        if _job['profile']:
+            # weakly, not to keep alive what the song lets go
+            _job['created'].append((weakref.ref(self), creation_site()))
+
+    pyo.Server.boot = hooked_boot
+    pyo.Server.recordOptions = hooked_record_options
+    pyo.Server.start = hooked_start
+    base.__init__ = hooked_init
+    for name, position in CALLBACK_OBJECTS.items():
+        if hasattr(pyo, name):
+            hook_callbacks(getattr(pyo, name), position)
+    pyo.Server._radiopyo_hooks = True
+
+
+def count_pyo_objects():
+    import gc
+    import pyo
+    base = getattr(pyo, 'PyoObjectBase', pyo.PyoObject)
+    return len([obj for obj in gc.get_objects() if isinstance(obj, base)])
+
+
+def hook_callbacks(cls, position):
+    """Time the functions given to a callback object, whether at
+    creation or later through `setFunction`."""
+    init = cls.__init__
+
+    def hooked_init(self, *args, **kwargs):
+        if _job['time_callbacks']:
+            if 'function' in kwargs:
+                kwargs['function'] = timed(kwargs['function'], cls.__name__)
+            elif len(args) > position:
+                args = list(args)
+                args[position] = timed(args[position], cls.__name__)
+        init(self, *args, **kwargs)
+
+    cls.__init__ = hooked_init
+    set_function = getattr(cls, 'setFunction', None)
+    if set_function is not None:
+        def hooked_set_function(self, function):
+            if _job['time_callbacks']:
+                function = timed(function, cls.__name__)
+            return set_function(self, function)
+
+        cls.setFunction = hooked_set_function
+
+
+def timed(function, kind):
+    """Wrap a callback so that every call is timed into the job's
+    records, under the callback's name and definition site."""
+    if isinstance(function, (list, tuple)):
+        return [timed(f, kind) for f in function]
+    if not callable(function):
+        return function
+    code = getattr(function, '__code__', None)
+    if code is not None:
+        name = '{0} {1} ({2}:{3})'.format(
+            kind, function.__name__, os.path.basename(code.co_filename),
+            code.co_firstlineno)
+    else:
+        name = '{0} {1!r}'.format(kind, function)
+    timings = _job['callbacks'].setdefault(name, [])
+
+    def timed_function(*args, **kwargs):
+        started = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings.append(clock() - started)
+
+    return timed_function
+
+
+def callback_report():
+    """Count, total, max and 99th percentile time of each callback."""
+    report = {}
+    for name, timings in _job['callbacks'].items():
+        if not timings:
+            continue
+        timings = sorted(timings)
+        report[name] = {
+            'count': len(timings), 'total': sum(timings),
+            'max': timings[-1],
+            'p99': timings[int(math.ceil(.99 * len(timings))) - 1]}
+    return report
+
+
+def creation_site():
+    """The line of the song that is creating an object, as `file:line`.
+    Objects created by pyo itself on behalf of the song (mixes, internal
+    tables...) get the song line that asked for them."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_filename == _job['script']:
+            return '{0}:{1}'.format(os.path.basename(_job['script']),
+                                    frame.f_lineno)
+        frame = frame.f_back
+    return '?'
+
+
+def profile_report():
+    """The pyo objects created by the song and still alive, counted per
+    creation site and class."""
+    sites = {}
+    for ref, site in _job['created']:
+        obj = ref()
+        if obj is None:
+            continue
+        classes = sites.setdefault(site, {})
+        name = obj.__class__.__name__
+        classes[name] = classes.get(name, 0) + 1
+    return sites
+
+
+class StreamingRecorder(object):
+    """Stands between pyo's recorder and an external encoder (see
+    `install_hooks`).
+
+    The offline server keeps the interpreter busy while it renders, so the
+    fifo is drained by a separate pump process (see `pump`), which also
+    reports progress and enforces the render budget.
+    """
+
+    def __init__(self, output_file, encoder, tags, status_file=None,
+                 max_rtf=None, grace=None):
+        self.output_file = output_file
+        self.part_file = output_file + '.part'
+        self.encoder = encoder
+        self.tags = tags
+        self.status_file = status_file
+        self.max_rtf = max_rtf
+        self.grace = grace
+        self.directory = tempfile.mkdtemp(prefix='radiopyo')
+        self.fifo = os.path.join(self.directory, 'pcm')
+        os.mkfifo(self.fifo)
+        self.process = None
+
+    def start(self, sr, nchnls, dur):
+        if self.process is not None:
+            return
+        encoder = list(self.encoder) + [
+            '--raw', '--raw-bits=16', '--raw-endianness=0',
+            '--raw-chan={0}'.format(nchnls),
+            '--raw-rate={0}'.format(int(sr))]
+        for tag in self.tags:
+            encoder += ['--comment', tag]
+        encoder += ['--output', self.part_file, '-']
+        config = {'fifo': self.fifo, 'encoder': encoder,
+                  'bytes_per_second': sr * nchnls * 2, 'duration': dur,
+                  'status_file': self.status_file, 'max_rtf': self.max_rtf,
+                  'grace': self.grace, 'render_pid': os.getpid(),
+                  'cleanup': [self.part_file, self.directory]}
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__),
+             '--pump', json.dumps(config)])
+
+    def finish(self, ok):
+        """Publish the encoded file if the song ran fine (`ok`) and the
+        encoding went fine too. Raises if only the latter failed; the
+        song's own error is the one to report otherwise."""
+        encoded = False
+        try:
+            if self.process is not None:
+                # wake up the pump if pyo never opened the fifo; this only
+                # works once the pump has opened its end
+                while self.process.poll() is None:
+                    try:
+                        os.close(os.open(self.fifo,
+                                         os.O_WRONLY | os.O_NONBLOCK))
+                        break
+                    except OSError:
+                        time.sleep(.01)
+                encoded = self.process.wait() == 0
+            if ok and encoded:
+                os.rename(self.part_file, self.output_file)
+            elif os.path.exists(self.part_file):
+                os.remove(self.part_file)
+        finally:
+            shutil.rmtree(self.directory, ignore_errors=True)
+        if ok and not encoded:
+            raise RuntimeError('Streaming render of {0} failed'.format(
+                self.output_file))
+
+
+def abort(encoder, config):
+    if encoder.poll() is None:
+        encoder.kill()
+    encoder.wait()
+    for name in config['cleanup']:
+        if os.path.isdir(name):
+            shutil.rmtree(name, ignore_errors=True)
+        elif os.path.exists(name):
+            os.remove(name)
+    return 1
+
+
+def write_status(status_file, status):
+    if status_file is None:
+        return
+    with open(status_file + '.tmp', 'w') as f:
+        json.dump(status, f)
+    os.rename(status_file + '.tmp', status_file)
+
+
+def blocks(fifo):
+    """The rendered PCM, block by block, until pyo closes the fifo."""
+    with open(fifo, 'rb') as pcm:
+        while True:
+            block = pcm.read(BLOCK_SIZE)
+            if not block:
+                return
+            yield block
+
+
+def watch_render(config):
+    """Wake the pump up if the render process dies before pyo opened the
+    fifo (e.g. killed by its limits), so that it does not wait forever."""
+    while os.getppid() == config['render_pid']:
+        time.sleep(STATUS_INTERVAL)
+    while True:
+        try:
+            os.close(os.open(config['fifo'], os.O_WRONLY | os.O_NONBLOCK))
+        except OSError:
+            # no reader, or the fifo is gone: the pump is past it
+            if not os.path.exists(config['fifo']):
+                return
+            time.sleep(.01)
+            continue
+        return
+
+
+def pump(config):
+    """Feed the encoder from the fifo, one fixed-size block at a time.
+
+    Every block tells how far the render went, which is written to the
+    status file about once per second. Past the grace period, a render
+    that needs more than `max_rtf` wall seconds per rendered second is
+    killed and its partial output removed."""
+    encoder = subprocess.Popen(config['encoder'], stdin=subprocess.PIPE)
+    status = {'state': 'rendering', 'rendered': 0., 'wall': 0.,
+              'duration': config['duration'], 'speed': None,
+              'max_rtf': config['max_rtf']}
+    started = time.time()
+    reported = started
+    received = 0
+    watchdog = threading.Thread(target=watch_render, args=(config,))
+    watchdog.daemon = True
+    watchdog.start()
+    try:
+        for block in blocks(config['fifo']):
+            encoder.stdin.write(block)
+            received += len(block)
+            now = time.time()
+            status['wall'] = now - started
+            status['rendered'] = received / float(config['bytes_per_second'])
+            if status['rendered'] > 0:
+                status['speed'] = status['rendered'] / status['wall']
+            if config['max_rtf'] is not None and \
+                    status['wall'] > config['grace'] + \
+                    config['max_rtf'] * status['rendered']:
+                status['state'] = 'aborted'
+                write_status(config['status_file'], status)
+                os.kill(config['render_pid'], signal.SIGKILL)
+                return abort(encoder, config)
+            if now - reported >= STATUS_INTERVAL:
+                reported = now
+                write_status(config['status_file'], status)
+    finally:
+        if encoder.returncode is None:
+            encoder.stdin.close()
+    if os.getppid() != config['render_pid']:
+        # the render died, nobody will collect the output
+        return abort(encoder, config)
+    status['state'] = 'encoded'
+    write_status(config['status_file'], status)
+    return encoder.wait()
+
+
+def apply_limits(limits):
+    """Limit the address space (`memory`, in megabytes) and the CPU time
+    (`cpu`, in seconds) of the render about to run. Both are counted from
+    what the process already uses, which matters to warm workers. Returns
+    what `restore_limits` needs to undo it."""
+    import resource
+    saved = []
+    if limits.get('cpu'):
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = usage.ru_utime + usage.ru_stime
+        saved.append(set_soft_limit(resource.RLIMIT_CPU,
+                                    int(math.ceil(used + limits['cpu']))))
+    if limits.get('memory'):
+        try:
+            with open('/proc/self/statm') as f:
+                size = int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+        except (IOError, OSError, ValueError):
+            size = 0
+        saved.append(set_soft_limit(resource.RLIMIT_AS,
+                                    size + int(limits['memory'] * 1048576)))
+    return saved
+
+
+def set_soft_limit(which, value):
+    import resource
+    soft, hard = resource.getrlimit(which)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    resource.setrlimit(which, (value, hard))
+    return which, soft, hard
+
+
+def restore_limits(saved):
+    import resource
+    for which, soft, hard in saved:
+        resource.setrlimit(which, (soft, hard))
+
+
+def run_song(script_file, output_file, seed=None, encoder=None, tags=(),
+             status_file=None, max_rtf=None, grace=None, truncate=None,
+             report_file=None, profile=False, mute=(),
+             time_callbacks=False, limits=None):
+    """Run a song in a namespace of its own. Whatever it changes in the
+    process (modules it imports, its servers) is undone afterwards, so
+    that another song can run in the same interpreter.
+
+    With `truncate`, at most that many seconds are rendered. The report
+    file, if any, receives a few facts about the render as JSON. With
+    `profile`, these include the creation sites of the pyo objects, and
+    the objects created at the `mute` sites are stopped before the server
+    starts (see radio_pyo_profile.py). With `time_callbacks`, they include
+    the time spent in each python function called from the audio loop.
+    `limits` are the resource limits of the render, see `apply_limits`."""
+    install_hooks()
+    if seed is not None:
+        random.seed(seed)
+    recorder = None
+    if encoder:
+        recorder = StreamingRecorder(output_file, encoder, tags,
+                                     status_file, max_rtf, grace)
+    reset_job(script=script_file, seed=seed, recorder=recorder,
+              truncate=truncate, profile=profile or bool(mute), mute=mute,
+              time_callbacks=time_callbacks)
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    saved_modules = set(sys.modules)
+    sys.argv = [script_file, output_file]
+    # the song's own directory, as if it was run on its own, and the
+    # pipeline's modules songs import (e.g. radio_pyo_tables)
+    sys.path[:0] = [os.path.dirname(os.path.abspath(script_file)), UTILS_DIR]
+    saved_limits = apply_limits(limits or {})
+    ok = False
+    try:
+        # kept until the report is written, along with the song's objects
+        namespace = runpy.run_path(script_file, run_name='__main__')
+        ok = True
+        if report_file is not None:
+            report = {'objects': _job['objects'],
+                      'render_time': _job['render_time']}
+            if _job['profile']:
+                report['sites'] = profile_report()
+            if _job['time_callbacks']:
+                report['callbacks'] = callback_report()
+            with open(report_file, 'w') as f:
+                json.dump(report, f)
+    finally:
+        try:
+            if recorder is not None:
+                recorder.finish(ok)
+        finally:
+            for server in _job['servers']:
+                try:
+                    server.shutdown()
+                except Exception:
+                    pass
+            reset_job()
+            restore_limits(saved_limits)
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            for name in set(sys.modules) - saved_modules:
+                del sys.modules[name]
+
+
+def resident_memory():
+    """Current resident set size of this process, in bytes."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError):
+        import resource
+        # the peak rather than the current size, in kilobytes on linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def serve(parser, max_jobs, max_growth):
+    """Warm worker mode: pyo is imported once, then each line read on
+    stdin is the (JSON) argument list of a render, answered by one JSON
+    line on stdout. The worker quits after `max_jobs` renders, or when it
+    grew by more than `max_growth` megabytes since it started."""
+    # anything the songs print goes to stderr, away from the replies
+    replies = os.fdopen(os.dup(1), 'w')
+    os.dup2(2, 1)
+    import pyo
+    # kept across jobs, along with the tables it maps
+    import radio_pyo_tables
+    baseline = resident_memory()
+    jobs = 0
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            return
+        jobs += 1
+        reply = {'ok': True}
+        try:
+            run_args(parser.parse_args(json.loads(line)))
+        except (Exception, SystemExit):
+            reply = {'ok': False, 'error': traceback.format_exc()}
+        growth = (resident_memory() - baseline) / 1048576.
+        reply['retire'] = jobs >= max_jobs or growth > max_growth
+        replies.write(json.dumps(reply) + '\n')
+        replies.flush()
+        if reply['retire']:
+            return
+
+
+def run_args(args):
+    run_song(args.script_file, args.output_file, args.seed, args.encoder,
+             args.tag, args.status, args.max_rtf, args.grace, args.truncate,
+             args.report, args.profile, args.mute, args.time_callbacks,
+             args.limits)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--encoder', type=json.loads, default=None)
+    parser.add_argument('--tag', action='append', default=[])
+    parser.add_argument('--status', default=None)
+    parser.add_argument('--max-rtf', type=float, default=None)
+    parser.add_argument('--grace', type=float, default=30.)
+    parser.add_argument('--truncate', type=float, default=None)
+    parser.add_argument('--report', default=None)
+    parser.add_argument('--profile', action='store_true')
+    parser.add_argument('--mute', action='append', default=[])
+    parser.add_argument('--time-callbacks', action='store_true')
+    parser.add_argument('--limits', type=json.loads, default=None)
+    parser.add_argument('--pump', type=json.loads, default=None,
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--serve', action='store_true')
+    parser.add_argument('--max-jobs', type=int, default=20)
+    parser.add_argument('--max-growth', type=float, default=256.)
+    parser.add_argument('script_file', nargs='?')
+    parser.add_argument('output_file', nargs='?')
+    args = parser.parse_args()
+    if args.pump is not None:
+        sys.exit(pump(args.pump))
+    if args.serve:
+        serve(parser, args.max_jobs, args.max_growth)
+        return
+    if args.output_file is None:
+        parser.error('a song script and an output file are needed')
+    run_args(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""Resource limits for song renders, and what follows when one fails.
+
+Renders run contributed code, so each one gets an address space and CPU
+time limit (applied by radio_pyo_run.py itself, see `--limits`), a lower
+CPU and IO priority, and optionally a cgroup of its own through
+systemd-run. A failed render is classified from the way its process
+ended, and the song is kept away from the renderers for a while, longer
+after each failure in a row.
+"""
+
+import os
+import json
+import time
+import fcntl
+import shutil
+import signal
+import tempfile
+import threading
+import contextlib
+
+MEMORY = 'memory'
+CPU = 'cpu'
+TIMEOUT = 'timeout'
+BUDGET = 'budget'
+CRASH = 'crash'
+ERROR = 'error'
+
+
+def command_prefix(nice=None, ionice=None, cgroup=None):
+    """What to put in front of a render command for the given priorities
+    and cgroup properties (e.g. {'MemoryMax': '2G'}). Tools that are not
+    installed are skipped."""
+    prefix = []
+    if cgroup and shutil.which('systemd-run'):
+        prefix += ['systemd-run', '--user', '--scope', '--quiet']
+        for name, value in sorted(cgroup.items()):
+            prefix += ['-p', '{0}={1}'.format(name, value)]
+    if ionice is not None and shutil.which('ionice'):
+        prefix += ['ionice', '-c', str(ionice)]
+    if nice:
+        prefix += ['nice', '-n', str(nice)]
+    return prefix
+
+
+def classify(returncode, output=None, status=None, killed=None,
+             limits=None):
+    """Why a render failed, from its exit status, its output and its
+    progress report (see radio_pyo_run.py). `killed` is the reason the
+    pipeline itself killed the render for (e.g. TIMEOUT), if it did, and
+    `limits` the limits it ran under (see radio_pyo.render_ogg): a
+    SIGKILL only means memory if one of them could have sent it."""
+    if killed is not None:
+        return killed
+    if status is not None and status.get('state') == 'aborted':
+        return BUDGET
+    if isinstance(output, bytes):
+        output = output.decode('utf-8', 'replace')
+    if output and 'MemoryError' in output:
+        return MEMORY
+    if returncode is not None and returncode < 0:
+        if -returncode == signal.SIGXCPU:
+            return CPU
+        # the address space limit makes allocations fail, only a cgroup
+        # memory cap gets the render killed by the kernel
+        if -returncode == signal.SIGKILL and memory_capped(limits):
+            return MEMORY
+        return CRASH
+    return ERROR
+
+
+def memory_capped(limits):
+    """Whether the kernel kills renders under these limits when they use
+    too much memory."""
+    cgroup = (limits or {}).get('cgroup') or {}
+    return any(name in cgroup for name in
+               ('MemoryMax', 'MemoryHigh', 'MemoryLimit', 'MemorySwapMax'))
+
+
+@contextlib.contextmanager
+def file_lock(lock_file):
+    """Hold an exclusive lock on a file, across processes."""
+    with open(lock_file, 'a') as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class FailureLog(object):
+    """Songs whose last renders failed, and until when to leave them
+    alone. Shared by every process rendering in the same directory, which
+    take turns updating it through a lock file next to it."""
+
+    def __init__(self, filename, backoff=600., max_backoff=86400.):
+        self.filename = filename
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock:
+            with file_lock(self.filename + '.lock'):
+                yield
+
+    def _load(self):
+        try:
+            with open(self.filename) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return {}
+
+    def _save(self, entries):
+        fd, tmp_file = tempfile.mkstemp(
+            prefix=os.path.basename(self.filename) + '.', suffix='.tmp',
+            dir=os.path.dirname(os.path.abspath(self.filename)))
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f)
+            os.chmod(tmp_file, 0o644)
+            os.rename(tmp_file, self.filename)
+        except BaseException:
+            os.remove(tmp_file)
+            raise
+
+    def record(self, script_file, kind):
+        with self._locked():
+            entries = self._load()
+            entry = entries.get(script_file, {'count': 0})
+            entry['count'] += 1
+            entry['kind'] = kind
+            entry['time'] = time.time()
+            entry['until'] = entry['time'] + min(
+                self.backoff * 2 ** (entry['count'] - 1), self.max_backoff)
+            entries[script_file] = entry
+            self._save(entries)
+            return entry
+
+    def clear(self, script_file):
+        with self._locked():
+            entries = self._load()
+            if entries.pop(script_file, None) is not None:
+                self._save(entries)
+
+    def backoff_until(self, script_file):
+        """When the song may be rendered again, or None if it may now."""
+        entry = self._load().get(script_file)
+        if entry is None or entry['until'] <= time.time():
+            return None
+        return entry['until']
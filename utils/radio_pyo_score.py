@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""Score engine: run the sections of a song at their times.
+
+Songs used to drive their form from a `Pattern` ticking every half
+second, counting the ticks in a global and walking an if/elif chain to
+find what to do, if anything, at each one. A `Score` knows the times of
+its sections instead, sorted once, and only wakes up when the next one
+is due:
+
+    mainp = Score(server=s)
+
+    @mainp.at(0)
+    def at_0():
+        intro.out()
+
+    @mainp.at(32.5)
+    def at_32_5():
+        intro.stop()
+        beat.out()
+
+    mainp.play()
+
+A timeline can also be given whole, as `Score({0: [f, g], 12: h})`.
+
+The wake-ups come from one `Pattern`, made by `play()` and set after
+each wake-up for the next section's time. Being made by the song's own
+code, it is one of the song's objects for whoever runs the song (e.g.
+the live engine, which stops it along with the others). Given the
+song's server, delays are measured from the samples it actually
+processed, so the blocks a wake-up can be late by don't add up over the
+song; sections then start on the block their time falls in, whatever it
+is, instead of the next half second tick.
+
+This file is imported by the songs' own interpreters, so it has to stay
+compatible with python 2.
+"""
+
+# sections this close to a wake-up are due at it
+EPSILON = 1e-9
+
+
+class Score(object):
+
+    def __init__(self, timeline=None, server=None):
+        self.server = server
+        self.timeline = {}
+        for time, actions in (timeline or {}).items():
+            if callable(actions):
+                actions = [actions]
+            for action in actions:
+                self.add(time, action)
+        self.times = []
+        self.actions = []
+        self.index = 0
+        self._due = 0.
+        self._start = None
+        self._caller = None
+        self._starting = False
+
+    def add(self, time, action):
+        self.timeline.setdefault(float(time), []).append(action)
+
+    def at(self, time):
+        """Decorator adding a function to the score at `time` seconds."""
+        def decorator(action):
+            self.add(time, action)
+            return action
+        return decorator
+
+    def _clock(self):
+        """Seconds since the score started, from the server when it can
+        tell, or else the time the current wake-up was set for."""
+        if self.server is not None:
+            try:
+                samples = self.server.getCurrentTimeInSamples()
+                sr = self.server.getSamplingRate()
+            except AttributeError:
+                self.server = None
+            else:
+                if self._start is None:
+                    self._start = samples
+                return (samples - self._start) / float(sr)
+        return self._due
+
+    def play(self):
+        self.times = sorted(self.timeline)
+        self.actions = [self.timeline[time] for time in self.times]
+        self.index = 0
+        self._due = 0.
+        self._start = None
+        self.stop()
+        delay = self._run_due()
+        if delay is not None:
+            if self._caller is None:
+                from pyo import Pattern
+                self._caller = Pattern(self._wake, time=delay)
+            else:
+                self._caller.setTime(delay)
+            # a Pattern calls back as soon as it starts, which is not a
+            # wake-up: the delay is counted from there
+            self._starting = True
+            self._caller.play()
+        return self
+
+    def stop(self):
+        if self._caller is not None:
+            self._caller.stop()
+        return self
+
+    def _run_due(self):
+        """Run the sections due now, and return the delay until the next
+        one, or None if there is none left."""
+        now = self._clock()
+        while self.index < len(self.times) and \
+                self.times[self.index] <= now + EPSILON:
+            for action in self.actions[self.index]:
+                action()
+            self.index += 1
+        if self.index == len(self.times):
+            return None
+        self._due = self.times[self.index]
+        return self._due - now
+
+    def _wake(self):
+        if self._starting:
+            # the score's time starts with its first block, which may be
+            # long after play() (e.g. a live song held while it loads)
+            self._starting = False
+            self._start = None
+            self._clock()
+            return
+        delay = self._run_due()
+        if delay is None:
+            self._caller.stop()
+        else:
+            self._caller.setTime(delay)
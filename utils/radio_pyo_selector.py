@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Resident song selector for ices2.
+
+Keeps the catalog of rendered songs, the locked songs and the play
+history in memory (see `radio_pyo_catalog`), and answers
+`radio_pyo_client` requests on a Unix-domain socket. The chosen path is
+sent back before the stamp and the web player infos are written, so the
+track change only waits for the in-memory draw and a one line append to
+the history log.
+"""
+
+import os
+import socket
+import logging
+
+import radio_pyo
+from radio_pyo_client import SELECTOR_SOCKET
+from radio_pyo_catalog import Catalog
+
+logger = logging.getLogger(__name__)
+
+
+class Selector(object):
+
+    def __init__(self, path=None):
+        self.path = path or radio_pyo.RADIOPYO_PATH
+        variants_path = None
+        if radio_pyo.VARIANT_POOL_SIZE:
+            variants_path = os.path.join(self.path, radio_pyo.VARIANTS_DIR)
+        self.catalog = Catalog(self.path, radio_pyo.queue_history(),
+                               variants_path=variants_path)
+
+    def choose(self):
+        self.catalog.sync()
+        return self.catalog.choose()
+
+    def played(self, song):
+        """Bookkeeping for a song that has been handed to ices2."""
+        logger.debug('Selected song: {0}'.format(song))
+        radio_pyo.announce_song(
+            song, self.catalog.info(song, radio_pyo.read_render_info))
+
+    def serve(self, socket_file=SELECTOR_SOCKET):
+        if os.path.exists(socket_file):
+            os.remove(socket_file)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_file)
+        server.listen(8)
+        while True:
+            conn, _ = server.accept()
+            song = None
+            try:
+                command = conn.makefile('rb').readline().strip()
+                if command == b'next':
+                    song = self.choose()
+                    conn.sendall(song.encode('utf-8') + b'\n')
+                else:
+                    conn.sendall(b'\n')
+            except Exception:
+                logger.exception('Selection failed')
+            finally:
+                conn.close()
+            if song is not None:
+                try:
+                    self.played(song)
+                except Exception:
+                    logger.exception('Could not announce {0}'.format(song))
+
+
+def main():
+    Selector().serve()
+
+
+if __name__ == '__main__':
+    main()
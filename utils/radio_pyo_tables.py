@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+"""Binary store of the sample tables songs would otherwise inline.
+
+A song carrying a few thousand float literals pays for them on every
+render: the parser boxes each one, the list is kept in the namespace,
+and `DataTable(init=...)` copies it once more. Such tables are kept
+instead as raw little-endian 32 bits floats in `tables/<sha1>.f32`, next
+to the songs, and the song loads them by digest:
+
+    from radio_pyo_tables import load_table
+    wave = load_table('3f786850e387550fdab836ed7e6dc881de23001b', DataTable)
+
+The file is memory-mapped once per process and copied straight into the
+table's own buffer. Since the digest is part of the script, a table that
+changes makes a new render key (see radio_pyo_cache.py).
+
+    radio_pyo_tables.py song.py VARIABLE
+
+stores the list assigned to VARIABLE at the top of song.py and prints
+its digest. This file is imported by the songs' own interpreters, so it
+has to stay compatible with python 2.
+"""
+
+import os
+import sys
+import ast
+import mmap
+import array
+import hashlib
+import tempfile
+import argparse
+
+TABLES_DIR = 'tables'
+TABLE_EXT = '.f32'
+
+_mapped = {}
+
+
+def song_directory(name):
+    """A directory next to the song being run (`sys.argv[0]`, under the
+    runner as when a song is started on its own)."""
+    return os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), name)
+
+
+def save_samples(filename, data):
+    """Write samples (bytes) to a store or cache file, atomically. Each
+    writer has a temporary file of its own, as concurrent renders may
+    write the same one."""
+    directory = os.path.dirname(filename)
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # another render created it meanwhile
+            if not os.path.isdir(directory):
+                raise
+    fd, tmp_file = tempfile.mkstemp(
+        prefix=os.path.basename(filename) + '.', suffix='.tmp',
+        dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # readable by the other users rendering, as a plain open() would
+        os.chmod(tmp_file, 0o644)
+        os.rename(tmp_file, filename)
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+
+
+def store_table(samples, directory=None):
+    """Store a list of floats, returns its digest."""
+    data = array.array('f', samples)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    data = data.tostring() if sys.version_info[0] < 3 else data.tobytes()
+    digest = hashlib.sha1(data).hexdigest()
+    filename = os.path.join(directory or song_directory(TABLES_DIR),
+                            digest + TABLE_EXT)
+    if not os.path.exists(filename):
+        save_samples(filename, data)
+    return digest
+
+
+def table_samples(digest, directory=None, size=None):
+    """The stored bytes of a table, mapped read-only. Raises ValueError,
+    and keeps nothing mapped, if the file does not hold whole samples,
+    or `size` of them when given."""
+    mapped = _mapped.get(digest)
+    if mapped is None:
+        filename = os.path.join(directory or song_directory(TABLES_DIR),
+                                digest + TABLE_EXT)
+        with open(filename, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mapped) % 4:
+            mapped.close()
+            raise ValueError('{0} is truncated'.format(filename))
+        _mapped[digest] = mapped
+    if size is not None and len(mapped) != size * 4:
+        raise ValueError('{0} holds {1} samples, not {2}'.format(
+            digest, len(mapped) // 4, size))
+    return mapped
+
+
+def unpack(mapped):
+    """The samples of a mapped table, as an array of floats."""
+    samples = array.array('f')
+    if sys.version_info[0] < 3:
+        samples.fromstring(mapped[:])
+    else:
+        samples.frombytes(mapped)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples
+
+
+def table_bytes(table):
+    """The samples of a 32 bits table as stored bytes, or None when its
+    buffer can't be read that way."""
+    if sys.version_info[0] < 3 or sys.byteorder != 'little':
+        return None
+    try:
+        view = memoryview(table.getBuffer())
+    except (AttributeError, TypeError):
+        return None
+    if view.format != 'f':
+        return None
+    return view.tobytes()
+
+
+def fill_table(table, data):
+    """Copy stored bytes into a table of the same size through its buffer.
+    Returns False when the table has no such buffer (python 2, double
+    precision, old pyo)."""
+    if sys.version_info[0] < 3 or sys.byteorder != 'little':
+        return False
+    try:
+        view = memoryview(table.getBuffer())
+    except (AttributeError, TypeError):
+        return False
+    if view.format != 'f' or view.nbytes != len(data):
+        return False
+    view.cast('B')[:] = memoryview(data).cast('B')
+    # the buffer stops before the guard point after the last sample, which
+    # interpolating readers expect to be the first one again
+    table.rotate(0)
+    return True
+
+
+def load_table(digest, table_class=None, directory=None):
+    """A one channel `DataTable` (or `table_class`, e.g. pyo64's) holding
+    the stored samples."""
+    if table_class is None:
+        from pyo import DataTable as table_class
+    mapped = table_samples(digest, directory)
+    table = table_class(size=len(mapped) // 4)
+    if not fill_table(table, mapped):
+        table.replace(unpack(mapped).tolist())
+    return table
+
+
+def _scan_literal(source, name):
+    """Find the assignment line by line, for scripts this python can't
+    parse (python 2 songs)."""
+    lines = source.decode('utf-8', 'replace').splitlines()
+    for number, line in enumerate(lines):
+        target, _, value = line.partition('=')
+        if target.strip() != name or not value.strip():
+            continue
+        for end in range(number, len(lines)):
+            try:
+                return ast.literal_eval(
+                    '\n'.join([value] + lines[number + 1:end + 1]).strip())
+            except SyntaxError:
+                pass
+    raise KeyError(name)
+
+
+def literal_table(script_file, name):
+    """The list assigned to `name` at the top level of a script."""
+    with open(script_file, 'rb') as f:
+        source = f.read()
+    try:
+        tree = ast.parse(source, script_file)
+    except SyntaxError:
+        return [float(value) for value in _scan_literal(source, name)]
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == name
+                for target in node.targets):
+            return [float(value) for value in ast.literal_eval(node.value)]
+    raise KeyError(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--directory', default=None,
+                        help='store (default: tables/ next to the song)')
+    parser.add_argument('script_file')
+    parser.add_argument('name')
+    args = parser.parse_args()
+    samples = literal_table(args.script_file, args.name)
+    directory = args.directory or os.path.join(
+        os.path.dirname(os.path.abspath(args.script_file)), TABLES_DIR)
+    print('{0} ({1} samples)'.format(store_table(samples, directory),
+                                     len(samples)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""Transforms of table samples for song authors.
+
+Preparing a table in python, one `get` and one `append` per sample,
+boxes every sample and can take longer than the render itself. These
+helpers take the samples of a table in one go (its buffer, or
+`getTable` without one), transform whole arrays, and write the result
+straight into a new table's buffer:
+
+    from radio_pyo_transforms import read_table, overlap_stretch, write_table
+    stretched = write_table(overlap_stretch(read_table(snd), 10), DataTable)
+
+With NumPy, samples are float64 arrays and the transforms are
+vectorized. Without it (the songs' interpreter may not have it), the
+same functions work on lists of floats, with the same results. Either
+way the arithmetic is done in double precision, as a song doing it
+itself in python would.
+
+This file is imported by the songs' own interpreters, so it has to stay
+compatible with python 2.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def read_table(table, chnl=0):
+    """The samples of one channel of a pyo table."""
+    size = table.getSize()
+    if isinstance(size, list):
+        size = size[chnl]
+    if numpy is not None and hasattr(table, 'getBuffer'):
+        buffers = table.getBuffer()
+        if isinstance(buffers, list):
+            buffers = buffers[chnl]
+        return numpy.array(numpy.asarray(buffers)[:size], dtype=numpy.float64)
+    samples = table.getTable(all=True) if chnl else table.getTable()
+    if chnl:
+        samples = samples[chnl]
+    if numpy is not None:
+        return numpy.array(samples, dtype=numpy.float64)
+    return list(samples)
+
+
+def write_table(samples, table_class=None):
+    """A one channel `DataTable` (or `table_class`, e.g. pyo64's) holding
+    the samples."""
+    if table_class is None:
+        from pyo import DataTable as table_class
+    if numpy is None:
+        return table_class(size=len(samples), init=list(samples))
+    table = table_class(size=len(samples))
+    try:
+        buffer = table.getBuffer()
+    except AttributeError:
+        table.replace(numpy.asarray(samples).tolist())
+        return table
+    numpy.asarray(buffer)[:len(samples)] = samples
+    # the buffer stops before the guard point, see radio_pyo_tables
+    table.rotate(0)
+    return table
+
+
+def overlap_stretch(samples, rounds=1):
+    """Make the samples half as long again per round: the second half is
+    mixed with the first one, and followed by a copy of itself."""
+    for _ in range(rounds):
+        length = len(samples)
+        half = length // 2
+        if numpy is not None:
+            samples = numpy.asarray(samples, dtype=numpy.float64)
+            middle = (samples[half:] + samples[:length - half]) * 0.5
+            samples = numpy.concatenate(
+                (samples[:half], middle, samples[length - half:]))
+        else:
+            middle = [(a + b) * 0.5 for a, b in zip(samples[half:], samples)]
+            samples = samples[:half] + middle + samples[length - half:]
+    return samples
+
+
+def crossfade(first, second, length):
+    """Join two sample arrays, the last `length` samples of the first
+    fading linearly into the first `length` samples of the second."""
+    length = min(length, len(first), len(second))
+    if length == 0:
+        if numpy is not None:
+            return numpy.concatenate((numpy.asarray(first, numpy.float64),
+                                      numpy.asarray(second, numpy.float64)))
+        return list(first) + list(second)
+    if numpy is not None:
+        first = numpy.asarray(first, dtype=numpy.float64)
+        second = numpy.asarray(second, dtype=numpy.float64)
+        ramp = numpy.arange(1, length + 1) / float(length + 1)
+        mixed = first[len(first) - length:] * (1 - ramp) + \
+            second[:length] * ramp
+        return numpy.concatenate(
+            (first[:len(first) - length], mixed, second[length:]))
+    ramp = [i / float(length + 1) for i in range(1, length + 1)]
+    mixed = [a * (1 - r) + b * r for a, b, r
+             in zip(first[len(first) - length:], second, ramp)]
+    return list(first[:len(first) - length]) + mixed + list(second[length:])
+
+
+def normalize(samples, peak=1.):
+    """Scale the samples so that the loudest one is at `peak`. Silence is
+    left alone."""
+    if numpy is not None:
+        samples = numpy.asarray(samples, dtype=numpy.float64)
+        loudest = numpy.abs(samples).max() if len(samples) else 0.
+        return samples * (peak / loudest) if loudest else samples.copy()
+    loudest = max([abs(sample) for sample in samples] or [0.])
+    if not loudest:
+        return list(samples)
+    return [sample * (peak / loudest) for sample in samples]
+
+
+def resample(samples, size):
+    """The samples stretched or squeezed to `size`, linearly
+    interpolated."""
+    length = len(samples)
+    if length < 2 or size < 2:
+        return (numpy.resize(numpy.asarray(samples, numpy.float64), size)
+                if numpy is not None else
+                (list(samples) * size)[:size])
+    step = (length - 1) / float(size - 1)
+    if numpy is not None:
+        samples = numpy.asarray(samples, dtype=numpy.float64)
+        return numpy.interp(numpy.arange(size) * step,
+                            numpy.arange(length), samples)
+    resampled = []
+    for i in range(size):
+        position = i * step
+        index = min(int(position), length - 2)
+        fraction = position - index
+        resampled.append(samples[index] * (1 - fraction) +
+                         samples[index + 1] * fraction)
+    return resampled
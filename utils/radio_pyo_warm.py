@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""Warm render workers.
+
+Starting an interpreter and importing pyo takes longer than rendering a
+short jingle. A warm worker is `radio_pyo_run.py --serve` kept running
+under a song interpreter: it has pyo imported already and renders the
+songs it is given one after the other, each in a namespace of its own.
+Workers retire themselves after a number of renders or when their
+memory grew too much.
+
+Workers are started ahead of the renders (see `WarmPool.prefork`), so
+that their startup overlaps whatever comes before, and a worker that
+retires is replaced right away. Each one runs in a process group of its
+own, along with the pump and encoder of its render, so that killing it
+leaves nothing behind writing to the output.
+"""
+
+import os
+import json
+import signal
+import select
+import threading
+import subprocess
+import logging
+
+logger = logging.getLogger(__name__)
+
+# seconds given to a worker that stopped answering to exit by itself
+EXIT_TIMEOUT = 1.
+
+
+class WarmWorker(object):
+
+    def __init__(self, interpreter, runner, max_jobs, max_growth, env=None,
+                 prefix=()):
+        self.command = list(prefix) + list(interpreter) + [
+            runner, '--serve', '--max-jobs', str(max_jobs),
+            '--max-growth', str(max_growth)]
+        self.process = subprocess.Popen(self.command, stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, env=env,
+                                        start_new_session=True)
+        self.alive = True
+
+    def render(self, args, timeout=None):
+        """Render with the given runner arguments. Failures raise the same
+        exceptions as `subprocess.check_output` would for a cold run."""
+        command = self.command + args
+        try:
+            self.process.stdin.write(
+                json.dumps(args).encode('utf-8') + b'\n')
+            self.process.stdin.flush()
+        except (IOError, OSError):
+            self.kill()
+            raise subprocess.CalledProcessError(-1, command)
+        ready = select.select([self.process.stdout], [], [], timeout)[0]
+        if not ready:
+            self.kill()
+            raise subprocess.TimeoutExpired(command, timeout)
+        line = self.process.stdout.readline()
+        if not line:
+            # killed by its render budget or its limits, or crashed
+            try:
+                returncode = self.process.wait(EXIT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                # hung on its way out: the SIGKILL below is ours, not
+                # what ended the render
+                returncode = -1
+            self.kill()
+            raise subprocess.CalledProcessError(returncode, command)
+        reply = json.loads(line.decode('utf-8'))
+        if reply['retire']:
+            self.alive = False
+            self.process.stdin.close()
+            self.process.wait()
+        if not reply['ok']:
+            raise subprocess.CalledProcessError(1, command,
+                                                output=reply['error'])
+
+    def kill(self):
+        """Kill the worker and whatever it started, even if the worker
+        itself is already gone."""
+        self.alive = False
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        self.process.wait()
+
+    def close(self):
+        if self.alive:
+            self.alive = False
+            self.process.stdin.close()
+            self.process.wait()
+
+
+class WarmPool(object):
+    """Idle warm workers, per interpreter. A render takes one or starts a
+    new one, and gives it back when done if it is still alive, so there
+    are never more workers than concurrent renders, or than were asked
+    for by `prefork`."""
+
+    def __init__(self, runner, max_jobs=20, max_growth=256., env=None,
+                 prefix=()):
+        self.runner = runner
+        self.max_jobs = max_jobs
+        self.max_growth = max_growth
+        self.env = env
+        # run in front of the interpreter, e.g. nice
+        self.prefix = prefix
+        self._idle = {}
+        # workers kept per interpreter, idle or rendering
+        self._ready = {}
+        self._busy = {}
+        self._lock = threading.Lock()
+
+    def _start(self, interpreter):
+        logger.debug('starting a warm worker for {0}'.format(
+            ' '.join(interpreter)))
+        return WarmWorker(interpreter, self.runner, self.max_jobs,
+                          self.max_growth, self.env, self.prefix)
+
+    def prefork(self, interpreter, count):
+        """Start workers for an interpreter until there are `count` of
+        them, and keep that many from now on. They import pyo while the
+        caller goes on."""
+        key = tuple(interpreter)
+        with self._lock:
+            self._ready[key] = max(self._ready.get(key, 0), count)
+        self._top_up(key)
+
+    def _top_up(self, key):
+        while True:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                idle[:] = [worker for worker in idle
+                           if worker.process.poll() is None]
+                if len(idle) + self._busy.get(key, 0) >= \
+                        self._ready.get(key, 0):
+                    return
+                # counted while it starts
+                self._busy[key] = self._busy.get(key, 0) + 1
+            worker = self._start(list(key))
+            with self._lock:
+                self._busy[key] -= 1
+                self._idle[key].append(worker)
+
+    def render(self, interpreter, args, timeout=None):
+        key = tuple(interpreter)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            worker = idle.pop() if idle else None
+            self._busy[key] = self._busy.get(key, 0) + 1
+        if worker is None or worker.process.poll() is not None:
+            worker = self._start(interpreter)
+        try:
+            worker.render(args, timeout)
+        finally:
+            with self._lock:
+                self._busy[key] -= 1
+                if worker.alive:
+                    self._idle[key].append(worker)
+            if not worker.alive:
+                # replace it before the next render needs it
+                self._top_up(key)
+
+    def close(self):
+        with self._lock:
+            workers = [worker for idle in self._idle.values()
+                       for worker in idle]
+            self._idle = {}
+        for worker in workers:
+            worker.close()
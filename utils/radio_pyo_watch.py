@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""Directory change notification for the long-running radiopyo processes.
+
+On Linux this talks to inotify through ctypes, so no extra package is
+needed. Anywhere else (or if inotify cannot be initialised) it falls back
+to comparing directory listings, but only when the directory mtime moves.
+"""
+
+import os
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+import logging
+
+logger = logging.getLogger(__name__)
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+
+WATCH_MASK = (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CLOSE_WRITE)
+EVENT_HEADER = struct.Struct('iIII')
+
+# event kinds handed out to the callers
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+OVERFLOW = 'overflow'
+
+
+def _load_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6',
+                           use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class Watcher(object):
+    """Watch a single directory (non recursive) for file changes.
+
+    `wait(timeout)` blocks for at most `timeout` seconds (None means
+    forever) and returns a list of `(kind, path)` tuples. A single
+    `(OVERFLOW, None)` event means the caller lost track and should
+    rescan the directory.
+    """
+
+    def __init__(self, path, poll_interval=1.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._fd = None
+        self._buffer = b''
+        libc = _load_libc()
+        if libc is not None:
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                wd = libc.inotify_add_watch(
+                    fd, os.fsencode(path), WATCH_MASK)
+                if wd >= 0:
+                    self._fd = fd
+                else:
+                    os.close(fd)
+        if self._fd is None:
+            logger.debug('inotify unavailable, polling {0}'.format(path))
+            self._mtime = None
+            self._listing = self._snapshot()
+
+    def fileno(self):
+        return self._fd
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def wait(self, timeout=None):
+        if self._fd is not None:
+            return self._wait_inotify(timeout)
+        return self._wait_poll(timeout)
+
+    def _wait_inotify(self, timeout):
+        if timeout is not None:
+            timeout = max(timeout, 0)
+        try:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+        except InterruptedError:
+            return []
+        if not ready:
+            return []
+        events = []
+        while True:
+            try:
+                chunk = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer, b''
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            end = offset + EVENT_HEADER.size + length
+            if end > len(data):
+                self._buffer = data[offset:]
+                break
+            name = data[offset + EVENT_HEADER.size:end].rstrip(b'\0')
+            offset = end
+            if mask & IN_Q_OVERFLOW:
+                return [(OVERFLOW, None)]
+            full_name = os.path.join(self.path, os.fsdecode(name))
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                events.append((ADDED, full_name))
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                events.append((REMOVED, full_name))
+            elif mask & IN_CLOSE_WRITE:
+                events.append((CHANGED, full_name))
+        return events
+
+    def _snapshot(self):
+        try:
+            self._mtime = os.stat(self.path).st_mtime
+            names = os.listdir(self.path)
+        except OSError:
+            return {}
+        listing = {}
+        for name in names:
+            full_name = os.path.join(self.path, name)
+            try:
+                listing[full_name] = os.stat(full_name).st_mtime
+            except OSError:
+                pass
+        return listing
+
+    def _wait_poll(self, timeout):
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            try:
+                changed = os.stat(self.path).st_mtime != self._mtime
+            except OSError:
+                changed = False
+            if changed:
+                break
+            remaining = self.poll_interval
+            if deadline is not None:
+                remaining = min(remaining, deadline - time.time())
+                if remaining <= 0:
+                    return []
+            time.sleep(remaining)
+        old, self._listing = self._listing, self._snapshot()
+        events = [(REMOVED, name) for name in old if name not in self._listing]
+        for name, mtime in self._listing.items():
+            if name not in old:
+                events.append((ADDED, name))
+            elif old[name] != mtime:
+                events.append((CHANGED, name))
+        return events
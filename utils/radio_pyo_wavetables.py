@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""Wavetables shared by the objects of a song, and across renders.
+
+Harmonic tables (`HarmTable`, `SawTable`, `SquareTable`, or a song's own
+subclass) are computed by additive synthesis when they are created: a
+24000 samples table of 50 harmonics is more than a million sines, paid
+again by every instrument that builds the same one. Songs ask for them
+here instead:
+
+    from radio_pyo_wavetables import shared_table
+    saw = shared_table(SawTable, order=50, size=24000, normalize=True)
+
+The first request builds the table (and normalizes it, if asked) and
+the same object is handed out for identical requests afterwards, so it
+must be read, never changed. Its samples are also written to
+`wavetable_cache/` next to the songs, keyed by the class (its source, for
+a song's own one), the arguments and the pyo version, so later renders
+get a `DataTable` filled from that file instead of synthesizing it.
+
+Shared objects belong to the current pyo server and live as long as
+this module: warm render workers drop it after each job, the live engine
+keeps it for all its songs. Python 2 interpreters only share within a
+render, as they can't fill a table from its buffer.
+
+This file is imported by the songs' own interpreters, so it has to stay
+compatible with python 2.
+"""
+
+import os
+import sys
+import json
+import inspect
+import hashlib
+
+from radio_pyo_tables import (TABLE_EXT, table_samples, table_bytes,
+                              fill_table, song_directory, save_samples)
+
+WAVETABLE_CACHE_DIR = 'wavetable_cache'
+
+getargspec = getattr(inspect, 'getfullargspec', None) or inspect.getargspec
+
+_shared = {}
+
+
+def class_origin(table_class):
+    """What identifies a table class for the disk cache: pyo's version,
+    and the source of the class if it is not one of pyo's. None when it
+    can't be told."""
+    pyo = sys.modules.get('pyo') or sys.modules.get('pyo64')
+    version = getattr(pyo, 'PYO_VERSION', None)
+    if version is None:
+        return None
+    if (table_class.__module__ or '').split('.')[0] in ('pyo', 'pyo64'):
+        return version
+    try:
+        source = inspect.getsource(table_class)
+    except (IOError, OSError, TypeError):
+        return None
+    # already bytes under python 2, where encoding would decode it as ascii
+    if not isinstance(source, bytes):
+        source = source.encode('utf-8')
+    return version + ':' + hashlib.sha1(source).hexdigest()
+
+
+def table_key(table_class, args, kwargs, normalize):
+    """The request's key, or None if its arguments can't be compared."""
+    try:
+        return hashlib.sha1(json.dumps(
+            [table_class.__module__, table_class.__name__,
+             class_origin(table_class), args, sorted(kwargs.items()),
+             normalize]).encode('utf-8')).hexdigest()
+    except TypeError:
+        return None
+
+
+def shared_table(table_class, *args, **kwargs):
+    """The table `table_class(*args, **kwargs)`, normalized if
+    `normalize=True` is given, shared with every identical request."""
+    normalize = kwargs.pop('normalize', False)
+    directory = kwargs.pop('directory', None) or \
+        song_directory(WAVETABLE_CACHE_DIR)
+    key = table_key(table_class, args, kwargs, normalize)
+    if key is not None and key in _shared:
+        return _shared[key]
+    cacheable = key is not None and class_origin(table_class) is not None
+    table = None
+    if cacheable:
+        table = cached_table(key, table_class, directory,
+                             table_size(table_class, args, kwargs))
+    if table is None:
+        table = table_class(*args, **kwargs)
+        if normalize:
+            table.normalize()
+        data = table_bytes(table) if cacheable else None
+        if data is not None:
+            try:
+                save_samples(os.path.join(directory, key + TABLE_EXT),
+                             data)
+            except (IOError, OSError):
+                pass
+    if key is not None:
+        _shared[key] = table
+    return table
+
+
+def table_size(table_class, args, kwargs):
+    """The size a request asks for, given or by default, or None if it
+    can't be told."""
+    if 'size' in kwargs:
+        return kwargs['size']
+    try:
+        spec = getargspec(table_class.__init__)
+    except TypeError:
+        return None
+    names = spec.args[1:]
+    if 'size' not in names:
+        return None
+    index = names.index('size')
+    if index < len(args):
+        return args[index]
+    defaults = spec.defaults or ()
+    offset = len(names) - len(defaults)
+    if index < offset:
+        return None
+    return defaults[index - offset]
+
+
+def cached_table(key, table_class, directory, size=None):
+    """A `DataTable` of the pyo `table_class` comes from, filled with the
+    cached samples, or None if they are not cached or don't fit it (not
+    `size` samples, when it is known)."""
+    if size is None:
+        # a file of the wrong size would be shared as is
+        return None
+    try:
+        mapped = table_samples(key, directory, size)
+    except (IOError, OSError, ValueError):
+        return None
+    module = sys.modules.get(table_class.__module__)
+    data_class = getattr(module, 'DataTable', None)
+    if data_class is None:
+        from pyo import DataTable as data_class
+    table = data_class(size=len(mapped) // 4)
+    if not fill_table(table, mapped):
+        # a double precision pyo; synthesize rather than lose precision
+        return None
+    return table